@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the parts of the `gh` CLI that `swarm.py` uses.
+
+Point the supervisor at it with `SWARM_GH=scripts/fake_gh.py` and describe the remote in a JSON file
+named by `FAKE_GH_STATE`:
+
+    {"prs": [{"number": 7, "headRefName": "T001_slug", "baseRefName": "main", "url": "...",
+              "updatedAt": "2026-01-22T00:00:00Z", "mergeable": "MERGEABLE", "statusCheckRollup": []}]}
+
+Supported: `pr list` (--base/--head/--json), `pr create`, `pr merge`, and `api -i repos/.../pulls`
+with `If-None-Match` (the ETag is derived from the PR list, so editing the file changes it).
+If `FAKE_GH_LOG` is set, every invocation is appended to it as one JSON line.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+
+def _state_path() -> Path:
+    path = os.environ.get("FAKE_GH_STATE")
+    if not path:
+        raise SystemExit("fake_gh: set FAKE_GH_STATE to a JSON file describing the open PRs")
+    return Path(path)
+
+
+def _load() -> dict[str, object]:
+    path = _state_path()
+    if not path.exists():
+        return {"prs": []}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _save(state: dict[str, object]) -> None:
+    _state_path().write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _open_prs(state: dict[str, object]) -> list[dict[str, object]]:
+    prs = state.get("prs", [])
+    if not isinstance(prs, list):
+        return []
+    return [pr for pr in prs if isinstance(pr, dict) and pr.get("state", "OPEN") == "OPEN"]
+
+
+def _etag(prs: list[dict[str, object]]) -> str:
+    return '"' + hashlib.sha256(json.dumps(prs, sort_keys=True).encode("utf-8")).hexdigest()[:16] + '"'
+
+
+def _opt(argv: list[str], name: str) -> str | None:
+    return argv[argv.index(name) + 1] if name in argv and argv.index(name) + 1 < len(argv) else None
+
+
+def _pr_list(argv: list[str]) -> int:
+    prs = _open_prs(_load())
+    base, head, fields = _opt(argv, "--base"), _opt(argv, "--head"), _opt(argv, "--json")
+    if base:
+        prs = [pr for pr in prs if pr.get("baseRefName", "main") == base]
+    if head:
+        prs = [pr for pr in prs if pr.get("headRefName") == head]
+    if fields:
+        keep = fields.split(",")
+        prs = [{k: pr[k] for k in keep if k in pr} for pr in prs]
+    print(json.dumps(prs))
+    return 0
+
+
+def _pr_create(argv: list[str]) -> int:
+    state = _load()
+    prs = state.setdefault("prs", [])
+    assert isinstance(prs, list)
+    head = _opt(argv, "--head")
+    if head is None:
+        cp = subprocess.run(["git", "rev-parse", "--abbrev-ref", "HEAD"], text=True, capture_output=True, check=True)
+        head = cp.stdout.strip()
+    number = max((int(pr.get("number", 0)) for pr in prs), default=0) + 1
+    prs.append(
+        {
+            "number": number,
+            "headRefName": head,
+            "baseRefName": _opt(argv, "--base") or "main",
+            "title": _opt(argv, "--title") or "",
+            "url": f"https://github.invalid/pull/{number}",
+            "updatedAt": "1970-01-01T00:00:00Z",
+            "mergeable": "MERGEABLE",
+            "statusCheckRollup": [],
+        }
+    )
+    _save(state)
+    print(f"https://github.invalid/pull/{number}")
+    return 0
+
+
+def _api(argv: list[str]) -> int:
+    path = next((a for a in argv if a.startswith("repos/")), "")
+    if not path.split("?", 1)[0].endswith("/pulls"):
+        print(f"fake_gh: unsupported api path {path!r}", file=sys.stderr)
+        return 1
+    query = dict(p.split("=", 1) for p in path.partition("?")[2].split("&") if "=" in p)
+    prs = [pr for pr in _open_prs(_load()) if pr.get("baseRefName", "main") == query.get("base", "main")]
+    etag = _etag(prs)
+    header = next((a for a in argv if a.lower().startswith("if-none-match:")), None)
+    if header is not None and header.split(":", 1)[1].strip() == etag:
+        print("HTTP/2.0 304 Not Modified")
+        print(f"Etag: {etag}")
+        print()
+        return 0
+    body = [
+        {"number": pr.get("number"), "head": {"ref": pr.get("headRefName")}, "html_url": pr.get("url"), "updated_at": pr.get("updatedAt")}
+        for pr in prs
+    ]
+    print("HTTP/2.0 200 OK")
+    print(f"Etag: {etag}")
+    print()
+    print(json.dumps(body))
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    log = os.environ.get("FAKE_GH_LOG")
+    if log:
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(json.dumps(argv) + "\n")
+    if argv[:2] == ["pr", "list"]:
+        return _pr_list(argv[2:])
+    if argv[:2] == ["pr", "create"]:
+        return _pr_create(argv[2:])
+    if argv[:2] == ["pr", "merge"]:
+        return 0
+    if argv[:1] == ["api"]:
+        return _api(argv[1:])
+    print(f"fake_gh: unsupported command {' '.join(argv)!r}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -3,22 +3,199 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import mmap
+import os
 import platform
+import random
 import re
 import shlex
 import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+HASH_MODES = ("serial", "thread", "process")
+MERKLE_ALGORITHM = "sha256-merkle-v1"
+JSONL_MANIFEST_FORMAT = "raw_manifest_jsonl_v1"
+MANIFEST_FORMATS = ("json", "jsonl")
+# Read buffer for small/medium files; files at or above the mmap threshold are hashed
+# straight from the page cache without copying through a Python-level buffer.
+HASH_BUFFER_BYTES = 8 * 1024 * 1024
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+ProgressCallback = Callable[[int, int, int], None]
 
 
 def _sha256_file(path: Path) -> str:
     h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+            return h.hexdigest()
+        buf = bytearray(min(max(size, 1), HASH_BUFFER_BYTES))
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
     return h.hexdigest()
 
 
+def _hash_file_entry(path: Path) -> tuple[str, int]:
+    """Return (sha256, bytes) for one file; module-level so process pools can pickle it."""
+    return _sha256_file(path), path.stat().st_size
+
+
+def default_workers() -> int:
+    return min(32, os.cpu_count() or 1)
+
+
+def _make_executor(hash_mode: str, workers: int) -> Executor | None:
+    if hash_mode not in HASH_MODES:
+        raise SystemExit(f"Invalid hash mode {hash_mode!r} (expected one of: {', '.join(HASH_MODES)})")
+    if hash_mode == "serial" or workers <= 1:
+        return None
+    if hash_mode == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    # hashlib releases the GIL while digesting large buffers, so threads scale on I/O + CPU.
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="manifest-hash")
+
+
+def iter_file_hashes(
+    paths: list[Path],
+    *,
+    hash_mode: str = "thread",
+    workers: int | None = None,
+    progress: ProgressCallback | None = None,
+) -> Iterator[tuple[Path, str, int]]:
+    """Yield (path, sha256, bytes) for each path, in the order given.
+
+    Hashing may run concurrently, but results are always yielded in input order so the
+    manifest is byte-identical regardless of `hash_mode` / `workers`.
+    """
+    n_workers = default_workers() if workers is None else max(1, int(workers))
+    executor = _make_executor(hash_mode, n_workers)
+    total = len(paths)
+    done_bytes = 0
+    try:
+        if executor is None:
+            results: Iterator[tuple[str, int]] = map(_hash_file_entry, paths)
+        else:
+            chunksize = 1
+            if isinstance(executor, ProcessPoolExecutor):
+                chunksize = max(1, total // (n_workers * 16))
+            results = executor.map(_hash_file_entry, paths, chunksize=chunksize)
+        for i, (path, (sha, size)) in enumerate(zip(paths, results), start=1):
+            done_bytes += size
+            if progress is not None:
+                progress(i, total, done_bytes)
+            yield path, sha, size
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _stderr_progress(min_interval_seconds: float = 0.5) -> ProgressCallback:
+    last = [0.0]
+
+    def _report(done: int, total: int, done_bytes: int) -> None:
+        now = time.monotonic()
+        if done != total and now - last[0] < min_interval_seconds:
+            return
+        last[0] = now
+        print(f"\r[manifest] hashed {done}/{total} files ({done_bytes / 2**20:.1f} MiB)", end="", file=sys.stderr)
+        if done == total:
+            print(file=sys.stderr)
+
+    return _report
+
+
+class MerkleBuilder:
+    """Streaming per-directory Merkle rollup over manifest entries.
+
+    Entries must arrive sorted by path components (the order `build_manifest` emits). A
+    directory's hash is the sha256 of its children's lines, in name order:
+    `F\t<name>\t<sha256>\t<bytes>\n` for files and `D\t<name>\t<dir_hash>\n` for subdirectories.
+    Memory is O(tree depth) for open directories plus one hash per finished directory.
+    """
+
+    def __init__(self, root_path: str) -> None:
+        self.root_parts = Path(root_path).parts
+        self.dirs: dict[str, str] = {}
+        self._stack: list[tuple[tuple[str, ...], "hashlib._Hash"]] = [(self.root_parts, hashlib.sha256())]
+        self._last: tuple[str, ...] | None = None
+
+    def add(self, path: str, sha256: str, size: int) -> None:
+        parts = Path(path).parts
+        if parts[: len(self.root_parts)] != self.root_parts or len(parts) <= len(self.root_parts):
+            raise ValueError(f"path outside tree root {'/'.join(self.root_parts)!r}: {path}")
+        if self._last is not None and parts <= self._last:
+            raise ValueError(f"entries not sorted by path: {path}")
+        self._last = parts
+
+        parent = parts[:-1]
+        while self._stack[-1][0] != parent[: len(self._stack[-1][0])]:
+            self._close_top()
+        while len(self._stack[-1][0]) < len(parent):
+            self._stack.append((parent[: len(self._stack[-1][0]) + 1], hashlib.sha256()))
+        self._stack[-1][1].update(f"F\t{parts[-1]}\t{sha256}\t{size}\n".encode("utf-8"))
+
+    def _close_top(self) -> str:
+        parts, h = self._stack.pop()
+        digest = h.hexdigest()
+        self.dirs["/".join(parts)] = digest
+        if self._stack:
+            self._stack[-1][1].update(f"D\t{parts[-1]}\t{digest}\n".encode("utf-8"))
+        return digest
+
+    def finish(self) -> dict[str, object]:
+        root = ""
+        while self._stack:
+            root = self._close_top()
+        return {
+            "algorithm": MERKLE_ALGORITHM,
+            "root_path": "/".join(self.root_parts),
+            "root": root,
+            "dirs": dict(sorted(self.dirs.items())),
+        }
+
+
+def build_merkle_tree(root_path: str, files: Iterable[dict[str, object]]) -> dict[str, object]:
+    builder = MerkleBuilder(root_path)
+    for entry in files:
+        builder.add(str(entry["path"]), str(entry["sha256"]), int(entry["bytes"]))  # type: ignore[call-overload]
+    return builder.finish()
+
+
+def changed_dirs(old_tree: dict[str, object], new_tree: dict[str, object]) -> list[str]:
+    """Return directories whose rollup hash differs between two manifest trees.
+
+    Walks top-down from the root and never descends into a directory whose hash is unchanged,
+    so identical subtrees (e.g. old `run_date=` partitions) cost O(1) each.
+    """
+    old_dirs: dict[str, str] = old_tree.get("dirs") or {}  # type: ignore[assignment]
+    new_dirs: dict[str, str] = new_tree.get("dirs") or {}  # type: ignore[assignment]
+    children: dict[str, list[str]] = {}
+    for d in set(old_dirs) | set(new_dirs):
+        parent = d.rsplit("/", 1)[0] if "/" in d else ""
+        children.setdefault(parent, []).append(d)
+
+    out: list[str] = []
+    queue = [str(new_tree.get("root_path") or old_tree.get("root_path") or "")]
+    while queue:
+        d = queue.pop()
+        if old_dirs.get(d) == new_dirs.get(d):
+            continue
+        out.append(d)
+        queue.extend(children.get(d, []))
+    return sorted(out)
+
+
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
@@ -44,34 +221,137 @@ def _infer_as_of_from_snapshot_dir(snapshot_dir: Path) -> date | None:
     return _parse_utc_date(snapshot_dir.name)
 
 
-def build_manifest(source: str, snapshot_dir: Path, command: str, *, as_of: date) -> dict[str, object]:
+def _list_snapshot_files(root: Path, snap: Path, only: Iterable[Path] | None = None) -> list[tuple[Path, Path]]:
+    """Return sorted (absolute_path, repo_relative_path) pairs for every file under snap (or just `only`)."""
+    out: list[tuple[Path, Path]] = []
+    if only is not None:
+        for p in sorted({q if q.is_absolute() else root / q for q in only}):
+            if not p.is_file():
+                raise SystemExit(f"Manifest file does not exist: {p}")
+            if not p.resolve().is_relative_to(snap.resolve()):
+                raise SystemExit(f"Manifest file is outside the snapshot dir {snap}: {p}")
+            out.append((p, _ensure_within_repo(root, p)))
+        return out
+    for p in sorted(snap.rglob("*")):
+        if not p.is_file():
+            continue
+        out.append((p, _ensure_within_repo(root, p)))
+    return out
+
+
+def stat_fingerprint(path: Path) -> list[int]:
+    """(size, mtime_ns, inode) — a file whose fingerprint is unchanged is assumed unchanged."""
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def stat_cache_path_for(manifest_path: Path) -> Path:
+    """Sidecar fingerprint cache for a manifest (untracked; lives under data/tmp/)."""
+    return _repo_root() / "data/tmp/manifest_stat_cache" / f"{manifest_path.name}.json"
+
+
+def _load_reusable_hashes(manifest_path: Path) -> dict[str, tuple[str, list[int]]]:
+    """Map path -> (sha256, fingerprint) for entries of a previous manifest that have a sidecar fingerprint.
+
+    Entries without a recorded fingerprint are never reused (they are re-hashed).
+    """
     root = _repo_root()
+    prev_path = manifest_path if manifest_path.is_absolute() else (root / manifest_path)
+    if not prev_path.exists():
+        raise SystemExit(f"--reuse-from manifest does not exist: {prev_path}")
+    cache_path = stat_cache_path_for(prev_path)
+    if not cache_path.exists():
+        return {}
+    fingerprints = json.loads(cache_path.read_text(encoding="utf-8")).get("fingerprints", {})
+
+    out: dict[str, tuple[str, list[int]]] = {}
+    for entry in _iter_manifest_entries(prev_path):
+        path, sha, size = entry.get("path"), entry.get("sha256"), entry.get("bytes")
+        fp = fingerprints.get(path) if isinstance(path, str) else None
+        if not isinstance(sha, str) or not isinstance(fp, list) or len(fp) != 3 or fp[0] != size:
+            continue
+        out[path] = (sha, fp)
+    return out
+
+
+def write_stat_cache(manifest_path: Path, fingerprints: dict[str, list[int]]) -> Path:
+    cache_path = stat_cache_path_for(manifest_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"manifest": manifest_path.name, "fingerprints": fingerprints}
+    cache_path.write_text(json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n", encoding="utf-8")
+    return cache_path
+
+
+def _resolve_snapshot_dir(root: Path, snapshot_dir: Path) -> Path:
     snap = snapshot_dir if snapshot_dir.is_absolute() else (root / snapshot_dir)
     if not snap.exists():
         raise SystemExit(f"snapshot_dir does not exist: {snap}")
     if not snap.is_dir():
         raise SystemExit(f"snapshot_dir is not a directory: {snap}")
+    return snap
 
-    files: list[dict[str, object]] = []
-    for p in sorted(snap.rglob("*")):
-        if not p.is_file():
-            continue
-        rel = _ensure_within_repo(root, p)
-        files.append(
-            {
-                "path": str(rel),
-                "sha256": _sha256_file(p),
-                "bytes": p.stat().st_size,
-            }
-        )
 
-    now = datetime.now(timezone.utc)
+def _iter_snapshot_entries(
+    root: Path,
+    snap: Path,
+    *,
+    hash_mode: str,
+    workers: int | None,
+    progress: ProgressCallback | None,
+    reuse_from: Path | None,
+    fingerprints_out: dict[str, list[int]] | None,
+    recomputed: list[str],
+    known_hashes: dict[str, tuple[str, list[int]]] | None = None,
+    only: Iterable[Path] | None = None,
+) -> Iterator[dict[str, object]]:
+    """Yield `{path, sha256, bytes}` entries in sorted path order as hashing completes.
+
+    Paths that had to be hashed (not reused) are appended to `recomputed`; the stat fingerprint
+    of every listed file is stored in `fingerprints_out` when given.
+    """
+    listed = _list_snapshot_files(root, snap, only)
+    track_stats = reuse_from is not None or fingerprints_out is not None or bool(known_hashes)
+    fingerprints: dict[str, list[int]] = {}
+    if track_stats:
+        # Fingerprint before hashing: a file modified mid-hash then fails to match next run.
+        fingerprints = {str(rel): stat_fingerprint(p) for p, rel in listed}
+    if fingerprints_out is not None:
+        fingerprints_out.update(fingerprints)
+    reusable = _load_reusable_hashes(reuse_from) if reuse_from is not None else {}
+    reusable.update(known_hashes or {})
+
+    reused: dict[str, tuple[str, int]] = {}
+    to_hash: list[Path] = []
+    for p, rel in listed:
+        key = str(rel)
+        prev = reusable.get(key)
+        if prev is not None and prev[1] == fingerprints[key]:
+            reused[key] = (prev[0], fingerprints[key][0])
+        else:
+            to_hash.append(p)
+
+    hashes = iter_file_hashes(to_hash, hash_mode=hash_mode, workers=workers, progress=progress)
+    for _, rel in listed:
+        key = str(rel)
+        if key in reused:
+            sha, size = reused[key]
+        else:
+            _, sha, size = next(hashes)
+            recomputed.append(key)
+        yield {
+            "path": key,
+            "sha256": sha,
+            "bytes": size,
+        }
+
+
+def _manifest_header(source: str, as_of: date, command: str, fetched_at: datetime | None) -> dict[str, object]:
+    now = fetched_at or datetime.now(timezone.utc)
     return {
         "source": source,
         "as_of_utc_date": as_of.isoformat(),
         "fetched_at_utc": now.isoformat(),
         "command": command,
-        "files": files,
         "environment": {
             "python_version": sys.version.split()[0],
             "python_implementation": platform.python_implementation(),
@@ -80,12 +360,350 @@ def build_manifest(source: str, snapshot_dir: Path, command: str, *, as_of: date
     }
 
 
+def _incremental_block(root: Path, reuse_from: Path, count: int, recomputed: list[str]) -> dict[str, object]:
+    # Reused entries are every path not listed under `recomputed`.
+    return {
+        "reused_from": str(_ensure_within_repo(root, root / reuse_from)),
+        "reused_count": count - len(recomputed),
+        "recomputed_count": len(recomputed),
+        "recomputed": recomputed,
+    }
+
+
+def build_manifest(
+    source: str,
+    snapshot_dir: Path,
+    command: str,
+    *,
+    as_of: date,
+    hash_mode: str = "thread",
+    workers: int | None = None,
+    progress: ProgressCallback | None = None,
+    fetched_at: datetime | None = None,
+    reuse_from: Path | None = None,
+    fingerprints_out: dict[str, list[int]] | None = None,
+    known_hashes: dict[str, tuple[str, list[int]]] | None = None,
+    files: Iterable[Path] | None = None,
+) -> dict[str, object]:
+    """Hash every file under snapshot_dir (or only `files`, which must lie under it) into a provenance manifest.
+
+    With `reuse_from`, sha256 values are copied from that previous manifest for files whose
+    (size, mtime_ns, inode) fingerprint matches its sidecar stat cache; only new or modified
+    files are re-hashed, and the manifest gains an `incremental` block listing them. With
+    `fingerprints_out`, the fingerprints observed in this run are collected for
+    `write_stat_cache`, which the caller runs once the manifest is written. `known_hashes` maps
+    repo-relative paths to (sha256, fingerprint) computed by the caller (e.g. while downloading);
+    matching files are not read again.
+    """
+    root = _repo_root()
+    snap = _resolve_snapshot_dir(root, snapshot_dir)
+
+    recomputed: list[str] = []
+    entries = list(
+        _iter_snapshot_entries(
+            root,
+            snap,
+            hash_mode=hash_mode,
+            workers=workers,
+            progress=progress,
+            reuse_from=reuse_from,
+            fingerprints_out=fingerprints_out,
+            recomputed=recomputed,
+            known_hashes=known_hashes,
+            only=files,
+        )
+    )
+    tree = build_merkle_tree(str(_ensure_within_repo(root, snap)), entries)
+
+    manifest = _manifest_header(source, as_of, command, fetched_at)
+    manifest["files"] = entries
+    manifest["tree"] = tree
+    if files is not None:
+        manifest["subset"] = True  # other files under the snapshot dir are not covered
+    if reuse_from is not None:
+        manifest["incremental"] = _incremental_block(root, reuse_from, len(entries), recomputed)
+    return manifest
+
+
+def write_manifest(manifest: dict[str, object], out_path: Path) -> None:
+    out_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _jsonl_line(obj: dict[str, object]) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")) + "\n"
+
+
+def build_manifest_jsonl(
+    source: str,
+    snapshot_dir: Path,
+    command: str,
+    out_path: Path,
+    *,
+    as_of: date,
+    hash_mode: str = "thread",
+    workers: int | None = None,
+    progress: ProgressCallback | None = None,
+    fetched_at: datetime | None = None,
+    reuse_from: Path | None = None,
+    fingerprints_out: dict[str, list[int]] | None = None,
+) -> dict[str, object]:
+    """Stream a JSON-lines manifest to out_path without holding the file list in memory.
+
+    Layout (format `raw_manifest_jsonl_v1`):
+    - line 1: `{"kind": "header", "format", "snapshot_dir", source, as_of_utc_date, fetched_at_utc, command, environment}`
+    - one `{path, sha256, bytes}` line per file, in sorted path order, written as hashing completes
+    - last line: `{"kind": "trailer", "count": N, "tree": {...}}` (+ `incremental` when reusing)
+
+    The file is written to a temporary sibling and renamed into place. Returns the trailer.
+    """
+    root = _repo_root()
+    snap = _resolve_snapshot_dir(root, snapshot_dir)
+    tree = MerkleBuilder(str(_ensure_within_repo(root, snap)))
+    recomputed: list[str] = []
+    count = 0
+
+    header: dict[str, object] = {
+        "kind": "header",
+        "format": JSONL_MANIFEST_FORMAT,
+        "snapshot_dir": str(_ensure_within_repo(root, snap)),
+    }
+    header.update(_manifest_header(source, as_of, command, fetched_at))
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        f.write(_jsonl_line(header))
+        entries = _iter_snapshot_entries(
+            root,
+            snap,
+            hash_mode=hash_mode,
+            workers=workers,
+            progress=progress,
+            reuse_from=reuse_from,
+            fingerprints_out=fingerprints_out,
+            recomputed=recomputed,
+        )
+        for entry in entries:
+            f.write(_jsonl_line(entry))
+            tree.add(str(entry["path"]), str(entry["sha256"]), int(entry["bytes"]))  # type: ignore[call-overload]
+            count += 1
+        trailer: dict[str, object] = {"kind": "trailer", "count": count, "tree": tree.finish()}
+        if reuse_from is not None:
+            trailer["incremental"] = _incremental_block(root, reuse_from, count, recomputed)
+        f.write(_jsonl_line(trailer))
+    os.replace(tmp_path, out_path)
+    return trailer
+
+
+def _iter_manifest_entries(manifest_path: Path, meta: dict[str, object] | None = None) -> Iterator[dict[str, object]]:
+    """Yield file entries from a `.json` manifest or stream them from a `.jsonl` manifest.
+
+    Non-entry fields (the JSON top level minus `files`, or the JSONL header and trailer lines)
+    are copied into `meta` when given. A `.json` manifest is parsed whole, so its memory use
+    grows with the file count; very large snapshots should use `--format jsonl`.
+    """
+    if manifest_path.suffix == ".jsonl":
+        with manifest_path.open("r", encoding="utf-8") as f:
+            for i, line in enumerate(f):
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise SystemExit(f"Manifest line {i + 1} is not valid JSON: {manifest_path}: {exc}") from exc
+                if not isinstance(obj, dict):
+                    continue
+                if "kind" not in obj:
+                    yield obj
+                elif meta is not None:
+                    meta.update(obj)
+        return
+
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Manifest is not valid JSON: {manifest_path}: {exc}") from exc
+    files = data.get("files") if isinstance(data, dict) else None
+    if not isinstance(files, list):
+        raise SystemExit(f"Manifest has no files list: {manifest_path}")
+    if meta is not None:
+        meta.update((k, v) for k, v in data.items() if k != "files")
+    for entry in files:
+        if isinstance(entry, dict):
+            yield entry
+
+
+def _recorded_snapshot_dir(meta: dict[str, object]) -> Path | None:
+    """Snapshot root the manifest was built from: JSONL header `snapshot_dir`, else `tree.root_path`."""
+    snapshot_dir = meta.get("snapshot_dir")
+    if isinstance(snapshot_dir, str):
+        return Path(snapshot_dir)
+    tree = meta.get("tree")
+    root_path = tree.get("root_path") if isinstance(tree, dict) else None
+    return Path(root_path) if isinstance(root_path, str) else None
+
+
+def verify_manifest(
+    manifest_path: Path,
+    *,
+    snapshot_dir: Path | None = None,
+    sample: int | None = None,
+    seed: int = 0,
+    fail_fast: bool = False,
+    hash_mode: str = "thread",
+    workers: int | None = None,
+    check_extra: bool | None = None,
+) -> dict[str, object]:
+    """Check files on disk against a manifest: sizes first (cheap), then sha256 for size matches.
+
+    Returns a JSON-serializable report with `missing`, `extra`, `size_mismatch` and
+    `sha256_mismatch` path lists. `sample` re-checks a deterministic random subset of entries
+    (seeded by `seed`); `fail_fast` stops at the first discrepancy.
+
+    Extra files are looked for under `snapshot_dir`, defaulting to the root recorded in the
+    manifest. Manifests built from an explicit file list (`subset`) skip that scan unless
+    `snapshot_dir` is given, since other files under their root are expected; so does a `sample`
+    spot check, whose cost would otherwise be the full tree walk. `check_extra` forces the scan on
+    (True) or off (False).
+    """
+    root = _repo_root()
+    manifest_abs = manifest_path if manifest_path.is_absolute() else (root / manifest_path)
+    if not manifest_abs.exists():
+        raise SystemExit(f"Manifest does not exist: {manifest_abs}")
+
+    expected: dict[str, tuple[str, int]] = {}
+    meta: dict[str, object] = {}
+    for entry in _iter_manifest_entries(manifest_abs, meta):
+        path, sha, size = entry.get("path"), entry.get("sha256"), entry.get("bytes")
+        if isinstance(path, str) and isinstance(sha, str) and isinstance(size, int):
+            expected[path] = (sha, size)
+
+    snap_rel = snapshot_dir if snapshot_dir is not None else _recorded_snapshot_dir(meta)
+    if check_extra is None:
+        check_extra = sample is None and (snapshot_dir is not None or not meta.get("subset"))
+    check_extra = check_extra and snap_rel is not None
+    to_check = sorted(expected)
+    if sample is not None and 0 <= sample < len(to_check):
+        to_check = sorted(random.Random(seed).sample(to_check, sample))
+
+    missing: list[str] = []
+    extra: list[str] = []
+    size_mismatch: list[str] = []
+    sha_mismatch: list[str] = []
+    checked = 0
+
+    def _report() -> dict[str, object]:
+        return {
+            "manifest": str(manifest_path),
+            "snapshot_dir": str(snap_rel) if snap_rel is not None else None,
+            "entries": len(expected),
+            "extra_checked": check_extra,
+            "sampled": len(to_check) != len(expected),
+            "checked": checked,
+            "missing": missing,
+            "extra": extra,
+            "size_mismatch": size_mismatch,
+            "sha256_mismatch": sha_mismatch,
+            "ok": not (missing or extra or size_mismatch or sha_mismatch),
+        }
+
+    # Pass 1: existence + size (stat only).
+    size_ok: list[str] = []
+    for rel in to_check:
+        try:
+            actual = (root / rel).stat().st_size
+        except FileNotFoundError:
+            missing.append(rel)
+        else:
+            if actual == expected[rel][1]:
+                size_ok.append(rel)
+            else:
+                size_mismatch.append(rel)
+        if fail_fast and (missing or size_mismatch):
+            return _report()
+
+    # Pass 2: files on disk that the manifest does not list.
+    if snap_rel is not None and check_extra and (root / snap_rel).is_dir():
+        for _, rel_path in _list_snapshot_files(root, root / snap_rel):
+            if str(rel_path) not in expected:
+                extra.append(str(rel_path))
+                if fail_fast:
+                    return _report()
+
+    # Pass 3: parallel re-hash of size-matching files only.
+    hashes = iter_file_hashes([root / r for r in size_ok], hash_mode=hash_mode, workers=workers)
+    try:
+        for rel, (_, sha, _) in zip(size_ok, hashes):
+            checked += 1
+            if sha != expected[rel][0]:
+                sha_mismatch.append(rel)
+                if fail_fast:
+                    break
+    finally:
+        hashes.close()  # cancels queued hashes on fail-fast
+    return _report()
+
+
+def _main_verify(argv: list[str]) -> None:
+    p = argparse.ArgumentParser(prog="make_raw_manifest.py verify")
+    p.add_argument("manifest", help="Manifest to verify, e.g. data/raw_manifest/<source>_<YYYY-MM-DD>.json")
+    p.add_argument(
+        "--snapshot-dir",
+        default=None,
+        help="Directory scanned for extra files (default: the snapshot dir recorded in the manifest)",
+    )
+    p.add_argument("--sample", type=int, default=None, help="Re-check only N randomly chosen entries")
+    p.add_argument("--seed", type=int, default=0, help="Seed for --sample (deterministic by default)")
+    p.add_argument("--fail-fast", action="store_true", help="Stop at the first discrepancy (CI)")
+    p.add_argument(
+        "--check-extra",
+        action="store_true",
+        default=None,
+        help="Scan the snapshot dir for unlisted files even with --sample (or for a subset manifest)",
+    )
+    p.add_argument("--hash-mode", choices=HASH_MODES, default="thread")
+    p.add_argument("--workers", type=int, default=None)
+    args = p.parse_args(argv)
+
+    report = verify_manifest(
+        Path(args.manifest),
+        snapshot_dir=Path(args.snapshot_dir) if args.snapshot_dir else None,
+        sample=args.sample,
+        seed=args.seed,
+        fail_fast=args.fail_fast,
+        hash_mode=args.hash_mode,
+        workers=args.workers,
+        check_extra=args.check_extra,
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    raise SystemExit(0 if report["ok"] else 1)
+
+
 def main(argv: list[str]) -> None:
+    if len(argv) > 1 and argv[1] == "verify":
+        _main_verify(argv[2:])
     p = argparse.ArgumentParser(prog="make_raw_manifest.py")
     p.add_argument("source")
     p.add_argument("snapshot_dir")
     p.add_argument("--as-of", dest="as_of", default=None, help="UTC snapshot date (YYYY-MM-DD)")
     p.add_argument("--out", dest="out_path", default=None, help="Optional output path for the manifest JSON")
+    p.add_argument(
+        "--format",
+        dest="fmt",
+        choices=MANIFEST_FORMATS,
+        default=None,
+        help="Manifest format (default: jsonl if --out ends in .jsonl, else json). Use jsonl for very large snapshots.",
+    )
+    p.add_argument("--hash-mode", choices=HASH_MODES, default="thread", help="How to parallelize file hashing")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Hashing workers for thread/process modes (default: {default_workers()})",
+    )
+    p.add_argument("--progress", action="store_true", help="Stream a hashed-files counter to stderr")
+    p.add_argument(
+        "--reuse-from",
+        dest="reuse_from",
+        default=None,
+        help="Previous manifest whose hashes are reused for files with unchanged (size, mtime_ns, inode)",
+    )
     p.add_argument(
         "command",
         nargs=argparse.REMAINDER,
@@ -115,11 +733,41 @@ def main(argv: list[str]) -> None:
         raise SystemExit("Missing command tokens after --")
     command = " ".join(shlex.quote(t) for t in cmd_tokens)
 
-    manifest = build_manifest(source=source, snapshot_dir=snapshot_dir, command=command, as_of=as_of)
     out_dir = _repo_root() / "data/raw_manifest"
     out_dir.mkdir(parents=True, exist_ok=True)
-    out_path = Path(args.out_path) if args.out_path else (out_dir / f"{source}_{as_of.isoformat()}.json")
-    out_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    fmt = args.fmt or ("jsonl" if args.out_path and args.out_path.endswith(".jsonl") else "json")
+    out_path = Path(args.out_path) if args.out_path else (out_dir / f"{source}_{as_of.isoformat()}.{fmt}")
+    progress = _stderr_progress() if args.progress else None
+    reuse_from = Path(args.reuse_from) if args.reuse_from else None
+    fingerprints: dict[str, list[int]] = {}
+    if fmt == "jsonl":
+        build_manifest_jsonl(
+            source,
+            snapshot_dir,
+            command,
+            out_path,
+            as_of=as_of,
+            hash_mode=args.hash_mode,
+            workers=args.workers,
+            progress=progress,
+            reuse_from=reuse_from,
+            fingerprints_out=fingerprints,
+        )
+    else:
+        manifest = build_manifest(
+            source=source,
+            snapshot_dir=snapshot_dir,
+            command=command,
+            as_of=as_of,
+            hash_mode=args.hash_mode,
+            workers=args.workers,
+            progress=progress,
+            reuse_from=reuse_from,
+            fingerprints_out=fingerprints,
+        )
+        write_manifest(manifest, out_path)
+    # Only after the manifest is in place: a sidecar must never describe a manifest that failed to write.
+    write_stat_cache(out_path, fingerprints)
     print(f"Wrote {out_path}")
 
 
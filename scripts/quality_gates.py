@@ -8,15 +8,27 @@ Design principles:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
+import argparse
+import functools
+import hashlib
+import importlib.util
 import re
 import platform
 import sys
 import json
 import subprocess
-import csv
 import os
+import threading
+import time
+
+from make_raw_manifest import JSONL_MANIFEST_FORMAT, MERKLE_ALGORITHM, MerkleBuilder, build_merkle_tree, stat_fingerprint
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "validation"))
+import panel_schema  # noqa: E402
 
 
 @dataclass
@@ -34,14 +46,14 @@ def _read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def _parse_project_mode(path: Path) -> str | None:
-    """Parse a minimal YAML key: `mode: <value>` from contracts/project.yaml.
+def _parse_project_mode(text: str | None) -> str | None:
+    """Parse a minimal YAML key: `mode: <value>` from contracts/project.yaml text.
 
     We intentionally avoid external YAML dependencies in quality gates.
     """
-    if not path.exists():
+    if text is None:
         return None
-    for raw_line in _read_text(path).splitlines():
+    for raw_line in text.splitlines():
         line = raw_line.split("#", 1)[0].strip()
         if not line:
             continue
@@ -112,6 +124,126 @@ def _parse_task_frontmatter(text: str) -> dict[str, object] | None:
     return data
 
 
+PROJECT_YAML = Path("contracts/project.yaml")
+TASK_DIRS = [
+    Path(".orchestrator/backlog"),
+    Path(".orchestrator/active"),
+    Path(".orchestrator/ready_for_review"),
+    Path(".orchestrator/blocked"),
+    Path(".orchestrator/done"),
+]
+BASE_REF_CANDIDATES = ["origin/main", "main"]
+
+
+@dataclass(frozen=True)
+class TaskFile:
+    path: Path
+    text: str
+    frontmatter: dict[str, object] | None
+
+
+@dataclass(frozen=True)
+class ChangedPaths:
+    base_ref: str | None
+    paths: list[str]
+    error: str | None
+
+
+class RepoIndex:
+    """Lazily built, memoized view of the repo inputs shared by every gate in one run.
+
+    Each input (a file's text, the parsed task files, the git diff against the base ref)
+    is produced at most once per index, even when gates run concurrently.
+    """
+
+    def __init__(self, cache: GateCache | None = None) -> None:
+        # Optional result cache; gates that scan several large files may use it per file.
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._key_locks: dict[object, threading.Lock] = {}
+        self._values: dict[object, object] = {}
+
+    def _memo(self, key: object, build: Callable[[], object]) -> object:
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._values:
+                value = build()
+                with self._lock:
+                    self._values[key] = value
+        return self._values[key]
+
+    def text(self, path: Path) -> str | None:
+        """File contents, or None if the file does not exist."""
+        value = self._memo(("text", str(path)), lambda: _read_text(path) if path.exists() else None)
+        return value if isinstance(value, str) else None
+
+    def digest(self, path: Path) -> str:
+        """Content fingerprint used for gate cache keys: sha256 for files, else `dir` / `missing`.
+
+        With a result cache, a file whose (size, mtime_ns, inode) matches the previous run is not
+        re-read: its sha256 comes from the cache's digest index.
+        """
+
+        def _build() -> str:
+            if path.is_dir():
+                return "dir"
+            if not path.exists():
+                return "missing"
+            fingerprint = stat_fingerprint(path)
+            known = self.cache.known_digest(path, fingerprint) if self.cache is not None else None
+            if known is not None:
+                return known
+            with path.open("rb") as f:
+                sha = hashlib.file_digest(f, "sha256").hexdigest()
+            if self.cache is not None:
+                self.cache.record_digest(path, fingerprint, sha)
+            return sha
+
+        return self._memo(("digest", str(path)), _build)  # type: ignore[return-value]
+
+    @property
+    def project_mode(self) -> str | None:
+        return self._memo("project_mode", lambda: _parse_project_mode(self.text(PROJECT_YAML)))  # type: ignore[return-value]
+
+    def _scan_tasks(self) -> tuple[list[TaskFile], list[Path]]:
+        paths: list[Path] = []
+        missing_dirs: list[Path] = []
+        for task_dir in TASK_DIRS:
+            if not task_dir.exists():
+                missing_dirs.append(task_dir)
+                continue
+            paths.extend(p for p in task_dir.glob("*.md") if p.name != "README.md")
+        tasks = []
+        for path in sorted(paths):
+            text = self.text(path) or ""
+            tasks.append(TaskFile(path=path, text=text, frontmatter=_parse_task_frontmatter(text)))
+        return tasks, missing_dirs
+
+    @property
+    def task_files(self) -> list[TaskFile]:
+        tasks, _ = self._memo("tasks", self._scan_tasks)  # type: ignore[misc]
+        return tasks
+
+    @property
+    def missing_task_dirs(self) -> list[Path]:
+        _, missing = self._memo("tasks", self._scan_tasks)  # type: ignore[misc]
+        return missing
+
+    def _diff_against_base(self) -> ChangedPaths:
+        base_ref = os.environ.get("GATE_BASE_REF") or _resolve_base_ref(BASE_REF_CANDIDATES)
+        if base_ref is None:
+            return ChangedPaths(base_ref=None, paths=[], error="base_ref_missing")
+        paths, err = _git_changed_paths_against_base(base_ref)
+        return ChangedPaths(base_ref=base_ref, paths=paths, error=err)
+
+    @property
+    def changed_paths(self) -> ChangedPaths:
+        return self._memo("changed_paths", self._diff_against_base)  # type: ignore[return-value]
+
+
 def _section_has_content(text: str, heading: str) -> bool:
     match = re.search(rf"^##\s+{re.escape(heading)}\s*$", text, flags=re.MULTILINE)
     if match is None:
@@ -127,67 +259,68 @@ def _section_has_content(text: str, heading: str) -> bool:
     return False
 
 
-def gate_repo_structure() -> GateResult:
-    required = [
-        Path("AGENTS.md"),
-        Path("CLAUDE.md"),
-        Path("contracts"),
-        Path("contracts/AGENTS.md"),
-        Path("contracts/CHANGELOG.md"),
-        Path("contracts/assumptions.md"),
-        Path("contracts/decisions.md"),
-        Path("contracts/project.yaml"),
-        Path("contracts/schemas"),
-        Path("docs"),
-        Path(".orchestrator"),
-        Path(".orchestrator/AGENTS.md"),
-        Path(".orchestrator/ready_for_review"),
-        Path(".orchestrator/workstreams.md"),
-        Path("data"),
-        Path("data/AGENTS.md"),
-        Path("data/samples"),
-        Path("data/processed_manifest"),
-        Path("reports"),
-        Path("reports/AGENTS.md"),
-        Path("reports/catalog.yaml"),
-        Path("scripts/quality_gates.py"),
-        Path("scripts/AGENTS.md"),
-        Path("src"),
-        Path("src/AGENTS.md"),
-        Path("tests"),
-        Path("registry"),
-        Path("registry/AGENTS.md"),
-        Path("registry/CHANGELOG.md"),
-        Path("registry/rollup_registry_v1.csv"),
-    ]
-    mode = _parse_project_mode(Path("contracts/project.yaml"))
+REPO_STRUCTURE_REQUIRED = [
+    Path("AGENTS.md"),
+    Path("CLAUDE.md"),
+    Path("contracts"),
+    Path("contracts/AGENTS.md"),
+    Path("contracts/CHANGELOG.md"),
+    Path("contracts/assumptions.md"),
+    Path("contracts/decisions.md"),
+    Path("contracts/project.yaml"),
+    Path("contracts/schemas"),
+    Path("docs"),
+    Path(".orchestrator"),
+    Path(".orchestrator/AGENTS.md"),
+    Path(".orchestrator/ready_for_review"),
+    Path(".orchestrator/workstreams.md"),
+    Path("data"),
+    Path("data/AGENTS.md"),
+    Path("data/samples"),
+    Path("data/processed_manifest"),
+    Path("reports"),
+    Path("reports/AGENTS.md"),
+    Path("reports/catalog.yaml"),
+    Path("scripts/quality_gates.py"),
+    Path("scripts/AGENTS.md"),
+    Path("src"),
+    Path("src/AGENTS.md"),
+    Path("tests"),
+    Path("registry"),
+    Path("registry/AGENTS.md"),
+    Path("registry/CHANGELOG.md"),
+    Path("registry/rollup_registry_v1.csv"),
+]
+REPO_STRUCTURE_EMPIRICAL = [
+    Path("docs/protocol.md"),
+    Path("contracts/schemas/panel_schema.yaml"),
+    Path("contracts/schemas/panel_schema_str_v1.yaml"),
+    Path("contracts/schemas/panel_schema_decomp_v1.yaml"),
+]
+REPO_STRUCTURE_MODELING = [
+    Path("contracts/instances"),
+    Path("contracts/instances/benchmark_small"),
+    Path("contracts/experiments"),
+    Path("src/model"),
+]
+
+
+def gate_repo_structure(index: RepoIndex) -> GateResult:
+    required = list(REPO_STRUCTURE_REQUIRED)
+    mode = index.project_mode
     if mode in {"empirical", "hybrid"}:
-        required.extend(
-            [
-                Path("docs/protocol.md"),
-                Path("contracts/schemas/panel_schema.yaml"),
-                Path("contracts/schemas/panel_schema_str_v1.yaml"),
-                Path("contracts/schemas/panel_schema_decomp_v1.yaml"),
-            ]
-        )
+        required.extend(REPO_STRUCTURE_EMPIRICAL)
     if mode in {"modeling", "hybrid"}:
-        required.extend(
-            [
-                Path("contracts/instances"),
-                Path("contracts/instances/benchmark_small"),
-                Path("contracts/experiments"),
-                Path("src/model"),
-            ]
-        )
+        required.extend(REPO_STRUCTURE_MODELING)
     missing = [str(p) for p in required if not p.exists()]
     return GateResult(ok=(len(missing) == 0), details={"mode": mode, "missing": missing})
 
 
-def gate_project_contract() -> GateResult:
-    path = Path("contracts/project.yaml")
-    if not path.exists():
+def gate_project_contract(index: RepoIndex) -> GateResult:
+    path = PROJECT_YAML
+    if index.text(path) is None:
         return GateResult(ok=False, details={"missing": str(path)})
-    mode = _parse_project_mode(path)
+    mode = index.project_mode
     if mode is None:
         return GateResult(ok=False, details={"failures": ["missing_mode"]})
     if mode not in VALID_PROJECT_MODES:
@@ -195,7 +328,7 @@ def gate_project_contract() -> GateResult:
     return GateResult(ok=True, details={"mode": mode})
 
 
-def gate_environment() -> GateResult:
+def gate_environment(index: RepoIndex) -> GateResult:
     """Validate that a pinned environment spec exists and report runtime versions."""
     env_spec_candidates = [
         Path("pyproject.toml"),
@@ -209,10 +342,7 @@ def gate_environment() -> GateResult:
     if len(present) == 0:
         return GateResult(ok=False, details={"missing": [str(p) for p in env_spec_candidates]})
 
-    python_version_file = Path(".python-version")
-    pinned_python = None
-    if python_version_file.exists():
-        pinned_python = _read_text(python_version_file).strip() or None
+    pinned_python = (index.text(Path(".python-version")) or "").strip() or None
 
     return GateResult(
         ok=True,
@@ -226,15 +356,15 @@ def gate_environment() -> GateResult:
     )
 
 
-def gate_protocol_complete() -> GateResult:
-    mode = _parse_project_mode(Path("contracts/project.yaml"))
+def gate_protocol_complete(index: RepoIndex) -> GateResult:
+    mode = index.project_mode
     if mode == "modeling":
         return GateResult(ok=True, details={"skipped": True, "mode": mode})
 
     path = Path("docs/protocol.md")
-    if not path.exists():
+    text = index.text(path)
+    if text is None:
         return GateResult(ok=False, details={"missing": str(path)})
-    text = _read_text(path)
 
     failures: list[str] = []
 
@@ -267,8 +397,8 @@ def gate_protocol_complete() -> GateResult:
     return GateResult(ok=(len(failures) == 0), details={"failures": failures})
 
 
-def gate_model_spec_complete() -> GateResult:
-    mode = _parse_project_mode(Path("contracts/project.yaml"))
+def gate_model_spec_complete(index: RepoIndex) -> GateResult:
+    mode = index.project_mode
     if mode not in {"modeling", "hybrid"}:
         return GateResult(ok=True, details={"skipped": True, "mode": mode})
 
@@ -277,17 +407,16 @@ def gate_model_spec_complete() -> GateResult:
         Path("contracts/model_spec.yaml"),
         Path("contracts/model_spec.yml"),
     ]
-    path = next((p for p in candidates if p.exists()), None)
+    path = next((p for p in candidates if index.text(p) is not None), None)
     if path is None:
         return GateResult(ok=False, details={"missing": [str(p) for p in candidates]})
+    text = index.text(path) or ""
 
     if path.suffix.lower() in {".yml", ".yaml"}:
         # Minimal check: file exists and is non-empty (structure gates cover existence).
-        text = _read_text(path)
         ok = bool(text.strip())
         return GateResult(ok=ok, details={"path": str(path), "empty": (not ok)})
 
-    text = _read_text(path)
     required_sections = [
         "Objective / question",
         "Notation and sets",
@@ -303,11 +432,11 @@ def gate_model_spec_complete() -> GateResult:
     return GateResult(ok=(len(failures) == 0), details={"path": str(path), "missing_or_empty_sections": failures})
 
 
-def gate_workstreams_complete() -> GateResult:
+def gate_workstreams_complete(index: RepoIndex) -> GateResult:
     path = Path(".orchestrator/workstreams.md")
-    if not path.exists():
+    text = index.text(path)
+    if text is None:
         return GateResult(ok=False, details={"missing": str(path)})
-    text = _read_text(path)
 
     failures: list[str] = []
     rows_checked = 0
@@ -338,30 +467,11 @@ def gate_workstreams_complete() -> GateResult:
     return GateResult(ok=(len(failures) == 0), details={"failures": failures})
 
 
-def gate_task_hygiene() -> GateResult:
-    failures: list[str] = []
-    task_dirs = [
-        Path(".orchestrator/backlog"),
-        Path(".orchestrator/active"),
-        Path(".orchestrator/ready_for_review"),
-        Path(".orchestrator/blocked"),
-        Path(".orchestrator/done"),
-    ]
-
-    task_files: list[Path] = []
-    for task_dir in task_dirs:
-        if not task_dir.exists():
-            failures.append(f"missing_dir:{task_dir}")
-            continue
-        for p in task_dir.glob("*.md"):
-            if p.name == "README.md":
-                continue
-            task_files.append(p)
-
-    for path in sorted(task_files):
-        text = _read_text(path)
+def gate_task_hygiene(index: RepoIndex) -> GateResult:
+    failures: list[str] = [f"missing_dir:{task_dir}" for task_dir in index.missing_task_dirs]
 
-        frontmatter = _parse_task_frontmatter(text)
+    for task in index.task_files:
+        path, text, frontmatter = task.path, task.text, task.frontmatter
         if frontmatter is None:
             failures.append(f"{path}:missing_yaml_frontmatter")
         else:
@@ -443,30 +553,14 @@ def gate_task_hygiene() -> GateResult:
     return GateResult(ok=(len(failures) == 0), details={"failures": failures})
 
 
-def gate_task_dependencies() -> GateResult:
+def gate_task_dependencies(index: RepoIndex) -> GateResult:
     failures: list[str] = []
-    task_dirs = [
-        Path(".orchestrator/backlog"),
-        Path(".orchestrator/active"),
-        Path(".orchestrator/ready_for_review"),
-        Path(".orchestrator/blocked"),
-        Path(".orchestrator/done"),
-    ]
-
-    task_files: list[Path] = []
-    for task_dir in task_dirs:
-        if not task_dir.exists():
-            continue
-        for p in task_dir.glob("*.md"):
-            if p.name == "README.md":
-                continue
-            task_files.append(p)
-
     id_to_path: dict[str, Path] = {}
     deps_map: dict[str, list[str]] = {}
 
-    for path in sorted(task_files):
-        fm = _parse_task_frontmatter(_read_text(path)) or {}
+    for task in index.task_files:
+        path = task.path
+        fm = task.frontmatter or {}
         task_id = fm.get("task_id")
         deps = fm.get("dependencies")
         if not isinstance(task_id, str):
@@ -555,19 +649,17 @@ def _resolve_base_ref(candidate_refs: list[str]) -> str | None:
     return None
 
 
-def gate_contract_change_discipline() -> GateResult:
+def gate_contract_change_discipline(index: RepoIndex) -> GateResult:
     """If contracts/protocol change, require a decision log + contract changelog update.
 
     Best-effort: compares against a base ref if available. Deterministic and offline.
     """
-    env_base = os.environ.get("GATE_BASE_REF")
-    base_ref = env_base or _resolve_base_ref(["origin/main", "main"])
+    diff = index.changed_paths
+    base_ref, changed = diff.base_ref, diff.paths
     if base_ref is None:
-        return GateResult(ok=True, details={"skipped": True, "reason": "base_ref_missing", "candidates": ["origin/main", "main"]})
-
-    changed, err = _git_changed_paths_against_base(base_ref)
-    if err is not None:
-        return GateResult(ok=True, details={"skipped": True, "reason": err, "base_ref": base_ref})
+        return GateResult(ok=True, details={"skipped": True, "reason": "base_ref_missing", "candidates": list(BASE_REF_CANDIDATES)})
+    if diff.error is not None:
+        return GateResult(ok=True, details={"skipped": True, "reason": diff.error, "base_ref": base_ref})
 
     def _is_contract_change(p: str) -> bool:
         if p == "docs/protocol.md":
@@ -593,16 +685,14 @@ def gate_contract_change_discipline() -> GateResult:
     )
 
 
-def gate_registry_change_discipline() -> GateResult:
+def gate_registry_change_discipline(index: RepoIndex) -> GateResult:
     """If registry files change, require registry/CHANGELOG.md update (best-effort diff)."""
-    env_base = os.environ.get("GATE_BASE_REF")
-    base_ref = env_base or _resolve_base_ref(["origin/main", "main"])
+    diff = index.changed_paths
+    base_ref, changed = diff.base_ref, diff.paths
     if base_ref is None:
-        return GateResult(ok=True, details={"skipped": True, "reason": "base_ref_missing", "candidates": ["origin/main", "main"]})
-
-    changed, err = _git_changed_paths_against_base(base_ref)
-    if err is not None:
-        return GateResult(ok=True, details={"skipped": True, "reason": err, "base_ref": base_ref})
+        return GateResult(ok=True, details={"skipped": True, "reason": "base_ref_missing", "candidates": list(BASE_REF_CANDIDATES)})
+    if diff.error is not None:
+        return GateResult(ok=True, details={"skipped": True, "reason": diff.error, "base_ref": base_ref})
 
     registry_changed = any(p.startswith("registry/") and p != "registry/CHANGELOG.md" for p in changed)
     if not registry_changed:
@@ -615,56 +705,158 @@ def gate_registry_change_discipline() -> GateResult:
     )
 
 
-def gate_raw_manifest_validity() -> GateResult:
+RAW_MANIFEST_REQUIRED_TOP_KEYS = {"source", "fetched_at_utc", "command", "files"}
+RAW_MANIFEST_REQUIRED_FILE_KEYS = {"path", "sha256", "bytes"}
+
+
+def _manifest_entry_failures(label: str, entry: object) -> list[str]:
+    if not isinstance(entry, dict):
+        return [f"{label}:not_object"]
+    missing_entry_keys = sorted(k for k in RAW_MANIFEST_REQUIRED_FILE_KEYS if k not in entry)
+    if missing_entry_keys:
+        return [f"{label}:missing_keys:{','.join(missing_entry_keys)}"]
+    sha = entry.get("sha256")
+    if isinstance(sha, str) and not re.fullmatch(r"[0-9a-f]{64}", sha):
+        return [f"{label}:invalid_sha256"]
+    return []
+
+
+def _compare_manifest_tree(tree: object, expected: dict[str, object]) -> list[str]:
+    if not isinstance(tree, dict):
+        return ["tree:not_object"]
+    failures: list[str] = []
+    if tree.get("root") != expected["root"]:
+        failures.append("tree:root_mismatch")
+    dirs = tree.get("dirs")
+    expected_dirs = expected["dirs"]
+    assert isinstance(expected_dirs, dict)
+    if not isinstance(dirs, dict):
+        failures.append("tree:dirs_not_object")
+    elif dirs != expected_dirs:
+        bad = sorted(d for d in set(dirs) | set(expected_dirs) if dirs.get(d) != expected_dirs.get(d))
+        failures.append(f"tree:dir_mismatch:{','.join(bad[:10])}")
+    return failures
+
+
+def _validate_manifest_tree(tree: object, files: list[object]) -> list[str]:
+    """Recompute the optional per-directory Merkle rollup from the leaf entries and compare."""
+    if not isinstance(tree, dict):
+        return ["tree:not_object"]
+    if tree.get("algorithm") != MERKLE_ALGORITHM:
+        return [f"tree:unsupported_algorithm:{tree.get('algorithm')}"]
+    root_path = tree.get("root_path")
+    if not isinstance(root_path, str):
+        return ["tree:missing_root_path"]
+    try:
+        expected = build_merkle_tree(root_path, (e for e in files if isinstance(e, dict)))
+    except (KeyError, TypeError, ValueError) as exc:
+        return [f"tree:leaves_invalid:{exc}"]
+    return _compare_manifest_tree(tree, expected)
+
+
+def _validate_json_manifest(path: Path, text: str) -> list[str]:
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as exc:
+        return [f"{path}:invalid_json:{exc}"]
+
+    if not isinstance(data, dict):
+        return [f"{path}:top_level_not_object"]
+
+    missing_keys = sorted(k for k in RAW_MANIFEST_REQUIRED_TOP_KEYS if k not in data)
+    if missing_keys:
+        return [f"{path}:missing_keys:{','.join(missing_keys)}"]
+
+    files = data.get("files")
+    if not isinstance(files, list):
+        return [f"{path}:files_not_list"]
+
+    failures: list[str] = []
+    for i, entry in enumerate(files):
+        failures.extend(_manifest_entry_failures(f"{path}:files[{i}]", entry))
+
+    tree = data.get("tree")
+    if tree is not None:
+        failures.extend(f"{path}:{f}" for f in _validate_manifest_tree(tree, files))
+    return failures
+
+
+def _validate_jsonl_manifest(path: Path) -> list[str]:
+    """Validate a streaming `.jsonl` manifest line by line.
+
+    Memory does not grow with the number of file entries: each line is parsed, checked, and
+    folded into a streaming Merkle builder, then compared with the trailer.
+    """
+    failures: list[str] = []
+    builder: MerkleBuilder | None = None
+    trailer: dict[str, object] | None = None
+    count = 0
+    with path.open("r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError as exc:
+                failures.append(f"{path}:line{lineno}:invalid_json:{exc}")
+                continue
+            if lineno == 1:
+                if not isinstance(obj, dict) or obj.get("kind") != "header":
+                    return [f"{path}:missing_header"]
+                if obj.get("format") != JSONL_MANIFEST_FORMAT:
+                    failures.append(f"{path}:unsupported_format:{obj.get('format')}")
+                missing_keys = sorted(k for k in RAW_MANIFEST_REQUIRED_TOP_KEYS - {"files"} if k not in obj)
+                if missing_keys:
+                    failures.append(f"{path}:missing_keys:{','.join(missing_keys)}")
+                snapshot_dir = obj.get("snapshot_dir")
+                if isinstance(snapshot_dir, str):
+                    builder = MerkleBuilder(snapshot_dir)
+                continue
+            if trailer is not None:
+                failures.append(f"{path}:line{lineno}:after_trailer")
+                break
+            if isinstance(obj, dict) and obj.get("kind") == "trailer":
+                trailer = obj
+                continue
+
+            entry_failures = _manifest_entry_failures(f"{path}:line{lineno}", obj)
+            failures.extend(entry_failures)
+            count += 1
+            if builder is not None and not entry_failures:
+                try:
+                    builder.add(str(obj["path"]), str(obj["sha256"]), int(obj["bytes"]))
+                except (TypeError, ValueError) as exc:
+                    failures.append(f"{path}:line{lineno}:tree_leaf_invalid:{exc}")
+                    builder = None
+
+    if trailer is None:
+        failures.append(f"{path}:missing_trailer")
+        return failures
+    if trailer.get("count") != count:
+        failures.append(f"{path}:count_mismatch:{trailer.get('count')}!={count}")
+    if builder is None:
+        failures.append(f"{path}:tree_unverifiable")
+    else:
+        failures.extend(f"{path}:{f}" for f in _compare_manifest_tree(trailer.get("tree"), builder.finish()))
+    return failures
+
+
+def gate_raw_manifest_validity(index: RepoIndex) -> GateResult:
     """Validate any tracked raw provenance manifests under data/raw_manifest/.
 
     This does not require raw snapshots to be present or hashed during gating;
     it only validates that any committed manifest JSON files are well-formed and
-    include required keys.
+    include required keys. `.jsonl` manifests are validated line by line.
     """
     failures: list[str] = []
     manifest_dir = Path("data/raw_manifest")
     if not manifest_dir.exists():
         return GateResult(ok=False, details={"missing": str(manifest_dir)})
 
-    manifest_paths = sorted(manifest_dir.glob("*.json"))
-    required_top_keys = {"source", "fetched_at_utc", "command", "files"}
-    required_file_keys = {"path", "sha256", "bytes"}
-
+    manifest_paths = sorted([*manifest_dir.glob("*.json"), *manifest_dir.glob("*.jsonl")])
     for path in manifest_paths:
-        try:
-            data = json.loads(_read_text(path))
-        except json.JSONDecodeError as exc:
-            failures.append(f"{path}:invalid_json:{exc}")
-            continue
-
-        if not isinstance(data, dict):
-            failures.append(f"{path}:top_level_not_object")
-            continue
-
-        missing_keys = sorted(k for k in required_top_keys if k not in data)
-        if missing_keys:
-            failures.append(f"{path}:missing_keys:{','.join(missing_keys)}")
-            continue
-
-        files = data.get("files")
-        if not isinstance(files, list):
-            failures.append(f"{path}:files_not_list")
-            continue
-
-        for i, entry in enumerate(files):
-            if not isinstance(entry, dict):
-                failures.append(f"{path}:files[{i}]:not_object")
-                continue
-            missing_entry_keys = sorted(k for k in required_file_keys if k not in entry)
-            if missing_entry_keys:
-                failures.append(
-                    f"{path}:files[{i}]:missing_keys:{','.join(missing_entry_keys)}"
-                )
-                continue
-            sha = entry.get("sha256")
-            if isinstance(sha, str) and not re.fullmatch(r"[0-9a-f]{64}", sha):
-                failures.append(f"{path}:files[{i}]:invalid_sha256")
+        if path.suffix == ".jsonl":
+            failures.extend(_validate_jsonl_manifest(path))
+        else:
+            failures.extend(_validate_json_manifest(path, index.text(path) or ""))
 
     return GateResult(
         ok=(len(failures) == 0),
@@ -672,80 +864,368 @@ def gate_raw_manifest_validity() -> GateResult:
     )
 
 
-def gate_panel_schema_nonempty() -> GateResult:
-    mode = _parse_project_mode(Path("contracts/project.yaml"))
+STR_SCHEMA = Path("contracts/schemas/panel_schema_str_v1.yaml")
+PANEL_SCHEMA_FILES = [STR_SCHEMA, Path("contracts/schemas/panel_schema_decomp_v1.yaml")]
+
+
+def gate_panel_schema_nonempty(index: RepoIndex) -> GateResult:
+    mode = index.project_mode
     if mode == "modeling":
         return GateResult(ok=True, details={"skipped": True, "mode": mode})
 
-    path = Path("contracts/schemas/panel_schema_str_v1.yaml")
-    if not path.exists():
+    path = STR_SCHEMA
+    text = index.text(path)
+    if text is None:
         return GateResult(ok=False, details={"missing": str(path), "mode": mode})
 
-    for raw_line in _read_text(path).splitlines():
+    nonempty = False
+    for raw_line in text.splitlines():
         line = raw_line.split("#", 1)[0].strip()
         if not line:
             continue
         if re.match(r"^[A-Za-z0-9_-]+\s*:", line):
-            return GateResult(ok=True, details={"path": str(path), "mode": mode})
-    return GateResult(ok=False, details={"path": str(path), "mode": mode, "failure": "comment_only"})
+            nonempty = True
+            break
+    if not nonempty:
+        return GateResult(ok=False, details={"path": str(path), "mode": mode, "failure": "comment_only"})
+
+    # Every present versioned schema must compile into a column validator.
+    failures: list[str] = []
+    compiled: dict[str, str] = {}
+    for schema_path in PANEL_SCHEMA_FILES:
+        schema_text = index.text(schema_path)
+        if schema_text is None:
+            continue
+        try:
+            compiled[str(schema_path)] = panel_schema.compile_schema(panel_schema.parse_schema(schema_text)).schema.table
+        except ValueError as exc:
+            failures.append(f"{schema_path}:invalid_schema:{exc}")
+    return GateResult(
+        ok=(len(failures) == 0),
+        details={"path": str(path), "mode": mode, "compiled": compiled, "failures": failures},
+    )
+
+
+PANEL_INTEGRITY_FILES = [
+    "data/samples/growthepie/vendor_daily_rollup_panel_sample.csv",
+    "data/processed/growthepie/vendor_daily_rollup_panel.csv",
+    "data/analysis_ready/*.csv",
+    # Parquet panels (src/etl/panel_store.py): one file per month partition, checked independently;
+    # the grain includes date_utc, so a key cannot repeat across months.
+    "data/processed/growthepie/vendor_daily_rollup_panel/month=*/*.parquet",
+    "data/analysis_ready/*.parquet",
+    "data/analysis_ready/*/month=*/*.parquet",
+]
+
+
+def _panel_cache_key(path: Path, index: RepoIndex, schema_text: str) -> str:
+    doc = {
+        "panel": str(path),
+        "code": _gate_code_version(),
+        "sha256": index.digest(path),
+        "schema": hashlib.sha256(schema_text.encode("utf-8")).hexdigest(),
+    }
+    return hashlib.sha256(json.dumps(doc, sort_keys=True).encode("utf-8")).hexdigest()
 
 
-def gate_sample_panel_integrity() -> GateResult:
-    """Best-effort integrity checks for committed golden samples (if present)."""
-    sample = Path("data/samples/growthepie/vendor_daily_rollup_panel_sample.csv")
-    if not sample.exists():
+def _validate_panel(compiled: panel_schema.CompiledSchema, path: Path) -> tuple[int, list[str]]:
+    if path.suffix == ".parquet" and importlib.util.find_spec("pyarrow") is None:
+        return 0, ["pyarrow_missing:pip install pyarrow to check Parquet panels"]
+    report = panel_schema.validate_file(compiled, path)
+    return report.rows, report.failures
+
+
+def gate_sample_panel_integrity(index: RepoIndex) -> GateResult:
+    """Validate the golden sample and any processed/analysis-ready panels against the STR panel schema.
+
+    Each panel goes through `panel_schema.validate_file` independently; with a result cache,
+    unchanged panels are not rescanned.
+    """
+    panels = [p for pattern in PANEL_INTEGRITY_FILES for p in sorted(Path().glob(pattern)) if p.is_file()]
+    if not panels:
         return GateResult(ok=True, details={"skipped": True, "reason": "sample_missing"})
 
-    required_cols = {"date_utc", "rollup_id", "l2_fees_eth", "rent_paid_eth"}
+    schema_text = index.text(STR_SCHEMA)
+    if schema_text is None:
+        return GateResult(ok=False, details={"missing": str(STR_SCHEMA)})
+    try:
+        compiled = panel_schema.compile_schema(panel_schema.parse_schema(schema_text))
+    except ValueError as exc:
+        return GateResult(ok=False, details={"failures": [f"{STR_SCHEMA}:invalid_schema:{exc}"]})
+
     failures: list[str] = []
+    rows: dict[str, int] = {}
+    for path in panels:
+        key = _panel_cache_key(path, index, schema_text) if index.cache is not None else None
+        cached = index.cache.get(key) if index.cache is not None and key is not None else None
+        if cached is not None:
+            n = int(cached.details.get("rows", 0))  # type: ignore[arg-type]
+            panel_failures = [str(x) for x in cached.details.get("failures", [])]  # type: ignore[union-attr]
+        else:
+            n, panel_failures = _validate_panel(compiled, path)
+            if index.cache is not None and key is not None:
+                details: dict[str, object] = {"rows": n, "failures": panel_failures}
+                index.cache.put(key, GateResult(ok=not panel_failures, details=details))
+        rows[str(path)] = n
+        failures.extend(f"{path}:{f}" for f in panel_failures)
+
+    return GateResult(ok=(len(failures) == 0), details={"panels": [str(p) for p in panels], "rows": rows, "failures": failures})
+
+
+Gate = Callable[[RepoIndex], GateResult]
+
+GATES: list[tuple[str, Gate]] = [
+    ("repo_structure", gate_repo_structure),
+    ("project_contract", gate_project_contract),
+    ("environment", gate_environment),
+    ("protocol_complete", gate_protocol_complete),
+    ("model_spec_complete", gate_model_spec_complete),
+    ("panel_schema_nonempty", gate_panel_schema_nonempty),
+    ("workstreams_complete", gate_workstreams_complete),
+    ("task_hygiene", gate_task_hygiene),
+    ("task_dependencies", gate_task_dependencies),
+    ("contract_change_discipline", gate_contract_change_discipline),
+    ("registry_change_discipline", gate_registry_change_discipline),
+    ("raw_manifest_validity", gate_raw_manifest_validity),
+    ("sample_panel_integrity", gate_sample_panel_integrity),
+]
+
+_TASK_INPUTS = [*(str(d) for d in TASK_DIRS), *(f"{d}/*.md" for d in TASK_DIRS)]
+
+# Paths (globs allowed) each gate reads. A gate's result is a pure function of these files and
+# the gate code, so it can be served from the cache when none of them changed. Gates that depend
+# on the runtime or on git state are absent and always run.
+GATE_INPUTS: dict[str, list[str]] = {
+    "repo_structure": [str(p) for p in [*REPO_STRUCTURE_REQUIRED, *REPO_STRUCTURE_EMPIRICAL, *REPO_STRUCTURE_MODELING]],
+    "project_contract": [str(PROJECT_YAML)],
+    "protocol_complete": [str(PROJECT_YAML), "docs/protocol.md"],
+    "model_spec_complete": [
+        str(PROJECT_YAML),
+        "contracts/model_spec.md",
+        "contracts/model_spec.yaml",
+        "contracts/model_spec.yml",
+    ],
+    "panel_schema_nonempty": [str(PROJECT_YAML), *(str(p) for p in PANEL_SCHEMA_FILES)],
+    "workstreams_complete": [".orchestrator/workstreams.md"],
+    "task_hygiene": _TASK_INPUTS,
+    "task_dependencies": _TASK_INPUTS,
+    "raw_manifest_validity": ["data/raw_manifest", "data/raw_manifest/*.json", "data/raw_manifest/*.jsonl"],
+    "sample_panel_integrity": [*PANEL_INTEGRITY_FILES, str(STR_SCHEMA)],
+}
+
+GATE_CACHE_DIR = Path("data/tmp/gate_cache")
+GATE_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _gate_code_version() -> str:
+    """Fingerprint of the gate implementation (this module and the helper modules it imports)."""
+    h = hashlib.sha256()
+    modules = [sys.modules[__name__], sys.modules[MerkleBuilder.__module__], panel_schema]
+    for path in sorted({Path(m.__file__ or "").resolve() for m in modules}):
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def gate_cache_key(name: str, index: RepoIndex) -> str | None:
+    """Hash of the gate name, code version, and the content of every declared input (None if uncacheable)."""
+    patterns = GATE_INPUTS.get(name)
+    if patterns is None:
+        return None
+    inputs: list[object] = []
+    for pattern in patterns:
+        if any(c in pattern for c in "*?["):
+            paths = sorted(Path().glob(pattern))
+        else:
+            paths = [Path(pattern)]
+        inputs.append([pattern, [[str(p), index.digest(p)] for p in paths]])
+    doc = {"gate": name, "code": _gate_code_version(), "inputs": inputs}
+    return hashlib.sha256(json.dumps(doc, sort_keys=True).encode("utf-8")).hexdigest()
 
-    rows: list[dict[str, str]] = []
-    with sample.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        if reader.fieldnames is None:
-            return GateResult(ok=False, details={"failures": ["missing_header"]})
-        cols = set(reader.fieldnames)
-        missing = sorted(c for c in required_cols if c not in cols)
-        if missing:
-            failures.append(f"missing_columns:{','.join(missing)}")
-        for row in reader:
-            rows.append(row)
-
-    # Non-negativity (where parseable).
-    for i, row in enumerate(rows[:2000]):  # safety cap for gates
-        for col in ["l2_fees_eth", "rent_paid_eth", "profit_eth"]:
-            if col not in row or row[col] in ("", None):
-                continue
+
+class GateCache:
+    """Content-addressed gate results under `data/tmp/gate_cache/` with size-bounded LRU eviction.
+
+    An entry's mtime is its last use (touched on every hit); eviction removes the least recently
+    used entries until the directory fits in `max_bytes`. A digest index maps each input file's
+    stat fingerprint to its sha256, so cache keys of unchanged files cost a stat, not a read.
+    """
+
+    def __init__(self, cache_dir: Path = GATE_CACHE_DIR, *, max_bytes: int = GATE_CACHE_MAX_BYTES) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._digest_lock = threading.Lock()
+        self._digests: dict[str, list[object]] | None = None
+        self._digests_dirty = False
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    @property
+    def _digest_index_path(self) -> Path:
+        # Outside the `*.json` entries, so LRU eviction never drops it.
+        return self.cache_dir / "digests" / "files.json"
+
+    def _load_digests(self) -> dict[str, list[object]]:
+        if self._digests is None:
+            try:
+                data = json.loads(_read_text(self._digest_index_path))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            self._digests = data if isinstance(data, dict) else {}
+        return self._digests
+
+    def known_digest(self, path: Path, fingerprint: list[int]) -> str | None:
+        """sha256 recorded for `path` by an earlier run, if its stat fingerprint is unchanged."""
+        with self._digest_lock:
+            entry = self._load_digests().get(str(path))
+        if isinstance(entry, list) and len(entry) == 4 and entry[:3] == fingerprint and isinstance(entry[3], str):
+            return entry[3]
+        return None
+
+    def record_digest(self, path: Path, fingerprint: list[int], sha256: str) -> None:
+        with self._digest_lock:
+            self._load_digests()[str(path)] = [*fingerprint, sha256]
+            self._digests_dirty = True
+
+    def save_digests(self) -> None:
+        """Persist the digest index (dropping files that no longer exist) if this run changed it."""
+        with self._digest_lock:
+            if not self._digests_dirty or self._digests is None:
+                return
+            kept = {p: e for p, e in self._digests.items() if Path(p).is_file()}
+            path = self._digest_index_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(kept, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, path)
+            self._digests_dirty = False
+
+    def get(self, key: str) -> GateResult | None:
+        path = self._path(key)
+        try:
+            data = json.loads(_read_text(path))
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("details"), dict):
+            return None
+        return GateResult(ok=bool(data.get("ok")), details=data["details"])
+
+    def put(self, key: str, result: GateResult) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        details = {k: v for k, v in result.details.items() if k not in {"elapsed_seconds", "cache"}}
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps({"ok": result.ok, "details": details}, sort_keys=True, default=str), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def evict(self) -> list[str]:
+        """Drop least recently used entries until the cache fits in `max_bytes`; returns evicted keys."""
+        entries = []
+        for p in self.cache_dir.glob("*.json"):
             try:
-                v = float(row[col])
-            except ValueError:
-                failures.append(f"row{i}:invalid_number:{col}")
+                st = p.stat()
+            except OSError:
                 continue
-            if v < 0:
-                failures.append(f"row{i}:negative:{col}")
-
-    return GateResult(ok=(len(failures) == 0), details={"sample": str(sample), "failures": failures})
-
-
-def main() -> None:
-    results = {
-        "repo_structure": gate_repo_structure(),
-        "project_contract": gate_project_contract(),
-        "environment": gate_environment(),
-        "protocol_complete": gate_protocol_complete(),
-        "model_spec_complete": gate_model_spec_complete(),
-        "panel_schema_nonempty": gate_panel_schema_nonempty(),
-        "workstreams_complete": gate_workstreams_complete(),
-        "task_hygiene": gate_task_hygiene(),
-        "task_dependencies": gate_task_dependencies(),
-        "contract_change_discipline": gate_contract_change_discipline(),
-        "registry_change_discipline": gate_registry_change_discipline(),
-        "raw_manifest_validity": gate_raw_manifest_validity(),
-        "sample_panel_integrity": gate_sample_panel_integrity(),
-    }
+            entries.append((st.st_mtime_ns, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        evicted: list[str] = []
+        for _, size, p in sorted(entries, key=lambda e: (e[0], e[2].name)):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            evicted.append(p.stem)
+        return evicted
+
+
+def _run_timed(gate: Gate, index: RepoIndex, name: str = "", cache: GateCache | None = None) -> GateResult:
+    start = time.perf_counter()
+    key = gate_cache_key(name, index) if cache is not None else None
+    cached = cache.get(key) if cache is not None and key is not None else None
+    if cached is not None:
+        result = cached
+        result.details["cache"] = "hit"
+    else:
+        try:
+            result = gate(index)
+        except Exception as exc:  # a crashing gate is a failing gate, not a crashed runner
+            result = GateResult(ok=False, details={"error": f"{type(exc).__name__}: {exc}"})
+        else:
+            if cache is not None and key is not None:
+                cache.put(key, result)
+                result.details["cache"] = "miss"
+    result.details["elapsed_seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def select_gates(
+    only: list[str] | None = None,
+    skip: list[str] | None = None,
+) -> list[tuple[str, Gate]]:
+    known = [name for name, _ in GATES]
+    unknown = sorted(set(only or []).union(skip or []) - set(known))
+    if unknown:
+        raise SystemExit(f"Unknown gate(s): {', '.join(unknown)} (known: {', '.join(known)})")
+    skipped = set(skip or [])
+    return [(name, fn) for name, fn in GATES if (not only or name in only) and name not in skipped]
+
+
+def run_gates(
+    gates: list[tuple[str, Gate]],
+    *,
+    workers: int,
+    index: RepoIndex | None = None,
+    cache: GateCache | None = None,
+) -> dict[str, GateResult]:
+    """Run gates concurrently (they are independent and read-only); results keep declaration order.
+
+    All gates share one `RepoIndex`, so each input file is read and parsed once per run. With a
+    `cache`, gates whose declared inputs are unchanged are answered from it instead of re-run.
+    """
+    index = index or RepoIndex(cache=cache)
+    if workers <= 1:
+        results = {name: _run_timed(fn, index, name, cache) for name, fn in gates}
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gate") as pool:
+            futures = {name: pool.submit(_run_timed, fn, index, name, cache) for name, fn in gates}
+            results = {name: fut.result() for name, fut in futures.items()}
+    if cache is not None:
+        cache.save_digests()
+        cache.evict()
+    return results
+
+
+def _split_names(values: list[str]) -> list[str]:
+    return [n.strip() for v in values for n in v.split(",") if n.strip()]
+
+
+def main(argv: list[str] | None = None) -> None:
+    p = argparse.ArgumentParser(prog="quality_gates.py")
+    p.add_argument("--only", action="append", default=[], help="Run only these gates (comma-separated, repeatable)")
+    p.add_argument("--skip", action="append", default=[], help="Skip these gates (comma-separated, repeatable)")
+    p.add_argument("--workers", type=int, default=8, help="Concurrent gates (1 = serial)")
+    p.add_argument("--json", dest="as_json", action="store_true", help="Print one machine-readable JSON document")
+    p.add_argument("--no-cache", action="store_true", help=f"Re-run every gate; ignore {GATE_CACHE_DIR}/")
+    args = p.parse_args(sys.argv[1:] if argv is None else argv)
+
+    start = time.perf_counter()
+    gates = select_gates(_split_names(args.only), _split_names(args.skip))
+    results = run_gates(gates, workers=args.workers, cache=None if args.no_cache else GateCache())
     ok = all(r.ok for r in results.values())
-    for name, r in results.items():
-        print(f"[{name}] ok={r.ok} details={r.details}")
+    if args.as_json:
+        payload = {
+            "ok": ok,
+            "elapsed_seconds": round(time.perf_counter() - start, 4),
+            "failed": [name for name, r in results.items() if not r.ok],
+            "cached": [name for name, r in results.items() if r.details.get("cache") == "hit"],
+            "gates": {name: {"ok": r.ok, "details": r.details} for name, r in results.items()},
+        }
+        print(json.dumps(payload, indent=2, sort_keys=True, default=str))
+    else:
+        for name, r in results.items():
+            print(f"[{name}] ok={r.ok} details={r.details}")
     raise SystemExit(0 if ok else 1)
 
 
@@ -22,21 +22,28 @@ Safety:
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import dataclasses
 import datetime as _dt
+import hashlib
 import json
 import os
 from pathlib import Path
 import re
 import shlex
+import shutil
+import signal
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 
 VALID_TASK_STATES = {"backlog", "active", "blocked", "ready_for_review", "done"}
 VALID_TASK_PRIORITIES = {"low", "medium", "high"}
+LIFECYCLE_DIRS = ["active", "backlog", "ready_for_review", "blocked", "done"]
 
 
 @dataclasses.dataclass(frozen=True)
@@ -49,6 +56,7 @@ class Task:
     priority: str
     dependencies: list[str]
     parallel_ok: bool
+    parallel_gates: bool
     allowed_paths: list[str]
     disallowed_paths: list[str]
     outputs: list[str]
@@ -192,6 +200,11 @@ def _coerce_list(value: object) -> list[str]:
     return []
 
 
+def _get_flag(fm: dict[str, object], key: str) -> bool:
+    raw = fm.get(key)
+    return isinstance(raw, str) and raw.strip().lower() in {"1", "true", "yes"}
+
+
 def load_task(path: Path) -> Task:
     text = _read_text(path)
     fm = _parse_task_frontmatter(text)
@@ -211,10 +224,8 @@ def load_task(path: Path) -> Task:
     priority = _get_str("priority").lower()
 
     dependencies = _coerce_list(fm.get("dependencies"))
-    parallel_ok = False
-    raw_parallel_ok = fm.get("parallel_ok")
-    if isinstance(raw_parallel_ok, str):
-        parallel_ok = raw_parallel_ok.strip().lower() in {"1", "true", "yes"}
+    parallel_ok = _get_flag(fm, "parallel_ok")
+    parallel_gates = _get_flag(fm, "parallel_gates")
     allowed_paths = _coerce_list(fm.get("allowed_paths"))
     disallowed_paths = _coerce_list(fm.get("disallowed_paths"))
     outputs = _coerce_list(fm.get("outputs"))
@@ -233,6 +244,7 @@ def load_task(path: Path) -> Task:
         priority=priority,
         dependencies=dependencies,
         parallel_ok=parallel_ok,
+        parallel_gates=parallel_gates,
         allowed_paths=allowed_paths,
         disallowed_paths=disallowed_paths,
         outputs=outputs,
@@ -263,95 +275,476 @@ def task_dir(name: str) -> Path:
     return _repo_root() / ".orchestrator" / name
 
 
-def done_task_ids() -> set[str]:
-    out: set[str] = set()
+# Parsed tasks keyed by path, valid while the file's (mtime_ns, size) is unchanged. Lives for the
+# whole process, so `loop` only re-parses task files that changed since the previous tick.
+_TASK_PARSE_CACHE: dict[Path, tuple[tuple[int, int], Task | None, str | None]] = {}
+
+
+def load_task_cached(path: Path) -> tuple[Task | None, str | None]:
+    """`load_task` memoized on file mtime/size; returns (task, error)."""
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _TASK_PARSE_CACHE.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1], hit[2]
+    try:
+        task, err = load_task(path), None
+    except (OSError, ValueError) as exc:
+        task, err = None, str(exc)
+    _TASK_PARSE_CACHE[path] = (key, task, err)
+    return task, err
+
+
+@dataclasses.dataclass
+class TaskIndex:
+    """All task files under `.orchestrator/`, parsed once per tick, with O(1) lookups."""
+
+    tasks: list[Task]
+    by_id: dict[str, Task]
+    by_state: dict[str, list[Task]]
+    by_workstream: dict[str, list[Task]]
+    by_folder: dict[str, list[Task]]
+    errors: dict[str, str]
+
+    @classmethod
+    def build(cls, repo: Path | None = None) -> TaskIndex:
+        orch = (repo or _repo_root()) / ".orchestrator"
+        index = cls(tasks=[], by_id={}, by_state={}, by_workstream={}, by_folder={}, errors={})
+        seen: set[Path] = set()
+        for sub in LIFECYCLE_DIRS:
+            index.by_folder[sub] = []
+            for p in iter_task_files(orch / sub):
+                seen.add(p)
+                task, err = load_task_cached(p)
+                if task is None:
+                    index.errors[str(p)] = err or "unparseable"
+                    continue
+                index.tasks.append(task)
+                index.by_folder[sub].append(task)
+                # Lifecycle order decides ties (e.g. a task mid-move exists in two folders).
+                index.by_id.setdefault(task.task_id, task)
+                index.by_state.setdefault(task.state or "", []).append(task)
+                index.by_workstream.setdefault(task.workstream, []).append(task)
+        for stale in [p for p in _TASK_PARSE_CACHE if p.is_relative_to(orch) and p not in seen]:
+            del _TASK_PARSE_CACHE[stale]
+        for path, err in sorted(index.errors.items()):
+            print(f"[tasks] skipping {path}: {err}", file=sys.stderr)
+        return index
+
+    def get(self, task_id: str) -> Task | None:
+        return self.by_id.get(task_id)
+
+    def with_state(self, state: str) -> list[Task]:
+        return self.by_state.get(state, [])
+
+    def in_workstream(self, workstream: str) -> list[Task]:
+        return self.by_workstream.get(workstream, [])
+
+
+def done_task_ids(index: TaskIndex | None = None) -> set[str]:
     # State-based completion: treat tasks as "done" if their `State:` is `done`,
     # regardless of which lifecycle folder they currently live in. Folder moves are
     # still useful for hygiene, but should not be required for dependency progress.
-    for sub in ["active", "backlog", "ready_for_review", "blocked", "done"]:
-        for t in list_tasks(task_dir(sub)):
-            if t.state == "done":
-                out.add(t.task_id)
-    return out
+    index = index or TaskIndex.build()
+    return {t.task_id for t in index.with_state("done")}
+
+
+class ReadySet:
+    """Backlog tasks whose dependencies are all done, maintained incrementally across ticks.
+
+    `update()` diffs the index against the previous one by Task identity (unchanged files keep their
+    cached Task object), so only edited tasks and the dependents of tasks whose done-ness flipped are
+    re-examined. `verify()` checks the result against a full recompute.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[Path, Task] = {}
+        self._done_copies: dict[str, int] = {}  # task_id -> task files with `State: done`
+        self._dependents: dict[str, set[Path]] = {}  # dependency task_id -> task files listing it
+        self._ready: set[Path] = set()
+        self.examined = 0
+
+    def _add(self, task: Task) -> None:
+        self._tasks[task.path] = task
+        if task.state == "done":
+            self._done_copies[task.task_id] = self._done_copies.get(task.task_id, 0) + 1
+        for dep in task.dependencies:
+            self._dependents.setdefault(dep, set()).add(task.path)
+
+    def _remove(self, task: Task) -> None:
+        del self._tasks[task.path]
+        if task.state == "done":
+            self._done_copies[task.task_id] -= 1
+            if not self._done_copies[task.task_id]:
+                del self._done_copies[task.task_id]
+        for dep in task.dependencies:
+            self._dependents[dep].discard(task.path)
+            if not self._dependents[dep]:
+                del self._dependents[dep]
+
+    def _recheck(self, path: Path) -> None:
+        t = self._tasks.get(path)
+        if (
+            t is not None
+            and path.parent.name == "backlog"
+            and t.state == "backlog"
+            and all(dep in self._done_copies for dep in t.dependencies)
+        ):
+            self._ready.add(path)
+        else:
+            self._ready.discard(path)
+
+    def update(self, index: TaskIndex) -> None:
+        current = {t.path: t for t in index.tasks}
+        dirty: set[Path] = set()
+        touched: dict[str, bool] = {}  # task_id -> was done before this update
+        for path, old in list(self._tasks.items()):
+            if current.get(path) is not old:
+                touched.setdefault(old.task_id, old.task_id in self._done_copies)
+                self._remove(old)
+                dirty.add(path)
+        for path, task in current.items():
+            if self._tasks.get(path) is not task:
+                touched.setdefault(task.task_id, task.task_id in self._done_copies)
+                self._add(task)
+                dirty.add(path)
+        for task_id, was_done in touched.items():
+            if was_done != (task_id in self._done_copies):
+                dirty |= self._dependents.get(task_id, set())
+        for path in dirty:
+            self._recheck(path)
+        self.examined = len(dirty)
+
+    def done_ids(self) -> set[str]:
+        return set(self._done_copies)
+
+    def ready(self, claimed_ids: set[str]) -> list[Task]:
+        return [self._tasks[p] for p in sorted(self._ready) if self._tasks[p].task_id not in claimed_ids]
+
+    def verify(self, index: TaskIndex) -> None:
+        full_done = done_task_ids(index)
+        full_ready = [t.path for t in ready_backlog_tasks(done_ids=full_done, claimed_ids=set(), index=index)]
+        ours = [t.path for t in self.ready(set())]
+        if full_done != self.done_ids() or full_ready != ours:
+            raise RuntimeError(
+                "incremental ready set diverged from full recompute: "
+                f"done +{sorted(self.done_ids() - full_done)} -{sorted(full_done - self.done_ids())}, "
+                f"ready +{sorted(map(str, set(ours) - set(full_ready)))} -{sorted(map(str, set(full_ready) - set(ours)))}"
+            )
+
+
+# Survives between `loop` iterations (ticks run in-process).
+_READY_SET: ReadySet | None = None
+
+
+def incremental_ready_set(index: TaskIndex, *, verify: bool = False) -> ReadySet:
+    global _READY_SET
+    if _READY_SET is None:
+        _READY_SET = ReadySet()
+    _READY_SET.update(index)
+    if verify:
+        _READY_SET.verify(index)
+    return _READY_SET
 
 
 def _parse_task_id_from_branch(name: str) -> str | None:
-    m = re.match(r"^(T\d{3})\b", name)
+    m = re.match(r"^(T\d{3})(?![0-9A-Za-z])", name)
     return m.group(1) if m else None
 
 
-def claimed_task_ids(remote: str, base_branch: str) -> set[str]:
-    """Detect claimed tasks via open PRs (preferred) or remote branches (fallback)."""
-    claimed: set[str] = set()
+def _branch_claims(branches: Iterable[str]) -> set[str]:
+    return {tid for b in branches if (tid := _parse_task_id_from_branch(b)) is not None}
 
-    # Local fallback (no network): any task-prefixed branch currently attached to a worktree.
-    try:
+
+def _probe_worktree_claims(remote: str, base_branch: str, timeout_seconds: float) -> set[str]:
+    # Local (no network): any task-prefixed branch currently attached to a worktree.
+    cp = _run(
+        ["git", "worktree", "list", "--porcelain"],
+        capture=True,
+        check=True,
+        cwd=_repo_root(),
+        timeout_seconds=timeout_seconds,
+    )
+    refs = [line.split(" ", 1)[1].strip() for line in (cp.stdout or "").splitlines() if line.startswith("branch ")]
+    return _branch_claims(r.removeprefix("refs/heads/") for r in refs if r.startswith("refs/heads/"))
+
+
+def _gh() -> str | None:
+    """The `gh` executable; `SWARM_GH` swaps in a stand-in such as `scripts/fake_gh.py`."""
+    return os.environ.get("SWARM_GH") or _which_or_none("gh")
+
+
+PR_CACHE_PATH = Path("data/tmp/gh_pr_cache.json")
+PR_CACHE_TTL_SECONDS = 60.0
+# Check rollups and mergeability change without touching the PR list ETag; refetch them at least this often.
+PR_CACHE_MAX_AGE_SECONDS = 900.0
+PR_LIST_FIELDS = "number,headRefName,url,updatedAt,mergeable,statusCheckRollup"
+PR_LIST_LIMIT = 200
+PR_REST_PAGE_SIZE = 100
+
+
+class PRStateCache:
+    """Open task PRs for a base branch, fetched with one `gh pr list` and shared by claims and repairs.
+
+    Entries persist in `data/tmp/gh_pr_cache.json` with their fetch time and the REST list ETag. Within
+    the TTL no call is made; after it, a conditional `GET /pulls` (`If-None-Match`) runs instead: a 304
+    revalidates the entry without spending rate limit, and a 200 replaces the list from the REST body
+    (check rollups and mergeability carry over for PRs whose `updatedAt` is unchanged). The full query
+    only runs when the entry is older than `max_age_seconds` or the conditional request fails.
+    """
+
+    def __init__(self, path: Path, *, ttl_seconds: float, max_age_seconds: float = PR_CACHE_MAX_AGE_SECONDS) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self.stats = {"hits": 0, "not_modified": 0, "list_changed": 0, "fetches": 0}
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, data: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def _store(self, base_branch: str, entry: dict[str, Any], outcome: str) -> list[dict[str, Any]]:
+        with self._lock:
+            data = self._load()
+            data[base_branch] = entry
+            self._save(data)
+            self.stats[outcome] += 1
+        return list(entry["prs"])
+
+    @staticmethod
+    def _conditional_list(
+        gh: str, base_branch: str, etag: str | None, timeout_seconds: float | None
+    ) -> tuple[int | None, str | None, list[dict[str, Any]] | None]:
+        """(HTTP status, ETag, REST body for a 200) of the open-PR list; (None, None, None) when the probe fails."""
+        cmd = [gh, "api", "-i", f"repos/{{owner}}/{{repo}}/pulls?state=open&base={base_branch}&per_page={PR_REST_PAGE_SIZE}"]
+        if etag:
+            cmd.extend(["-H", f"If-None-Match: {etag}"])
+        try:
+            cp = _run(cmd, capture=True, check=False, cwd=_repo_root(), timeout_seconds=timeout_seconds)
+        except (OSError, subprocess.TimeoutExpired):
+            return None, None, None
+        head, _, body = (cp.stdout or "").replace("\r\n", "\n").partition("\n\n")
+        lines = head.splitlines()
+        m = re.match(r"^HTTP/\S+\s+(\d{3})", lines[0]) if lines else None
+        if m is None:
+            return None, None, None
+        new_etag = next((ln.split(":", 1)[1].strip() for ln in lines[1:] if ln.lower().startswith("etag:")), None)
+        items: list[dict[str, Any]] | None = None
+        if m.group(1) == "200":
+            try:
+                decoded = json.loads(body)
+            except ValueError:
+                decoded = None
+            if isinstance(decoded, list):
+                items = [item for item in decoded if isinstance(item, dict)]
+        return int(m.group(1)), new_etag, items
+
+    @staticmethod
+    def _from_rest(item: dict[str, Any], previous: dict[Any, dict[str, Any]]) -> dict[str, Any]:
+        head = item.get("head")
+        pr = {
+            "number": item.get("number"),
+            "headRefName": head.get("ref") if isinstance(head, dict) else None,
+            "url": item.get("html_url"),
+            "updatedAt": item.get("updated_at"),
+        }
+        old = previous.get(pr["number"])
+        if old is not None and old.get("updatedAt") == pr["updatedAt"]:
+            pr.update((k, old[k]) for k in ("mergeable", "statusCheckRollup") if k in old)
+        return pr
+
+    def open_prs(self, base_branch: str, *, timeout_seconds: float | None = None) -> list[dict[str, Any]]:
+        with self._lock:
+            entry = self._load().get(base_branch)
+            now = time.time()
+            if isinstance(entry, dict) and now - float(entry.get("validated_at", 0)) < self.ttl_seconds:
+                self.stats["hits"] += 1
+                return list(entry["prs"])
+        # gh runs outside the lock: concurrent callers may both refresh, and the last write wins.
+        gh = _gh()
+        if gh is None:
+            raise FileNotFoundError("gh not found")
+        if isinstance(entry, dict) and now - float(entry.get("fetched_at", 0)) < self.max_age_seconds:
+            status, etag, items = self._conditional_list(gh, base_branch, entry.get("etag"), timeout_seconds)
+            if status == 304:
+                return self._store(base_branch, {**entry, "validated_at": now}, "not_modified")
+            if status == 200 and items is not None and len(items) < PR_REST_PAGE_SIZE:  # a full page may be truncated
+                previous = {pr.get("number"): pr for pr in entry["prs"] if isinstance(pr, dict)}
+                prs = [self._from_rest(item, previous) for item in items]
+                return self._store(base_branch, {**entry, "validated_at": now, "etag": etag, "prs": prs}, "list_changed")
         cp = _run(
-            ["git", "worktree", "list", "--porcelain"],
+            [
+                gh,
+                "pr",
+                "list",
+                "--state",
+                "open",
+                "--base",
+                base_branch,
+                "--limit",
+                str(PR_LIST_LIMIT),
+                "--json",
+                PR_LIST_FIELDS,
+            ],
             capture=True,
             check=True,
             cwd=_repo_root(),
+            timeout_seconds=timeout_seconds,
         )
-        for line in (cp.stdout or "").splitlines():
-            if not line.startswith("branch "):
-                continue
-            ref = line.split(" ", 1)[1].strip()
-            if ref.startswith("refs/heads/"):
-                branch = ref.removeprefix("refs/heads/")
-                tid = _parse_task_id_from_branch(branch)
-                if tid is not None:
-                    claimed.add(tid)
-    except Exception:
-        pass
+        prs = json.loads(cp.stdout or "[]")
+        if not isinstance(prs, list):
+            prs = []
+        prs = [pr for pr in prs if isinstance(pr, dict)]
+        # No ETag yet: the next conditional request fetches one along with the REST list.
+        return self._store(base_branch, {"fetched_at": now, "validated_at": now, "etag": None, "prs": prs}, "fetches")
 
-    gh = _which_or_none("gh")
-    if gh is not None:
-        try:
-            cp = _run(
-                [gh, "pr", "list", "--state", "open", "--base", base_branch, "--json", "headRefName"],
-                capture=True,
-                check=True,
-                cwd=_repo_root(),
-            )
-            prs = json.loads(cp.stdout or "[]")
-            if isinstance(prs, list):
-                for pr in prs:
-                    if not isinstance(pr, dict):
-                        continue
-                    head = pr.get("headRefName")
-                    if isinstance(head, str):
-                        tid = _parse_task_id_from_branch(head)
-                        if tid is not None:
-                            claimed.add(tid)
-        except Exception:
-            pass
 
+_PR_CACHE: PRStateCache | None = None
+
+
+def _pr_cache(ttl_seconds: float | None = None) -> PRStateCache:
+    global _PR_CACHE
+    if _PR_CACHE is None:
+        _PR_CACHE = PRStateCache(_repo_root() / PR_CACHE_PATH, ttl_seconds=PR_CACHE_TTL_SECONDS)
+    if ttl_seconds is not None:
+        _PR_CACHE.ttl_seconds = ttl_seconds
+    return _PR_CACHE
+
+
+def _probe_pr_claims(remote: str, base_branch: str, timeout_seconds: float) -> set[str]:
+    # Preferred: open PRs against the base branch (shared with the repair loop via the PR cache).
+    prs = _pr_cache().open_prs(base_branch, timeout_seconds=timeout_seconds)
+    heads = [pr.get("headRefName") for pr in prs]
+    return _branch_claims(h for h in heads if isinstance(h, str))
+
+
+def _probe_remote_branch_claims(remote: str, base_branch: str, timeout_seconds: float) -> set[str]:
     # Fallback: any remote branch with prefix T###_
-    try:
-        cp = _run(
-            ["git", "ls-remote", "--heads", remote, "T[0-9][0-9][0-9]_*"],
-            capture=True,
-            check=True,
-            cwd=_repo_root(),
-        )
-        for line in (cp.stdout or "").splitlines():
-            parts = line.split("\t")
-            if len(parts) != 2:
-                continue
-            ref = parts[1].strip()
-            if ref.startswith("refs/heads/"):
-                branch = ref.removeprefix("refs/heads/")
-                tid = _parse_task_id_from_branch(branch)
-                if tid is not None:
-                    claimed.add(tid)
-    except Exception:
-        pass
+    cp = _run(
+        ["git", "ls-remote", "--heads", remote, "T[0-9][0-9][0-9]_*"],
+        capture=True,
+        check=True,
+        cwd=_repo_root(),
+        timeout_seconds=timeout_seconds,
+    )
+    refs = [parts[1].strip() for line in (cp.stdout or "").splitlines() if len(parts := line.split("\t")) == 2]
+    return _branch_claims(r.removeprefix("refs/heads/") for r in refs if r.startswith("refs/heads/"))
+
+
+ClaimProbe = Callable[[str, str, float], set[str]]
+
+# (name, probe, is_remote). Remote probes fall back to their last good answer when they fail.
+CLAIM_PROBES: list[tuple[str, ClaimProbe, bool]] = [
+    ("worktrees", _probe_worktree_claims, False),
+    ("open_prs", _probe_pr_claims, True),
+    ("remote_branches", _probe_remote_branch_claims, True),
+]
+CLAIM_PROBE_TIMEOUT_SECONDS = 20.0
+CLAIM_CACHE_MAX_AGE_SECONDS = 900.0
+
+# Last successful remote probe answers for this process: (probe, remote, base) -> (monotonic time, ids).
+_REMOTE_CLAIMS_CACHE: dict[tuple[str, str, str], tuple[float, set[str]]] = {}
+
+# Probes that need an external tool; skipped quietly when it is not installed.
+CLAIM_PROBE_TOOLS: dict[str, Callable[[], str | None]] = {"open_prs": _gh}
+
+# One long-lived pool with a thread per probe. A hung probe keeps its thread, and later ticks wait on
+# its in-flight future instead of stacking another call behind it.
+_CLAIM_PROBE_POOL: ThreadPoolExecutor | None = None
+_CLAIM_PROBE_INFLIGHT: dict[tuple[str, str, str], Future[tuple[set[str], float]]] = {}
+
+
+def _claim_probe_future(
+    name: str, probe: ClaimProbe, remote: str, base_branch: str, timeout_seconds: float
+) -> Future[tuple[set[str], float]]:
+    global _CLAIM_PROBE_POOL
+    key = (name, remote, base_branch)
+    fut = _CLAIM_PROBE_INFLIGHT.get(key)
+    if fut is not None and not fut.done():
+        return fut
+    if _CLAIM_PROBE_POOL is None:
+        _CLAIM_PROBE_POOL = ThreadPoolExecutor(max_workers=len(CLAIM_PROBES), thread_name_prefix="claim-probe")
+    fut = _CLAIM_PROBE_POOL.submit(_timed_probe, probe, remote, base_branch, timeout_seconds)
+    _CLAIM_PROBE_INFLIGHT[key] = fut
+    return fut
+
+
+def _timed_probe(probe: ClaimProbe, remote: str, base_branch: str, timeout_seconds: float) -> tuple[set[str], float]:
+    start = time.monotonic()
+    ids = probe(remote, base_branch, timeout_seconds)
+    return ids, time.monotonic() - start
+
 
+def claimed_task_ids(
+    remote: str,
+    base_branch: str,
+    *,
+    timeout_seconds: float = CLAIM_PROBE_TIMEOUT_SECONDS,
+    stats: list[dict[str, Any]] | None = None,
+) -> set[str]:
+    """Detect claimed tasks via worktrees, open PRs and remote branches, probed concurrently.
+
+    Each probe gets `timeout_seconds`. A remote probe that fails or times out contributes its last
+    successful answer (if younger than CLAIM_CACHE_MAX_AGE_SECONDS) so a slow remote cannot stall
+    the tick. A probe still running from an earlier tick is waited on rather than started again, and
+    probes whose CLI is missing (see CLAIM_PROBE_TOOLS) are skipped. Per-probe latency/outcome is
+    appended to `stats` when given.
+    """
+    claimed: set[str] = set()
+    start = time.monotonic()
+    futures: list[tuple[str, bool, Future[tuple[set[str], float]] | None]] = []
+    for name, probe, is_remote in CLAIM_PROBES:
+        tool = CLAIM_PROBE_TOOLS.get(name)
+        if tool is not None and tool() is None:
+            futures.append((name, is_remote, None))
+        else:
+            futures.append((name, is_remote, _claim_probe_future(name, probe, remote, base_branch, timeout_seconds)))
+    for name, is_remote, fut in futures:
+        # A timed-out child can hold its pipes open (e.g. ssh under git); never wait past the budget.
+        remaining = max(0.0, timeout_seconds + 1.0 - (time.monotonic() - start))
+        entry: dict[str, Any] = {"probe": name, "remote": is_remote}
+        if fut is None:
+            ids = set()
+            entry.update(ok=True, seconds=0.0, count=0, source="skipped")
+        else:
+            try:
+                ids, seconds = fut.result(timeout=remaining)
+                entry.update(ok=True, seconds=round(seconds, 3), count=len(ids), source="live")
+                if is_remote:
+                    _REMOTE_CLAIMS_CACHE[(name, remote, base_branch)] = (time.monotonic(), ids)
+            except Exception as exc:
+                timed_out = isinstance(exc, (FutureTimeoutError, subprocess.TimeoutExpired))
+                entry.update(
+                    ok=False,
+                    seconds=round(time.monotonic() - start, 3),
+                    error="timeout" if timed_out else f"{type(exc).__name__}: {exc}",
+                    source="none",
+                )
+                ids = set()
+                cached = _REMOTE_CLAIMS_CACHE.get((name, remote, base_branch)) if is_remote else None
+                if cached is not None and time.monotonic() - cached[0] <= CLAIM_CACHE_MAX_AGE_SECONDS:
+                    ids = cached[1]
+                    entry.update(source="cache", cache_age_seconds=round(time.monotonic() - cached[0], 1))
+                entry["count"] = len(ids)
+        claimed |= ids
+        if stats is not None:
+            stats.append(entry)
     return claimed
 
 
-def ready_backlog_tasks(*, done_ids: set[str], claimed_ids: set[str]) -> list[Task]:
-    tasks = [t for t in list_tasks(task_dir("backlog")) if t.state == "backlog"]
+def ready_backlog_tasks(*, done_ids: set[str], claimed_ids: set[str], index: TaskIndex | None = None) -> list[Task]:
+    index = index or TaskIndex.build()
+    tasks = [t for t in index.by_folder.get("backlog", []) if t.state == "backlog"]
     ready: list[Task] = []
     for t in tasks:
         if t.task_id in claimed_ids:
@@ -361,21 +754,23 @@ def ready_backlog_tasks(*, done_ids: set[str], claimed_ids: set[str]) -> list[Ta
     return ready
 
 
-def _compute_workstream_locks(*, repo: Path, claimed_ids: set[str]) -> tuple[set[str], set[str]]:
+def _compute_workstream_locks(
+    *,
+    repo: Path,
+    claimed_ids: set[str],
+    index: TaskIndex | None = None,
+) -> tuple[set[str], set[str]]:
     """Return (locked_workstreams, parallel_only_workstreams).
 
     - If any claimed task in a workstream is not parallel_ok, the workstream is locked.
     - If only parallel_ok tasks are claimed for a workstream, the workstream is parallel-only.
     """
+    index = index or TaskIndex.build(repo)
     locked: set[str] = set()
     parallel_only: set[str] = set()
     for tid in claimed_ids:
-        tf = _find_task_file_anywhere(tid, repo)
-        if tf is None:
-            continue
-        try:
-            t = load_task(tf)
-        except Exception:
+        t = index.get(tid)
+        if t is None:
             continue
         if t.parallel_ok:
             parallel_only.add(t.workstream)
@@ -413,9 +808,109 @@ def _priority_rank(priority: str) -> int:
     return {"high": 0, "medium": 1, "low": 2}.get(priority, 9)
 
 
-def choose_tasks_heuristic(ready: list[Task], capacity: int) -> list[Task]:
-    ready_sorted = sorted(ready, key=lambda t: (_priority_rank(t.priority), t.task_id))
-    return ready_sorted[: max(0, capacity)]
+# Fallback duration estimate for tasks in workstreams with no recorded worker time.
+DEFAULT_TASK_SECONDS = 3600.0
+
+
+@dataclasses.dataclass(frozen=True)
+class TaskScore:
+    task_id: str
+    fanout: int  # open tasks that (transitively) depend on this one
+    duration_seconds: float  # estimate: mean recorded worker time for the workstream
+    critical_path_seconds: float  # longest chain of estimated durations from this task to a sink
+
+    def sort_key(self, priority: str) -> tuple[float, int, int, str]:
+        return (-self.critical_path_seconds, -self.fanout, _priority_rank(priority), self.task_id)
+
+
+def compute_task_scores(
+    index: TaskIndex,
+    *,
+    done_ids: set[str],
+    workstream_seconds: dict[str, float] | None = None,
+) -> dict[str, TaskScore]:
+    """Score every open task on the dependency DAG built from frontmatter `dependencies`.
+
+    Durations come from `workstream_seconds` (the state store's history) where known, otherwise the
+    mean of the known workstreams, otherwise DEFAULT_TASK_SECONDS. Dependency cycles are reported on
+    stderr and cut at the back edge.
+    """
+    workstream_seconds = workstream_seconds or {}
+    fallback = (
+        sum(workstream_seconds.values()) / len(workstream_seconds) if workstream_seconds else DEFAULT_TASK_SECONDS
+    )
+    open_tasks = {t.task_id: t for t in index.tasks if t.task_id not in done_ids}
+    dependents: dict[str, list[str]] = {tid: [] for tid in open_tasks}
+    for t in open_tasks.values():
+        for dep in t.dependencies:
+            if dep in dependents:
+                dependents[dep].append(t.task_id)
+
+    path: dict[str, float] = {}
+    reach: dict[str, frozenset[str]] = {}
+    visiting: set[str] = set()
+
+    def _visit(tid: str) -> None:
+        visiting.add(tid)
+        longest, below = 0.0, set()
+        for child in dependents[tid]:
+            if child in visiting:
+                print(f"[scheduler] dependency cycle through {tid} -> {child}; ignoring that edge", file=sys.stderr)
+                continue
+            if child not in path:
+                _visit(child)
+            longest = max(longest, path[child])
+            below.add(child)
+            below.update(reach[child])
+        visiting.discard(tid)
+        path[tid] = workstream_seconds.get(open_tasks[tid].workstream, fallback) + longest
+        reach[tid] = frozenset(below)
+
+    for tid in sorted(open_tasks):
+        if tid not in path:
+            _visit(tid)
+    return {
+        tid: TaskScore(
+            task_id=tid,
+            fanout=len(reach[tid]),
+            duration_seconds=workstream_seconds.get(t.workstream, fallback),
+            critical_path_seconds=path[tid],
+        )
+        for tid, t in open_tasks.items()
+    }
+
+
+def schedule_order(tasks: list[Task], scores: dict[str, TaskScore] | None) -> list[Task]:
+    """Critical path first (then fan-out, priority, id); plain priority order when unscored."""
+    if not scores:
+        return sorted(tasks, key=lambda t: (_priority_rank(t.priority), t.task_id))
+    return sorted(
+        tasks,
+        key=lambda t: (
+            scores[t.task_id].sort_key(t.priority)
+            if t.task_id in scores
+            else (0.0, 0, _priority_rank(t.priority), t.task_id)
+        ),
+    )
+
+
+def _task_scores(args: argparse.Namespace, index: TaskIndex, done_ids: set[str]) -> dict[str, TaskScore] | None:
+    if args.scheduler != "critical-path":
+        return None
+    store = _state_store(_repo_root())
+    try:
+        history = store.worker_seconds_by_workstream() if store is not None else {}
+    except sqlite3.Error:
+        history = {}
+    return compute_task_scores(
+        index, done_ids=done_ids, workstream_seconds={ws: float(h["mean_seconds"]) for ws, h in history.items()}
+    )
+
+
+def choose_tasks_heuristic(
+    ready: list[Task], capacity: int, scores: dict[str, TaskScore] | None = None
+) -> list[Task]:
+    return schedule_order(ready, scores)[: max(0, capacity)]
 
 
 def choose_tasks_claude(
@@ -424,11 +919,12 @@ def choose_tasks_claude(
     capacity: int,
     model: str | None,
     unattended: bool,
+    scores: dict[str, TaskScore] | None = None,
 ) -> list[Task]:
     claude = _which_or_none("claude")
     if claude is None:
         print("claude not found; falling back to heuristic planner", file=sys.stderr)
-        return choose_tasks_heuristic(ready, capacity)
+        return choose_tasks_heuristic(ready, capacity, scores)
 
     payload = [
         {
@@ -438,6 +934,14 @@ def choose_tasks_claude(
             "priority": t.priority,
             "dependencies": t.dependencies,
             "parallel_ok": t.parallel_ok,
+            **(
+                {
+                    "unblocks_tasks": scores[t.task_id].fanout,
+                    "critical_path_seconds": round(scores[t.task_id].critical_path_seconds),
+                }
+                if scores and t.task_id in scores
+                else {}
+            ),
         }
         for t in ready
     ]
@@ -460,7 +964,7 @@ def choose_tasks_claude(
             "Rules:",
             f"- Select at most {capacity} task_ids.",
             "- Prefer higher priority tasks.",
-            "- Prefer tasks that unblock dependencies.",
+            "- Prefer tasks that unblock dependencies (higher unblocks_tasks / critical_path_seconds when given).",
             "- Start at most ONE task per workstream unless tasks are marked parallel_ok=true.",
             "- Return ONLY the JSON object required by the schema (selected_task_ids, optional rationale).",
             "",
@@ -491,17 +995,16 @@ def choose_tasks_claude(
     structured = data.get("structured_output")
     if not isinstance(structured, dict):
         print("claude planner did not return structured_output; falling back", file=sys.stderr)
-        return choose_tasks_heuristic(ready, capacity)
+        return choose_tasks_heuristic(ready, capacity, scores)
     selected = structured.get("selected_task_ids")
     if not isinstance(selected, list):
         print("claude planner missing selected_task_ids; falling back", file=sys.stderr)
-        return choose_tasks_heuristic(ready, capacity)
+        return choose_tasks_heuristic(ready, capacity, scores)
 
     selected_ids = {x for x in selected if isinstance(x, str)}
     out = [t for t in ready if t.task_id in selected_ids]
-    # Preserve a stable order (priority then id) if Claude returns many.
-    out_sorted = sorted(out, key=lambda t: (_priority_rank(t.priority), t.task_id))
-    return out_sorted[: max(0, capacity)]
+    # Preserve a stable (schedule) order if Claude returns many.
+    return schedule_order(out, scores)[: max(0, capacity)]
 
 
 def _slug_from_task_path(path: Path, task_id: str) -> str:
@@ -512,8 +1015,10 @@ def _slug_from_task_path(path: Path, task_id: str) -> str:
     return stem
 
 
-def ensure_worktree(*, task: Task, worktree_parent: Path, base_ref: str) -> tuple[Path, str]:
-    """Create a new worktree for a task branch.
+def ensure_worktree(
+    *, task: Task, worktree_parent: Path, base_ref: str, pool: WorktreePool | None = None
+) -> tuple[Path, str]:
+    """Create a new worktree for a task branch (reusing a warm pool slot when one is available).
 
     Returns (worktree_path, branch_name).
     """
@@ -524,6 +1029,11 @@ def ensure_worktree(*, task: Task, worktree_parent: Path, base_ref: str) -> tupl
     if wt_path.exists():
         raise SystemExit(f"Worktree path already exists: {wt_path}")
 
+    if pool is not None:
+        claimed = pool.claim(task_id=task.task_id, branch=branch, base_ref=base_ref)
+        if claimed is not None:
+            return claimed, branch
+
     # If branch exists locally, attach it; otherwise create from base_ref.
     branch_exists = False
     try:
@@ -594,6 +1104,227 @@ def ensure_worktree_for_branch(*, branch: str, task_id: str, worktree_parent: Pa
     return wt_path
 
 
+WORKTREE_POOL_PREFIX = "wt-pool-"
+_TASK_WORKTREE_RE = re.compile(r"^wt-(T\d{3})$")
+
+
+def _list_worktrees(repo: Path) -> list[dict[str, Any]]:
+    """Parse `git worktree list --porcelain` into {path, head, branch, detached, locked, prunable} records."""
+    cp = _run(["git", "worktree", "list", "--porcelain"], cwd=repo, capture=True, check=True)
+    out: list[dict[str, Any]] = []
+    for line in (cp.stdout or "").splitlines():
+        key, _, value = line.partition(" ")
+        if key == "worktree":
+            out.append({"path": Path(value), "head": None, "branch": None, "detached": False})
+        elif out and key == "HEAD":
+            out[-1]["head"] = value
+        elif out and key == "branch":
+            out[-1]["branch"] = value.removeprefix("refs/heads/")
+        elif out and key in {"detached", "locked", "prunable"}:
+            out[-1][key] = True
+    return out
+
+
+def _git_quiet(args: list[str], cwd: Path) -> None:
+    _run(["git", *args], cwd=cwd, capture=True, check=True)
+
+
+def _git_common_dir(repo: Path) -> Path:
+    cp = _run(["git", "rev-parse", "--path-format=absolute", "--git-common-dir"], cwd=repo, capture=True, check=True)
+    return Path((cp.stdout or "").strip()).resolve()
+
+
+def _worktree_common_dir(path: Path) -> Path | None:
+    """The common dir a worktree's `.git` file points at (`<common>/worktrees/<name>`), if any."""
+    try:
+        text = (path / ".git").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    if not text.startswith("gitdir:"):
+        return None
+    gitdir = Path(text.removeprefix("gitdir:").strip())
+    if not gitdir.is_absolute():
+        gitdir = path / gitdir
+    return gitdir.resolve().parent.parent
+
+
+class WorktreePool:
+    """Warm, detached worktrees (`wt-pool-<repo>-N`) handed to new tasks instead of a fresh `git worktree add`.
+
+    Slot names carry a hash of the repo's git common dir, so pools of other clones sharing `parent`
+    are never touched. Claiming renames a clean slot to `wt-<task_id>` and switches it onto the task branch, so only the
+    files that differ from the slot's commit are rewritten. Worktrees of tasks that are done (merged)
+    are reset and returned to the pool; `gc()` drops slots left dirty or on a branch by crashed runs.
+    """
+
+    def __init__(self, *, repo: Path, parent: Path, size: int) -> None:
+        self.repo = repo
+        self.parent = parent
+        self.size = size
+        self.common_dir = _git_common_dir(repo)
+        self.prefix = f"{WORKTREE_POOL_PREFIX}{hashlib.sha256(str(self.common_dir).encode()).hexdigest()[:8]}-"
+        self._lock = threading.Lock()
+        self._refresher: threading.Thread | None = None
+
+    def _registered(self) -> list[dict[str, Any]]:
+        return [wt for wt in _list_worktrees(self.repo) if wt["path"].parent == self.parent]
+
+    def _slots(self) -> list[dict[str, Any]]:
+        return sorted(
+            (wt for wt in self._registered() if wt["path"].name.startswith(self.prefix)),
+            key=lambda wt: wt["path"].name,
+        )
+
+    def _free_slot_path(self) -> Path:
+        taken = {wt["path"].name for wt in self._registered()}
+        k = 0
+        while f"{self.prefix}{k}" in taken or (self.parent / f"{self.prefix}{k}").exists():
+            k += 1
+        return self.parent / f"{self.prefix}{k}"
+
+    @staticmethod
+    def _is_clean(path: Path) -> bool:
+        cp = _run(["git", "status", "--porcelain"], cwd=path, capture=True, check=False)
+        return cp.returncode == 0 and not (cp.stdout or "").strip()
+
+    def claim(self, *, task_id: str, branch: str, base_ref: str) -> Path | None:
+        """Turn an idle slot into the task worktree.
+
+        None when no clean slot is available, when `branch` is already checked out in another
+        worktree, or when switching the slot fails (the slot is then moved back into the pool).
+        """
+        self.wait()
+        target = self.parent / f"wt-{task_id}"
+        with self._lock:
+            if any(wt["branch"] == branch for wt in _list_worktrees(self.repo)):
+                return None  # the fresh `git worktree add` fallback reports where it is checked out
+            for slot in self._slots():
+                if not slot["detached"] or slot.get("locked") or not self._is_clean(slot["path"]):
+                    continue
+                exists = _run(
+                    ["git", "show-ref", "--verify", "--quiet", f"refs/heads/{branch}"], cwd=self.repo, capture=True, check=False
+                ).returncode == 0
+                _git_quiet(["worktree", "move", str(slot["path"]), str(target)], self.repo)
+                try:
+                    _git_quiet(["switch", branch] if exists else ["switch", "-c", branch, base_ref], target)
+                except subprocess.CalledProcessError as exc:
+                    print(f"[worktree-pool] could not switch {slot['path'].name} to {branch}: {exc}", file=sys.stderr)
+                    back = _run(["git", "worktree", "move", str(target), str(slot["path"])], cwd=self.repo, capture=True, check=False)
+                    if back.returncode != 0:
+                        _run(["git", "worktree", "remove", "--force", str(target)], cwd=self.repo, capture=True, check=False)
+                    return None
+                return target
+        return None
+
+    def release(self, wt_path: Path, *, base_ref: str) -> str:
+        """Return a finished task worktree to the pool (or remove it when the pool is full)."""
+        with self._lock:
+            if len(self._slots()) >= self.size:
+                _git_quiet(["worktree", "remove", str(wt_path)], self.repo)
+                return "removed"
+            slot = self._free_slot_path()
+            _git_quiet(["worktree", "move", str(wt_path), str(slot)], self.repo)
+            _git_quiet(["checkout", "-q", "--detach", base_ref], slot)
+            _git_quiet(["reset", "-q", "--hard"], slot)
+            # Untracked files only: ignored caches/logs under data/tmp stay warm for the next task.
+            _git_quiet(["clean", "-q", "-fd"], slot)
+            return "pooled"
+
+    def recycle(self, *, done_ids: set[str], busy_ids: set[str], base_ref: str) -> dict[str, str]:
+        """Release worktrees of done tasks that no worker is using and that hold no uncommitted work."""
+        out: dict[str, str] = {}
+        for wt in self._registered():
+            m = _TASK_WORKTREE_RE.match(wt["path"].name)
+            if m is None or m.group(1) not in done_ids or m.group(1) in busy_ids or wt.get("locked"):
+                continue
+            if not self._is_clean(wt["path"]):
+                continue
+            try:
+                out[m.group(1)] = self.release(wt["path"], base_ref=base_ref)
+            except subprocess.CalledProcessError as exc:
+                print(f"[worktree-pool] could not release {wt['path']}: {exc}", file=sys.stderr)
+        return out
+
+    def gc(self) -> list[str]:
+        """Drop stale registrations and slots that are unusable or over the size cap."""
+        self.wait()
+        removed: list[str] = []
+        with self._lock:
+            _git_quiet(["worktree", "prune"], self.repo)
+            slots = self._slots()
+            for i, slot in enumerate(slots):
+                usable = slot["detached"] and not slot.get("locked") and self._is_clean(slot["path"])
+                if usable and i < self.size:
+                    continue
+                _run(["git", "worktree", "remove", "--force", str(slot["path"])], cwd=self.repo, capture=True, check=False)
+                removed.append(str(slot["path"]))
+            registered = {wt["path"] for wt in self._registered()}
+            for path in sorted(self.parent.glob(f"{self.prefix}*")):
+                if not path.is_dir() or path in registered:
+                    continue
+                # Directory left behind by a crash between `worktree add` and registration. Anything
+                # that is a worktree of another repository is not ours to delete.
+                owner = _worktree_common_dir(path)
+                if owner is not None and owner != self.common_dir:
+                    continue
+                shutil.rmtree(path)
+                removed.append(str(path))
+        return removed
+
+    def refill(self, *, base_ref: str) -> None:
+        """Fast-forward idle slots to `base_ref` and create new ones up to the size cap."""
+        with self._lock:
+            slots = self._slots()
+            for slot in slots:
+                if slot["detached"] and not slot.get("locked"):
+                    _run(["git", "checkout", "-q", "--detach", base_ref], cwd=slot["path"], capture=True, check=False)
+            for _ in range(self.size - len(slots)):
+                _git_quiet(["worktree", "add", "-q", "--detach", str(self._free_slot_path()), base_ref], self.repo)
+
+    def refill_in_background(self, *, base_ref: str) -> None:
+        self.wait()
+
+        def _refill() -> None:
+            try:
+                self.refill(base_ref=base_ref)
+            except (OSError, subprocess.CalledProcessError) as exc:
+                print(f"[worktree-pool] refill failed: {exc}", file=sys.stderr)
+
+        self._refresher = threading.Thread(target=_refill, name="worktree-pool-refill", daemon=True)
+        self._refresher.start()
+
+    def wait(self) -> None:
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+
+
+_WORKTREE_POOL: WorktreePool | None = None
+
+
+def _worktree_parent(args: argparse.Namespace, repo: Path) -> Path:
+    return Path(args.worktree_parent).expanduser().resolve() if args.worktree_parent else repo.parent
+
+
+def _worktree_pool(args: argparse.Namespace, repo: Path, parent: Path) -> WorktreePool | None:
+    global _WORKTREE_POOL
+    if args.worktree_pool_size <= 0:
+        return None
+    if _WORKTREE_POOL is None:
+        _WORKTREE_POOL = WorktreePool(repo=repo, parent=parent, size=args.worktree_pool_size)
+    return _WORKTREE_POOL
+
+
+def _tmux_window_task_ids(session: str) -> set[str]:
+    """Task ids of worker windows (`T123`, `repair-T123-...`) still open in the tmux session."""
+    if _which_or_none("tmux") is None:
+        return set()
+    cp = _tmux("list-windows", "-t", session, "-F", "#{window_name}", check=False, capture=True)
+    if cp.returncode != 0:
+        return set()
+    return {m.group(0) for name in (cp.stdout or "").splitlines() if (m := re.search(r"T\d{3}", name))}
+
+
 def _tmux(*args: str, check: bool = True, capture: bool = False) -> subprocess.CompletedProcess[str]:
     tmux = _which_or_none("tmux")
     if tmux is None:
@@ -631,6 +1362,382 @@ def tmux_spawn_task_window(
     )
 
 
+SWARM_LOG_DIR = Path("data/tmp/swarm_logs")
+# Budget a pool child gets beyond --max-worker-seconds + --max-review-seconds + --max-gate-seconds (git, PR calls).
+POOL_CHILD_GRACE_SECONDS = 900
+POOL_KILL_WAIT_SECONDS = 10
+
+
+@dataclasses.dataclass
+class PoolWorker:
+    task_id: str
+    proc: subprocess.Popen[bytes]
+    log_path: Path
+    started: float
+    deadline: float | None
+    log_file: Any
+
+
+class WorkerPool:
+    """Headless runner: `run-task` children as concurrent subprocesses, logged to files.
+
+    Children run in their own process group so a timeout kills the whole worker tree. `reap()`
+    collects finished (or over-deadline) children so the next tick can refill their slots.
+    """
+
+    def __init__(self, *, log_dir: Path, max_child_seconds: float | None) -> None:
+        self.log_dir = log_dir
+        self.max_child_seconds = max_child_seconds
+        self.workers: dict[str, PoolWorker] = {}
+
+    def running_ids(self) -> set[str]:
+        return set(self.workers)
+
+    def spawn(self, task_id: str, command: list[str], *, cwd: Path) -> PoolWorker:
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = self.log_dir / f"{task_id}-{_utc_timestamp_compact()}.log"
+        log_file = log_path.open("ab")
+        proc = subprocess.Popen(
+            command,
+            cwd=str(cwd),
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        now = time.monotonic()
+        worker = PoolWorker(
+            task_id=task_id,
+            proc=proc,
+            log_path=log_path,
+            started=now,
+            deadline=(now + self.max_child_seconds) if self.max_child_seconds else None,
+            log_file=log_file,
+        )
+        self.workers[task_id] = worker
+        return worker
+
+    def _kill(self, worker: PoolWorker) -> None:
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(worker.proc.pid, sig)
+            except ProcessLookupError:
+                return
+            try:
+                worker.proc.wait(timeout=POOL_KILL_WAIT_SECONDS)
+                return
+            except subprocess.TimeoutExpired:
+                continue
+
+    def reap(self) -> list[dict[str, Any]]:
+        """Collect finished children, killing any past their deadline; returns one record per child."""
+        finished: list[dict[str, Any]] = []
+        now = time.monotonic()
+        for task_id, worker in list(self.workers.items()):
+            timed_out = False
+            if worker.proc.poll() is None:
+                if worker.deadline is None or now < worker.deadline:
+                    continue
+                self._kill(worker)
+                timed_out = True
+            worker.log_file.close()
+            del self.workers[task_id]
+            finished.append(
+                {
+                    "task_id": task_id,
+                    "returncode": worker.proc.returncode,
+                    "seconds": round(now - worker.started, 1),
+                    "timed_out": timed_out,
+                    "log": str(worker.log_path),
+                }
+            )
+        return finished
+
+    def wait_all(self, *, poll_seconds: float = 2.0) -> list[dict[str, Any]]:
+        finished: list[dict[str, Any]] = []
+        while self.workers:
+            finished.extend(self.reap())
+            if self.workers:
+                time.sleep(poll_seconds)
+        return finished
+
+
+# The pool outlives a single tick when `loop` drives ticks in-process.
+_WORKER_POOL: WorkerPool | None = None
+
+
+def _worker_pool(args: argparse.Namespace, repo: Path) -> WorkerPool:
+    global _WORKER_POOL
+    if _WORKER_POOL is None:
+        budget = None
+        if args.max_worker_seconds:
+            budget = float(
+                args.max_worker_seconds + args.max_review_seconds + args.max_gate_seconds + POOL_CHILD_GRACE_SECONDS
+            )
+        _WORKER_POOL = WorkerPool(log_dir=repo / SWARM_LOG_DIR, max_child_seconds=budget)
+    return _WORKER_POOL
+
+
+def _print_pool_finished(finished: list[dict[str, Any]]) -> None:
+    for rec in finished:
+        outcome = "timed out" if rec["timed_out"] else f"rc={rec['returncode']}"
+        print(f"[pool] {rec['task_id']} finished ({outcome}) after {rec['seconds']}s; log: {rec['log']}")
+
+
+STATE_DB_RELPATH = Path("data/tmp/swarm_state.sqlite3")
+STATE_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ticks (
+    id INTEGER PRIMARY KEY,
+    command TEXT NOT NULL,
+    started_ts REAL NOT NULL,
+    seconds REAL,
+    status_json TEXT
+);
+CREATE TABLE IF NOT EXISTS task_runs (
+    id INTEGER PRIMARY KEY,
+    task_id TEXT NOT NULL,
+    workstream TEXT,
+    kind TEXT NOT NULL,
+    runner TEXT,
+    tick_id INTEGER REFERENCES ticks(id),
+    pr_number INTEGER,
+    reason TEXT,
+    started_ts REAL NOT NULL,
+    finished_ts REAL,
+    worker_seconds REAL,
+    returncode INTEGER,
+    gate_ok INTEGER,
+    final_state TEXT
+);
+CREATE INDEX IF NOT EXISTS task_runs_task_kind ON task_runs(task_id, kind, started_ts);
+CREATE INDEX IF NOT EXISTS task_runs_workstream ON task_runs(workstream, kind);
+CREATE INDEX IF NOT EXISTS task_runs_open ON task_runs(task_id) WHERE finished_ts IS NULL;
+CREATE TABLE IF NOT EXISTS gate_results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES task_runs(id),
+    command TEXT NOT NULL,
+    returncode INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    failed_gates TEXT,
+    peak_rss_kb INTEGER,
+    timed_out INTEGER
+);
+CREATE INDEX IF NOT EXISTS gate_results_run ON gate_results(run_id);
+"""
+
+
+def _state_db_path(repo: Path) -> Path:
+    """The store lives in the main checkout so task worktrees and the supervisor share one file."""
+    override = os.environ.get("SWARM_STATE_DB")
+    if override:
+        return Path(override)
+    try:
+        common_dir = _git_common_dir(repo)
+    except (OSError, subprocess.CalledProcessError):
+        return repo / STATE_DB_RELPATH
+    main_root = common_dir.parent if common_dir.name == ".git" else repo
+    return main_root / STATE_DB_RELPATH
+
+
+class StateStore:
+    """SQLite record of ticks, task runs (worker + repair passes) and gate outcomes.
+
+    Writers are the supervisor and every `run-task` child, so the file uses WAL with a busy timeout.
+    Recording is best-effort: a locked or broken store is reported on stderr and never stops a tick.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(STATE_DB_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _write(self, sql: str, params: Iterable[Any] = ()) -> int | None:
+        try:
+            return self.conn.execute(sql, tuple(params)).lastrowid
+        except sqlite3.Error as exc:
+            print(f"[state] write to {self.path} failed: {exc}", file=sys.stderr)
+            return None
+
+    def start_tick(self, command: str) -> int | None:
+        return self._write("INSERT INTO ticks (command, started_ts) VALUES (?, ?)", (command, time.time()))
+
+    def finish_tick(self, tick_id: int | None, *, seconds: float, status: dict[str, Any]) -> None:
+        if tick_id is not None:
+            self._write(
+                "UPDATE ticks SET seconds = ?, status_json = ? WHERE id = ?",
+                (round(seconds, 3), json.dumps(status, sort_keys=True, default=str), tick_id),
+            )
+
+    def start_run(
+        self,
+        task_id: str,
+        *,
+        kind: str,
+        workstream: str | None = None,
+        runner: str | None = None,
+        tick_id: int | None = None,
+        pr_number: int | None = None,
+        reason: str | None = None,
+    ) -> int | None:
+        return self._write(
+            "INSERT INTO task_runs (task_id, workstream, kind, runner, tick_id, pr_number, reason, started_ts)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (task_id, workstream, kind, runner, tick_id, pr_number, reason, time.time()),
+        )
+
+    def open_run(self, task_id: str, *, kind: str, workstream: str | None) -> int | None:
+        """Adopt the unfinished run the supervisor started for this task, or start one (manual `run-task`)."""
+        try:
+            row = self.conn.execute(
+                "SELECT id FROM task_runs WHERE task_id = ? AND kind = ? AND finished_ts IS NULL"
+                " ORDER BY started_ts DESC LIMIT 1",
+                (task_id, kind),
+            ).fetchone()
+        except sqlite3.Error as exc:
+            print(f"[state] read from {self.path} failed: {exc}", file=sys.stderr)
+            row = None
+        if row is None:
+            return self.start_run(task_id, kind=kind, workstream=workstream, runner="manual")
+        self._write("UPDATE task_runs SET workstream = coalesce(workstream, ?) WHERE id = ?", (workstream, row["id"]))
+        return int(row["id"])
+
+    def record_gate(
+        self,
+        run_id: int | None,
+        *,
+        command: str,
+        returncode: int,
+        seconds: float,
+        failed_gates: list[str] | None,
+        peak_rss_kb: int | None = None,
+        timed_out: bool = False,
+    ) -> None:
+        if run_id is not None:
+            self._write(
+                "INSERT INTO gate_results (run_id, command, returncode, seconds, failed_gates, peak_rss_kb, timed_out)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    command,
+                    returncode,
+                    round(seconds, 3),
+                    json.dumps(failed_gates) if failed_gates else None,
+                    peak_rss_kb,
+                    timed_out,
+                ),
+            )
+
+    def finish_run(
+        self,
+        run_id: int | None,
+        *,
+        final_state: str,
+        returncode: int | None = None,
+        gate_ok: bool | None = None,
+        worker_seconds: float | None = None,
+    ) -> None:
+        if run_id is not None:
+            self._write(
+                "UPDATE task_runs SET finished_ts = ?, final_state = ?, returncode = ?, gate_ok = ?,"
+                " worker_seconds = coalesce(?, worker_seconds) WHERE id = ?",
+                (time.time(), final_state, returncode, gate_ok, worker_seconds, run_id),
+            )
+
+    def close_open_runs(self, task_id: str, *, returncode: int | None, timed_out: bool) -> None:
+        """Pool children that died before `run-task` recorded its own outcome."""
+        self._write(
+            "UPDATE task_runs SET finished_ts = ?, returncode = ?, final_state = ?"
+            " WHERE task_id = ? AND finished_ts IS NULL",
+            (time.time(), returncode, "timed_out" if timed_out else "exited", task_id),
+        )
+
+    def repair_stats(self) -> dict[str, tuple[int, float]]:
+        """task_id -> (repair attempts, last repair start as epoch seconds)."""
+        rows = self.conn.execute(
+            "SELECT task_id, count(*) AS n, max(started_ts) AS last FROM task_runs"
+            " WHERE kind = 'repair' GROUP BY task_id"
+        )
+        return {r["task_id"]: (int(r["n"]), float(r["last"])) for r in rows}
+
+    def attempt_counts(self, task_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        ids = sorted(set(task_ids))
+        if not ids:
+            return {}
+        rows = self.conn.execute(
+            "SELECT task_id, count(*) AS runs, sum(kind = 'repair') AS repairs,"
+            " (SELECT final_state FROM task_runs t2 WHERE t2.task_id = t.task_id"
+            "  ORDER BY started_ts DESC LIMIT 1) AS last_state"
+            f" FROM task_runs t WHERE task_id IN ({','.join('?' * len(ids))}) GROUP BY task_id",
+            ids,
+        )
+        return {
+            r["task_id"]: {"runs": int(r["runs"]), "repairs": int(r["repairs"]), "last_state": r["last_state"]}
+            for r in rows
+        }
+
+    def worker_seconds_by_workstream(self) -> dict[str, dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT coalesce(workstream, '?') AS ws, count(*) AS runs, avg(worker_seconds) AS mean,"
+            " max(worker_seconds) AS max FROM task_runs WHERE worker_seconds IS NOT NULL GROUP BY ws ORDER BY ws"
+        )
+        return {
+            r["ws"]: {"runs": int(r["runs"]), "mean_seconds": round(r["mean"], 1), "max_seconds": round(r["max"], 1)}
+            for r in rows
+        }
+
+    def tasks_repaired_more_than(self, n: int) -> dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT task_id, count(*) AS n FROM task_runs WHERE kind = 'repair'"
+            " GROUP BY task_id HAVING n > ? ORDER BY n DESC, task_id",
+            (n,),
+        )
+        return {r["task_id"]: int(r["n"]) for r in rows}
+
+    def gate_failures(self) -> dict[str, dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT command, count(*) AS runs, sum(returncode != 0) AS failed, avg(seconds) AS mean,"
+            " max(peak_rss_kb) AS rss FROM gate_results GROUP BY command ORDER BY command"
+        )
+        return {
+            r["command"]: {
+                "runs": int(r["runs"]),
+                "failed": int(r["failed"]),
+                "mean_seconds": round(r["mean"], 1),
+                "max_peak_rss_kb": r["rss"],
+            }
+            for r in rows
+        }
+
+    def recent_runs(self, limit: int) -> list[dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT task_id, kind, runner, started_ts, finished_ts, worker_seconds, returncode, gate_ok, final_state"
+            " FROM task_runs ORDER BY started_ts DESC, id DESC LIMIT ?",
+            (limit,),
+        )
+        return [dict(r) for r in rows]
+
+
+_STATE_STORE: StateStore | None = None
+
+
+def _state_store(repo: Path) -> StateStore | None:
+    global _STATE_STORE
+    if _STATE_STORE is None:
+        path = _state_db_path(repo)
+        try:
+            _STATE_STORE = StateStore(path)
+        except sqlite3.Error as exc:
+            print(f"[state] cannot open {path}: {exc}; run history will not be recorded", file=sys.stderr)
+            return None
+    return _STATE_STORE
+
+
 def _git_current_branch(cwd: Path) -> str:
     cp = _run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd, capture=True, check=True)
     return (cp.stdout or "").strip()
@@ -744,6 +1851,106 @@ def _find_task_file_anywhere(task_id: str, cwd: Path) -> Path | None:
     return None
 
 
+def _parse_quality_gates_report(output: str) -> dict[str, Any] | None:
+    """Extract the `quality_gates.py --json` document from captured gate output (if present)."""
+    decoder = json.JSONDecoder()
+    for m in re.finditer(r"^\{", output, flags=re.MULTILINE):
+        try:
+            data, _ = decoder.raw_decode(output, m.start())
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, dict) and isinstance(data.get("gates"), dict):
+            return data
+    return None
+
+
+JUDGE_GATE_TIMEOUT_SECONDS = 3600
+GATE_OUTPUT_TAIL_CHARS = 2000
+# The `quality_gates.py --json` report is the last thing a gate prints; only this much of the log
+# end is read back to find it.
+GATE_REPORT_TAIL_BYTES = 1 << 20
+
+
+def _read_log_tail(path: Path, max_bytes: int) -> str:
+    with path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - max_bytes))
+        return f.read().decode("utf-8", errors="replace")
+
+
+def _peak_rss_kb(usage: Any) -> int:
+    # ru_maxrss is KiB on Linux but bytes on macOS.
+    return int(usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss)
+
+
+def run_judge_gate(
+    command: str, *, cwd: Path, env: dict[str, str], log_path: Path, timeout_seconds: float | None
+) -> dict[str, Any]:
+    """Run one task gate through the shell, streaming its output to `log_path`.
+
+    The gate runs in its own process group (a timeout kills the whole tree) and is reaped with
+    `os.wait4`, so the record carries its peak RSS including the children it waited for.
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    started = time.monotonic()
+    deadline = started + timeout_seconds if timeout_seconds else None
+    kill_at: float | None = None
+    delay = 0.01
+    with log_path.open("wb") as log_file:
+        proc = subprocess.Popen(
+            command,
+            cwd=str(cwd),
+            shell=True,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        while True:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            if pid:
+                break
+            now = time.monotonic()
+            try:
+                if deadline is not None and now >= deadline and kill_at is None:
+                    os.killpg(proc.pid, signal.SIGTERM)
+                    kill_at = now + POOL_KILL_WAIT_SECONDS
+                elif kill_at is not None and now >= kill_at:
+                    os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    output = _read_log_tail(log_path, GATE_REPORT_TAIL_BYTES)
+    record: dict[str, Any] = {
+        "command": command,
+        "returncode": proc.returncode,
+        "seconds": round(time.monotonic() - started, 1),
+        "peak_rss_kb": _peak_rss_kb(usage),
+        "timed_out": kill_at is not None,
+        "log": str(log_path),
+        "output": output[-GATE_OUTPUT_TAIL_CHARS:],
+    }
+    report = _parse_quality_gates_report(output)
+    if report is not None:
+        record["failed_gates"] = report.get("failed", [])
+    return record
+
+
+def _gate_summary_line(gate: dict[str, Any]) -> str:
+    line = (
+        f"- `{gate['command']}` (rc={gate['returncode']}, {gate['seconds']}s, "
+        f"peak RSS {gate['peak_rss_kb'] / 1024:.0f} MiB)"
+    )
+    if gate.get("timed_out"):
+        line += " timed out"
+    if gate.get("failed_gates"):
+        line += f" failed: {', '.join(gate['failed_gates'])}"
+    return line
+
+
 def _require_unattended_ack() -> None:
     if os.environ.get("SWARM_UNATTENDED_I_UNDERSTAND") == "1":
         return
@@ -814,7 +2021,7 @@ def _gh_create_pr_if_missing(
     title: str,
     body: str,
 ) -> None:
-    gh = _which_or_none("gh")
+    gh = _gh()
     if gh is None:
         return
 
@@ -855,7 +2062,7 @@ def _maybe_auto_merge(
     cwd: Path,
     squash: bool,
 ) -> None:
-    gh = _which_or_none("gh")
+    gh = _gh()
     if gh is None:
         return
     branch = _git_current_branch(cwd)
@@ -931,34 +2138,19 @@ def _maybe_spawn_repairs(args: argparse.Namespace, repo: Path) -> None:
         return
     if args.max_repairs_per_tick <= 0:
         return
-    gh = _which_or_none("gh")
-    if gh is None:
+    if _gh() is None:
         return
 
     try:
-        cp = _run(
-            [
-                gh,
-                "pr",
-                "list",
-                "--state",
-                "open",
-                "--base",
-                args.base_branch,
-                "--json",
-                "number,headRefName,url,updatedAt,mergeable,statusCheckRollup",
-            ],
-            capture=True,
-            check=True,
-            cwd=repo,
-        )
-        prs = json.loads(cp.stdout or "[]")
+        prs = _pr_cache(args.pr_cache_ttl_seconds).open_prs(args.base_branch)
     except Exception:
         return
 
-    if not isinstance(prs, list):
-        return
-
+    store = _state_store(repo)
+    try:
+        repair_stats = store.repair_stats() if store is not None else {}
+    except sqlite3.Error:
+        repair_stats = {}
     now = _dt.datetime.now(tz=_dt.timezone.utc)
     candidates: list[dict[str, Any]] = []
     for pr in prs:
@@ -977,6 +2169,12 @@ def _maybe_spawn_repairs(args: argparse.Namespace, repo: Path) -> None:
         age_seconds = (now - updated_at).total_seconds()
         if age_seconds < float(args.repair_after_seconds):
             continue
+        attempts, last_repair_ts = repair_stats.get(task_id, (0, 0.0))
+        if args.max_repair_attempts and attempts >= int(args.max_repair_attempts):
+            continue
+        # A repair that has not pushed yet leaves updatedAt untouched; do not stack another one on it.
+        if now.timestamp() - last_repair_ts < float(args.repair_after_seconds):
+            continue
 
         checks_status, failing_checks = _summarize_pr_checks(pr)
         mergeable = pr.get("mergeable")
@@ -996,6 +2194,7 @@ def _maybe_spawn_repairs(args: argparse.Namespace, repo: Path) -> None:
                 "failing_checks": failing_checks,
                 "mergeable": mergeable_s,
                 "age_seconds": age_seconds,
+                "attempts": attempts,
             }
         )
 
@@ -1003,13 +2202,18 @@ def _maybe_spawn_repairs(args: argparse.Namespace, repo: Path) -> None:
     if not candidates_sorted:
         return
 
-    wt_parent = Path(args.worktree_parent).expanduser().resolve() if args.worktree_parent else repo.parent
+    wt_parent = _worktree_parent(args, repo)
     wt_parent.mkdir(parents=True, exist_ok=True)
+    pool = _worker_pool(args, repo) if args.runner == "pool" else None
 
     repairs_started = 0
-    for cand in candidates_sorted:
+    for i, cand in enumerate(candidates_sorted):
         if repairs_started >= int(args.max_repairs_per_tick):
             break
+        # Repairs share the --max-workers bound with task workers; the rest wait for a later tick.
+        if pool is not None and len(pool.workers) >= args.max_workers:
+            print(f"[repair] max_workers={args.max_workers} slots busy; deferring {len(candidates_sorted) - i} repair(s)")
+            break
         task_id = str(cand["task_id"])
         branch = str(cand["branch"])
         try:
@@ -1051,6 +2255,7 @@ def _maybe_spawn_repairs(args: argparse.Namespace, repo: Path) -> None:
             run_cmd.extend(["--max-worker-seconds", str(args.max_worker_seconds)])
         if args.max_review_seconds:
             run_cmd.extend(["--max-review-seconds", str(args.max_review_seconds)])
+        run_cmd.extend(["--max-gate-seconds", str(args.max_gate_seconds)])
         if args.codex_model:
             run_cmd.extend(["--codex-model", args.codex_model])
         if args.create_pr:
@@ -1058,6 +2263,16 @@ def _maybe_spawn_repairs(args: argparse.Namespace, repo: Path) -> None:
         if args.auto_merge:
             run_cmd.append("--auto-merge")
 
+        if pool is not None and task_id in pool.running_ids():
+            continue
+        if store is not None:
+            store.start_run(
+                task_id,
+                kind="repair",
+                runner=args.runner,
+                pr_number=cand.get("pr_number") if isinstance(cand.get("pr_number"), int) else None,
+                reason=reason,
+            )
         if args.runner == "tmux":
             tmux_ensure_session(args.tmux_session, repo)
             window_name = f"repair-{task_id}-{_utc_timestamp_compact()[9:15]}"
@@ -1067,6 +2282,8 @@ def _maybe_spawn_repairs(args: argparse.Namespace, repo: Path) -> None:
                 workdir=wt_path,
                 command=run_cmd,
             )
+        elif pool is not None:
+            pool.spawn(task_id, run_cmd, cwd=wt_path)
         else:
             _run(run_cmd, cwd=wt_path, check=False)
 
@@ -1074,10 +2291,38 @@ def _maybe_spawn_repairs(args: argparse.Namespace, repo: Path) -> None:
 
 
 def cmd_plan(args: argparse.Namespace) -> int:
-    done_ids = done_task_ids()
-    claimed_ids = claimed_task_ids(args.remote, args.base_branch)
-    ready = ready_backlog_tasks(done_ids=done_ids, claimed_ids=claimed_ids)
-    print(json.dumps({"done": sorted(done_ids), "claimed": sorted(claimed_ids), "ready": [dataclasses.asdict(t) for t in ready]}, indent=2, sort_keys=True, default=str))
+    index = TaskIndex.build()
+    ready_set = incremental_ready_set(index, verify=args.verify_incremental)
+    done_ids = ready_set.done_ids()
+    pr_cache = _pr_cache(args.pr_cache_ttl_seconds)
+    probes: list[dict[str, Any]] = []
+    claimed_ids = claimed_task_ids(
+        args.remote, args.base_branch, timeout_seconds=args.probe_timeout_seconds, stats=probes
+    )
+    ready = ready_set.ready(claimed_ids)
+    scores = _task_scores(args, index, done_ids)
+    ready = schedule_order(ready, scores)
+    store = _state_store(_repo_root())
+    try:
+        history = store.attempt_counts([t.task_id for t in ready] + sorted(claimed_ids)) if store else {}
+    except sqlite3.Error as exc:
+        history = {"error": str(exc)}
+    print(
+        json.dumps(
+            {
+                "done": sorted(done_ids),
+                "claimed": sorted(claimed_ids),
+                "claim_probes": probes,
+                "pr_cache": pr_cache.stats,
+                "ready": [dataclasses.asdict(t) for t in ready],
+                "scores": {t.task_id: dataclasses.asdict(scores[t.task_id]) for t in ready} if scores else {},
+                "history": history,
+            },
+            indent=2,
+            sort_keys=True,
+            default=str,
+        )
+    )
     return 0
 
 
@@ -1086,24 +2331,83 @@ def cmd_tick(args: argparse.Namespace) -> int:
     if args.unattended:
         _require_unattended_ack()
 
-    done_ids = done_task_ids()
-    claimed_ids = claimed_task_ids(args.remote, args.base_branch)
-    ready = ready_backlog_tasks(done_ids=done_ids, claimed_ids=claimed_ids)
-    locked_workstreams, parallel_only_workstreams = _compute_workstream_locks(repo=repo, claimed_ids=claimed_ids)
+    store = _state_store(repo)
+    tick_id = store.start_tick(args.cmd) if store is not None else None
+    status: dict[str, Any] = {}
+    started = time.monotonic()
+    try:
+        return _tick(args, repo, store, tick_id, status)
+    finally:
+        wt_pool = _worktree_pool(args, repo, _worktree_parent(args, repo))
+        if wt_pool is not None and not args.dry_run:
+            # Top the pool up off the critical path; a one-shot tick waits so the process can exit cleanly.
+            wt_pool.refill_in_background(base_ref=args.base_branch)
+            if args.cmd != "loop":
+                wt_pool.wait()
+        if store is not None:
+            store.finish_tick(tick_id, seconds=time.monotonic() - started, status=status)
+
+
+def _tick(
+    args: argparse.Namespace, repo: Path, store: StateStore | None, tick_id: int | None, status: dict[str, Any]
+) -> int:
+    """One planner pass; fills `status` with what happened so `cmd_tick` can record it."""
+    pool = _worker_pool(args, repo) if args.runner == "pool" else None
+    pool_finished = pool.reap() if pool is not None else []
+    _print_pool_finished(pool_finished)
+    if store is not None:
+        for rec in pool_finished:
+            store.close_open_runs(rec["task_id"], returncode=rec["returncode"], timed_out=rec["timed_out"])
+
+    index = TaskIndex.build(repo)
+    ready_set = incremental_ready_set(index, verify=args.verify_incremental)
+    done_ids = ready_set.done_ids()
+    wt_parent = _worktree_parent(args, repo)
+    wt_pool = _worktree_pool(args, repo, wt_parent)
+    if wt_pool is not None and not args.dry_run:
+        busy_ids = pool.running_ids() if pool is not None else set()
+        if args.runner == "tmux":
+            busy_ids |= _tmux_window_task_ids(args.tmux_session)
+        status["worktree_pool"] = {
+            "gc_removed": wt_pool.gc(),
+            "recycled": wt_pool.recycle(done_ids=done_ids, busy_ids=busy_ids, base_ref=args.base_branch),
+        }
+    pr_cache = _pr_cache(args.pr_cache_ttl_seconds)
+    probes: list[dict[str, Any]] = []
+    claimed_ids = claimed_task_ids(
+        args.remote, args.base_branch, timeout_seconds=args.probe_timeout_seconds, stats=probes
+    )
+    if pool is not None:
+        claimed_ids |= pool.running_ids()
+    for probe in probes:
+        if not probe["ok"]:
+            print(
+                f"[claims] {probe['probe']} probe failed ({probe['error']}); using {probe['source']} claims",
+                file=sys.stderr,
+            )
+    ready = ready_set.ready(claimed_ids)
+    scores = _task_scores(args, index, done_ids)
+    locked_workstreams, parallel_only_workstreams = _compute_workstream_locks(
+        repo=repo, claimed_ids=claimed_ids, index=index
+    )
     ready = _apply_workstream_concurrency_filters(
-        tasks=sorted(ready, key=lambda t: (_priority_rank(t.priority), t.task_id)),
+        tasks=schedule_order(ready, scores),
         locked_workstreams=locked_workstreams,
         parallel_only_workstreams=parallel_only_workstreams,
         capacity=len(ready),
     )
 
     if not ready:
+        status["result"] = "no_ready_tasks"
         print("No ready tasks in backlog.")
         return 0
 
     capacity = max(0, args.max_workers)
+    if pool is not None:
+        capacity = max(0, capacity - len(pool.workers))
     if capacity == 0:
-        print("max_workers=0; nothing to do.")
+        status["result"] = "no_capacity"
+        print(f"max_workers={args.max_workers} slots busy; nothing to do." if pool else "max_workers=0; nothing to do.")
         return 0
 
     if args.planner == "claude":
@@ -1112,9 +2416,10 @@ def cmd_tick(args: argparse.Namespace) -> int:
             capacity=capacity,
             model=args.claude_model,
             unattended=args.unattended,
+            scores=scores,
         )
     else:
-        selected = choose_tasks_heuristic(ready, capacity)
+        selected = choose_tasks_heuristic(ready, capacity, scores)
 
     selected = _apply_workstream_concurrency_filters(
         tasks=selected,
@@ -1123,10 +2428,10 @@ def cmd_tick(args: argparse.Namespace) -> int:
         capacity=capacity,
     )
     if not selected:
+        status["result"] = "none_selected"
         print("Planner selected no tasks.")
         return 0
 
-    wt_parent = Path(args.worktree_parent).expanduser().resolve() if args.worktree_parent else repo.parent
     wt_parent.mkdir(parents=True, exist_ok=True)
 
     tasks_started: list[dict[str, str]] = []
@@ -1140,8 +2445,12 @@ def cmd_tick(args: argparse.Namespace) -> int:
             print(f"[dry-run] would start {task.task_id}: {task.title}")
             continue
 
-        wt_path, branch = ensure_worktree(task=task, worktree_parent=wt_parent, base_ref=args.base_branch)
+        wt_path, branch = ensure_worktree(
+            task=task, worktree_parent=wt_parent, base_ref=args.base_branch, pool=wt_pool
+        )
         tasks_started.append({"task_id": task.task_id, "branch": branch, "worktree": str(wt_path)})
+        if store is not None:
+            store.start_run(task.task_id, kind="run", workstream=task.workstream, runner=args.runner, tick_id=tick_id)
 
         run_cmd = [
             sys.executable,
@@ -1164,6 +2473,7 @@ def cmd_tick(args: argparse.Namespace) -> int:
             run_cmd.extend(["--max-worker-seconds", str(args.max_worker_seconds)])
         if args.max_review_seconds:
             run_cmd.extend(["--max-review-seconds", str(args.max_review_seconds)])
+        run_cmd.extend(["--max-gate-seconds", str(args.max_gate_seconds)])
         if args.codex_model:
             run_cmd.extend(["--codex-model", args.codex_model])
         if args.create_pr:
@@ -1178,16 +2488,34 @@ def cmd_tick(args: argparse.Namespace) -> int:
                 workdir=wt_path,
                 command=run_cmd,
             )
+        elif pool is not None:
+            worker = pool.spawn(task.task_id, run_cmd, cwd=wt_path)
+            tasks_started[-1]["log"] = str(worker.log_path)
         else:
             # local (sequential)
             _run(run_cmd, cwd=wt_path, check=True)
 
-    status = {
-        "timestamp_utc": _utc_timestamp_compact(),
-        "selected": [t.task_id for t in selected],
-        "started": tasks_started,
-    }
+    status.update(
+        {
+            "timestamp_utc": _utc_timestamp_compact(),
+            "selected": [t.task_id for t in selected],
+            "started": tasks_started,
+            "claim_probes": probes,
+            "pr_cache": dict(pr_cache.stats),
+        }
+    )
+    if scores is not None:
+        status["scores"] = {t.task_id: dataclasses.asdict(scores[t.task_id]) for t in selected}
+    if pool is not None:
+        status["pool"] = {"running": sorted(pool.running_ids()), "finished": pool_finished}
     print(json.dumps(status, indent=2, sort_keys=True))
+    if pool is not None and args.cmd != "loop":
+        # One-shot tick: supervise children to completion (a loop reaps them on later ticks instead).
+        finished = pool.wait_all()
+        _print_pool_finished(finished)
+        if store is not None:
+            for rec in finished:
+                store.close_open_runs(rec["task_id"], returncode=rec["returncode"], timed_out=rec["timed_out"])
     return 0
 
 
@@ -1224,16 +2552,20 @@ def cmd_tmux_start(args: argparse.Namespace) -> int:
     ]
     if args.worktree_parent:
         loop_cmd.extend(["--worktree-parent", args.worktree_parent])
+    if args.worktree_pool_size:
+        loop_cmd.extend(["--worktree-pool-size", str(args.worktree_pool_size)])
     if args.unattended:
         loop_cmd.append("--unattended")
     if args.max_worker_seconds:
         loop_cmd.extend(["--max-worker-seconds", str(args.max_worker_seconds)])
     if args.max_review_seconds:
         loop_cmd.extend(["--max-review-seconds", str(args.max_review_seconds)])
+    loop_cmd.extend(["--max-gate-seconds", str(args.max_gate_seconds)])
     if args.repair_after_seconds:
         loop_cmd.extend(["--repair-after-seconds", str(args.repair_after_seconds)])
     if args.max_repairs_per_tick is not None:
         loop_cmd.extend(["--max-repairs-per-tick", str(args.max_repairs_per_tick)])
+    loop_cmd.extend(["--max-repair-attempts", str(args.max_repair_attempts)])
     if args.codex_model:
         loop_cmd.extend(["--codex-model", args.codex_model])
     if args.claude_model:
@@ -1242,6 +2574,10 @@ def cmd_tmux_start(args: argparse.Namespace) -> int:
         loop_cmd.append("--create-pr")
     if args.auto_merge:
         loop_cmd.append("--auto-merge")
+    loop_cmd.extend(["--pr-cache-ttl-seconds", str(args.pr_cache_ttl_seconds)])
+    loop_cmd.extend(["--scheduler", args.scheduler])
+    if args.watch:
+        loop_cmd.append("--watch")
 
     tmux_spawn_task_window(
         session=args.tmux_session,
@@ -1255,14 +2591,129 @@ def cmd_tmux_start(args: argparse.Namespace) -> int:
     return 0
 
 
+@dataclasses.dataclass
+class LoopWatcher:
+    """Cheap polled fingerprints of everything that can give the next tick new work.
+
+    Sources: task files under `.orchestrator/`, local git refs (worker commits), remote heads
+    (`git ls-remote`, polled less often since it hits the network), and tmux worker windows /
+    pool children (either disappears when its worker exits).
+    """
+
+    repo: Path
+    remote: str
+    tmux_session: str | None = None
+    remote_poll_seconds: float = 60.0
+    _last: dict[str, object] = dataclasses.field(default_factory=dict)
+    _last_remote_poll: float = 0.0
+
+    def _orchestrator(self) -> object:
+        orch = self.repo / ".orchestrator"
+        entries: list[tuple[str, int, int]] = []
+        for sub in LIFECYCLE_DIRS:
+            d = orch / sub
+            try:
+                entries.append((sub, d.stat().st_mtime_ns, 0))
+            except FileNotFoundError:
+                continue
+            for p in d.glob("*.md"):
+                try:
+                    st = p.stat()
+                except FileNotFoundError:  # moved to another lifecycle dir between glob and stat
+                    continue
+                entries.append((f"{sub}/{p.name}", st.st_mtime_ns, st.st_size))
+        return tuple(sorted(entries))
+
+    def _git_lines(self, cmd: list[str], timeout_seconds: float) -> object:
+        try:
+            cp = _run(cmd, cwd=self.repo, capture=True, check=True, timeout_seconds=timeout_seconds)
+        except Exception:
+            return None  # unknown: never counts as a change
+        return tuple(sorted((cp.stdout or "").splitlines()))
+
+    def _local_refs(self) -> object:
+        return self._git_lines(["git", "for-each-ref", "--format=%(objectname) %(refname)", "refs/heads"], 10)
+
+    def _remote_refs(self) -> object:
+        return self._git_lines(["git", "ls-remote", "--heads", self.remote], CLAIM_PROBE_TIMEOUT_SECONDS)
+
+    def _tmux_windows(self) -> object:
+        if self.tmux_session is None or _which_or_none("tmux") is None:
+            return None
+        cp = _tmux(
+            "list-windows", "-t", self.tmux_session, "-F", "#{window_id} #{window_name}", check=False, capture=True
+        )
+        return tuple(sorted((cp.stdout or "").splitlines())) if cp.returncode == 0 else None
+
+    def _pool_children(self) -> object:
+        if _WORKER_POOL is None:
+            return None
+        return tuple(sorted(tid for tid, w in _WORKER_POOL.workers.items() if w.proc.poll() is None))
+
+    def _sources(self, *, include_remote: bool) -> dict[str, Callable[[], object]]:
+        sources: dict[str, Callable[[], object]] = {
+            "orchestrator": self._orchestrator,
+            "local_refs": self._local_refs,
+            "tmux_windows": self._tmux_windows,
+            "pool_children": self._pool_children,
+        }
+        if include_remote:
+            sources["remote_refs"] = self._remote_refs
+        return sources
+
+    def mark(self) -> None:
+        """Record the current state of every source (call right after a tick)."""
+        self._last = {name: fn() for name, fn in self._sources(include_remote=True).items()}
+        self._last_remote_poll = time.monotonic()
+
+    def changed(self) -> list[str]:
+        """Names of sources that differ from the last observation (remote refs only when due)."""
+        include_remote = time.monotonic() - self._last_remote_poll >= self.remote_poll_seconds
+        if include_remote:
+            self._last_remote_poll = time.monotonic()
+        out: list[str] = []
+        for name, fn in self._sources(include_remote=include_remote).items():
+            value = fn()
+            if value is None:
+                continue
+            if value != self._last.get(name):
+                out.append(name)
+            self._last[name] = value
+        return out
+
+    def wait(self, *, max_idle_seconds: float, poll_seconds: float) -> str:
+        """Block until a source changes (returns their names) or `max_idle_seconds` pass (`max_idle`)."""
+        deadline = time.monotonic() + max_idle_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return "max_idle"
+            time.sleep(min(poll_seconds, remaining))
+            changed = self.changed()
+            if changed:
+                return ",".join(changed)
+
+
 def cmd_loop(args: argparse.Namespace) -> int:
     repo = _repo_root()
     if args.unattended:
         _require_unattended_ack()
     interval = max(5, int(args.interval_seconds))
-    print(f"Swarm loop started (interval={interval}s). Repo: {repo}")
+    watcher: LoopWatcher | None = None
+    if args.watch:
+        watcher = LoopWatcher(
+            repo=repo,
+            remote=args.remote,
+            tmux_session=args.tmux_session if args.runner == "tmux" else None,
+            remote_poll_seconds=float(args.remote_poll_seconds),
+        )
+        print(f"Swarm loop started (event-driven, max idle={interval}s). Repo: {repo}")
+    else:
+        print(f"Swarm loop started (interval={interval}s). Repo: {repo}")
     while True:
         try:
+            if _WORKTREE_POOL is not None:
+                _WORKTREE_POOL.wait()  # no pool refill racing the base-branch reset
             _supervisor_sync_to_remote_base(repo=repo, remote=args.remote, base_branch=args.base_branch)
             cmd_tick(args)
             _maybe_spawn_repairs(args, repo)
@@ -1272,6 +2723,11 @@ def cmd_loop(args: argparse.Namespace) -> int:
                 # Fail loudly in unattended mode; persistent sync/auth failures otherwise cause silent stalls.
                 return 1
         try:
+            if watcher is not None:
+                watcher.mark()
+                reason = watcher.wait(max_idle_seconds=interval, poll_seconds=max(1.0, float(args.poll_seconds)))
+                print(f"[loop] tick triggered by: {reason}")
+                continue
             time_to_sleep = interval
             # Sleep in small increments so Ctrl-C works responsively even in tmux.
             while time_to_sleep > 0:
@@ -1283,6 +2739,27 @@ def cmd_loop(args: argparse.Namespace) -> int:
             return 0
 
 
+def cmd_history(args: argparse.Namespace) -> int:
+    path = Path(args.state_db) if args.state_db else _state_db_path(_repo_root())
+    if not path.exists():
+        raise SystemExit(f"No swarm state store at {path} (it is created by the first tick or run-task)")
+    store = StateStore(path)
+    try:
+        payload: dict[str, Any] = {
+            "state_db": str(path),
+            "worker_seconds_by_workstream": store.worker_seconds_by_workstream(),
+            f"repaired_more_than_{args.repaired_more_than}": store.tasks_repaired_more_than(args.repaired_more_than),
+            "gate_results": store.gate_failures(),
+            "recent_runs": store.recent_runs(args.limit),
+        }
+        if args.task_id:
+            payload["task"] = store.attempt_counts([args.task_id]).get(args.task_id)
+    finally:
+        store.close()
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
 def cmd_run_task(args: argparse.Namespace) -> int:
     repo = _repo_root()
 
@@ -1300,6 +2777,12 @@ def cmd_run_task(args: argparse.Namespace) -> int:
 
     task = load_task(task_file)
     allow_network = task.workstream in {"W1", "W2"}
+    store = _state_store(repo)
+    run_id = (
+        store.open_run(task.task_id, kind="repair" if args.repair_context else "run", workstream=task.workstream)
+        if store is not None
+        else None
+    )
 
     # Claim: set State=active (do NOT move lifecycle folders; Planner sweeps separately)
     if task.state == "backlog":
@@ -1346,9 +2829,14 @@ def cmd_run_task(args: argparse.Namespace) -> int:
         output_last_message=worker_last_msg,
     )
     worker_timeout = int(args.max_worker_seconds) if args.max_worker_seconds else None
+    worker_started = time.monotonic()
     try:
         _run(worker_cmd, cwd=repo, check=False, timeout_seconds=worker_timeout)
     except subprocess.TimeoutExpired:
+        if store is not None:
+            store.finish_run(
+                run_id, final_state="active", returncode=124, worker_seconds=time.monotonic() - worker_started
+            )
         timeout_note = (
             f"Worker timed out after {worker_timeout}s; leaving task active. "
             f"Last message: {worker_last_msg.as_posix()}"
@@ -1360,17 +2848,43 @@ def cmd_run_task(args: argparse.Namespace) -> int:
             _run(["git", "push", "-u", args.remote, _git_current_branch(repo)], cwd=repo, check=False)
         print(json.dumps({"task_id": task.task_id, "state": "active", "error": "worker_timeout"}, indent=2))
         return 1
+    worker_seconds = time.monotonic() - worker_started
 
     # Judge: run declared gates (deterministic) + enforce path ownership
-    gate_ok = True
-    gate_outputs: list[dict[str, Any]] = []
-    for gate in task.gates:
+    # `make gate` honours GATE_ARGS; ask the quality gate runner for a parseable JSON report.
+    gate_env = {**os.environ, "GATE_ARGS": "--json"}
+    gate_stamp = _utc_timestamp_compact()
+    gate_timeout = float(args.max_gate_seconds) if args.max_gate_seconds else None
+
+    def _judge_gate(i: int, gate: str) -> dict[str, Any]:
         # gates are declared in task files; run as shell for simplicity
         print(f"[judge] running gate: {gate}")
-        cp = subprocess.run(gate, cwd=str(repo), shell=True, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        gate_outputs.append({"command": gate, "returncode": cp.returncode, "output": (cp.stdout or "")[-2000:]})
-        if cp.returncode != 0:
-            gate_ok = False
+        return run_judge_gate(
+            gate,
+            cwd=repo,
+            env=gate_env,
+            log_path=logs_dir / f"{task.task_id}_{gate_stamp}_gate{i}.log",
+            timeout_seconds=gate_timeout,
+        )
+
+    if task.parallel_gates and len(task.gates) > 1:
+        with ThreadPoolExecutor(max_workers=len(task.gates)) as ex:
+            gate_outputs = list(ex.map(_judge_gate, range(len(task.gates)), task.gates))
+    else:
+        gate_outputs = [_judge_gate(i, gate) for i, gate in enumerate(task.gates)]
+    gate_ok = all(g["returncode"] == 0 and not g["timed_out"] for g in gate_outputs)
+    for g in gate_outputs:
+        print(f"[judge] {_gate_summary_line(g)[2:]}; log: {g['log']}")
+        if store is not None:
+            store.record_gate(
+                run_id,
+                command=g["command"],
+                returncode=g["returncode"],
+                seconds=g["seconds"],
+                failed_gates=g.get("failed_gates"),
+                peak_rss_kb=g["peak_rss_kb"],
+                timed_out=g["timed_out"],
+            )
 
     status_entries = _git_status_entries(repo)
     changed = sorted({e["path"] for e in status_entries if e.get("path")})
@@ -1447,6 +2961,10 @@ def cmd_run_task(args: argparse.Namespace) -> int:
 
     # Update task status (do NOT move file; Planner action is separate via sweep_tasks.py)
     _update_task_status_and_notes(task_path=task_file, new_state=new_state, note_line=note)
+    if store is not None:
+        store.finish_run(
+            run_id, final_state=new_state, returncode=0, gate_ok=gate_ok and ownership_ok, worker_seconds=worker_seconds
+        )
 
     # Commit + push
     if _git_has_changes(repo):
@@ -1462,8 +2980,8 @@ def cmd_run_task(args: argparse.Namespace) -> int:
                 f"Task: `{task_file.as_posix()}`",
                 f"State: `{new_state}`",
                 "",
-                "Gates run:",
-                *(f"- `{g['command']}` (rc={g['returncode']})" for g in gate_outputs),
+                "Gates run" + (" (in parallel):" if task.parallel_gates and len(gate_outputs) > 1 else ":"),
+                *(_gate_summary_line(g) for g in gate_outputs),
                 "",
                 "Notes:",
                 "- This PR was generated by the swarm supervisor (unattended).",
@@ -1481,6 +2999,7 @@ def cmd_run_task(args: argparse.Namespace) -> int:
                 "state": new_state,
                 "branch": _git_current_branch(repo),
                 "gate_ok": gate_ok,
+                "gates": [{k: v for k, v in g.items() if k != "output"} for g in gate_outputs],
                 "ownership_ok": ownership_ok,
                 "ownership_failures": ownership_failures,
                 "review_log": str(review_path),
@@ -1499,14 +3018,32 @@ def build_parser() -> argparse.ArgumentParser:
     plan = sub.add_parser("plan", help="Print done/claimed/ready tasks (JSON)")
     plan.add_argument("--remote", default="origin")
     plan.add_argument("--base-branch", default="main")
+    plan.add_argument("--probe-timeout-seconds", type=float, default=CLAIM_PROBE_TIMEOUT_SECONDS)
+    plan.add_argument(
+        "--pr-cache-ttl-seconds", type=float, default=PR_CACHE_TTL_SECONDS, help="Reuse open-PR state this long"
+    )
+    plan.add_argument(
+        "--verify-incremental",
+        action="store_true",
+        help="Debug: check the incremental ready set against a full recompute every tick (fails on mismatch)",
+    )
+    plan.add_argument(
+        "--scheduler",
+        choices=["critical-path", "priority"],
+        default="critical-path",
+        help="Order ready tasks by dependency critical path (default) or by priority only",
+    )
     plan.set_defaults(func=cmd_plan)
 
     tick = sub.add_parser("tick", help="Start up to N ready tasks (spawns tmux windows by default)")
     tick.add_argument("--planner", choices=["heuristic", "claude"], default="heuristic")
-    tick.add_argument("--runner", choices=["tmux", "local"], default="tmux")
+    tick.add_argument("--runner", choices=["tmux", "local", "pool"], default="tmux")
     tick.add_argument("--tmux-session", default="swarm")
     tick.add_argument("--max-workers", type=int, default=1)
     tick.add_argument("--worktree-parent", default=None)
+    tick.add_argument(
+        "--worktree-pool-size", type=int, default=0, help="Keep N warm detached worktrees for new tasks (0=off)"
+    )
     tick.add_argument("--remote", default="origin")
     tick.add_argument("--base-branch", default="main")
     tick.add_argument("--codex-model", default=None)
@@ -1515,21 +3052,43 @@ def build_parser() -> argparse.ArgumentParser:
     tick.add_argument("--unattended", action="store_true")
     tick.add_argument("--max-worker-seconds", type=int, default=0)
     tick.add_argument("--max-review-seconds", type=int, default=0)
+    tick.add_argument("--max-gate-seconds", type=int, default=JUDGE_GATE_TIMEOUT_SECONDS)
     tick.add_argument("--repair-after-seconds", type=int, default=14400)
     tick.add_argument("--max-repairs-per-tick", type=int, default=1)
+    tick.add_argument(
+        "--max-repair-attempts", type=int, default=3, help="Stop auto-repairing a task after N recorded attempts (0=never)"
+    )
     tick.add_argument("--create-pr", action="store_true")
     tick.add_argument("--auto-merge", action="store_true")
     tick.add_argument("--final-state", choices=["ready_for_review", "done"], default="ready_for_review")
     tick.add_argument("--dry-run", action="store_true")
+    tick.add_argument("--probe-timeout-seconds", type=float, default=CLAIM_PROBE_TIMEOUT_SECONDS)
+    tick.add_argument(
+        "--pr-cache-ttl-seconds", type=float, default=PR_CACHE_TTL_SECONDS, help="Reuse open-PR state this long"
+    )
+    tick.add_argument(
+        "--verify-incremental",
+        action="store_true",
+        help="Debug: check the incremental ready set against a full recompute every tick (fails on mismatch)",
+    )
+    tick.add_argument(
+        "--scheduler",
+        choices=["critical-path", "priority"],
+        default="critical-path",
+        help="Order ready tasks by dependency critical path (default) or by priority only",
+    )
     tick.set_defaults(func=cmd_tick)
 
     loop = sub.add_parser("loop", help="Run tick repeatedly (intended to be run inside tmux)")
     loop.add_argument("--interval-seconds", type=int, default=300)
     loop.add_argument("--planner", choices=["heuristic", "claude"], default="heuristic")
-    loop.add_argument("--runner", choices=["tmux", "local"], default="tmux")
+    loop.add_argument("--runner", choices=["tmux", "local", "pool"], default="tmux")
     loop.add_argument("--tmux-session", default="swarm")
     loop.add_argument("--max-workers", type=int, default=1)
     loop.add_argument("--worktree-parent", default=None)
+    loop.add_argument(
+        "--worktree-pool-size", type=int, default=0, help="Keep N warm detached worktrees for new tasks (0=off)"
+    )
     loop.add_argument("--remote", default="origin")
     loop.add_argument("--base-branch", default="main")
     loop.add_argument("--codex-model", default=None)
@@ -1538,12 +3097,38 @@ def build_parser() -> argparse.ArgumentParser:
     loop.add_argument("--unattended", action="store_true")
     loop.add_argument("--max-worker-seconds", type=int, default=0)
     loop.add_argument("--max-review-seconds", type=int, default=0)
+    loop.add_argument("--max-gate-seconds", type=int, default=JUDGE_GATE_TIMEOUT_SECONDS)
     loop.add_argument("--repair-after-seconds", type=int, default=14400)
     loop.add_argument("--max-repairs-per-tick", type=int, default=1)
+    loop.add_argument(
+        "--max-repair-attempts", type=int, default=3, help="Stop auto-repairing a task after N recorded attempts (0=never)"
+    )
     loop.add_argument("--create-pr", action="store_true")
     loop.add_argument("--auto-merge", action="store_true")
     loop.add_argument("--final-state", choices=["ready_for_review", "done"], default="ready_for_review")
     loop.add_argument("--dry-run", action="store_true")
+    loop.add_argument("--probe-timeout-seconds", type=float, default=CLAIM_PROBE_TIMEOUT_SECONDS)
+    loop.add_argument(
+        "--pr-cache-ttl-seconds", type=float, default=PR_CACHE_TTL_SECONDS, help="Reuse open-PR state this long"
+    )
+    loop.add_argument(
+        "--verify-incremental",
+        action="store_true",
+        help="Debug: check the incremental ready set against a full recompute every tick (fails on mismatch)",
+    )
+    loop.add_argument(
+        "--watch",
+        action="store_true",
+        help="Tick only when tasks, git refs or tmux worker windows change (--interval-seconds becomes the max idle)",
+    )
+    loop.add_argument("--poll-seconds", type=float, default=5, help="Local change poll period in --watch mode")
+    loop.add_argument("--remote-poll-seconds", type=float, default=60, help="git ls-remote period in --watch mode")
+    loop.add_argument(
+        "--scheduler",
+        choices=["critical-path", "priority"],
+        default="critical-path",
+        help="Order ready tasks by dependency critical path (default) or by priority only",
+    )
     loop.set_defaults(func=cmd_loop)
 
     tmux_start = sub.add_parser("tmux-start", help="Create tmux session + start supervisor loop window")
@@ -1553,6 +3138,9 @@ def build_parser() -> argparse.ArgumentParser:
     tmux_start.add_argument("--planner", choices=["heuristic", "claude"], default="heuristic")
     tmux_start.add_argument("--max-workers", type=int, default=1)
     tmux_start.add_argument("--worktree-parent", default=None)
+    tmux_start.add_argument(
+        "--worktree-pool-size", type=int, default=0, help="Keep N warm detached worktrees for new tasks (0=off)"
+    )
     tmux_start.add_argument("--remote", default="origin")
     tmux_start.add_argument("--base-branch", default="main")
     tmux_start.add_argument("--codex-model", default=None)
@@ -1561,13 +3149,32 @@ def build_parser() -> argparse.ArgumentParser:
     tmux_start.add_argument("--unattended", action="store_true")
     tmux_start.add_argument("--max-worker-seconds", type=int, default=0)
     tmux_start.add_argument("--max-review-seconds", type=int, default=0)
+    tmux_start.add_argument("--max-gate-seconds", type=int, default=JUDGE_GATE_TIMEOUT_SECONDS)
     tmux_start.add_argument("--repair-after-seconds", type=int, default=14400)
     tmux_start.add_argument("--max-repairs-per-tick", type=int, default=1)
+    tmux_start.add_argument(
+        "--max-repair-attempts", type=int, default=3, help="Stop auto-repairing a task after N recorded attempts (0=never)"
+    )
     tmux_start.add_argument("--create-pr", action="store_true")
     tmux_start.add_argument("--auto-merge", action="store_true")
     tmux_start.add_argument("--final-state", choices=["ready_for_review", "done"], default="ready_for_review")
+    tmux_start.add_argument("--pr-cache-ttl-seconds", type=float, default=PR_CACHE_TTL_SECONDS)
+    tmux_start.add_argument("--watch", action="store_true", help="Run the supervisor loop in event-driven mode")
+    tmux_start.add_argument(
+        "--scheduler",
+        choices=["critical-path", "priority"],
+        default="critical-path",
+        help="Order ready tasks by dependency critical path (default) or by priority only",
+    )
     tmux_start.set_defaults(func=cmd_tmux_start)
 
+    history = sub.add_parser("history", help="Query the swarm state store (JSON)")
+    history.add_argument("--state-db", default=None, help="Defaults to data/tmp/swarm_state.sqlite3 in the main checkout")
+    history.add_argument("--repaired-more-than", type=int, default=1, help="List tasks with more than N repair passes")
+    history.add_argument("--limit", type=int, default=20, help="Number of recent runs to list")
+    history.add_argument("--task-id", default=None)
+    history.set_defaults(func=cmd_history)
+
     run_task = sub.add_parser("run-task", help="Run a single task in the current worktree (Codex worker + gates + PR)")
     run_task.add_argument("--task-id", required=True)
     run_task.add_argument("--remote", default="origin")
@@ -1577,6 +3184,9 @@ def build_parser() -> argparse.ArgumentParser:
     run_task.add_argument("--unattended", action="store_true")
     run_task.add_argument("--max-worker-seconds", type=int, default=0, help="If >0, timeout Codex worker execution")
     run_task.add_argument("--max-review-seconds", type=int, default=0, help="If >0, timeout optional Codex review")
+    run_task.add_argument(
+        "--max-gate-seconds", type=int, default=JUDGE_GATE_TIMEOUT_SECONDS, help="Per-gate timeout (0=none)"
+    )
     run_task.add_argument("--repair-context", default=None, help="Optional context string for automated repair passes")
     run_task.add_argument("--create-pr", action="store_true")
     run_task.add_argument("--auto-merge", action="store_true")
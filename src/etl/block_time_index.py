@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Resolve UTC dates to L1 block ranges from a memory-mapped block-timestamp index.
+
+Phase 2 Step 1 of `docs/end_to_end_data_collection_plan.md`. The index
+(`data/tmp/l1_block_timestamps.u32`) stores one little-endian uint32 timestamp per block,
+starting at a base block. Unknown blocks hold 0xFFFFFFFF, and a 16-byte header records the base and
+the length of the contiguous filled run from it (the *indexed head*).
+
+`l1_extract.py` (and so `l1_backfill.py`) records every block it writes. `build` fills the index
+from existing block parts. Re-recording a range (e.g. after a reorg) overwrites it and clears stored
+neighbours that no longer fit in order. Over `[base, head]`, block timestamps strictly increase, so "first block
+at or after t" is one `bisect` over the mmap, with no parsing or loading.
+
+Targets outside the indexed range fall back to a search over JSON-RPC. Each step fetches
+`PROBES_PER_ROUND` headers in one batch request and narrows the interval ~17x per round trip.
+
+`bounds` writes `data/reference/block_bounds.json`:
+- `start_block` is the first block of `--start-date`;
+- `end_block` is the last block of `--end-date` (both inclusive, UTC days).
+
+Usage:
+  python src/etl/block_time_index.py build data/raw/l1/blocks/run_date=2026-01-22
+  python src/etl/block_time_index.py day --date 2024-03-13
+  L1_RPC_URL=https://... python src/etl/block_time_index.py bounds --start-date 2024-01-01 --end-date 2024-06-30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import fcntl
+import json
+import mmap
+import os
+import struct
+import sys
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+
+INDEX_PATH = Path("data/tmp/l1_block_timestamps.u32")
+BOUNDS_PATH = Path("data/reference/block_bounds.json")
+MAGIC = b"L1TS"
+VERSION = 1
+HEADER = struct.Struct("<4sIII")  # magic, version, base block, contiguous entries from base
+MISSING = 0xFFFFFFFF
+PROBES_PER_ROUND = 16
+FILL_CHUNK_ENTRIES = 1 << 20
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+def _day_start(day: date) -> int:
+    return int(datetime.combine(day, dtime(0), tzinfo=timezone.utc).timestamp())
+
+
+def _utc(ts: int) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+class BlockTimeIndex:
+    """Read-only mmap view of the index; open once and query many times."""
+
+    def __init__(self, path: Path) -> None:
+        if sys.byteorder != "little":
+            raise SystemExit("block_time_index requires a little-endian host")
+        self.path = path
+        self._f = path.open("rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._f.close()
+            raise SystemExit(f"Block-time index is empty: {path}")
+        magic, version, self.base, self.count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise SystemExit(f"Not a block-time index (or unsupported version): {path}")
+        self._ts = memoryview(self._mm)[HEADER.size :].cast("I")
+
+    def __enter__(self) -> "BlockTimeIndex":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if getattr(self, "_ts", None) is not None:
+            self._ts.release()
+            self._ts = None  # type: ignore[assignment]
+        self._mm.close()
+        self._f.close()
+
+    @property
+    def head(self) -> int | None:
+        """Last block of the contiguous indexed run, or None if it is empty."""
+        return self.base + self.count - 1 if self.count else None
+
+    def timestamp(self, block: int) -> int | None:
+        i = block - self.base
+        if 0 <= i < len(self._ts) and self._ts[i] != MISSING:
+            return self._ts[i]
+        return None
+
+    def locate(self, ts: int) -> int | None:
+        """First block with timestamp >= ts, if the indexed run can decide it (else None)."""
+        if not self.count or ts > self._ts[self.count - 1]:
+            return None
+        if ts < self._ts[0] and self.base > 0:
+            return None  # the answer may lie below the indexed range
+        return self.base + bisect.bisect_left(self._ts, ts, 0, self.count)
+
+    def day_range(self, day: date) -> tuple[int, int] | None:
+        """(first, last) block of a UTC day, or None if the index does not cover the whole day."""
+        first = self.locate(_day_start(day))
+        nxt = self.locate(_day_start(day + timedelta(days=1)))
+        if first is None or nxt is None:
+            return None
+        return first, nxt - 1
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+
+def _write_header(f: Any, base: int, count: int) -> None:
+    f.seek(0)
+    f.write(HEADER.pack(MAGIC, VERSION, base, count))
+
+
+def _fill_missing(f: Any, entries: int) -> None:
+    chunk = struct.pack("<I", MISSING) * min(entries, FILL_CHUNK_ENTRIES)
+    while entries > 0:
+        n = min(entries, FILL_CHUNK_ENTRIES)
+        f.write(chunk[: 4 * n])
+        entries -= n
+
+
+def _rebase(path: Path, new_base: int) -> None:
+    """Rewrite the index so that it starts at `new_base` (below the current base)."""
+    tmp = path.with_name(f".{path.name}.part")
+    try:
+        with path.open("rb") as src, tmp.open("wb") as dst:
+            _, _, base, _ = HEADER.unpack(src.read(HEADER.size))
+            _write_header(dst, new_base, 0)
+            _fill_missing(dst, base - new_base)
+            while chunk := src.read(1 << 24):
+                dst.write(chunk)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def check_timestamps(items: Iterable[tuple[int, int]]) -> dict[int, int]:
+    """Validate (block, timestamp) pairs for the index: in range and strictly increasing with the block."""
+    entries = dict(items)
+    prev: tuple[int, int] | None = None
+    for block in sorted(entries):
+        ts = entries[block]
+        if block < 0 or not 0 <= ts < MISSING:
+            raise ValueError(f"block {block}: timestamp {ts} out of range for the index")
+        if prev is not None and prev[1] >= ts:
+            raise ValueError(f"block {block}: timestamp {ts} does not increase after block {prev[0]} ({prev[1]})")
+        prev = (block, ts)
+    return entries
+
+
+def record_timestamps(path: Path, items: Iterable[tuple[int, int]]) -> int | None:
+    """Store (block, timestamp) pairs in the index (created on first use); returns the indexed head.
+
+    The pairs own the range [min block, max block]: stored entries inside it are replaced (or cleared
+    where no pair is given), and stored neighbours past its edges that no longer increase against it
+    (e.g. from before a reorg) are cleared. Writers serialize on a sidecar lock file; readers that
+    already mapped the file are unaffected by a rebase (which replaces the file).
+    """
+    entries = check_timestamps(items)
+    if not entries:
+        return None
+    lo, hi = min(entries), max(entries)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.with_name(f"{path.name}.lock").open("a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not path.exists():
+            with path.open("wb") as f:
+                _write_header(f, lo, 0)
+        with path.open("rb") as f:
+            _, _, base, _ = HEADER.unpack(f.read(HEADER.size))
+        if lo < base:
+            _rebase(path, lo)
+            base = lo
+        with path.open("r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            have = (size - HEADER.size) // 4
+            if hi - base + 1 > have:
+                _fill_missing(f, hi - base + 1 - have)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0) as mm:
+                ts_view = memoryview(mm)[HEADER.size :].cast("I")
+                try:
+                    _, _, _, count = HEADER.unpack_from(mm, 0)
+                    for i in range(lo - base, hi - base + 1):
+                        ts_view[i] = entries.get(base + i, MISSING)
+                    cleared = _clear_stale_neighbours(ts_view, lo - base, hi - base, entries[lo], entries[hi])
+                    gap = next((b - base for b in range(lo, hi + 1) if b not in entries), cleared)
+                    count = min(count, cleared, gap)
+                    while count < len(ts_view) and ts_view[count] != MISSING:
+                        count += 1
+                finally:
+                    ts_view.release()
+                HEADER.pack_into(mm, 0, MAGIC, VERSION, base, count)
+                mm.flush()
+    return base + count - 1 if count else None
+
+
+def _clear_stale_neighbours(ts_view: memoryview, lo: int, hi: int, lo_ts: int, hi_ts: int) -> int:
+    """Clear stored entries below `lo` / above `hi` that do not increase against the range's edges.
+
+    Returns the lowest cleared offset (len(ts_view) if none), so the caller can pull the head back.
+    """
+    lowest = len(ts_view)
+    i = lo - 1
+    while i >= 0 and ts_view[i] != MISSING and ts_view[i] >= lo_ts:
+        ts_view[i] = MISSING
+        lowest = i
+        i -= 1
+    i = hi + 1
+    while i < len(ts_view) and ts_view[i] != MISSING and ts_view[i] <= hi_ts:
+        ts_view[i] = MISSING
+        lowest = min(lowest, i)
+        i += 1
+    return lowest
+
+
+def build_from_parts(path: Path, part_paths: Iterable[Path]) -> int | None:
+    """Record the (block_number, timestamp) of every row in l1_extract block part files."""
+    import l1_extract as l1
+
+    head = None
+    for part in part_paths:
+        rows = l1.read_part(part, ["block_number", "timestamp"])
+        head = record_timestamps(path, ((r["block_number"], r["timestamp"]) for r in rows))
+    return head
+
+
+# ---------------------------------------------------------------------------
+# RPC fallback
+# ---------------------------------------------------------------------------
+
+
+class RpcTimestamps:
+    """Block-header timestamps over JSON-RPC, with a per-run cache."""
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+        self.cache: dict[int, int] = {}
+        self.round_trips = 0
+
+    async def latest(self) -> int:
+        self.round_trips += 1
+        (number,) = await self.client.batch([("eth_blockNumber", [])])
+        return int(number, 16)
+
+    async def timestamps(self, blocks: Iterable[int]) -> dict[int, int]:
+        todo = sorted({b for b in blocks if b not in self.cache})
+        if todo:
+            self.round_trips += 1
+            headers = await self.client.batch([("eth_getBlockByNumber", [hex(b), False]) for b in todo])
+            for b, header in zip(todo, headers):
+                self.cache[b] = int(header["timestamp"], 16)
+        return self.cache
+
+    async def first_block_at_or_after(self, ts: int, lo: int, hi: int) -> int | None:
+        """Smallest block in [lo, hi] with timestamp >= ts; None if even hi is earlier than ts."""
+        known = await self.timestamps([hi])
+        if known[hi] < ts:
+            return None
+        while lo < hi:
+            step = max(1, (hi - lo) // (PROBES_PER_ROUND + 1))
+            probes = list(range(lo + step - 1, hi, step))[:PROBES_PER_ROUND]
+            known = await self.timestamps(probes)
+            for b in probes:
+                if known[b] >= ts:
+                    hi = b
+                    break
+                lo = b + 1
+        return lo
+
+
+async def resolve_first_block(ts: int, index: BlockTimeIndex | None, rpc: RpcTimestamps | None) -> tuple[int, str] | None:
+    """(first block with timestamp >= ts, "index" | "rpc"); None if no block that late exists yet."""
+    if index is not None:
+        hit = index.locate(ts)
+        if hit is not None:
+            return hit, "index"
+    if rpc is None:
+        raise SystemExit(f"{_utc(ts)} is outside the block-time index; pass --rpc-url (or set L1_RPC_URL) to search over RPC")
+    lo, hi = 0, None
+    if index is not None and index.count:
+        if ts > index.timestamp(index.head):  # type: ignore[arg-type]
+            lo = index.head + 1  # type: ignore[operator]
+        else:
+            hi = index.base  # before the indexed run; its first block is an upper bound
+    if hi is None:
+        hi = await rpc.latest()
+        if lo > hi:
+            return None
+    block = await rpc.first_block_at_or_after(ts, lo, hi)
+    return None if block is None else (block, "rpc")
+
+
+async def resolve_bounds(
+    start: date, end: date, index: BlockTimeIndex | None, rpc: RpcTimestamps | None
+) -> dict[str, object]:
+    first = await resolve_first_block(_day_start(start), index, rpc)
+    after = await resolve_first_block(_day_start(end + timedelta(days=1)), index, rpc)
+    if first is None:
+        raise SystemExit(f"No block on or after {start} yet")
+    if after is None:
+        raise SystemExit(f"{end} is not complete yet (no block after it as of the latest head)")
+    start_block, end_block = first[0], after[0] - 1
+
+    async def block_ts(block: int) -> int:
+        ts = index.timestamp(block) if index is not None else None
+        if ts is None:
+            ts = (await rpc.timestamps([block]))[block]  # type: ignore[union-attr]
+        return ts
+
+    return {
+        "chain": "ethereum",
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "start_block": start_block,
+        "end_block": end_block,
+        "start_block_timestamp_utc": _utc(await block_ts(start_block)),
+        "end_block_timestamp_utc": _utc(await block_ts(end_block)),
+        "resolved_by": {"start_block": first[1], "end_block": after[1]},
+        "index_head": index.head if index is not None else None,
+    }
+
+
+async def _bounds_with_rpc(rpc_url: str | None, start: date, end: date, index: BlockTimeIndex | None) -> dict[str, object]:
+    if not rpc_url:
+        return await resolve_bounds(start, end, index, None)
+    import l1_extract as l1
+
+    transport = l1.RpcTransport(rpc_url)
+    client = l1.BatchRpcClient(transport, l1.AdaptiveConcurrency(initial=1, maximum=1))
+    async with client:
+        return await resolve_bounds(start, end, index, RpcTimestamps(client))
+
+
+def _parse_date(value: str, flag: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise SystemExit(f"Invalid {flag} {value!r} (expected YYYY-MM-DD)")
+
+
+def main(argv: list[str]) -> int:
+    p = argparse.ArgumentParser(prog="block_time_index.py")
+    p.add_argument("--index", default=str(INDEX_PATH), help=f"Index file (default: {INDEX_PATH})")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    b = sub.add_parser("build", help="Record block timestamps from l1_extract block parts")
+    b.add_argument("parts", nargs="+", help="Block part files or directories of them")
+
+    d = sub.add_parser("day", help="Print the block range of one UTC day from the index")
+    d.add_argument("--date", required=True)
+
+    q = sub.add_parser("bounds", help="Resolve a date range to blocks and write block_bounds.json")
+    q.add_argument("--start-date", required=True)
+    q.add_argument("--end-date", required=True)
+    q.add_argument("--rpc-url", default=os.environ.get("L1_RPC_URL"), help="Fallback endpoint (default: $L1_RPC_URL)")
+    q.add_argument("--out", default=str(BOUNDS_PATH), help=f"Output JSON (default: {BOUNDS_PATH})")
+    args = p.parse_args(argv)
+
+    root = _repo_root()
+    index_path = Path(args.index) if Path(args.index).is_absolute() else root / args.index
+
+    if args.cmd == "build":
+        parts: list[Path] = []
+        for arg in args.parts:
+            path = Path(arg) if Path(arg).is_absolute() else root / arg
+            parts.extend(sorted(path.glob("part-*")) if path.is_dir() else [path])
+        try:
+            head = build_from_parts(index_path, parts)
+        except ValueError as exc:
+            raise SystemExit(f"Cannot index block parts: {exc}")
+        print(f"[block_time_index] {index_path.name} parts={len(parts)} head={head}")
+        return 0
+
+    if args.cmd == "day":
+        if not index_path.exists():
+            raise SystemExit(f"Block-time index not found: {index_path}")
+        day = _parse_date(args.date, "--date")
+        with BlockTimeIndex(index_path) as index:
+            rng = index.day_range(day)
+        if rng is None:
+            raise SystemExit(f"{day} is not fully covered by the block-time index")
+        print(f"{day.isoformat()} {rng[0]} {rng[1]}")
+        return 0
+
+    start, end = _parse_date(args.start_date, "--start-date"), _parse_date(args.end_date, "--end-date")
+    if end < start:
+        raise SystemExit("--end-date must be >= --start-date")
+    index = BlockTimeIndex(index_path) if index_path.exists() else None
+    try:
+        bounds = asyncio.run(_bounds_with_rpc(args.rpc_url, start, end, index))
+    finally:
+        if index is not None:
+            index.close()
+    out = Path(args.out) if Path(args.out).is_absolute() else root / args.out
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(bounds, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(
+        f"[block_time_index] {start}..{end} -> blocks {bounds['start_block']}..{bounds['end_block']} "
+        f"({bounds['resolved_by']['start_block']}/{bounds['resolved_by']['end_block']})"  # type: ignore[index]
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Snapshot growthepie exports into `data/raw/growthepie/<run-date>/` and write its provenance manifest.
+
+Fetches `master.json` plus `export/{metric_key}.json` for the requested metrics over a small pool of
+keep-alive connections (one per worker thread), retrying 429/5xx responses and dropped connections
+with exponential backoff. Every file is streamed to a `.part` sibling while being hashed and then
+renamed into place, so the snapshot only ever contains complete files: rerunning with the same
+`--run-date` skips files already fetched and downloads only what is missing. The manifest is built
+in-process from the hashes computed during download (only files fetched by an earlier run are read
+again) and is written only once every requested export is present.
+
+This is the only module that performs network calls for growthepie.
+
+Usage:
+  python src/etl/growthepie_fetch.py --run-date 2026-01-22
+  python src/etl/growthepie_fetch.py --run-date 2026-01-22 --metrics all --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import http.client
+import json
+import os
+import random
+import re
+import shlex
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+import make_raw_manifest as mrm  # noqa: E402
+
+
+SOURCE = "growthepie"
+DEFAULT_BASE_URL = "https://api.growthepie.com/v1"
+RAW_ROOT = Path("data/raw/growthepie")
+MANIFEST_DIR = Path("data/raw_manifest")
+MASTER_FILE = "master.json"
+# Daily series needed for the STR panel (fees = L2Fees denominator; rent_paid/profit = vendor costs).
+STR_METRICS = ("fees", "rent_paid", "profit", "txcount")
+DEFAULT_WORKERS = 4
+MAX_RETRIES = 5
+BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 60.0
+TIMEOUT_SECONDS = 60.0
+CHUNK_BYTES = 1024 * 1024
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+USER_AGENT = "l2-rent-research-etl/1 (+growthepie_fetch.py)"
+# Metric keys become file names under export/; anything else could escape the snapshot dir.
+METRIC_KEY_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+class FetchError(RuntimeError):
+    pass
+
+
+@dataclass
+class ClientStats:
+    requests: int = 0
+    retries: int = 0
+    connections: int = 0
+    bytes: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for key, n in counts.items():
+                setattr(self, key, getattr(self, key) + n)
+
+    def to_dict(self) -> dict[str, int]:
+        return {"requests": self.requests, "retries": self.retries, "connections": self.connections, "bytes": self.bytes}
+
+
+class PooledClient:
+    """GET files from one host over keep-alive connections, one per calling thread.
+
+    A connection is reused until the server closes it or a request on it fails; with N worker threads
+    at most N connections are open at once.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_retries: int = MAX_RETRIES,
+        backoff_seconds: float = BACKOFF_SECONDS,
+        timeout_seconds: float = TIMEOUT_SECONDS,
+    ) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise SystemExit(f"Invalid --base-url {base_url!r} (expected http(s)://host/path)")
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout_seconds = timeout_seconds
+        self.stats = ClientStats()
+        self._local = threading.local()
+        self._all: list[http.client.HTTPConnection] = []
+        self._all_lock = threading.Lock()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            conn = cls(self._host, self._port, timeout=self.timeout_seconds)
+            self._local.conn = conn
+            with self._all_lock:
+                self._all.append(conn)
+            self.stats.add(connections=1)
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def close(self) -> None:
+        with self._all_lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+
+    def _backoff(self, attempt: int, retry_after: str | None) -> float:
+        if retry_after is not None and retry_after.strip().isdigit():
+            return min(float(retry_after), MAX_BACKOFF_SECONDS)
+        delay = self.backoff_seconds * (2**attempt)
+        return min(delay * (1 + random.random()), MAX_BACKOFF_SECONDS)
+
+    def download(self, path: str, dest: Path) -> tuple[str, int]:
+        """Stream `<base_url>/<path>` into dest atomically; returns (sha256, bytes)."""
+        url_path = f"{self._prefix}/{path.lstrip('/')}"
+        headers = {"User-Agent": USER_AGENT, "Accept": "application/json", "Connection": "keep-alive"}
+        last_error = ""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats.add(retries=1)
+            retry_after: str | None = None
+            try:
+                conn = self._connection()
+                self.stats.add(requests=1)
+                conn.request("GET", url_path, headers=headers)
+                resp = conn.getresponse()
+                if resp.status == 200:
+                    result = _stream_to_file(resp, dest)
+                    self.stats.add(bytes=result[1])
+                    if resp.will_close:
+                        self._drop_connection()
+                    return result
+                resp.read()  # drain so the connection can be reused
+                retry_after = resp.getheader("Retry-After")
+                last_error = f"HTTP {resp.status} {resp.reason}"
+                if resp.will_close:
+                    self._drop_connection()
+                if resp.status not in RETRY_STATUSES:
+                    raise FetchError(f"GET {url_path}: {last_error}")
+            except (OSError, http.client.HTTPException) as exc:
+                self._drop_connection()
+                last_error = f"{type(exc).__name__}: {exc}"
+            if attempt < self.max_retries:
+                time.sleep(self._backoff(attempt, retry_after))
+        raise FetchError(f"GET {url_path}: {last_error} (gave up after {self.max_retries + 1} attempts)")
+
+
+def _part_path(dest: Path) -> Path:
+    return dest.with_name(f".{dest.name}.part")
+
+
+def _stream_to_file(resp: http.client.HTTPResponse, dest: Path) -> tuple[str, int]:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = _part_path(dest)
+    h = hashlib.sha256()
+    size = 0
+    try:
+        with part.open("wb") as f:
+            while chunk := resp.read(CHUNK_BYTES):
+                h.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        if resp.length:  # server closed before sending the declared Content-Length
+            raise http.client.IncompleteRead(b"", resp.length)
+        os.replace(part, dest)
+    finally:
+        part.unlink(missing_ok=True)
+    return h.hexdigest(), size
+
+
+def _remove_stale_parts(snap: Path) -> None:
+    for part in snap.rglob(".*.part"):
+        part.unlink()
+
+
+def _resolve_metrics(master: dict[str, object], requested: str) -> list[str]:
+    metrics = master.get("metrics")
+    if not isinstance(metrics, dict):
+        raise SystemExit(f"{MASTER_FILE} has no `metrics` object; the growthepie API layout may have changed")
+    if requested == "all":
+        keys = sorted(metrics)
+    else:
+        keys = [k.strip() for k in requested.split(",") if k.strip()]
+        unknown = [k for k in keys if k not in metrics]
+        if unknown:
+            raise SystemExit(f"Unknown growthepie metrics {unknown} (known: {', '.join(sorted(metrics))})")
+    unsafe = [k for k in keys if not METRIC_KEY_RE.fullmatch(k)]
+    if unsafe:
+        raise SystemExit(f"Refusing growthepie metric keys that are not plain names: {unsafe}")
+    return keys
+
+
+def fetch_snapshot(
+    client: PooledClient,
+    snap: Path,
+    *,
+    metrics: str,
+    workers: int,
+) -> tuple[dict[str, tuple[str, list[int]]], list[str], list[str]]:
+    """Fetch master.json and the metric exports missing from snap.
+
+    Returns (known_hashes keyed by repo-relative path, skipped paths, failure messages).
+    """
+    root = _repo_root()
+    snap.mkdir(parents=True, exist_ok=True)
+    _remove_stale_parts(snap)
+    known: dict[str, tuple[str, list[int]]] = {}
+    skipped: list[str] = []
+    failures: list[str] = []
+
+    def fetch(rel: str) -> None:
+        dest = snap / rel
+        key = str(dest.relative_to(root))
+        if dest.exists():
+            skipped.append(key)
+            return
+        try:
+            sha, _ = client.download(rel, dest)
+        except FetchError as exc:
+            failures.append(str(exc))
+            return
+        known[key] = (sha, mrm.stat_fingerprint(dest))
+
+    # master.json goes through the pool too, so connections never outnumber workers.
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="growthepie") as pool:
+        pool.submit(fetch, MASTER_FILE).result()
+        if failures:
+            return known, skipped, failures
+        try:
+            master = json.loads((snap / MASTER_FILE).read_text(encoding="utf-8"))
+        except ValueError as exc:
+            raise SystemExit(f"{snap / MASTER_FILE} is not valid JSON ({exc}); delete it and rerun")
+        rels = [f"export/{key}.json" for key in _resolve_metrics(master, metrics)]
+        list(pool.map(fetch, rels))
+    return known, sorted(skipped), sorted(failures)
+
+
+def main(argv: list[str]) -> int:
+    p = argparse.ArgumentParser(prog="growthepie_fetch.py")
+    p.add_argument("--run-date", required=True, help="UTC snapshot date (YYYY-MM-DD); names the snapshot folder")
+    p.add_argument(
+        "--metrics",
+        default=",".join(STR_METRICS),
+        help="Comma-separated metric keys from master.json, or `all` (default: the STR panel series)",
+    )
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel downloads (= max open connections)")
+    p.add_argument("--base-url", default=DEFAULT_BASE_URL, help="API root serving master.json and export/")
+    p.add_argument("--max-retries", type=int, default=MAX_RETRIES, help="Retries per file on 429/5xx or dropped connections")
+    p.add_argument("--backoff-seconds", type=float, default=BACKOFF_SECONDS, help="Initial retry backoff (doubles per attempt)")
+    args = p.parse_args(argv)
+
+    try:
+        run_date = date.fromisoformat(args.run_date)
+    except ValueError:
+        raise SystemExit(f"Invalid --run-date {args.run_date!r} (expected YYYY-MM-DD)")
+
+    root = _repo_root()
+    snap = root / RAW_ROOT / run_date.isoformat()
+    client = PooledClient(args.base_url, max_retries=args.max_retries, backoff_seconds=args.backoff_seconds)
+    t0 = time.monotonic()
+    try:
+        known, skipped, failures = fetch_snapshot(client, snap, metrics=args.metrics, workers=args.workers)
+    finally:
+        client.close()
+    stats = client.stats.to_dict()
+    print(
+        f"[growthepie] {snap.relative_to(root)} fetched={len(known)} skipped={len(skipped)} failed={len(failures)} "
+        f"requests={stats['requests']} retries={stats['retries']} connections={stats['connections']} "
+        f"bytes={stats['bytes']} seconds={time.monotonic() - t0:.1f}"
+    )
+    if failures:
+        for msg in failures:
+            print(f"  FAILED {msg}", file=sys.stderr)
+        print("Snapshot incomplete; no manifest written. Rerun the same command to fetch only the missing files.", file=sys.stderr)
+        return 1
+
+    command = " ".join(shlex.quote(t) for t in ["python", "src/etl/growthepie_fetch.py", *argv])
+    manifest = mrm.build_manifest(SOURCE, snap, command, as_of=run_date, known_hashes=known)
+    out_path = root / MANIFEST_DIR / f"{SOURCE}_{run_date.isoformat()}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    mrm.write_manifest(manifest, out_path)
+    print(f"[growthepie] manifest {out_path.relative_to(root)} files={len(manifest['files'])}")  # type: ignore[arg-type]
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Build the vendor daily rollup panel from a growthepie snapshot without loading whole exports.
+
+Each `export/{metric}.json` in `data/raw/growthepie/<run-date>/` is a JSON array of records
+`{"metric_key", "origin_key", "date", "value"}` covering every chain and day (USD and ETH variants).
+The array is parsed incrementally in fixed-size chunks, one record at a time, and the ETH-native
+series are emitted as `(date_utc, rollup_id, metric, value)` tuples into a columnar pivot buffer
+(one float64 array per panel column, one row per (date, rollup)). Peak memory therefore tracks the
+size of the panel, not of the exports. Rows are written sorted by (date_utc, rollup_id) with
+round-trip float formatting, so the CSV is byte-identical for the same snapshot.
+
+Output columns follow `contracts/schemas/panel_schema_str_v1.yaml`; (date, rollup) rows missing a
+non-nullable series (fees or rent) are dropped and counted.
+
+Usage:
+  python src/etl/growthepie_panel.py --run-date 2026-01-22
+  python src/etl/growthepie_panel.py --run-date 2026-01-22 --out /tmp/panel.csv
+  python src/etl/growthepie_panel.py --run-date 2026-01-22 --parquet   # Parquet dataset + derived CSV
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import os
+import re
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, TextIO
+
+
+RAW_ROOT = Path("data/raw/growthepie")
+PANEL_PATH = Path("data/processed/growthepie/vendor_daily_rollup_panel.csv")
+PANEL_DATASET = Path("data/processed/growthepie/vendor_daily_rollup_panel")
+STR_SCHEMA = Path("contracts/schemas/panel_schema_str_v1.yaml")
+EXPORTS = ("fees", "rent_paid", "profit", "txcount")
+# growthepie metric_key -> panel column (ETH-native series only; USD variants are skipped).
+METRIC_COLUMNS = {
+    "fees_paid_eth": "l2_fees_eth",
+    "rent_paid_eth": "rent_paid_eth",
+    "profit_eth": "profit_eth",
+    "txcount": "txcount",
+}
+PANEL_COLUMNS = ("date_utc", "rollup_id", "l2_fees_eth", "rent_paid_eth", "profit_eth", "txcount")
+REQUIRED_COLUMNS = ("l2_fees_eth", "rent_paid_eth")
+INTEGER_COLUMNS = ("txcount",)
+CHUNK_CHARS = 1024 * 1024
+MAX_ITEM_CHARS = 16 * 1024 * 1024
+
+_WS = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+class _ArrayReader:
+    def __init__(self, f: TextIO, chunk_chars: int) -> None:
+        self.f = f
+        self.chunk_chars = chunk_chars
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_chars)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of input), without consuming it."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        c = self.peek()
+        if not c or c not in chars:
+            raise ValueError(f"expected one of {chars!r} but found {c or 'end of input'!r}")
+        self.pos += 1
+        return c
+
+    def value(self) -> object:
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if len(self.buf) - self.pos > MAX_ITEM_CHARS or not self._fill():
+                    raise
+                continue
+            # A number followed only by number characters up to the buffer edge ("12" of "12.5")
+            # may continue in the next chunk.
+            if isinstance(value, (int, float)) and _NUMBER_TAIL.fullmatch(self.buf, end) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(f: TextIO, *, chunk_chars: int = CHUNK_CHARS) -> Iterator[object]:
+    """Yield the items of a top-level JSON array, reading f in chunk_chars pieces."""
+    reader = _ArrayReader(f, chunk_chars)
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+    else:
+        while True:
+            reader.peek()
+            yield reader.value()
+            if reader.expect(",]") == "]":
+                break
+    if reader.peek():
+        raise ValueError("unexpected data after the top-level array")
+
+
+def iter_export_records(path: Path, *, chunk_chars: int = CHUNK_CHARS) -> Iterator[tuple[str, str, str, float]]:
+    """Yield `(date_utc, rollup_id, metric_key, value)` for the panel series in one export file."""
+    with path.open(encoding="utf-8") as f:
+        for i, rec in enumerate(iter_json_array(f, chunk_chars=chunk_chars)):
+            if not isinstance(rec, dict):
+                raise ValueError(f"{path}: item {i} is not an object")
+            metric = rec.get("metric_key")
+            if metric not in METRIC_COLUMNS:
+                continue
+            day, rollup, value = rec.get("date"), rec.get("origin_key"), rec.get("value")
+            if value is None:
+                continue
+            if not isinstance(day, str) or not isinstance(rollup, str) or not isinstance(value, (int, float)):
+                raise ValueError(f"{path}: item {i} has a malformed date/origin_key/value")
+            yield day, rollup, metric, float(value)
+
+
+class PanelPivot:
+    """Columnar (date_utc, rollup_id) x metric buffer; unset cells are NaN."""
+
+    def __init__(self) -> None:
+        self._index: dict[tuple[str, str], int] = {}
+        self._columns = {col: array("d") for col in METRIC_COLUMNS.values()}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, date_utc: str, rollup_id: str, metric: str, value: float) -> None:
+        key = (date_utc, rollup_id)
+        row = self._index.get(key)
+        if row is None:
+            row = self._index[key] = len(self._index)
+            for values in self._columns.values():
+                values.append(math.nan)
+        values = self._columns[METRIC_COLUMNS[metric]]
+        prev = values[row]
+        if not math.isnan(prev) and prev != value:
+            raise ValueError(f"conflicting {metric} values for {date_utc}/{rollup_id}: {prev!r} vs {value!r}")
+        values[row] = value
+
+    def iter_rows(self) -> Iterator[list[str]]:
+        """Panel rows sorted by grain; cells formatted deterministically ('' for missing)."""
+        for (day, rollup), row in sorted(self._index.items()):
+            out = [day, rollup]
+            for col in PANEL_COLUMNS[2:]:
+                v = self._columns[col][row]
+                if math.isnan(v):
+                    out.append("")
+                elif col in INTEGER_COLUMNS:
+                    if not v.is_integer():
+                        raise ValueError(f"non-integer {col} {v!r} for {day}/{rollup}")
+                    out.append(str(int(v)))
+                else:
+                    out.append(repr(v))
+            yield out
+
+
+def build_pivot(snap: Path, *, chunk_chars: int = CHUNK_CHARS) -> PanelPivot:
+    pivot = PanelPivot()
+    for name in EXPORTS:
+        path = snap / "export" / f"{name}.json"
+        if not path.exists():
+            raise SystemExit(f"Missing growthepie export {path}; run src/etl/growthepie_fetch.py for this run date")
+        try:
+            for rec in iter_export_records(path, chunk_chars=chunk_chars):
+                pivot.add(*rec)
+        except ValueError as exc:
+            raise SystemExit(f"Cannot parse {path}: {exc}")
+    return pivot
+
+
+def panel_rows(pivot: PanelPivot, dropped: list[int]) -> Iterator[list[str]]:
+    """Rows with every non-nullable series present; the count of skipped rows is added to dropped[0]."""
+    required = [PANEL_COLUMNS.index(c) for c in REQUIRED_COLUMNS]
+    for row in pivot.iter_rows():
+        if any(row[i] == "" for i in required):
+            dropped[0] += 1
+            continue
+        yield row
+
+
+def write_panel(pivot: PanelPivot, out_path: Path) -> tuple[int, int]:
+    """Write the panel CSV atomically; returns (rows written, rows dropped for missing required series)."""
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    part = out_path.with_name(f".{out_path.name}.part")
+    written, dropped = 0, [0]
+    try:
+        with part.open("w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f, lineterminator="\n")
+            w.writerow(PANEL_COLUMNS)
+            for row in panel_rows(pivot, dropped):
+                w.writerow(row)
+                written += 1
+        os.replace(part, out_path)
+    finally:
+        part.unlink(missing_ok=True)
+    return written, dropped[0]
+
+
+def write_panel_parquet(pivot: PanelPivot, dataset_dir: Path, csv_path: Path) -> tuple[int, int]:
+    """Write the panel as a month-partitioned Parquet dataset, then derive the CSV from it."""
+    import panel_store
+
+    dropped = [0]
+    schema = panel_store.load_table_schema(str(STR_SCHEMA))
+    panel_store.write_dataset(schema, PANEL_COLUMNS, panel_rows(pivot, dropped), dataset_dir)
+    return panel_store.export_csv(schema, dataset_dir, csv_path), dropped[0]
+
+
+def main(argv: list[str]) -> int:
+    p = argparse.ArgumentParser(prog="growthepie_panel.py")
+    p.add_argument("--run-date", required=True, help="Snapshot date under data/raw/growthepie/ (YYYY-MM-DD)")
+    p.add_argument("--out", default=None, help=f"Output CSV (default: {PANEL_PATH})")
+    p.add_argument("--chunk-chars", type=int, default=CHUNK_CHARS, help="Characters read per parser refill")
+    p.add_argument(
+        "--parquet",
+        action="store_true",
+        help=f"Store the panel as Parquet under {PANEL_DATASET}/ and derive the CSV from it (needs pyarrow)",
+    )
+    args = p.parse_args(argv)
+
+    root = _repo_root()
+    snap = root / RAW_ROOT / args.run_date
+    if not snap.is_dir():
+        raise SystemExit(f"Snapshot not found: {snap}")
+    out_path = Path(args.out) if args.out else root / PANEL_PATH
+    pivot = build_pivot(snap, chunk_chars=args.chunk_chars)
+    try:
+        if args.parquet:
+            written, dropped = write_panel_parquet(pivot, root / PANEL_DATASET, out_path)
+        else:
+            written, dropped = write_panel(pivot, out_path)
+    except ValueError as exc:
+        raise SystemExit(f"Cannot build panel from {snap}: {exc}")
+    print(f"[growthepie_panel] {out_path} rows={written} dropped_missing_required={dropped}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Checkpointed, resumable backfill of an L1 block range into `data/raw/l1/` (Phase 2).
+
+`[--from-block, --to-block]` is split into units aligned to `--unit-blocks`. One unit is one
+`l1_extract.py` part. Unit state lives in a SQLite checkpoint:
+- pending → running (leased by one worker) → done;
+- or failed, after `--max-attempts`.
+
+`--workers` processes claim units in block order. Each extracts its unit with `l1_extract.extract`
+under `--unit-timeout-seconds`. A unit whose extraction fails or times out is re-queued. So is a
+unit whose worker dies (the scheduler reaps it) or whose lease expires (the next claim takes it
+over). Part file names are a function of the unit, so a redone unit overwrites its own files and
+never duplicates blocks.
+
+A rerun of the same range needs `--resume`:
+- units left running by a dead process and failed units go back to pending;
+- done units whose part files are gone also go back to pending;
+- done units are never refetched.
+
+Range and layout parameters must match the checkpoint. The RPC endpoint is not stored.
+
+At the end, only the part files of done units go into
+`data/raw_manifest/l1_<run-date>_<from>-<to>.json` (via `make_raw_manifest.build_manifest`).
+Once every unit is done, the Phase 2 block-continuity check must pass: every block in range is
+present exactly once. Otherwise the exit status is 1.
+
+Usage:
+  L1_RPC_URL=https://... python src/etl/l1_backfill.py --run-date 2026-01-22 --from-block 19000000 --to-block 19999999 --workers 8
+  L1_RPC_URL=https://... python src/etl/l1_backfill.py --run-date 2026-01-22 --from-block 19000000 --to-block 19999999 --workers 8 --resume
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import re
+import shlex
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+import l1_extract as l1  # noqa: E402
+import make_raw_manifest as mrm  # noqa: E402
+
+
+SOURCE = "l1"
+CHECKPOINT_DIR = Path("data/tmp/l1_backfill")
+MANIFEST_DIR = Path("data/raw_manifest")
+WORKERS = 4
+MAX_ATTEMPTS = 3
+UNIT_TIMEOUT_SECONDS = 1800.0
+LEASE_GRACE_SECONDS = 60.0
+POLL_SECONDS = 0.2
+MAX_REPORTED_PROBLEMS = 20
+
+_PART_RE = re.compile(r"^part-(\d+)-(\d+)\.")
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True)
+class BackfillConfig:
+    rpc_url: str
+    run_date: str
+    start_block: int
+    end_block: int
+    unit_blocks: int
+    fmt: str
+    out_root: str
+    batch_size: int = l1.BATCH_SIZE
+    receipts: str = "auto"
+    max_concurrency: int = l1.MAX_CONCURRENCY
+    target_latency_seconds: float = l1.TARGET_LATENCY_SECONDS
+    max_retries: int = l1.MAX_RETRIES
+    backoff_seconds: float = l1.BACKOFF_SECONDS
+    unit_timeout_seconds: float = UNIT_TIMEOUT_SECONDS
+    max_attempts: int = MAX_ATTEMPTS
+    block_index: str | None = None
+
+    def identity(self) -> dict[str, str]:
+        """Parameters a checkpoint is bound to; `--resume` refuses to continue under different ones."""
+        return {
+            "run_date": self.run_date,
+            "start_block": str(self.start_block),
+            "end_block": str(self.end_block),
+            "unit_blocks": str(self.unit_blocks),
+            "format": self.fmt,
+            "out_root": self.out_root,
+        }
+
+    def unit_paths(self, first: int, last: int) -> dict[str, Path]:
+        return l1.part_paths(Path(self.out_root), date.fromisoformat(self.run_date), first, last, self.fmt)
+
+
+class Checkpoint:
+    """SQLite-backed unit queue shared by the scheduler and its worker processes."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    @classmethod
+    def create(cls, path: Path, identity: dict[str, str], units: list[tuple[int, int]]) -> "Checkpoint":
+        path.parent.mkdir(parents=True, exist_ok=True)
+        cp = cls(path)
+        with cp.conn:
+            cp.conn.execute("BEGIN")
+            cp.conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            cp.conn.execute(
+                "CREATE TABLE units ("
+                " first_block INTEGER PRIMARY KEY, last_block INTEGER NOT NULL,"
+                " status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,"
+                " owner TEXT, lease_expires REAL, error TEXT, finished_at TEXT)"
+            )
+            cp.conn.executemany("INSERT INTO meta VALUES (?, ?)", sorted(identity.items()))
+            cp.conn.executemany("INSERT INTO units (first_block, last_block) VALUES (?, ?)", units)
+        return cp
+
+    def identity(self) -> dict[str, str]:
+        return dict(self.conn.execute("SELECT key, value FROM meta"))
+
+    def counts(self) -> dict[str, int]:
+        out = {s: 0 for s in ("pending", "running", "done", "failed")}
+        out.update(self.conn.execute("SELECT status, COUNT(*) FROM units GROUP BY status"))
+        return out
+
+    def units(self, status: str) -> list[tuple[int, int]]:
+        return list(self.conn.execute("SELECT first_block, last_block FROM units WHERE status = ? ORDER BY first_block", (status,)))
+
+    def errors(self, status: str = "failed") -> list[tuple[int, int, int, str | None]]:
+        return list(
+            self.conn.execute(
+                "SELECT first_block, last_block, attempts, error FROM units WHERE status = ? ORDER BY first_block", (status,)
+            )
+        )
+
+    def claimable(self, now: float) -> int:
+        (n,) = self.conn.execute(
+            "SELECT COUNT(*) FROM units WHERE status = 'pending' OR (status = 'running' AND lease_expires < ?)", (now,)
+        ).fetchone()
+        return n
+
+    def claim(self, owner: str, *, lease_seconds: float, max_attempts: int, now: float | None = None) -> tuple[int, int] | None:
+        """Lease the lowest pending (or lease-expired) unit to `owner`; None when nothing is claimable."""
+        now = time.time() if now is None else now
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.execute(
+                "UPDATE units SET status = 'failed', owner = NULL, lease_expires = NULL, error = 'lease expired'"
+                " WHERE status = 'running' AND lease_expires < ? AND attempts >= ?",
+                (now, max_attempts),
+            )
+            row = self.conn.execute(
+                "SELECT first_block, last_block FROM units"
+                " WHERE status = 'pending' OR (status = 'running' AND lease_expires < ?)"
+                " ORDER BY first_block LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE units SET status = 'running', owner = ?, lease_expires = ?, attempts = attempts + 1"
+                " WHERE first_block = ?",
+                (owner, now + lease_seconds, row[0]),
+            )
+        return row[0], row[1]
+
+    def complete(self, first: int, owner: str) -> bool:
+        """Mark a unit done; False if `owner` lost its lease in the meantime."""
+        finished = datetime.now(timezone.utc).isoformat()
+        cur = self.conn.execute(
+            "UPDATE units SET status = 'done', owner = NULL, lease_expires = NULL, error = NULL, finished_at = ?"
+            " WHERE first_block = ? AND owner = ?",
+            (finished, first, owner),
+        )
+        return cur.rowcount == 1
+
+    def fail(self, first: int, owner: str, error: str, *, max_attempts: int) -> None:
+        self.conn.execute(
+            "UPDATE units SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,"
+            " owner = NULL, lease_expires = NULL, error = ? WHERE first_block = ? AND owner = ?",
+            (max_attempts, error, first, owner),
+        )
+
+    def release_worker(self, pid: int) -> int:
+        """Re-queue the units a (dead) worker process still holds."""
+        cur = self.conn.execute(
+            "UPDATE units SET status = 'pending', owner = NULL, lease_expires = NULL, error = 'worker exited'"
+            " WHERE status = 'running' AND owner LIKE ?",
+            (f"pid:{pid}:%",),
+        )
+        return cur.rowcount
+
+    def reset_for_resume(self, config: BackfillConfig) -> dict[str, int]:
+        """Re-queue units no live process can finish: stale running, failed, and done-but-missing-files."""
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            stale = self.conn.execute(
+                "UPDATE units SET status = 'pending', owner = NULL, lease_expires = NULL WHERE status = 'running'"
+            ).rowcount
+            failed = self.conn.execute("UPDATE units SET status = 'pending', attempts = 0 WHERE status = 'failed'").rowcount
+            missing = [
+                first
+                for first, last in self.conn.execute("SELECT first_block, last_block FROM units WHERE status = 'done'")
+                if not all(p.is_file() for p in config.unit_paths(first, last).values())
+            ]
+            self.conn.executemany(
+                "UPDATE units SET status = 'pending', attempts = 0, error = 'part files missing' WHERE first_block = ?",
+                [(first,) for first in missing],
+            )
+        return {"stale_running": stale, "failed": failed, "missing_files": len(missing)}
+
+
+async def _extract_unit(config: BackfillConfig, first: int, last: int) -> None:
+    limiter = l1.AdaptiveConcurrency(maximum=config.max_concurrency, target_latency_seconds=config.target_latency_seconds)
+    await asyncio.wait_for(
+        l1.extract(
+            config.rpc_url,
+            [(first, last)],
+            out_root=Path(config.out_root),
+            run_date=date.fromisoformat(config.run_date),
+            fmt=config.fmt,
+            batch_size=config.batch_size,
+            receipts=config.receipts,
+            limiter=limiter,
+            max_retries=config.max_retries,
+            backoff_seconds=config.backoff_seconds,
+            block_index=Path(config.block_index) if config.block_index else None,
+        ),
+        config.unit_timeout_seconds,
+    )
+
+
+def _worker_main(config: BackfillConfig, checkpoint_path: str) -> None:
+    """Worker process: claim and extract units until none is claimable."""
+    cp = Checkpoint(Path(checkpoint_path))
+    lease_seconds = config.unit_timeout_seconds + LEASE_GRACE_SECONDS
+    seq = 0
+    try:
+        while True:
+            seq += 1
+            owner = f"pid:{os.getpid()}:{seq}"
+            unit = cp.claim(owner, lease_seconds=lease_seconds, max_attempts=config.max_attempts)
+            if unit is None:
+                return
+            first, last = unit
+            try:
+                asyncio.run(_extract_unit(config, first, last))
+            except (Exception, SystemExit) as exc:  # noqa: BLE001 - recorded on the unit, which is retried
+                error = "timed out" if isinstance(exc, asyncio.TimeoutError) else f"{type(exc).__name__}: {exc}"
+                print(f"[l1_backfill] unit {first}-{last} failed: {error}", file=sys.stderr)
+                cp.fail(first, owner, error, max_attempts=config.max_attempts)
+            else:
+                if not cp.complete(first, owner):
+                    print(f"[l1_backfill] unit {first}-{last}: lease lost before completion", file=sys.stderr)
+    finally:
+        cp.close()
+
+
+def run_workers(cp: Checkpoint, config: BackfillConfig, *, workers: int) -> None:
+    """Keep up to `workers` worker processes busy until no unit is pending or running."""
+    ctx = multiprocessing.get_context("spawn")
+    procs: list[multiprocessing.process.BaseProcess] = []
+    while True:
+        for p in [p for p in procs if not p.is_alive()]:
+            p.join()
+            procs.remove(p)
+            released = cp.release_worker(p.pid)  # type: ignore[arg-type]
+            if released:
+                print(f"[l1_backfill] worker {p.pid} exited (code {p.exitcode}); re-queued {released} unit(s)", file=sys.stderr)
+        claimable = cp.claimable(time.time())
+        if not procs and not claimable:
+            return
+        for _ in range(min(workers - len(procs), claimable)):
+            p = ctx.Process(target=_worker_main, args=(config, str(cp.path)), daemon=True)
+            p.start()
+            procs.append(p)
+        time.sleep(POLL_SECONDS)
+
+
+def check_block_continuity(blocks_dir: Path, first: int, last: int) -> list[str]:
+    """Phase 2 block continuity: each block of [first, last] stored exactly once in the partition."""
+    seen = bytearray(last - first + 1)
+    problems: list[str] = []
+    for path in sorted(blocks_dir.glob("part-*")):
+        m = _PART_RE.match(path.name)
+        if not m or int(m.group(2)) < first or int(m.group(1)) > last:
+            continue
+        for row in l1.read_part(path, ["block_number"]):
+            n = row["block_number"]
+            if not first <= n <= last:
+                problems.append(f"{path.name}: block {n} outside [{first}, {last}]")
+            elif seen[n - first]:
+                problems.append(f"{path.name}: duplicate block {n}")
+            else:
+                seen[n - first] = 1
+    start = None
+    for i, present in enumerate([*seen, 1]):
+        if not present and start is None:
+            start = i
+        elif present and start is not None:
+            problems.append(f"missing blocks {first + start}-{first + i - 1}")
+            start = None
+    return problems
+
+
+def _redacted_command(argv: list[str]) -> str:
+    out: list[str] = []
+    for i, tok in enumerate(argv):
+        if i and argv[i - 1] == "--rpc-url":
+            tok = "$L1_RPC_URL"
+        elif tok.startswith("--rpc-url="):
+            tok = "--rpc-url=$L1_RPC_URL"
+        out.append(tok)
+    return " ".join(shlex.quote(t) for t in ["python", "src/etl/l1_backfill.py", *out])
+
+
+def write_completed_manifest(cp: Checkpoint, config: BackfillConfig, command: str) -> tuple[Path, int] | None:
+    """Manifest over the part files of done units only; None if no unit is done yet."""
+    files = [p for first, last in cp.units("done") for p in config.unit_paths(first, last).values()]
+    if not files:
+        return None
+    root = _repo_root()
+    manifest = mrm.build_manifest(
+        SOURCE, Path(config.out_root), command, as_of=date.fromisoformat(config.run_date), files=files
+    )
+    out_path = root / MANIFEST_DIR / f"{SOURCE}_{config.run_date}_{config.start_block}-{config.end_block}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    mrm.write_manifest(manifest, out_path)
+    return out_path, len(files)
+
+
+def main(argv: list[str]) -> int:
+    p = argparse.ArgumentParser(prog="l1_backfill.py")
+    p.add_argument("--run-date", required=True, help="UTC run date (YYYY-MM-DD); names the output partitions")
+    p.add_argument("--from-block", type=int, required=True, help="First block (inclusive)")
+    p.add_argument("--to-block", type=int, required=True, help="Last block (inclusive)")
+    p.add_argument("--rpc-url", default=os.environ.get("L1_RPC_URL"), help="JSON-RPC endpoint (default: $L1_RPC_URL)")
+    p.add_argument("--resume", action="store_true", help="Continue the existing checkpoint for this range")
+    p.add_argument("--checkpoint", default=None, help=f"Checkpoint database (default: {CHECKPOINT_DIR}/<run-date>_<from>-<to>.sqlite)")
+    p.add_argument("--workers", type=int, default=WORKERS, help="Worker processes")
+    p.add_argument("--unit-blocks", type=int, default=l1.PART_BLOCKS, help="Blocks per work unit (= output part)")
+    p.add_argument("--format", dest="fmt", choices=l1.FORMATS, default="parquet", help="Part file format")
+    p.add_argument("--out-root", default=str(l1.RAW_ROOT), help="Output root (tables are subdirectories)")
+    p.add_argument("--batch-size", type=int, default=l1.BATCH_SIZE, help="Calls per JSON-RPC batch request")
+    p.add_argument("--receipts", choices=l1.RECEIPT_MODES, default="auto", help="eth_getBlockReceipts or per-tx receipts")
+    p.add_argument("--max-concurrency", type=int, default=l1.MAX_CONCURRENCY, help="In-flight batch ceiling per worker")
+    p.add_argument("--target-latency-seconds", type=float, default=l1.TARGET_LATENCY_SECONDS, help="Adaptive concurrency target")
+    p.add_argument("--max-retries", type=int, default=l1.MAX_RETRIES, help="Retries per batch item")
+    p.add_argument("--unit-timeout-seconds", type=float, default=UNIT_TIMEOUT_SECONDS, help="Per-unit extraction deadline")
+    p.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS, help="Attempts per unit before it is marked failed")
+    p.add_argument("--block-index", default=str(l1.block_time_index.INDEX_PATH), help="Block-time index to update")
+    p.add_argument("--no-block-index", action="store_true", help="Do not record block timestamps in the index")
+    args = p.parse_args(argv)
+
+    if not args.rpc_url:
+        raise SystemExit("Missing RPC endpoint: pass --rpc-url or set L1_RPC_URL")
+    try:
+        run_date = date.fromisoformat(args.run_date)
+    except ValueError:
+        raise SystemExit(f"Invalid --run-date {args.run_date!r} (expected YYYY-MM-DD)")
+    if args.from_block < 0 or args.to_block < args.from_block:
+        raise SystemExit("--to-block must be >= --from-block >= 0")
+    if args.unit_blocks < 1 or args.workers < 1:
+        raise SystemExit("--unit-blocks and --workers must be >= 1")
+    if args.fmt == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise SystemExit("Parquet output requires pyarrow (pip install pyarrow), or pass --format jsonl.")
+
+    root = _repo_root()
+    out_root = Path(args.out_root)
+    if not out_root.is_absolute():
+        out_root = root / out_root
+    block_index = None if args.no_block_index else Path(args.block_index)
+    if block_index is not None and not block_index.is_absolute():
+        block_index = root / block_index
+    config = BackfillConfig(
+        rpc_url=args.rpc_url,
+        run_date=run_date.isoformat(),
+        start_block=args.from_block,
+        end_block=args.to_block,
+        unit_blocks=args.unit_blocks,
+        fmt=args.fmt,
+        out_root=str(out_root),
+        batch_size=args.batch_size,
+        receipts=args.receipts,
+        max_concurrency=args.max_concurrency,
+        target_latency_seconds=args.target_latency_seconds,
+        max_retries=args.max_retries,
+        unit_timeout_seconds=args.unit_timeout_seconds,
+        max_attempts=args.max_attempts,
+        block_index=str(block_index) if block_index is not None else None,
+    )
+    cp_path = Path(args.checkpoint) if args.checkpoint else root / CHECKPOINT_DIR / f"{run_date}_{args.from_block}-{args.to_block}.sqlite"
+
+    if args.resume:
+        if not cp_path.exists():
+            raise SystemExit(f"No checkpoint to resume at {cp_path}")
+        cp = Checkpoint(cp_path)
+        stored = cp.identity()
+        diff = sorted(k for k, v in config.identity().items() if stored.get(k) != v)
+        if diff:
+            cp.close()
+            details = ", ".join(f"{k}: checkpoint={stored.get(k)!r} now={config.identity()[k]!r}" for k in diff)
+            raise SystemExit(f"Checkpoint {cp_path} was created with different parameters ({details})")
+        reset = cp.reset_for_resume(config)
+        print(f"[l1_backfill] resuming {cp_path.name}: re-queued " + " ".join(f"{k}={v}" for k, v in reset.items()))
+    else:
+        if cp_path.exists():
+            raise SystemExit(f"Checkpoint {cp_path} exists; pass --resume to continue it or delete it to start over")
+        units = l1.split_range(args.from_block, args.to_block, args.unit_blocks)
+        cp = Checkpoint.create(cp_path, config.identity(), units)
+
+    t0 = time.monotonic()
+    try:
+        run_workers(cp, config, workers=args.workers)
+        counts = cp.counts()
+        failed = cp.errors()
+        written = write_completed_manifest(cp, config, _redacted_command(argv))
+    finally:
+        cp.close()
+    print(
+        f"[l1_backfill] blocks {args.from_block}-{args.to_block} units done={counts['done']} failed={counts['failed']} "
+        f"pending={counts['pending']} seconds={time.monotonic() - t0:.1f}"
+    )
+    if written is not None:
+        print(f"[l1_backfill] manifest {written[0].relative_to(root)} files={written[1]}")
+    if failed or counts["pending"] or counts["running"]:
+        for first, last, attempts, error in failed:
+            print(f"  FAILED unit {first}-{last} attempts={attempts}: {error}", file=sys.stderr)
+        print("Backfill incomplete; rerun with --resume to retry the remaining units.", file=sys.stderr)
+        return 1
+
+    blocks_dir = out_root / "blocks" / f"run_date={run_date.isoformat()}"
+    problems = check_block_continuity(blocks_dir, args.from_block, args.to_block)
+    if problems:
+        for msg in problems[:MAX_REPORTED_PROBLEMS]:
+            print(f"  CONTINUITY {msg}", file=sys.stderr)
+        if len(problems) > MAX_REPORTED_PROBLEMS:
+            print(f"  ... and {len(problems) - MAX_REPORTED_PROBLEMS} more", file=sys.stderr)
+        return 1
+    print(f"[l1_backfill] block continuity ok: {args.to_block - args.from_block + 1} blocks, each exactly once")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
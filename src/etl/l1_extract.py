@@ -0,0 +1,862 @@
+#!/usr/bin/env python3
+"""
+Extract Ethereum L1 blocks, transactions, receipts and blob-tx fields over batched JSON-RPC.
+
+Phase 2 of `docs/end_to_end_data_collection_plan.md`. A block range is split into parts of
+`--part-blocks` blocks. Each part is fetched as JSON-RPC batch requests:
+- `eth_getBlockByNumber(n, true)`;
+- then `eth_getBlockReceipts(n)`, or `eth_getTransactionReceipt(hash)` per transaction when the
+  endpoint lacks the former (probed once with `--receipts auto`).
+
+Batches run on an asyncio worker pool over keep-alive HTTP connections. In-flight batches are capped
+by an AIMD limit: it grows by one after a full window of fast successes, and halves on errors,
+rate limiting, or latency above `--target-latency-seconds`. Failed batches and failed items of a
+batch are retried with backoff. Receipts are checked against their block (count and block hash)
+and each block's parentHash against the previous block of the part, so a reorg mid-fetch re-fetches
+the part instead of mixing forks.
+
+Each part becomes one file per table:
+
+    data/raw/l1/{blocks,txs,receipts,blob_tx}/run_date=<run-date>/part-<first>-<last>.<ext>
+
+Parts are renamed into place only when complete. The format is Parquet, which needs the optional
+`pyarrow`; `--format jsonl` writes gzip JSON lines with the stdlib only. Wei amounts are
+decimal(38, 0) in Parquet and plain integers in JSON.
+
+The endpoint comes from `--rpc-url` or `$L1_RPC_URL` (keep provider API keys out of shell history).
+Block timestamps of every written part are also recorded in the block-time index read by
+`block_time_index.py` (`--block-index`, or `--no-block-index` to skip).
+
+Usage:
+  L1_RPC_URL=https://... python src/etl/l1_extract.py --run-date 2026-01-22 --from-block 13916166 --to-block 13917165
+  python src/etl/l1_extract.py --run-date 2026-01-22 --from-block 19426587 --to-block 19426686 --format jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import random
+import ssl
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+from urllib.parse import urlsplit
+
+import block_time_index
+
+
+RAW_ROOT = Path("data/raw/l1")
+TABLES = ("blocks", "txs", "receipts", "blob_tx")
+FORMATS = ("parquet", "jsonl")
+RECEIPT_MODES = ("auto", "block", "tx")
+PART_BLOCKS = 1000
+BATCH_SIZE = 50
+MIN_CONCURRENCY = 1
+INITIAL_CONCURRENCY = 4
+MAX_CONCURRENCY = 32
+TARGET_LATENCY_SECONDS = 2.0
+REQUEST_TIMEOUT_SECONDS = 60.0
+MAX_RETRIES = 6
+BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 30.0
+PARTS_IN_FLIGHT = 4
+MAX_PART_ATTEMPTS = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+METHOD_NOT_FOUND = -32601
+BLOB_GAS_PER_BLOB = 131072
+
+# Output columns per table; *_wei columns are unbounded integers (decimal(38, 0) in Parquet).
+COLUMNS: dict[str, tuple[str, ...]] = {
+    "blocks": (
+        "block_number",
+        "block_hash",
+        "timestamp",
+        "base_fee_per_gas_wei",
+        "gas_used",
+        "gas_limit",
+        "blob_gas_used",
+        "excess_blob_gas",
+        "tx_count",
+    ),
+    "txs": (
+        "tx_hash",
+        "block_number",
+        "tx_index",
+        "from_address",
+        "to_address",
+        "tx_type",
+        "max_fee_per_gas_wei",
+        "max_priority_fee_per_gas_wei",
+    ),
+    "receipts": (
+        "tx_hash",
+        "block_number",
+        "from_address",
+        "to_address",
+        "tx_type",
+        "gas_used",
+        "effective_gas_price_wei",
+        "status",
+        "blob_gas_used",
+        "blob_gas_price_wei",
+    ),
+    "blob_tx": ("tx_hash", "block_number", "blob_count", "max_fee_per_blob_gas_wei", "blob_versioned_hashes"),
+}
+STRING_COLUMNS = {"block_hash", "tx_hash", "from_address", "to_address", "blob_versioned_hashes"}
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+class RpcError(RuntimeError):
+    def __init__(self, message: str, *, code: int | None = None, retryable: bool = True) -> None:
+        super().__init__(message)
+        self.code = code
+        self.retryable = retryable
+
+
+class ExtractError(RuntimeError):
+    pass
+
+
+class ConnectionClosed(ConnectionError):
+    """The server closed the connection before sending a status line."""
+
+
+# ---------------------------------------------------------------------------
+# Transport: keep-alive HTTP/1.1 over asyncio streams
+# ---------------------------------------------------------------------------
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[int, dict[str, str], bytes]:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionClosed("connection closed by server")
+    parts = status_line.decode("latin-1").split(" ", 2)
+    if len(parts) < 2 or not parts[1].isdigit():
+        raise ConnectionError(f"malformed status line {status_line!r}")
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        key, _, value = line.decode("latin-1").partition(":")
+        headers[key.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = bytearray()
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0], 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+        return int(parts[1]), headers, bytes(body)
+    if "content-length" in headers:
+        return int(parts[1]), headers, await reader.readexactly(int(headers["content-length"]))
+    headers["connection"] = "close"
+    return int(parts[1]), headers, await reader.read()
+
+
+@dataclass
+class TransportStats:
+    http_requests: int = 0
+    rpc_calls: int = 0
+    connections: int = 0
+    retries: int = 0
+    reconnects: int = 0
+    bytes_in: int = 0
+
+
+class RpcTransport:
+    """POST JSON-RPC payloads over a pool of keep-alive connections to one endpoint."""
+
+    def __init__(self, url: str, *, timeout_seconds: float = REQUEST_TIMEOUT_SECONDS) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise SystemExit("Invalid RPC URL (expected http(s)://host[:port]/path)")
+        self._host = parts.hostname
+        self._port = parts.port or (443 if parts.scheme == "https" else 80)
+        self._ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self._path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._host_header = parts.netloc.rpartition("@")[2]
+        self.timeout_seconds = timeout_seconds
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.stats = TransportStats()
+
+    async def _connect(self, *, fresh: bool = False) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._idle and not fresh:
+            return self._idle.pop()
+        self.stats.connections += 1
+        return await asyncio.open_connection(
+            self._host, self._port, ssl=self._ssl, server_hostname=self._host if self._ssl else None, limit=1 << 20
+        )
+
+    async def post(self, payload: bytes) -> tuple[int, dict[str, str], bytes]:
+        reused = bool(self._idle)
+        try:
+            return await self._post(await self._connect(), payload)
+        except (ConnectionClosed, BrokenPipeError, ConnectionResetError):
+            if not reused:
+                raise
+        # The server dropped an idle keep-alive connection; that says nothing about load, so
+        # resend once on a fresh connection instead of surfacing it as a failed batch.
+        self.stats.reconnects += 1
+        return await self._post(await self._connect(fresh=True), payload)
+
+    async def _post(
+        self, conn: tuple[asyncio.StreamReader, asyncio.StreamWriter], payload: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        reader, writer = conn
+        head = (
+            f"POST {self._path} HTTP/1.1\r\nHost: {self._host_header}\r\nContent-Type: application/json\r\n"
+            f"Accept: application/json\r\nContent-Length: {len(payload)}\r\nConnection: keep-alive\r\n\r\n"
+        )
+        try:
+            writer.write(head.encode("latin-1") + payload)
+            await writer.drain()
+            status, headers, body = await asyncio.wait_for(_read_response(reader), self.timeout_seconds)
+        except BaseException:
+            writer.close()
+            raise
+        self.stats.http_requests += 1
+        self.stats.bytes_in += len(body)
+        if headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self._idle.append(conn)
+        return status, headers, body
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Adaptive concurrency + worker pool
+# ---------------------------------------------------------------------------
+
+
+class AdaptiveConcurrency:
+    """AIMD cap on in-flight batches driven by observed latency and errors.
+
+    After `limit` consecutive successes faster than the target, the limit grows by one; an error,
+    a rate limit, or a response slower than twice the target halves it (at most once per window,
+    so one burst of failures counts as a single congestion signal).
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = INITIAL_CONCURRENCY,
+        minimum: int = MIN_CONCURRENCY,
+        maximum: int = MAX_CONCURRENCY,
+        target_latency_seconds: float = TARGET_LATENCY_SECONDS,
+    ) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.target = target_latency_seconds
+        self.in_flight = 0
+        self.peak_limit = self.limit
+        self.decreases = 0
+        self._successes = 0
+        self._last_decrease = -1.0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveConcurrency":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def record(self, latency_seconds: float, *, ok: bool) -> None:
+        if ok and latency_seconds <= self.target:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self.limit += 1
+                self.peak_limit = max(self.peak_limit, self.limit)
+                self._successes = 0
+            return
+        if ok and latency_seconds <= 2 * self.target:
+            return
+        self._successes = 0
+        now = time.monotonic()
+        if now - self._last_decrease < max(latency_seconds, self.target):
+            return
+        self._last_decrease = now
+        if self.limit > self.minimum:
+            self.limit = max(self.minimum, self.limit // 2)
+            self.decreases += 1
+
+
+@dataclass
+class _Job:
+    calls: list[tuple[str, list[Any]]]
+    future: asyncio.Future[list[Any]]
+
+
+class BatchRpcClient:
+    """Runs JSON-RPC batches on `workers` asyncio workers gated by an AdaptiveConcurrency limit."""
+
+    def __init__(
+        self,
+        transport: RpcTransport,
+        limiter: AdaptiveConcurrency,
+        *,
+        max_retries: int = MAX_RETRIES,
+        backoff_seconds: float = BACKOFF_SECONDS,
+    ) -> None:
+        self.transport = transport
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._queue: asyncio.Queue[_Job | None] = asyncio.Queue()
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def __aenter__(self) -> "BatchRpcClient":
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.limiter.maximum)]
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        for _ in self._workers:
+            self._queue.put_nowait(None)
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        await self.transport.close()
+
+    async def batch(self, calls: Sequence[tuple[str, list[Any]]]) -> list[Any]:
+        """Results in call order; raises RpcError once an item exhausts its retries."""
+        if not calls:
+            return []
+        job = _Job(list(calls), asyncio.get_running_loop().create_future())
+        await self._queue.put(job)
+        return await job.future
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            if job is None:
+                return
+            try:
+                result = await self._run(job.calls)
+            except Exception as exc:  # noqa: BLE001 - delivered to the awaiting caller
+                if not job.future.done():
+                    job.future.set_exception(exc)
+            else:
+                if not job.future.done():
+                    job.future.set_result(result)
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.backoff_seconds * (2**attempt) * (1 + random.random()), MAX_BACKOFF_SECONDS)
+
+    async def _run(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+        results: list[Any] = [None] * len(calls)
+        pending = list(range(len(calls)))
+        last_error: RpcError | None = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.transport.stats.retries += 1
+                await asyncio.sleep(self._backoff(attempt - 1))
+            payload = json.dumps(
+                [{"jsonrpc": "2.0", "id": i, "method": calls[i][0], "params": calls[i][1]} for i in pending],
+                separators=(",", ":"),
+            ).encode("utf-8")
+            async with self.limiter:
+                t0 = time.monotonic()
+                try:
+                    status, _, body = await self.transport.post(payload)
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError) as exc:
+                    self.limiter.record(time.monotonic() - t0, ok=False)
+                    last_error = RpcError(f"transport error: {type(exc).__name__}: {exc}")
+                    continue
+                latency = time.monotonic() - t0
+            if status != 200:
+                self.limiter.record(latency, ok=False)
+                last_error = RpcError(f"HTTP {status}", retryable=status in RETRY_STATUSES)
+                if not last_error.retryable:
+                    raise last_error
+                continue
+            self.transport.stats.rpc_calls += len(pending)
+            failed, last = self._collect(body, pending, calls, results)
+            self.limiter.record(latency, ok=not failed)
+            if last is not None:
+                last_error = last
+            if not failed:
+                return results
+            pending = failed
+        raise last_error or RpcError("batch failed")
+
+    @staticmethod
+    def _collect(
+        body: bytes, pending: list[int], calls: list[tuple[str, list[Any]]], results: list[Any]
+    ) -> tuple[list[int], RpcError | None]:
+        try:
+            decoded = json.loads(body)
+        except ValueError:
+            return pending, RpcError("malformed JSON-RPC response")
+        if isinstance(decoded, dict):  # some servers answer a whole batch with one error object
+            err = decoded.get("error") or {}
+            return pending, RpcError(f"batch rejected: {err.get('message', decoded)}", code=err.get("code"))
+        by_id = {item.get("id"): item for item in decoded if isinstance(item, dict)}
+        failed: list[int] = []
+        last: RpcError | None = None
+        for i in pending:
+            item = by_id.get(i)
+            if item is None:
+                failed.append(i)
+                last = RpcError(f"{calls[i][0]}: missing from batch response")
+            elif item.get("error"):
+                err = item["error"]
+                code = err.get("code")
+                if code == METHOD_NOT_FOUND:
+                    raise RpcError(f"{calls[i][0]}: {err.get('message')}", code=code, retryable=False)
+                failed.append(i)
+                last = RpcError(f"{calls[i][0]}{calls[i][1]}: {err.get('message')}", code=code)
+            elif item.get("result") is None:
+                failed.append(i)  # e.g. block not yet visible on a lagging backend
+                last = RpcError(f"{calls[i][0]}{calls[i][1]}: null result")
+            else:
+                results[i] = item["result"]
+        return failed, last
+
+
+# ---------------------------------------------------------------------------
+# Row extraction
+# ---------------------------------------------------------------------------
+
+
+def _int(value: object) -> int | None:
+    return int(value, 16) if isinstance(value, str) else None
+
+
+def _addr(value: object) -> str | None:
+    return value.lower() if isinstance(value, str) else None
+
+
+def block_rows(block: dict[str, Any]) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    """(blocks row, txs rows, blob_tx rows) for an `eth_getBlockByNumber(n, true)` result."""
+    number = _int(block["number"])
+    txs = block.get("transactions") or []
+    b = {
+        "block_number": number,
+        "block_hash": block["hash"],
+        "timestamp": _int(block["timestamp"]),
+        "base_fee_per_gas_wei": _int(block.get("baseFeePerGas")),
+        "gas_used": _int(block["gasUsed"]),
+        "gas_limit": _int(block["gasLimit"]),
+        "blob_gas_used": _int(block.get("blobGasUsed")),
+        "excess_blob_gas": _int(block.get("excessBlobGas")),
+        "tx_count": len(txs),
+    }
+    tx_rows: list[dict[str, Any]] = []
+    blob_rows: list[dict[str, Any]] = []
+    for tx in txs:
+        if not isinstance(tx, dict):
+            raise ExtractError(f"block {number}: transactions are hashes; request full transaction objects")
+        tx_type = _int(tx.get("type")) or 0
+        tx_rows.append(
+            {
+                "tx_hash": tx["hash"],
+                "block_number": number,
+                "tx_index": _int(tx["transactionIndex"]),
+                "from_address": _addr(tx.get("from")),
+                "to_address": _addr(tx.get("to")),
+                "tx_type": tx_type,
+                "max_fee_per_gas_wei": _int(tx.get("maxFeePerGas")),
+                "max_priority_fee_per_gas_wei": _int(tx.get("maxPriorityFeePerGas")),
+            }
+        )
+        if tx_type == 3:
+            hashes = tx.get("blobVersionedHashes") or []
+            blob_rows.append(
+                {
+                    "tx_hash": tx["hash"],
+                    "block_number": number,
+                    "blob_count": len(hashes),
+                    "max_fee_per_blob_gas_wei": _int(tx.get("maxFeePerBlobGas")),
+                    "blob_versioned_hashes": json.dumps(hashes),
+                }
+            )
+    return b, tx_rows, blob_rows
+
+
+def receipt_row(r: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "tx_hash": r["transactionHash"],
+        "block_number": _int(r["blockNumber"]),
+        "from_address": _addr(r.get("from")),
+        "to_address": _addr(r.get("to")),
+        "tx_type": _int(r.get("type")) or 0,
+        "gas_used": _int(r["gasUsed"]),
+        "effective_gas_price_wei": _int(r.get("effectiveGasPrice")),
+        "status": _int(r.get("status")),
+        "blob_gas_used": _int(r.get("blobGasUsed")),
+        "blob_gas_price_wei": _int(r.get("blobGasPrice")),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+
+def part_name(first: int, last: int, fmt: str) -> str:
+    ext = "parquet" if fmt == "parquet" else "jsonl.gz"
+    return f"part-{first:09d}-{last:09d}.{ext}"
+
+
+def part_paths(out_root: Path, run_date: date, first: int, last: int, fmt: str) -> dict[str, Path]:
+    name = part_name(first, last, fmt)
+    return {t: out_root / t / f"run_date={run_date.isoformat()}" / name for t in TABLES}
+
+
+def _arrow_table(table: str, rows: list[dict[str, Any]]) -> Any:
+    import pyarrow as pa
+
+    fields = []
+    arrays = []
+    for col in COLUMNS[table]:
+        values = [r[col] for r in rows]
+        if col in STRING_COLUMNS:
+            typ = pa.string()
+        elif col.endswith("_wei"):
+            typ = pa.decimal128(38, 0)
+            values = [None if v is None else Decimal(v) for v in values]
+        else:
+            typ = pa.int64()
+        fields.append(pa.field(col, typ))
+        arrays.append(pa.array(values, type=typ))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _write_table(path: Path, table: str, rows: list[dict[str, Any]], fmt: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.part")
+    try:
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            pq.write_table(_arrow_table(table, rows), tmp, compression="zstd")
+        else:
+            with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as f:
+                for r in rows:
+                    f.write(json.dumps({c: r[c] for c in COLUMNS[table]}, separators=(",", ":")) + "\n")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def write_part(paths: dict[str, Path], tables: dict[str, list[dict[str, Any]]], fmt: str) -> None:
+    """Write all tables of a part; `blocks` goes last, so its presence marks the part complete."""
+    for table in (*(t for t in TABLES if t != "blocks"), "blocks"):
+        _write_table(paths[table], table, tables[table], fmt)
+
+
+def read_part(path: Path, columns: Sequence[str] | None = None) -> list[dict[str, Any]]:
+    """Rows of one part file (either format), optionally projected to `columns`."""
+    if path.name.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        rows = pq.read_table(path, columns=list(columns) if columns else None).to_pylist()
+        return [{k: int(v) if isinstance(v, Decimal) else v for k, v in r.items()} for r in rows]
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    return [{c: r[c] for c in columns} for r in rows] if columns else rows
+
+
+# ---------------------------------------------------------------------------
+# Extraction
+# ---------------------------------------------------------------------------
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+@dataclass
+class ExtractStats:
+    parts: int = 0
+    blocks: int = 0
+    txs: int = 0
+    receipts: int = 0
+    blob_txs: int = 0
+    part_retries: int = 0
+    receipts_mode: str = ""
+    part_seconds: list[float] = field(default_factory=list)
+
+
+class L1Extractor:
+    def __init__(
+        self,
+        client: BatchRpcClient,
+        *,
+        out_root: Path,
+        run_date: date,
+        fmt: str = "parquet",
+        batch_size: int = BATCH_SIZE,
+        receipts: str = "auto",
+        block_index: Path | None = None,
+    ) -> None:
+        self.client = client
+        self.out_root = out_root
+        self.run_date = run_date
+        self.fmt = fmt
+        self.batch_size = max(1, batch_size)
+        self.receipts_mode = receipts
+        self.block_index = block_index
+        self.stats = ExtractStats()
+
+    async def _detect_receipts_mode(self, block_number: int) -> str:
+        if self.receipts_mode != "auto":
+            return self.receipts_mode
+        try:
+            await self.client.batch([("eth_getBlockReceipts", [hex(block_number)])])
+        except RpcError as exc:
+            if exc.code == METHOD_NOT_FOUND or not exc.retryable:
+                return "tx"
+            raise
+        return "block"
+
+    async def _fetch_blocks(self, numbers: Sequence[int]) -> list[dict[str, Any]]:
+        batches = [[("eth_getBlockByNumber", [hex(n), True]) for n in chunk] for chunk in _chunks(numbers, self.batch_size)]
+        results = await asyncio.gather(*(self.client.batch(b) for b in batches))
+        return [block for batch in results for block in batch]
+
+    async def _fetch_receipts(self, blocks: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Receipts per block, in block order."""
+        if self.receipts_mode == "block":
+            numbers = [b["number"] for b in blocks]
+            batches = [[("eth_getBlockReceipts", [n]) for n in chunk] for chunk in _chunks(numbers, self.batch_size)]
+            results = await asyncio.gather(*(self.client.batch(b) for b in batches))
+            return [list(r) for batch in results for r in batch]
+        hashes = [tx["hash"] for b in blocks for tx in b.get("transactions") or []]
+        batches = [[("eth_getTransactionReceipt", [h]) for h in chunk] for chunk in _chunks(hashes, self.batch_size)]
+        flat = [r for batch in await asyncio.gather(*(self.client.batch(b) for b in batches)) for r in batch]
+        out: list[list[dict[str, Any]]] = []
+        i = 0
+        for b in blocks:
+            n = len(b.get("transactions") or [])
+            out.append(flat[i : i + n])
+            i += n
+        return out
+
+    async def extract_part(self, first: int, last: int) -> dict[str, list[dict[str, Any]]]:
+        """Fetch and cross-check one part; retried from scratch if receipts disagree with their blocks."""
+        for attempt in range(MAX_PART_ATTEMPTS):
+            blocks = await self._fetch_blocks(range(first, last + 1))
+            receipts = await self._fetch_receipts(blocks)
+            tables: dict[str, list[dict[str, Any]]] = {t: [] for t in TABLES}
+            try:
+                for block, block_receipts in zip(blocks, receipts):
+                    b, txs, blobs = block_rows(block)
+                    if b["block_number"] != first + len(tables["blocks"]):
+                        raise ExtractError(f"expected block {first + len(tables['blocks'])}, got {b['block_number']}")
+                    if tables["blocks"] and block.get("parentHash") != tables["blocks"][-1]["block_hash"]:
+                        raise ExtractError(f"block {b['block_number']}: parent is not the previous block (reorg)")
+                    if len(block_receipts) != len(txs):
+                        raise ExtractError(f"block {b['block_number']}: {len(block_receipts)} receipts for {len(txs)} txs")
+                    for tx, r in zip(txs, block_receipts):
+                        if r.get("blockHash") != b["block_hash"] or r.get("transactionHash") != tx["tx_hash"]:
+                            raise ExtractError(f"block {b['block_number']}: receipt from another fork (reorg)")
+                    tables["blocks"].append(b)
+                    tables["txs"].extend(txs)
+                    tables["blob_tx"].extend(blobs)
+                    tables["receipts"].extend(receipt_row(r) for r in block_receipts)
+            except ExtractError as exc:
+                if attempt + 1 == MAX_PART_ATTEMPTS:
+                    raise
+                self.stats.part_retries += 1
+                print(f"[l1_extract] part {first}-{last}: {exc}; refetching", file=sys.stderr)
+                continue
+            return tables
+        raise AssertionError("unreachable")
+
+    async def run_part(self, first: int, last: int) -> dict[str, Path]:
+        t0 = time.monotonic()
+        tables = await self.extract_part(first, last)
+        paths = part_paths(self.out_root, self.run_date, first, last, self.fmt)
+        stamps = [(b["block_number"], b["timestamp"]) for b in tables["blocks"]]
+        try:
+            block_time_index.check_timestamps(stamps)  # before the part is published
+        except ValueError as exc:
+            raise ExtractError(f"part {first}-{last}: {exc}") from exc
+        await asyncio.to_thread(write_part, paths, tables, self.fmt)
+        if self.block_index is not None:
+            try:
+                await asyncio.to_thread(block_time_index.record_timestamps, self.block_index, stamps)
+            except ValueError as exc:
+                raise ExtractError(f"part {first}-{last}: block-time index: {exc}") from exc
+        self.stats.parts += 1
+        self.stats.blocks += len(tables["blocks"])
+        self.stats.txs += len(tables["txs"])
+        self.stats.receipts += len(tables["receipts"])
+        self.stats.blob_txs += len(tables["blob_tx"])
+        self.stats.part_seconds.append(time.monotonic() - t0)
+        return paths
+
+    async def run(
+        self, parts: Sequence[tuple[int, int]], *, parts_in_flight: int = PARTS_IN_FLIGHT
+    ) -> list[dict[str, Path]]:
+        if not parts:
+            return []
+        self.receipts_mode = await self._detect_receipts_mode(parts[0][0])
+        self.stats.receipts_mode = self.receipts_mode
+        gate = asyncio.Semaphore(max(1, parts_in_flight))
+
+        async def one(first: int, last: int) -> dict[str, Path]:
+            async with gate:
+                return await self.run_part(first, last)
+
+        return list(await asyncio.gather(*(one(a, b) for a, b in parts)))
+
+
+def split_range(first: int, last: int, part_blocks: int) -> list[tuple[int, int]]:
+    """Inclusive [first, last] as parts aligned to multiples of part_blocks (stable across runs)."""
+    out = []
+    start = first
+    while start <= last:
+        end = min(last, (start // part_blocks + 1) * part_blocks - 1)
+        out.append((start, end))
+        start = end + 1
+    return out
+
+
+async def extract(
+    rpc_url: str,
+    parts: Sequence[tuple[int, int]],
+    *,
+    out_root: Path,
+    run_date: date,
+    fmt: str,
+    batch_size: int,
+    receipts: str,
+    limiter: AdaptiveConcurrency,
+    parts_in_flight: int = PARTS_IN_FLIGHT,
+    max_retries: int = MAX_RETRIES,
+    backoff_seconds: float = BACKOFF_SECONDS,
+    timeout_seconds: float = REQUEST_TIMEOUT_SECONDS,
+    block_index: Path | None = None,
+) -> tuple[L1Extractor, TransportStats]:
+    transport = RpcTransport(rpc_url, timeout_seconds=timeout_seconds)
+    client = BatchRpcClient(transport, limiter, max_retries=max_retries, backoff_seconds=backoff_seconds)
+    async with client:
+        extractor = L1Extractor(
+            client,
+            out_root=out_root,
+            run_date=run_date,
+            fmt=fmt,
+            batch_size=batch_size,
+            receipts=receipts,
+            block_index=block_index,
+        )
+        await extractor.run(parts, parts_in_flight=parts_in_flight)
+    return extractor, transport.stats
+
+
+def main(argv: list[str]) -> int:
+    p = argparse.ArgumentParser(prog="l1_extract.py")
+    p.add_argument("--run-date", required=True, help="UTC run date (YYYY-MM-DD); names the output partitions")
+    p.add_argument("--from-block", type=int, required=True, help="First block (inclusive)")
+    p.add_argument("--to-block", type=int, required=True, help="Last block (inclusive)")
+    p.add_argument("--rpc-url", default=os.environ.get("L1_RPC_URL"), help="JSON-RPC endpoint (default: $L1_RPC_URL)")
+    p.add_argument("--format", dest="fmt", choices=FORMATS, default="parquet", help="Part file format")
+    p.add_argument("--out-root", default=str(RAW_ROOT), help="Output root (tables are subdirectories)")
+    p.add_argument("--part-blocks", type=int, default=PART_BLOCKS, help="Blocks per output part")
+    p.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Calls per JSON-RPC batch request")
+    p.add_argument("--receipts", choices=RECEIPT_MODES, default="auto", help="eth_getBlockReceipts or per-tx receipts")
+    p.add_argument("--min-concurrency", type=int, default=MIN_CONCURRENCY, help="Floor for in-flight batches")
+    p.add_argument("--initial-concurrency", type=int, default=INITIAL_CONCURRENCY, help="Starting in-flight batches")
+    p.add_argument("--max-concurrency", type=int, default=MAX_CONCURRENCY, help="Ceiling for in-flight batches (= workers)")
+    p.add_argument(
+        "--target-latency-seconds",
+        type=float,
+        default=TARGET_LATENCY_SECONDS,
+        help="Batch latency above which concurrency stops growing (halves above 2x)",
+    )
+    p.add_argument("--parts-in-flight", type=int, default=PARTS_IN_FLIGHT, help="Parts fetched concurrently (bounds memory)")
+    p.add_argument("--max-retries", type=int, default=MAX_RETRIES, help="Retries per batch item")
+    p.add_argument("--block-index", default=str(block_time_index.INDEX_PATH), help="Block-time index to update")
+    p.add_argument("--no-block-index", action="store_true", help="Do not record block timestamps in the index")
+    args = p.parse_args(argv)
+
+    if not args.rpc_url:
+        raise SystemExit("Missing RPC endpoint: pass --rpc-url or set L1_RPC_URL")
+    try:
+        run_date = date.fromisoformat(args.run_date)
+    except ValueError:
+        raise SystemExit(f"Invalid --run-date {args.run_date!r} (expected YYYY-MM-DD)")
+    if args.from_block < 0 or args.to_block < args.from_block:
+        raise SystemExit("--to-block must be >= --from-block >= 0")
+    if args.fmt == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise SystemExit("Parquet output requires pyarrow (pip install pyarrow), or pass --format jsonl.")
+
+    out_root = Path(args.out_root)
+    if not out_root.is_absolute():
+        out_root = _repo_root() / out_root
+    block_index = None if args.no_block_index else Path(args.block_index)
+    if block_index is not None and not block_index.is_absolute():
+        block_index = _repo_root() / block_index
+    parts = split_range(args.from_block, args.to_block, args.part_blocks)
+    limiter = AdaptiveConcurrency(
+        initial=args.initial_concurrency,
+        minimum=args.min_concurrency,
+        maximum=args.max_concurrency,
+        target_latency_seconds=args.target_latency_seconds,
+    )
+    t0 = time.monotonic()
+    try:
+        extractor, stats = asyncio.run(
+            extract(
+                args.rpc_url,
+                parts,
+                out_root=out_root,
+                run_date=run_date,
+                fmt=args.fmt,
+                batch_size=args.batch_size,
+                receipts=args.receipts,
+                limiter=limiter,
+                parts_in_flight=args.parts_in_flight,
+                max_retries=args.max_retries,
+                block_index=block_index,
+            )
+        )
+    except (RpcError, ExtractError) as exc:
+        raise SystemExit(f"L1 extraction failed: {exc}")
+    seconds = time.monotonic() - t0
+    s = extractor.stats
+    print(
+        f"[l1_extract] blocks={s.blocks} txs={s.txs} receipts={s.receipts} blob_txs={s.blob_txs} parts={s.parts} "
+        f"receipts_mode={s.receipts_mode} http_requests={stats.http_requests} rpc_calls={stats.rpc_calls} "
+        f"retries={stats.retries} connections={stats.connections} reconnects={stats.reconnects} concurrency={limiter.limit} "
+        f"peak_concurrency={limiter.peak_limit} seconds={seconds:.1f} blocks_per_s={s.blocks / max(seconds, 1e-9):.1f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Typed, month-partitioned Parquet storage for the panel tables in `contracts/schemas/`.
+
+A panel (`daily_rollup_panel`, `daily_l1_rent_decomposition`) is stored as a directory of
+`month=YYYY-MM/part-0.parquet` files:
+- column types come from the schema contract (date -> date32, number -> float64,
+  integer -> int64, string -> dictionary-encoded string); non-nullable fields are non-nullable;
+- rows are sorted by the schema grain and written as zstd-compressed row groups with min/max
+  statistics, so readers skip whole months (partition pruning) and row groups (statistics) that
+  fall outside a `date_utc` range or `rollup_id` set, and decode only the projected columns.
+
+CSV stays a derived artefact: `export-csv` writes it from the dataset with the same formatting as
+the ETL writers (sorted by grain, round-trip floats, blanks for nulls), and the quality gates read
+either format. Needs the optional `pyarrow` package.
+
+Usage:
+  python src/etl/panel_store.py write --schema str panel.csv data/processed/growthepie/vendor_daily_rollup_panel
+  python src/etl/panel_store.py export-csv --schema str data/processed/growthepie/vendor_daily_rollup_panel panel.csv
+  python src/etl/panel_store.py query data/processed/growthepie/vendor_daily_rollup_panel \\
+      --from 2024-03-01 --to 2024-03-31 --rollup base --columns date_utc,l2_fees_eth
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import functools
+import operator
+import os
+import shutil
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src" / "validation"))
+
+import panel_schema  # noqa: E402
+
+
+PARTITION_KEY = "month"
+PART_FILE = "part-0.parquet"
+COMPRESSION = "zstd"
+ROW_GROUP_ROWS = 65536
+CHUNK_ROWS = 65536
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.dataset  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise SystemExit("Parquet panel storage requires pyarrow (pip install pyarrow), or keep using the CSV panel.")
+    return pyarrow
+
+
+def load_table_schema(name_or_path: str) -> panel_schema.TableSchema:
+    """Schema YAML path or entrypoint key (e.g. `str`, `decomposition`)."""
+    path = panel_schema.resolve_schema_path(name_or_path)
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parents[2] / path
+    try:
+        return panel_schema.load_schema(path)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"Invalid schema {path}: {exc}")
+
+
+def arrow_schema(schema: panel_schema.TableSchema) -> Any:
+    pa = _pyarrow()
+    types = {
+        "date": pa.date32(),
+        "number": pa.float64(),
+        "integer": pa.int64(),
+        "string": pa.dictionary(pa.int32(), pa.string()),
+    }
+    return pa.schema([pa.field(f.name, types[f.type], nullable=f.nullable) for f in schema.fields])
+
+
+def _cast_column(field: panel_schema.FieldSpec, values: list[str], row_numbers: list[int]) -> list[object]:
+    cast = {"date": date.fromisoformat, "number": float, "integer": int, "string": str}[field.type]
+    out: list[object] = []
+    for row, v in zip(row_numbers, values):
+        if v == "":
+            if not field.nullable:
+                raise ValueError(f"row{row}: null in non-nullable column {field.name}")
+            out.append(None)
+            continue
+        try:
+            out.append(cast(v))
+        except ValueError:
+            raise ValueError(f"row{row}: invalid {field.type} {v!r} in column {field.name}")
+    return out
+
+
+def _swap_into_place(staging: Path, out_dir: Path) -> None:
+    old = out_dir.with_name(f".{out_dir.name}.old")
+    shutil.rmtree(old, ignore_errors=True)
+    if out_dir.exists():
+        os.replace(out_dir, old)
+    os.replace(staging, out_dir)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def _flush(writer: Any, pending: list[Any], row_group_rows: int, *, final: bool) -> None:
+    pa = _pyarrow()
+    rows = sum(t.num_rows for t in pending)
+    n = rows if final else rows - rows % row_group_rows
+    if not n:
+        return
+    table = pa.concat_tables(pending)
+    writer.write_table(table.slice(0, n), row_group_size=row_group_rows)
+    pending[:] = [table.slice(n)] if n < rows else []
+
+
+def write_dataset(
+    schema: panel_schema.TableSchema,
+    header: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    out_dir: Path,
+    *,
+    chunk_rows: int = CHUNK_ROWS,
+    row_group_rows: int = ROW_GROUP_ROWS,
+) -> dict[str, int]:
+    """Write CSV-formatted rows (strings, "" for null) as a month-partitioned dataset; returns rows per month.
+
+    Rows must arrive sorted by the schema grain (as the ETL writers and `export-csv` produce them);
+    the dataset replaces out_dir atomically.
+    """
+    pa = _pyarrow()
+    import pyarrow.parquet as pq
+
+    missing = [f.name for f in schema.fields if f.name not in header]
+    if missing:
+        raise ValueError(f"missing columns {missing} for table {schema.table}")
+    positions = [list(header).index(f.name) for f in schema.fields]
+    target = arrow_schema(schema)
+    staging = out_dir.with_name(f".{out_dir.name}.staging")
+    shutil.rmtree(staging, ignore_errors=True)
+    writers: dict[str, Any] = {}
+    pending: dict[str, list[Any]] = {}
+    counts: dict[str, int] = {}
+    last_key: tuple[str, ...] | None = None
+    grain = [list(header).index(g) for g in schema.grain]
+    month_pos = list(header).index("date_utc")
+    start = 0
+    it = iter(rows)
+    try:
+        while True:
+            chunk = [r for _, r in zip(range(chunk_rows), it)]
+            if not chunk:
+                break
+            by_month: dict[str, list[int]] = {}
+            for i, r in enumerate(chunk):
+                key = tuple(r[g] for g in grain)
+                if last_key is not None and key <= last_key:
+                    raise ValueError(f"row{start + i}: rows are not sorted by grain {schema.grain} (or repeat a key)")
+                last_key = key
+                by_month.setdefault(r[month_pos][:7], []).append(i)
+            for month, offsets in by_month.items():
+                row_numbers = [start + i for i in offsets]
+                columns = [
+                    _cast_column(f, [chunk[i][p] for i in offsets], row_numbers) for f, p in zip(schema.fields, positions)
+                ]
+                table = pa.Table.from_arrays(
+                    [pa.array(c, type=t.type) for c, t in zip(columns, target)], schema=target
+                )
+                if month not in writers:
+                    part = staging / f"{PARTITION_KEY}={month}" / PART_FILE
+                    part.parent.mkdir(parents=True)
+                    writers[month] = pq.ParquetWriter(
+                        part, target, compression=COMPRESSION, write_statistics=True, use_dictionary=True
+                    )
+                    pending[month] = []
+                pending[month].append(table)
+                # Emit only whole row groups so chunk boundaries do not fragment them.
+                _flush(writers[month], pending[month], row_group_rows, final=False)
+                counts[month] = counts.get(month, 0) + len(offsets)
+            start += len(chunk)
+        for month, w in writers.items():
+            _flush(w, pending[month], row_group_rows, final=True)
+            w.close()
+        staging.mkdir(parents=True, exist_ok=True)
+        _swap_into_place(staging, out_dir)
+    finally:
+        for w in writers.values():
+            if w.is_open:
+                w.close()
+        shutil.rmtree(staging, ignore_errors=True)
+    return dict(sorted(counts.items()))
+
+
+def write_csv_as_dataset(schema: panel_schema.TableSchema, csv_path: Path, out_dir: Path) -> dict[str, int]:
+    with csv_path.open(encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"{csv_path} is empty")
+        return write_dataset(schema, header, reader, out_dir)
+
+
+def _filters(
+    columns_in_file: Sequence[str],
+    *,
+    date_from: date | None,
+    date_to: date | None,
+    rollup_ids: Sequence[str] | None,
+) -> tuple[Any, Any]:
+    """(partition filter on `month`, row filter pushed into the row-group statistics); None = no filter."""
+    import pyarrow.dataset as ds
+
+    months, rows = [], []
+    if date_from is not None:
+        months.append(ds.field(PARTITION_KEY) >= date_from.isoformat()[:7])
+        rows.append(ds.field("date_utc") >= date_from)
+    if date_to is not None:
+        months.append(ds.field(PARTITION_KEY) <= date_to.isoformat()[:7])
+        rows.append(ds.field("date_utc") <= date_to)
+    if rollup_ids is not None:
+        if "rollup_id" not in columns_in_file:
+            raise SystemExit("rollup_id filter given but the panel has no rollup_id column")
+        rows.append(ds.field("rollup_id").isin(list(rollup_ids)))
+    return functools.reduce(operator.and_, months) if months else None, (
+        functools.reduce(operator.and_, rows) if rows else None
+    )
+
+
+def _dataset(dataset_dir: Path) -> Any:
+    pa = _pyarrow()
+    import pyarrow.dataset as ds
+
+    if not dataset_dir.is_dir():
+        raise SystemExit(f"Parquet panel dataset not found: {dataset_dir}")
+    partitioning = ds.partitioning(pa.schema([(PARTITION_KEY, pa.string())]), flavor="hive")
+    return ds.dataset(dataset_dir, format="parquet", partitioning=partitioning)
+
+
+def _projection(dataset: Any, columns: Sequence[str] | None) -> list[str]:
+    names = [n for n in dataset.schema.names if n != PARTITION_KEY]
+    if columns is None:
+        return names
+    unknown = [c for c in columns if c not in names]
+    if unknown:
+        raise SystemExit(f"Unknown columns {unknown} (panel has: {', '.join(names)})")
+    return list(columns)
+
+
+def scan(
+    dataset_dir: Path,
+    *,
+    columns: Sequence[str] | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    rollup_ids: Sequence[str] | None = None,
+    batch_rows: int = CHUNK_ROWS,
+) -> Iterator[Any]:
+    """Yield record batches in (month, grain) order, reading only matching months, row groups and columns."""
+    dataset = _dataset(dataset_dir)
+    names = _projection(dataset, None)
+    columns = _projection(dataset, columns)
+    month_filter, row_filter = _filters(names, date_from=date_from, date_to=date_to, rollup_ids=rollup_ids)
+    # Fragments are scanned in path (= month) order so output stays sorted by grain.
+    fragments = sorted(dataset.get_fragments(filter=month_filter), key=lambda frag: frag.path)
+    for frag in fragments:
+        yield from frag.to_batches(
+            columns=columns, filter=row_filter, batch_size=batch_rows
+        )
+
+
+def read_panel(dataset_dir: Path, *, columns: Sequence[str] | None = None, **filters: Any) -> Any:
+    """Materialise `scan()` as one pyarrow Table."""
+    pa = _pyarrow()
+    dataset = _dataset(dataset_dir)
+    names = _projection(dataset, columns)
+    batches = scan(dataset_dir, columns=names, **filters)
+    return pa.Table.from_batches(batches, schema=pa.schema([dataset.schema.field(n) for n in names]))
+
+
+def _format_cell(v: object) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, float):
+        return repr(v)
+    if isinstance(v, date):
+        return v.isoformat()
+    return str(v)
+
+
+def write_csv(batches: Iterable[Any], out: Any, columns: Sequence[str]) -> int:
+    w = csv.writer(out, lineterminator="\n")
+    w.writerow(columns)
+    n = 0
+    for batch in batches:
+        cols = [batch.column(c).to_pylist() for c in columns]
+        for row in zip(*cols):
+            w.writerow([_format_cell(v) for v in row])
+            n += 1
+    return n
+
+
+def export_csv(schema: panel_schema.TableSchema, dataset_dir: Path, out_path: Path) -> int:
+    """Derive the CSV panel from a dataset (columns in schema order); replaces out_path atomically."""
+    columns = [f.name for f in schema.fields]
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    part = out_path.with_name(f".{out_path.name}.part")
+    try:
+        with part.open("w", encoding="utf-8", newline="") as f:
+            n = write_csv(scan(dataset_dir, columns=columns), f, columns)
+        os.replace(part, out_path)
+    finally:
+        part.unlink(missing_ok=True)
+    return n
+
+
+def _parse_date(value: str | None, flag: str) -> date | None:
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise SystemExit(f"Invalid {flag} {value!r} (expected YYYY-MM-DD)")
+
+
+def main(argv: list[str]) -> int:
+    p = argparse.ArgumentParser(prog="panel_store.py")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    w = sub.add_parser("write", help="Convert a CSV panel into a month-partitioned Parquet dataset")
+    w.add_argument("--schema", required=True, help="Schema YAML path or entrypoint key (e.g. str, decomposition)")
+    w.add_argument("csv_path")
+    w.add_argument("dataset_dir")
+
+    e = sub.add_parser("export-csv", help="Derive the CSV panel from a Parquet dataset")
+    e.add_argument("--schema", required=True, help="Schema YAML path or entrypoint key (e.g. str, decomposition)")
+    e.add_argument("dataset_dir")
+    e.add_argument("csv_path")
+
+    q = sub.add_parser("query", help="Print the rows matching date/rollup filters as CSV")
+    q.add_argument("dataset_dir")
+    q.add_argument("--from", dest="date_from", default=None, help="First date_utc (inclusive)")
+    q.add_argument("--to", dest="date_to", default=None, help="Last date_utc (inclusive)")
+    q.add_argument("--rollup", action="append", default=None, help="rollup_id to keep (repeatable)")
+    q.add_argument("--columns", default=None, help="Comma-separated columns to read (default: all)")
+    args = p.parse_args(argv)
+
+    if args.cmd == "write":
+        try:
+            counts = write_csv_as_dataset(load_table_schema(args.schema), Path(args.csv_path), Path(args.dataset_dir))
+        except ValueError as exc:
+            raise SystemExit(f"Cannot convert {args.csv_path}: {exc}")
+        print(f"[panel_store] {args.dataset_dir} months={len(counts)} rows={sum(counts.values())}")
+        return 0
+    if args.cmd == "export-csv":
+        n = export_csv(load_table_schema(args.schema), Path(args.dataset_dir), Path(args.csv_path))
+        print(f"[panel_store] {args.csv_path} rows={n}")
+        return 0
+
+    dataset_dir = Path(args.dataset_dir)
+    columns = [c.strip() for c in args.columns.split(",")] if args.columns else None
+    batches = scan(
+        dataset_dir,
+        columns=columns,
+        date_from=_parse_date(args.date_from, "--from"),
+        date_to=_parse_date(args.date_to, "--to"),
+        rollup_ids=args.rollup,
+    )
+    write_csv(batches, sys.stdout, _projection(_dataset(dataset_dir), columns))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
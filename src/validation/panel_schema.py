@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+Schema-driven panel validator compiled from `contracts/schemas/*.yaml`.
+
+A schema (fields, types, nullability, grain) is compiled once into per-column checks that are then
+applied column-at-a-time to bounded chunks of a CSV or Parquet file (or a month-partitioned
+Parquet dataset directory):
+- type: `date` (YYYY-MM-DD), `string`, `number` (finite), `integer`
+- nullability (`nullable: false` forbids blanks / nulls)
+- grain uniqueness (64-bit key hashes; collisions confirmed exactly in a second pass)
+- table identities (e.g. `l1_total_rent_eth = base + blob + priority` for the decomposition table)
+- the protocol's sign and profit ≈ fees − rent sanity checks for the daily rollup panel
+
+Deterministic and offline. Parquet input needs the optional `pyarrow` package. When pyarrow is
+installed, CSV input is read into typed Arrow batches and checked with `pyarrow.compute`; a file
+with a cell that does not convert to its declared type is re-checked row by row in pure Python.
+
+Usage:
+  python src/validation/panel_schema.py --schema str data/samples/growthepie/vendor_daily_rollup_panel_sample.csv
+  python src/validation/panel_schema.py --schema contracts/schemas/panel_schema_decomp_v1.yaml decomp.parquet --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import operator
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterator
+
+
+SCHEMA_INDEX = Path("contracts/schemas/panel_schema.yaml")
+FIELD_TYPES = {"date", "string", "number", "integer"}
+CHUNK_ROWS = 65536
+MAX_FAILURES = 100
+
+# Accounting identities implied by the schema descriptions: total column == sum of part columns.
+TABLE_IDENTITIES: dict[str, list[tuple[str, tuple[str, ...]]]] = {
+    "daily_l1_rent_decomposition": [
+        ("l1_total_rent_eth", ("l1_base_fee_burn_eth", "l1_blob_fee_burn_eth", "l1_priority_fee_eth")),
+    ],
+}
+IDENTITY_ABS_TOL = 1e-12
+IDENTITY_REL_TOL = 1e-9
+
+# docs/protocol.md: fee and rent series are non-negative, and a vendor profit series must satisfy
+# abs(profit - (fees - rent)) <= max(1e-9, 0.01 * max(|fees|, |rent|, 1e-9)). (profit, fees, rent) columns.
+TABLE_NONNEGATIVE: dict[str, tuple[str, ...]] = {
+    "daily_rollup_panel": ("l2_fees_eth", "rent_paid_eth", "profit_eth"),
+}
+TABLE_PROFIT_IDENTITIES: dict[str, list[tuple[str, str, str]]] = {
+    "daily_rollup_panel": [("profit_eth", "l2_fees_eth", "rent_paid_eth")],
+}
+PROFIT_ABS_TOL = 1e-9
+PROFIT_REL_TOL = 0.01
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    name: str
+    type: str
+    nullable: bool
+    units: str = ""
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    table: str
+    version: int
+    grain: tuple[str, ...]
+    fields: tuple[FieldSpec, ...]
+
+
+def _strip_comment(line: str) -> str:
+    quote: str | None = None
+    for i, ch in enumerate(line):
+        if quote is not None:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"":
+            quote = ch
+        elif ch == "#" and (i == 0 or line[i - 1].isspace()):
+            return line[:i].rstrip()
+    return line.rstrip()
+
+
+def _scalar(raw: str) -> object:
+    v = raw.strip()
+    if len(v) >= 2 and v[0] == v[-1] and v[0] in "'\"":
+        return v[1:-1]
+    if v.lower() in {"true", "false"}:
+        return v.lower() == "true"
+    if re.fullmatch(r"-?\d+", v):
+        return int(v)
+    return v
+
+
+def parse_yaml_subset(text: str) -> dict[str, object]:
+    """Parse the small YAML subset used by `contracts/schemas/` (no external YAML dependency).
+
+    Supports top-level `key: value`, and top-level `key:` blocks holding either a mapping of
+    `k: v`, a list of scalars (`- item`), or a list of flat mappings (`- name: x` + indented `k: v`).
+    """
+    root: dict[str, object] = {}
+    block_key: str | None = None
+    item: dict[str, object] | None = None
+    for lineno, raw_line in enumerate(text.splitlines(), start=1):
+        line = _strip_comment(raw_line)
+        if not line.strip():
+            continue
+        indent = len(line) - len(line.lstrip(" "))
+        content = line.strip()
+        if indent == 0:
+            key, sep, rest = content.partition(":")
+            if not sep:
+                raise ValueError(f"line {lineno}: expected `key: value`")
+            block_key, item = None, None
+            if rest.strip():
+                root[key.strip()] = _scalar(rest)
+            else:
+                block_key = key.strip()
+                root[block_key] = None
+            continue
+        if block_key is None:
+            raise ValueError(f"line {lineno}: unexpected indentation")
+        block = root[block_key]
+        if content.startswith("- ") or content == "-":
+            if block is None:
+                block = root[block_key] = []
+            if not isinstance(block, list):
+                raise ValueError(f"line {lineno}: list item inside mapping `{block_key}`")
+            entry = content[1:].strip()
+            key, sep, rest = entry.partition(":")
+            if sep and entry[:1] not in "'\"":
+                item = {key.strip(): _scalar(rest)}
+                block.append(item)
+            else:
+                item = None
+                block.append(_scalar(entry))
+            continue
+        key, sep, rest = content.partition(":")
+        if not sep:
+            raise ValueError(f"line {lineno}: expected `key: value`")
+        if isinstance(block, list):
+            if item is None:
+                raise ValueError(f"line {lineno}: mapping key outside a list item")
+            item[key.strip()] = _scalar(rest)
+        else:
+            if block is None:
+                block = root[block_key] = {}
+            assert isinstance(block, dict)
+            block[key.strip()] = _scalar(rest)
+    return root
+
+
+def parse_schema(text: str) -> TableSchema:
+    """Build a `TableSchema` from schema YAML text; raises ValueError if it is malformed."""
+    data = parse_yaml_subset(text)
+    table = data.get("table")
+    if not isinstance(table, str) or not table:
+        raise ValueError("missing `table`")
+    raw_fields = data.get("fields")
+    if not isinstance(raw_fields, list) or not raw_fields:
+        raise ValueError("missing `fields` list")
+    fields: list[FieldSpec] = []
+    for i, f in enumerate(raw_fields):
+        if not isinstance(f, dict) or not isinstance(f.get("name"), str):
+            raise ValueError(f"fields[{i}]: missing `name`")
+        ftype = f.get("type")
+        if ftype not in FIELD_TYPES:
+            raise ValueError(f"fields[{i}] ({f['name']}): unsupported type {ftype!r}")
+        nullable = f.get("nullable", True)
+        if not isinstance(nullable, bool):
+            raise ValueError(f"fields[{i}] ({f['name']}): `nullable` must be true/false")
+        fields.append(
+            FieldSpec(
+                name=str(f["name"]),
+                type=str(ftype),
+                nullable=nullable,
+                units=str(f.get("units", "")),
+                description=str(f.get("description", "")),
+            )
+        )
+    names = [f.name for f in fields]
+    dupes = sorted(n for n, c in Counter(names).items() if c > 1)
+    if dupes:
+        raise ValueError(f"duplicate field(s): {', '.join(dupes)}")
+    grain = data.get("grain") or []
+    if not isinstance(grain, list) or any(g not in names for g in grain):
+        raise ValueError(f"grain must list declared fields: {grain!r}")
+    version = data.get("version", 0)
+    return TableSchema(
+        table=table,
+        version=version if isinstance(version, int) else 0,
+        grain=tuple(str(g) for g in grain),
+        fields=tuple(fields),
+    )
+
+
+def load_schema(path: Path) -> TableSchema:
+    return parse_schema(path.read_text(encoding="utf-8"))
+
+
+def resolve_schema_path(name_or_path: str) -> Path:
+    """Accept a schema file path or an entrypoint key from `contracts/schemas/panel_schema.yaml`."""
+    path = Path(name_or_path)
+    if path.suffix in {".yaml", ".yml"}:
+        return path
+    entrypoints = parse_yaml_subset(SCHEMA_INDEX.read_text(encoding="utf-8")).get("schemas")
+    if not isinstance(entrypoints, dict) or name_or_path not in entrypoints:
+        known = ", ".join(sorted(entrypoints)) if isinstance(entrypoints, dict) else ""
+        raise SystemExit(f"Unknown schema {name_or_path!r} (known: {known})")
+    return Path(str(entrypoints[name_or_path]))
+
+
+# Column checks take raw column values (CSV strings, or typed values from Parquet; "" / None are
+# null) and return parsed values (None for null / invalid) plus offsets of values that failed to parse.
+ColumnParser = Callable[[list[object]], tuple[list[object], list[int]]]
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _parse_date_column(values: list[object]) -> tuple[list[object], list[int]]:
+    # Panels repeat each date once per rollup: validate each distinct value once.
+    bad: set[object] = set()
+    for v in set(values):
+        if v is None or v == "" or isinstance(v, date):
+            continue
+        if not isinstance(v, str) or _DATE_RE.fullmatch(v) is None:
+            bad.add(v)
+            continue
+        try:
+            date.fromisoformat(v)
+        except ValueError:
+            bad.add(v)
+    parsed = [None if v == "" or v in bad else v for v in values]
+    return parsed, ([i for i, v in enumerate(values) if v in bad] if bad else [])
+
+
+def _parse_string_column(values: list[object]) -> tuple[list[object], list[int]]:
+    return [None if v == "" else v for v in values], []
+
+
+def _numeric_parser(cast: Callable[[object], object]) -> ColumnParser:
+    def _parse(values: list[object]) -> tuple[list[object], list[int]]:
+        try:
+            return list(map(cast, values)), []  # whole column in one C-level pass when clean
+        except (TypeError, ValueError):
+            pass
+        parsed: list[object] = []
+        bad: list[int] = []
+        for i, v in enumerate(values):
+            if v is None or v == "":
+                parsed.append(None)
+                continue
+            try:
+                parsed.append(cast(v))
+            except (TypeError, ValueError):
+                parsed.append(None)
+                bad.append(i)
+        return parsed, bad
+
+    return _parse
+
+
+def _cast_number(v: object) -> float:
+    x = float(v)  # type: ignore[arg-type]
+    if not math.isfinite(x):  # "nan" / "inf" parse as floats but are not valid panel values
+        raise ValueError(v)
+    return x
+
+
+def _cast_integer(v: object) -> int:
+    if isinstance(v, float):
+        if not v.is_integer():
+            raise ValueError(v)
+        return int(v)
+    return int(v)  # type: ignore[call-overload]
+
+
+COLUMN_PARSERS: dict[str, ColumnParser] = {
+    "date": _parse_date_column,
+    "string": _parse_string_column,
+    "number": _numeric_parser(_cast_number),
+    "integer": _numeric_parser(_cast_integer),
+}
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    schema: TableSchema
+    parsers: dict[str, ColumnParser]
+    required: tuple[str, ...]
+    identities: tuple[tuple[str, tuple[str, ...]], ...]
+    nonnegative: tuple[str, ...] = ()
+    profit_identities: tuple[tuple[str, str, str], ...] = ()
+
+
+def compile_schema(schema: TableSchema) -> CompiledSchema:
+    """Resolve every per-column parser and table identity once, ahead of scanning any data."""
+    names = {f.name for f in schema.fields}
+    identities = tuple(
+        (total, parts)
+        for total, parts in TABLE_IDENTITIES.get(schema.table, [])
+        if total in names and all(p in names for p in parts)
+    )
+    return CompiledSchema(
+        schema=schema,
+        parsers={f.name: COLUMN_PARSERS[f.type] for f in schema.fields},
+        required=tuple(f.name for f in schema.fields if not f.nullable),
+        identities=identities,
+        nonnegative=tuple(c for c in TABLE_NONNEGATIVE.get(schema.table, ()) if c in names),
+        profit_identities=tuple(
+            cols for cols in TABLE_PROFIT_IDENTITIES.get(schema.table, []) if all(c in names for c in cols)
+        ),
+    )
+
+
+@dataclass
+class ValidationReport:
+    path: str
+    table: str
+    rows: int = 0
+    failures: list[str] = field(default_factory=list)
+    counts: Counter[str] = field(default_factory=Counter)
+
+    def fail(self, row: int | None, check: str, column: str) -> None:
+        self.counts[check] += 1
+        if len(self.failures) < MAX_FAILURES:
+            self.failures.append(f"{check}:{column}" if row is None else f"row{row}:{check}:{column}")
+
+    @property
+    def ok(self) -> bool:
+        return not self.counts
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "path": self.path,
+            "table": self.table,
+            "rows": self.rows,
+            "ok": self.ok,
+            "counts": dict(sorted(self.counts.items())),
+            "failures": self.failures,
+        }
+
+
+def _csv_column(rows: list[list[str]], i: int) -> list[object]:
+    try:
+        return list(map(operator.itemgetter(i), rows))
+    except IndexError:  # ragged rows: pad short ones with blanks
+        return [r[i] if i < len(r) else "" for r in rows]
+
+
+def _iter_csv_chunks(path: Path, chunk_rows: int) -> tuple[list[str], Iterator[dict[str, list[object]]]]:
+    f = path.open("r", encoding="utf-8", newline="")
+    reader = csv.reader(f)
+    header = next(reader, None) or []
+
+    def _chunks() -> Iterator[dict[str, list[object]]]:
+        with f:
+            while True:
+                rows = [r for _, r in zip(range(chunk_rows), reader)]
+                if not rows:
+                    return
+                yield {name: _csv_column(rows, i) for i, name in enumerate(header)}
+
+    return header, _chunks()
+
+
+def _iter_parquet_chunks(path: Path, chunk_rows: int) -> tuple[list[str], Iterator[dict[str, list[object]]]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Parquet input requires pyarrow (pip install pyarrow), or validate a CSV export instead.")
+    # A directory is a partitioned dataset (`month=YYYY-MM/part-0.parquet`, see src/etl/panel_store.py).
+    files = sorted(path.rglob("*.parquet")) if path.is_dir() else [path]
+    if not files:
+        return [], iter(())
+    header = list(pq.ParquetFile(files[0]).schema_arrow.names)
+
+    def _chunks() -> Iterator[dict[str, list[object]]]:
+        for file in files:
+            for batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_rows):
+                yield {name: batch.column(i).to_pylist() for i, name in enumerate(batch.schema.names)}
+
+    return header, _chunks()
+
+
+def iter_table_chunks(path: Path, chunk_rows: int = CHUNK_ROWS) -> tuple[list[str], Iterator[dict[str, list[object]]]]:
+    """Return the column names and an iterator of `{column: values}` chunks for a CSV or Parquet file
+    (or a directory of Parquet partitions)."""
+    if path.suffix == ".parquet" or path.is_dir():
+        return _iter_parquet_chunks(path, chunk_rows)
+    return _iter_csv_chunks(path, chunk_rows)
+
+
+# Arrow types for the vectorized CSV path, by schema field type.
+ARROW_CSV_TYPES = {"date": "date32", "string": "string", "number": "float64", "integer": "int64"}
+ARROW_CSV_BLOCK_BYTES = 1 << 24
+
+
+def _csv_header(path: Path) -> list[str]:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        return next(csv.reader(f), None) or []
+
+
+def _fail_where(report: ValidationReport, mask: object, start: int, check: str, column: str) -> None:
+    import pyarrow.compute as pc
+
+    mask = pc.fill_null(mask, False)
+    if not pc.any(mask).as_py():
+        return
+    for i in pc.indices_nonzero(mask).to_pylist():
+        report.fail(start + i, check, column)
+
+
+def _arrow_duplicate_rows(keys: object, grain: tuple[str, ...]) -> list[tuple[int, tuple[object, ...]]]:
+    """(row, key) for every repeat of a grain key, in row order (stable sort by key, compare neighbours)."""
+    import pyarrow.compute as pc
+
+    order = pc.sort_indices(keys, sort_keys=[(g, "ascending") for g in grain])
+    ranked = keys.take(order)  # type: ignore[attr-defined]
+    if ranked.num_rows < 2:
+        return []
+    same = None
+    for g in grain:
+        col = ranked.column(g)
+        prev, cur = col.slice(0, len(col) - 1), col.slice(1)
+        eq = pc.coalesce(pc.equal(cur, prev), pc.and_(pc.is_null(cur), pc.is_null(prev)))
+        same = eq if same is None else pc.and_(same, eq)
+    repeats = pc.indices_nonzero(same).to_pylist()
+    if not repeats:
+        return []
+    rows = order.slice(1).take(repeats).to_pylist()
+    values = ranked.slice(1).take(repeats).select(list(grain)).to_pylist()
+    return sorted(zip(rows, (tuple(v[g] for g in grain) for v in values)))
+
+
+def _validate_csv_arrow(compiled: CompiledSchema, path: Path) -> ValidationReport | None:
+    """Vectorized CSV validation; None when pyarrow is missing or a cell does not convert to its type
+    (the caller then falls back to the row-level Python path for exact failure rows)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+    schema = compiled.schema
+    header = _csv_header(path)
+    columns = [name for name in compiled.parsers if name in header]
+    if not columns or len(set(header)) != len(header):
+        return None
+    types = {f.name: getattr(pa, ARROW_CSV_TYPES[f.type])() for f in schema.fields if f.name in columns}
+    report = ValidationReport(path=str(path), table=schema.table)
+    for f in schema.fields:
+        if f.name not in header:
+            report.fail(None, "missing_column", f.name)
+    grain = schema.grain if all(g in header for g in schema.grain) else ()
+
+    def _f64(col: object) -> object:
+        return pc.cast(col, pa.float64())
+
+    keys: list[object] = []
+    try:
+        reader = pa_csv.open_csv(
+            path,
+            read_options=pa_csv.ReadOptions(block_size=ARROW_CSV_BLOCK_BYTES),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=types, include_columns=columns, null_values=[""], strings_can_be_null=True
+            ),
+        )
+        for batch in reader:
+            start = report.rows
+            report.rows += batch.num_rows
+            cols = {name: batch.column(name) for name in columns}
+            for name in columns:
+                if types[name] == pa.float64():
+                    _fail_where(report, pc.invert(pc.is_finite(cols[name])), start, "invalid_type", name)
+                if name in compiled.required:
+                    _fail_where(report, pc.is_null(cols[name]), start, "null", name)
+            for total, parts in compiled.identities:
+                if total not in cols or any(p not in cols for p in parts):
+                    continue
+                t = _f64(cols[total])
+                parts_sum = _f64(cols[parts[0]])
+                for part in parts[1:]:
+                    parts_sum = pc.add(parts_sum, _f64(cols[part]))
+                tol = pc.max_element_wise(
+                    pc.multiply(pc.max_element_wise(pc.abs(t), pc.abs(parts_sum)), IDENTITY_REL_TOL), IDENTITY_ABS_TOL
+                )
+                _fail_where(report, pc.greater(pc.abs(pc.subtract(t, parts_sum)), tol), start, "identity", total)
+            for name in compiled.nonnegative:
+                if name in cols:
+                    _fail_where(report, pc.less(cols[name], 0), start, "negative", name)
+            for profit, fees, rent in compiled.profit_identities:
+                if profit not in cols or fees not in cols or rent not in cols:
+                    continue
+                p, f, r = _f64(cols[profit]), _f64(cols[fees]), _f64(cols[rent])
+                scale = pc.max_element_wise(pc.abs(f), pc.abs(r), PROFIT_ABS_TOL)
+                tol = pc.max_element_wise(pc.multiply(scale, PROFIT_REL_TOL), PROFIT_ABS_TOL)
+                off = pc.greater(pc.abs(pc.subtract(p, pc.subtract(f, r))), tol)
+                _fail_where(report, off, start, "profit_identity", profit)
+            if grain:
+                keys.append(pa.table({g: cols[g] for g in grain}))
+    except pa.ArrowInvalid:
+        return None
+    if keys:
+        for row, key in _arrow_duplicate_rows(pa.concat_tables(keys), grain):
+            report.fail(row, "duplicate_grain", "|".join(map(str, key)))
+    return report
+
+
+def _identity_holds(total: float, parts_sum: float) -> bool:
+    return abs(total - parts_sum) <= max(IDENTITY_ABS_TOL, IDENTITY_REL_TOL * max(abs(total), abs(parts_sum)))
+
+
+def _profit_holds(profit: float, fees: float, rent: float) -> bool:
+    return abs(profit - (fees - rent)) <= max(PROFIT_ABS_TOL, PROFIT_REL_TOL * max(abs(fees), abs(rent), PROFIT_ABS_TOL))
+
+
+def validate_file(compiled: CompiledSchema, path: Path, *, chunk_rows: int = CHUNK_ROWS) -> ValidationReport:
+    """Apply a compiled schema column-at-a-time over `path` in bounded memory."""
+    if path.suffix != ".parquet" and not path.is_dir():
+        arrow_report = _validate_csv_arrow(compiled, path)
+        if arrow_report is not None:
+            return arrow_report
+    schema = compiled.schema
+    report = ValidationReport(path=str(path), table=schema.table)
+    header, chunks = iter_table_chunks(path, chunk_rows)
+    missing = [f.name for f in schema.fields if f.name not in header]
+    for name in missing:
+        report.fail(None, "missing_column", name)
+    grain = schema.grain if all(g in header for g in schema.grain) else ()
+
+    seen: set[int] = set()
+    suspects: set[int] = set()
+    for cols in chunks:
+        start = report.rows
+        n = len(next(iter(cols.values()), []))
+        report.rows += n
+        parsed: dict[str, list[object]] = {}
+        for name, parse in compiled.parsers.items():
+            if name not in cols:
+                continue
+            values, bad = parse(cols[name])
+            parsed[name] = values
+            for i in bad:
+                report.fail(start + i, "invalid_type", name)
+            if name in compiled.required and None in values:
+                bad_set = set(bad)
+                for i, v in enumerate(values):
+                    if v is None and i not in bad_set:
+                        report.fail(start + i, "null", name)
+        for total, parts in compiled.identities:
+            if total not in parsed or any(p not in parsed for p in parts):
+                continue
+            for i, row in enumerate(zip(parsed[total], *(parsed[p] for p in parts))):
+                if None in row:
+                    continue
+                if not _identity_holds(row[0], sum(row[1:])):  # type: ignore[arg-type]
+                    report.fail(start + i, "identity", total)
+        for name in compiled.nonnegative:
+            for i, v in enumerate(parsed.get(name, ())):
+                if v is not None and v < 0:  # type: ignore[operator]
+                    report.fail(start + i, "negative", name)
+        for profit, fees, rent in compiled.profit_identities:
+            if profit not in parsed or fees not in parsed or rent not in parsed:
+                continue
+            for i, row in enumerate(zip(parsed[profit], parsed[fees], parsed[rent])):
+                if None not in row and not _profit_holds(*row):  # type: ignore[arg-type]
+                    report.fail(start + i, "profit_identity", profit)
+        if grain:
+            for key in map(hash, zip(*(cols[g] for g in grain))):
+                if key in seen:
+                    suspects.add(key)
+                else:
+                    seen.add(key)
+    del seen
+
+    if suspects:
+        first_row: dict[tuple[object, ...], int] = {}
+        _, chunks = iter_table_chunks(path, chunk_rows)
+        offset = 0
+        for cols in chunks:
+            for i, key in enumerate(zip(*(cols[g] for g in grain))):
+                if hash(key) not in suspects:
+                    continue
+                if key in first_row:
+                    report.fail(offset + i, "duplicate_grain", "|".join(map(str, key)))
+                else:
+                    first_row[key] = offset + i
+            offset += len(next(iter(cols.values()), []))
+    return report
+
+
+def main(argv: list[str]) -> int:
+    p = argparse.ArgumentParser(prog="panel_schema.py")
+    p.add_argument("--schema", required=True, help="Schema YAML path or entrypoint key (e.g. str, decomposition)")
+    p.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="Rows per column chunk")
+    p.add_argument("--json", dest="as_json", action="store_true", help="Print JSON reports")
+    p.add_argument("paths", nargs="+", help="CSV or Parquet panel files, or Parquet dataset directories")
+    args = p.parse_args(argv)
+
+    schema_path = resolve_schema_path(args.schema)
+    try:
+        compiled = compile_schema(load_schema(schema_path))
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"Invalid schema {schema_path}: {exc}")
+
+    reports = [validate_file(compiled, Path(path), chunk_rows=args.chunk_rows) for path in args.paths]
+    if args.as_json:
+        print(json.dumps([r.to_dict() for r in reports], indent=2, sort_keys=True))
+    else:
+        for r in reports:
+            print(f"[{r.path}] table={r.table} rows={r.rows} ok={r.ok} counts={dict(r.counts)}")
+            for failure in r.failures:
+                print(f"  {failure}")
+    return 0 if all(r.ok for r in reports) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
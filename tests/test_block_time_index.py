@@ -0,0 +1,169 @@
+import asyncio
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from datetime import date, datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "src" / "etl"))
+sys.path.insert(0, str(REPO / "tests"))
+
+import block_time_index as bti  # noqa: E402
+import l1_extract as l1  # noqa: E402
+from test_l1_extract import MockRpc, _serve  # noqa: E402
+
+T0 = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()) - 12 * 3000
+HEAD = 100_000
+
+
+def ts_of(n: int) -> int:
+    """Synthetic chain: 12s slots with every 7th slot missed (strictly increasing)."""
+    return T0 + 12 * n + 12 * (n // 7)
+
+
+def first_at_or_after(ts: int) -> int:
+    return next(n for n in range(HEAD + 1) if ts_of(n) >= ts)
+
+
+class HeaderRpc(MockRpc):
+    """Serves eth_blockNumber and header-only blocks of the synthetic chain."""
+
+    def answer(self, call: dict) -> dict:
+        out = {"jsonrpc": "2.0", "id": call["id"]}
+        with self.lock:
+            self.calls.append(call["method"])
+        if call["method"] == "eth_blockNumber":
+            out["result"] = hex(HEAD)
+        elif call["method"] == "eth_getBlockByNumber":
+            n = int(call["params"][0], 16)
+            out["result"] = {"number": hex(n), "timestamp": hex(ts_of(n))} if n <= HEAD else None
+        else:
+            out["error"] = {"code": -32601, "message": "method not found"}
+        return out
+
+
+class BlockTimeIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.repo = Path(self._tmp.name)
+        patcher = mock.patch.object(bti, "_repo_root", return_value=self.repo)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = self.repo / bti.INDEX_PATH
+
+    def _record(self, first: int, last: int) -> int | None:
+        return bti.record_timestamps(self.path, ((n, ts_of(n)) for n in range(first, last + 1)))
+
+    def test_out_of_order_chunks_advance_contiguous_head(self) -> None:
+        self.assertEqual(self._record(1000, 1999), 1999)
+        self.assertEqual(self._record(3000, 3999), 1999)  # gap 2000-2999: head stays
+        self.assertEqual(self._record(2000, 2999), 3999)
+        self.assertEqual(self._record(500, 999), 3999)  # below base: rebased
+        with bti.BlockTimeIndex(self.path) as index:
+            self.assertEqual((index.base, index.head), (500, 3999))
+            self.assertEqual(index.timestamp(2500), ts_of(2500))
+            self.assertIsNone(index.timestamp(4000))
+            self.assertEqual(index.locate(ts_of(500)), 500)  # exact hit at the base
+            self.assertIsNone(index.locate(ts_of(500) - 1))  # may be below the indexed range
+            self.assertEqual(index.locate(ts_of(501)), 501)
+            self.assertEqual(index.locate(ts_of(2500) - 1), 2500)
+            self.assertIsNone(index.locate(ts_of(3999) + 1))
+        self.assertEqual(self.path.stat().st_size, bti.HEADER.size + 4 * 3500)
+
+        with self.assertRaisesRegex(ValueError, "does not increase after block 4000"):
+            bti.record_timestamps(self.path, [(4000, ts_of(4000)), (4001, ts_of(4000))])
+        with self.assertRaisesRegex(ValueError, "out of range"):
+            bti.record_timestamps(self.path, [(4000, 2**32)])
+
+    def test_refreshed_range_overwrites_and_clears_stale_neighbours(self) -> None:
+        self.assertEqual(self._record(1000, 1999), 1999)
+        # A reorg refresh of 1500-1509 one slot later: the stored 1510 no longer follows 1509.
+        head = bti.record_timestamps(self.path, ((n, ts_of(n) + 12) for n in range(1500, 1510)))
+        self.assertEqual(head, 1509)
+        with bti.BlockTimeIndex(self.path) as index:
+            self.assertEqual(index.timestamp(1505), ts_of(1505) + 12)
+            self.assertEqual(index.timestamp(1499), ts_of(1499))
+            self.assertIsNone(index.timestamp(1510))
+            self.assertEqual(index.timestamp(1511), ts_of(1511))
+        self.assertEqual(bti.record_timestamps(self.path, [(1510, ts_of(1510) + 6)]), 1999)
+
+    def test_day_ranges_match_brute_force(self) -> None:
+        self._record(0, 30_000)
+        with bti.BlockTimeIndex(self.path) as index:
+            for day in (date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)):
+                start = bti._day_start(day)
+                expected = (first_at_or_after(start), first_at_or_after(start + 86400) - 1)
+                self.assertEqual(index.day_range(day), expected)
+                self.assertLess(ts_of(expected[0] - 1), start)
+            self.assertIsNone(index.day_range(date(2024, 3, 1)))
+
+            rng = random.Random(3)
+            targets = [rng.randrange(ts_of(1), ts_of(30_000)) for _ in range(20_000)]
+            t0 = time.perf_counter()
+            for t in targets:
+                index.locate(t)
+            per_lookup = (time.perf_counter() - t0) / len(targets)
+            self.assertLess(per_lookup, 200e-6)
+            self.assertTrue(all(ts_of(index.locate(t)) >= t > ts_of(index.locate(t) - 1) for t in targets[:500]))
+
+    def test_rpc_fallback_beyond_indexed_head(self) -> None:
+        self._record(0, 20_000)
+        rpc = HeaderRpc()
+        server = _serve(rpc)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        out = self.repo / bti.BOUNDS_PATH
+
+        with redirect_stdout(io.StringIO()):
+            bti.main(["bounds", "--start-date", "2024-01-02", "--end-date", "2024-01-10", "--rpc-url", url])
+        bounds = json.loads(out.read_text())
+        self.assertEqual(bounds["start_block"], first_at_or_after(bti._day_start(date(2024, 1, 2))))
+        self.assertEqual(bounds["end_block"], first_at_or_after(bti._day_start(date(2024, 1, 11))) - 1)
+        self.assertEqual(bounds["resolved_by"], {"start_block": "index", "end_block": "rpc"})
+        self.assertEqual(bounds["index_head"], 20_000)
+        self.assertLessEqual(rpc.http_requests, 10)  # batched k-ary search, not ~17 single probes
+
+        with self.assertRaisesRegex(SystemExit, "not complete yet"):
+            bti.main(["bounds", "--start-date", "2024-01-02", "--end-date", "2024-02-01", "--rpc-url", url])
+        with self.assertRaisesRegex(SystemExit, "outside the block-time index"):
+            bti.main(["bounds", "--start-date", "2024-01-02", "--end-date", "2024-01-10", "--rpc-url", ""])
+
+    def test_rpc_search_without_index(self) -> None:
+        rpc = HeaderRpc()
+        server = _serve(rpc)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        async def run() -> list:
+            transport = l1.RpcTransport(f"http://127.0.0.1:{server.server_address[1]}")
+            async with l1.BatchRpcClient(transport, l1.AdaptiveConcurrency(initial=1, maximum=1)) as client:
+                search = bti.RpcTimestamps(client)
+                return [await bti.resolve_first_block(t, None, search) for t in (0, ts_of(777), ts_of(HEAD) + 1)]
+
+        self.assertEqual(asyncio.run(run()), [(0, "rpc"), (777, "rpc"), None])
+
+    def test_build_from_parts_and_day_cli(self) -> None:
+        parts = self.repo / "blocks"
+        for first, last in ((0, 6999), (7000, 9999)):
+            rows = [{c: 0 for c in l1.COLUMNS["blocks"]} | {"block_number": n, "timestamp": ts_of(n)} for n in range(first, last + 1)]
+            l1._write_table(parts / l1.part_name(first, last, "jsonl"), "blocks", rows, "jsonl")
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            bti.main(["build", str(parts)])
+            bti.main(["day", "--date", "2024-01-01"])
+        day = bti._day_start(date(2024, 1, 1))
+        self.assertIn("parts=2 head=9999", buf.getvalue())
+        self.assertIn(f"2024-01-01 {first_at_or_after(day)} {first_at_or_after(day + 86400) - 1}", buf.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
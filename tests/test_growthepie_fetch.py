@@ -0,0 +1,139 @@
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "src" / "etl"))
+
+import growthepie_fetch as gf  # noqa: E402
+
+mrm = gf.mrm
+
+MASTER = {"metrics": {k: {"name": k} for k in ("fees", "rent_paid", "profit", "txcount", "daa")}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        server = self.server
+        with server.lock:  # type: ignore[attr-defined]
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1  # type: ignore[attr-defined]
+            server.ports.add(self.client_address[1])  # type: ignore[attr-defined]
+            failures = server.fail.get(self.path, 0)  # type: ignore[attr-defined]
+            if failures:
+                server.fail[self.path] = failures - 1  # type: ignore[attr-defined]
+        if failures:
+            self._send(503, b"busy", retry_after="0")
+            return
+        body = server.routes.get(self.path)  # type: ignore[attr-defined]
+        self._send(200, body) if body is not None else self._send(404, b"missing")
+
+    def _send(self, status: int, body: bytes, *, retry_after: str | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if retry_after is not None:
+            self.send_header("Retry-After", retry_after)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class GrowthepieFetchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.repo = Path(self._tmp.name).resolve()
+        for mod in (gf, mrm):
+            patcher = mock.patch.object(mod, "_repo_root", return_value=self.repo)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.lock = threading.Lock()  # type: ignore[attr-defined]
+        self.server.hits = {}  # type: ignore[attr-defined]
+        self.server.ports = set()  # type: ignore[attr-defined]
+        self.server.fail = {}  # type: ignore[attr-defined]
+        self.server.routes = {"/v1/master.json": json.dumps(MASTER).encode()}  # type: ignore[attr-defined]
+        for key in MASTER["metrics"]:
+            rows = [{"date": f"2024-03-{d:02d}", "origin_key": "base", "value": d * 0.5} for d in range(1, 200)]
+            self.server.routes[f"/v1/export/{key}.json"] = json.dumps(rows).encode()  # type: ignore[attr-defined]
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def run_fetch(self, *extra: str) -> tuple[int, str]:
+        argv = ["--run-date", "2026-01-22", "--base-url", self.base_url, "--backoff-seconds", "0", *extra]
+        with contextlib.redirect_stdout(io.StringIO()) as out, contextlib.redirect_stderr(io.StringIO()) as err:
+            rc = gf.main(argv)
+        return rc, out.getvalue() + err.getvalue()
+
+    def test_pooled_fetch_retries_and_manifest_matches_full_hash(self) -> None:
+        self.server.fail["/v1/export/fees.json"] = 2  # type: ignore[attr-defined]
+        rc, out = self.run_fetch("--workers", "2")
+        self.assertEqual(rc, 0, out)
+        self.assertIn("fetched=5 skipped=0 failed=0 requests=7 retries=2", out)
+        self.assertLessEqual(len(self.server.ports), 2)  # type: ignore[attr-defined]
+
+        snap = self.repo / "data/raw/growthepie/2026-01-22"
+        self.assertEqual(
+            sorted(str(p.relative_to(snap)) for p in snap.rglob("*") if p.is_file()),
+            ["export/fees.json", "export/profit.json", "export/rent_paid.json", "export/txcount.json", "master.json"],
+        )
+        self.assertEqual((snap / "export/txcount.json").read_bytes(), self.server.routes["/v1/export/txcount.json"])  # type: ignore[attr-defined]
+
+        manifest = json.loads((self.repo / "data/raw_manifest/growthepie_2026-01-22.json").read_text())
+        full = mrm.build_manifest("growthepie", snap, manifest["command"], as_of=date(2026, 1, 22))
+        self.assertEqual(manifest["files"], full["files"])
+        self.assertEqual(manifest["tree"], full["tree"])
+        self.assertIn("--run-date 2026-01-22", manifest["command"])
+
+    def test_failed_export_resumes_without_refetching(self) -> None:
+        self.server.fail["/v1/export/profit.json"] = 100  # type: ignore[attr-defined]
+        snap = self.repo / "data/raw/growthepie/2026-01-22"
+        (snap / "export").mkdir(parents=True)
+        (snap / "export/.fees.json.part").write_bytes(b"trunc")
+        rc, out = self.run_fetch("--max-retries", "1")
+        self.assertEqual(rc, 1)
+        self.assertIn("FAILED GET /v1/export/profit.json: HTTP 503", out)
+        self.assertFalse((snap / "export/profit.json").exists())
+        self.assertEqual(list(snap.rglob("*.part")), [])
+        self.assertFalse((self.repo / "data/raw_manifest").exists())
+
+        self.server.fail.clear()  # type: ignore[attr-defined]
+        self.server.hits.clear()  # type: ignore[attr-defined]
+        rc, out = self.run_fetch("--metrics", "fees,profit,rent_paid,txcount")
+        self.assertEqual(rc, 0, out)
+        self.assertIn("fetched=1 skipped=4", out)
+        self.assertEqual(self.server.hits, {"/v1/export/profit.json": 1})  # type: ignore[attr-defined]
+        manifest = json.loads((self.repo / "data/raw_manifest/growthepie_2026-01-22.json").read_text())
+        self.assertEqual(len(manifest["files"]), 5)
+
+    def test_unknown_metric_rejected(self) -> None:
+        with self.assertRaisesRegex(SystemExit, "Unknown growthepie metrics"):
+            self.run_fetch("--metrics", "fees,nope")
+
+    def test_path_like_metric_keys_rejected(self) -> None:
+        master = {"metrics": {**MASTER["metrics"], "../../escape": {}}}
+        self.server.routes["/v1/master.json"] = json.dumps(master).encode()  # type: ignore[attr-defined]
+        with self.assertRaisesRegex(SystemExit, "not plain names: \\['../../escape'\\]"):
+            self.run_fetch("--metrics", "all")
+        self.assertEqual(sorted(p.name for p in (self.repo / "data/raw").rglob("*.json")), ["master.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
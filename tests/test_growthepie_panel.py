@@ -0,0 +1,127 @@
+import io
+import json
+import random
+import sys
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "src" / "etl"))
+sys.path.insert(0, str(REPO / "src" / "validation"))
+
+import growthepie_panel as gp  # noqa: E402
+import panel_schema as ps  # noqa: E402
+
+
+EXPORT_KEYS = {
+    "fees": ("fees_paid_usd", "fees_paid_eth"),
+    "rent_paid": ("rent_paid_usd", "rent_paid_eth"),
+    "profit": ("profit_usd", "profit_eth"),
+    "txcount": ("txcount",),
+}
+
+
+def _reference_panel(snap: Path) -> list[list[str]]:
+    """json.load-based pivot the streaming path must reproduce."""
+    cells: dict[tuple[str, str], dict[str, float]] = {}
+    for name in gp.EXPORTS:
+        for rec in json.loads((snap / "export" / f"{name}.json").read_text()):
+            if rec["metric_key"] in gp.METRIC_COLUMNS and rec["value"] is not None:
+                col = gp.METRIC_COLUMNS[rec["metric_key"]]
+                cells.setdefault((rec["date"], rec["origin_key"]), {})[col] = float(rec["value"])
+    rows = []
+    for (day, rollup), vals in sorted(cells.items()):
+        if not all(c in vals for c in gp.REQUIRED_COLUMNS):
+            continue
+        row = [day, rollup]
+        for col in gp.PANEL_COLUMNS[2:]:
+            v = vals.get(col)
+            row.append("" if v is None else str(int(v)) if col in gp.INTEGER_COLUMNS else repr(v))
+        rows.append(row)
+    return rows
+
+
+class StreamingParserTest(unittest.TestCase):
+    def test_items_across_chunk_boundaries(self) -> None:
+        items = [{"a": "x\\" * i, "n": 10**i} for i in range(4)]
+        items += [12345.678, -0.5e-7, "s]", [], {}, None, True, 987654321]
+        text = " \n[ " + " ,\n".join(json.dumps(x) for x in items) + " ]\n"
+        for chunk in (1, 2, 3, 7, 64):
+            self.assertEqual(list(gp.iter_json_array(io.StringIO(text), chunk_chars=chunk)), items, chunk)
+        self.assertEqual(list(gp.iter_json_array(io.StringIO("[ ]"), chunk_chars=1)), [])
+
+    def test_malformed_input_rejected(self) -> None:
+        for text in ('{"a": 1}', "[1, 2", "[1 2]", "[1,]", "[1] x"):
+            with self.assertRaises(ValueError, msg=text):
+                list(gp.iter_json_array(io.StringIO(text), chunk_chars=3))
+
+    def test_peak_memory_independent_of_input_size(self) -> None:
+        def peak(n: int) -> int:
+            text = json.dumps([{"metric_key": "fees_paid_usd", "origin_key": "base", "date": "2024-01-01", "value": 1.5}] * n)
+            f = io.StringIO(text)
+            tracemalloc.start()
+            for _ in gp.iter_json_array(f, chunk_chars=4096):
+                pass
+            _, top = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return top
+
+        small, large = peak(1_000), peak(50_000)
+        self.assertLess(large, 64 * 1024)
+        self.assertLess(large, small * 2)
+
+
+class PanelBuildTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.snap = Path(self._tmp.name) / "2026-01-22"
+        (self.snap / "export").mkdir(parents=True)
+        rng = random.Random(7)
+        # Consistent with the protocol checks: non-negative series and profit == fees - rent.
+        fees = {(r, d): 5 + rng.random() * 5 for r in ("zksync_era", "base", "arbitrum") for d in range(1, 29)}
+        rent = {k: rng.random() * 5 for k in fees}
+        series = {"fees": fees, "rent_paid": rent, "profit": {k: fees[k] - rent[k] for k in fees}}
+        for name, keys in EXPORT_KEYS.items():
+            records = []
+            for rollup in ("zksync_era", "base", "arbitrum"):
+                for day in range(1, 29):
+                    for key in keys:
+                        if name == "rent_paid" and rollup == "zksync_era" and day == 5:
+                            continue  # missing required series -> row dropped
+                        value = rng.randint(0, 10**6) if key == "txcount" else series[name][rollup, day]
+                        records.append({"metric_key": key, "origin_key": rollup, "date": f"2024-02-{day:02d}", "value": value})
+            records.append({"metric_key": keys[-1], "origin_key": "base", "date": "2024-02-01", "value": None})
+            rng.shuffle(records)
+            (self.snap / "export" / f"{name}.json").write_text(json.dumps(records, indent=1))
+
+    def test_matches_reference_and_validates(self) -> None:
+        out = Path(self._tmp.name) / "panel.csv"
+        written, dropped = gp.write_panel(gp.build_pivot(self.snap, chunk_chars=97), out)
+        self.assertEqual((written, dropped), (83, 1))
+        lines = out.read_text().splitlines()
+        self.assertEqual(lines[0], ",".join(gp.PANEL_COLUMNS))
+        self.assertEqual([line.split(",") for line in lines[1:]], _reference_panel(self.snap))
+
+        again = Path(self._tmp.name) / "again.csv"
+        gp.write_panel(gp.build_pivot(self.snap), again)
+        self.assertEqual(again.read_bytes(), out.read_bytes())
+
+        compiled = ps.compile_schema(ps.load_schema(REPO / "contracts/schemas/panel_schema_str_v1.yaml"))
+        report = ps.validate_file(compiled, out)
+        self.assertTrue(report.ok, report.failures)
+
+    def test_conflicting_duplicate_rejected(self) -> None:
+        path = self.snap / "export" / "fees.json"
+        records = json.loads(path.read_text())
+        dup = dict(next(r for r in records if r["metric_key"] == "fees_paid_eth"))
+        dup["value"] += 1
+        path.write_text(json.dumps(records + [dup]))
+        with self.assertRaisesRegex(SystemExit, "conflicting fees_paid_eth"):
+            gp.build_pivot(self.snap)
+
+
+if __name__ == "__main__":
+    unittest.main()
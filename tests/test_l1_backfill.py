@@ -0,0 +1,151 @@
+import io
+import json
+import sqlite3
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "src" / "etl"))
+sys.path.insert(0, str(REPO / "scripts"))
+sys.path.insert(0, str(REPO / "tests"))
+
+import l1_backfill as bf  # noqa: E402
+import l1_extract as l1  # noqa: E402
+import make_raw_manifest as mrm  # noqa: E402
+from test_l1_extract import FIRST, LAST, MockRpc, _serve  # noqa: E402
+
+
+class BrokenBlockRpc(MockRpc):
+    """Fails every header request for one block."""
+
+    def __init__(self, block: int) -> None:
+        super().__init__()
+        self.block = block
+
+    def answer(self, call: dict) -> dict:
+        if call["method"] == "eth_getBlockByNumber" and call["params"][0] == hex(self.block):
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32000, "message": "header not found"}}
+        return super().answer(call)
+
+
+class L1BackfillTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.repo = Path(self._tmp.name)
+        for mod in (bf, mrm):
+            patcher = mock.patch.object(mod, "_repo_root", return_value=self.repo)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.blocks_dir = self.repo / "data/raw/l1/blocks/run_date=2026-01-22"
+        self.checkpoint = self.repo / bf.CHECKPOINT_DIR / f"2026-01-22_{FIRST}-{LAST}.sqlite"
+        self.manifest = self.repo / bf.MANIFEST_DIR / f"l1_2026-01-22_{FIRST}-{LAST}.json"
+
+    def _main(self, rpc: MockRpc, *extra: str) -> tuple[int, str]:
+        server = _serve(rpc)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        argv = [
+            "--run-date", "2026-01-22", "--from-block", str(FIRST), "--to-block", str(LAST),
+            "--rpc-url", f"http://127.0.0.1:{server.server_address[1]}", "--format", "jsonl",
+            "--unit-blocks", "8", "--batch-size", "4", "--max-retries", "1", "--workers", "2", *extra,
+        ]  # fmt: skip
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            code = bf.main(argv)
+        return code, out.getvalue() + err.getvalue()
+
+    def _manifest_parts(self) -> list[str]:
+        return sorted(Path(f["path"]).name for f in json.loads(self.manifest.read_text())["files"] if "/blocks/" in f["path"])
+
+    def test_backfill_completes_with_continuity_and_manifest(self) -> None:
+        code, log = self._main(MockRpc())
+        self.assertEqual(code, 0, log)
+        self.assertIn("block continuity ok: 40 blocks", log)
+        manifest = json.loads(self.manifest.read_text())
+        self.assertEqual(len(manifest["files"]), 6 * len(l1.TABLES))  # units 100-103, 104-111, ..., 136-139
+        self.assertNotIn("127.0.0.1", manifest["command"])
+        self.assertEqual(bf.check_block_continuity(self.blocks_dir, FIRST, LAST), [])
+        with l1.block_time_index.BlockTimeIndex(self.repo / l1.block_time_index.INDEX_PATH) as index:
+            self.assertEqual((index.base, index.head), (FIRST, LAST))  # recorded by the worker processes
+        with self.assertRaisesRegex(SystemExit, "pass --resume"):
+            self._main(MockRpc())
+
+    def test_failed_unit_is_retried_then_resumed_without_refetching_done_units(self) -> None:
+        rpc = BrokenBlockRpc(130)
+        code, log = self._main(rpc, "--max-attempts", "2")
+        self.assertEqual(code, 1, log)
+        self.assertIn("FAILED unit 128-135 attempts=2", log)
+        self.assertNotIn("part-000000128-000000135.jsonl.gz", self._manifest_parts())
+        self.assertEqual(len(self._manifest_parts()), 5)
+
+        rpc = MockRpc()
+        code, log = self._main(rpc, "--resume")
+        self.assertEqual(code, 0, log)
+        self.assertIn("failed=1", log)
+        self.assertEqual(self._manifest_parts()[4], "part-000000128-000000135.jsonl.gz")
+        self.assertEqual(len(self._manifest_parts()), 6)
+        fetched = [m for m in rpc.calls if m == "eth_getBlockByNumber"]
+        self.assertEqual(len(fetched), 8)  # only the failed unit
+
+    def test_resume_requeues_stale_and_missing_units_and_checks_parameters(self) -> None:
+        self.assertEqual(self._main(MockRpc())[0], 0)
+        conn = sqlite3.connect(self.checkpoint)
+        with conn:
+            conn.execute("UPDATE units SET status = 'running', owner = 'pid:1:1', lease_expires = 1e18 WHERE first_block = 104")
+        conn.close()
+        (self.blocks_dir / "part-000000120-000000127.jsonl.gz").unlink()
+
+        rpc = MockRpc()
+        code, log = self._main(rpc, "--resume")
+        self.assertEqual(code, 0, log)
+        self.assertIn("stale_running=1 failed=0 missing_files=1", log)
+        self.assertEqual(len([m for m in rpc.calls if m == "eth_getBlockByNumber"]), 16)
+
+        with self.assertRaisesRegex(SystemExit, "unit_blocks: checkpoint='8' now='16'"):
+            self._main(MockRpc(), "--resume", "--unit-blocks", "16")
+
+    def test_expired_lease_is_reclaimed_and_exhausted_units_fail(self) -> None:
+        path = self.repo / "cp.sqlite"
+        cp = bf.Checkpoint.create(path, {"k": "v"}, [(0, 9), (10, 19)])
+        self.addCleanup(cp.close)
+        self.assertEqual(cp.claim("a", lease_seconds=10, max_attempts=2, now=0), (0, 9))
+        self.assertEqual(cp.claim("b", lease_seconds=10, max_attempts=2, now=1), (10, 19))
+        self.assertIsNone(cp.claim("c", lease_seconds=10, max_attempts=2, now=5))
+        self.assertEqual(cp.claim("c", lease_seconds=10, max_attempts=2, now=10.5), (0, 9))  # a timed out
+        self.assertFalse(cp.complete(0, "a"))  # a lost its lease
+        self.assertTrue(cp.complete(0, "c"))
+        self.assertIsNone(cp.claim("d", lease_seconds=10, max_attempts=1, now=12))  # b expired on its last attempt
+        self.assertEqual(cp.counts(), {"pending": 0, "running": 0, "done": 1, "failed": 1})
+        self.assertEqual(cp.errors()[0][3], "lease expired")
+
+    def test_continuity_check_reports_gaps_duplicates_and_strays(self) -> None:
+        d = self.repo / "blocks"
+        d.mkdir()
+
+        def part(first: int, last: int, numbers: list[int]) -> None:
+            rows = [{c: 0 for c in l1.COLUMNS["blocks"]} | {"block_number": n} for n in numbers]
+            l1._write_table(d / l1.part_name(first, last, "jsonl"), "blocks", rows, "jsonl")
+
+        part(0, 4, [0, 1, 2, 3, 4])
+        part(5, 9, [5, 6, 8])
+        part(0, 9, [9, 11])
+        part(20, 29, [20])  # outside the checked range: ignored
+        self.assertEqual(
+            bf.check_block_continuity(d, 0, 10),
+            [
+                "part-000000000-000000009.jsonl.gz: block 11 outside [0, 10]",
+                "missing blocks 7-7",
+                "missing blocks 10-10",
+            ],
+        )
+        part(8, 8, [8])
+        self.assertIn("part-000000008-000000008.jsonl.gz: duplicate block 8", bf.check_block_continuity(d, 0, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,363 @@
+import asyncio
+import importlib.util
+import io
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "src" / "etl"))
+
+import l1_extract as l1  # noqa: E402
+
+FIRST, LAST = 100, 139
+RUN_DATE = date(2026, 1, 22)
+
+
+def _fixture_chain() -> tuple[dict[int, dict], dict[int, list[dict]]]:
+    """Deterministic blocks (full tx objects) and their receipts, including type-3 blob txs."""
+    blocks, receipts = {}, {}
+    for n in range(FIRST, LAST + 1):
+        block_hash = f"0x{n:064x}"
+        txs, rcpts = [], []
+        for i in range(n % 5):
+            tx_hash = f"0x{n:056x}{i:08x}"
+            tx_type = 3 if (n + i) % 7 == 0 else 2 if i % 2 else 0
+            tx = {
+                "hash": tx_hash,
+                "transactionIndex": hex(i),
+                "from": f"0x{'AB' * 19}{i:02x}",
+                "to": None if i == 3 else f"0x{'cd' * 19}{n % 256:02x}",
+                "type": hex(tx_type),
+            }
+            if tx_type:
+                tx["maxFeePerGas"] = hex(2**70 + n)  # wider than int64
+                tx["maxPriorityFeePerGas"] = hex(10**9)
+            if tx_type == 3:
+                tx["maxFeePerBlobGas"] = hex(n * 1000)
+                tx["blobVersionedHashes"] = [f"0x01{n:062x}", f"0x01{n + 1:062x}"][: 1 + i % 2]
+            txs.append(tx)
+            rcpt = {
+                "transactionHash": tx_hash,
+                "blockNumber": hex(n),
+                "blockHash": block_hash,
+                "from": tx["from"],
+                "to": tx["to"],
+                "type": hex(tx_type),
+                "gasUsed": hex(21000 + i),
+                "effectiveGasPrice": hex(10**10 + n),
+                "status": hex(i % 2 == 0),
+            }
+            if tx_type == 3:
+                rcpt["blobGasUsed"] = hex(l1.BLOB_GAS_PER_BLOB * len(tx["blobVersionedHashes"]))
+                rcpt["blobGasPrice"] = hex(1)
+            rcpts.append(rcpt)
+        blocks[n] = {
+            "number": hex(n),
+            "hash": block_hash,
+            "parentHash": f"0x{n - 1:064x}",
+            "timestamp": hex(1_700_000_000 + 12 * n),
+            "baseFeePerGas": hex(7 * n),
+            "gasUsed": hex(21000 * len(txs)),
+            "gasLimit": hex(30_000_000),
+            "blobGasUsed": hex(0),
+            "excessBlobGas": hex(n),
+            "transactions": txs,
+        }
+        receipts[n] = rcpts
+    return blocks, receipts
+
+
+BLOCKS, RECEIPTS = _fixture_chain()
+
+
+class MockRpc:
+    """Replays the fixture chain over JSON-RPC with optional faults."""
+
+    def __init__(self, *, block_receipts: bool = True) -> None:
+        self.block_receipts = block_receipts
+        self.latency = 0.0
+        self.throttle_every = 0  # answer every Nth HTTP request with 429
+        self.flaky_calls: set[str] = set()  # "method:param" -> error once, then succeed
+        self.null_once: set[int] = set()  # blocks answered with null once (lagging backend)
+        self.reorg_once: set[int] = set()  # blocks whose first receipts carry another block hash
+        self.fork_once: set[int] = set()  # blocks whose first header has another parent
+        self.close_every = 0  # silently drop the keep-alive connection after every Nth response
+        self.lock = threading.Lock()
+        self.http_requests = 0
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def answer(self, call: dict) -> dict:
+        method, params = call["method"], call["params"]
+        out = {"jsonrpc": "2.0", "id": call["id"]}
+        key = f"{method}:{params[0]}"
+        with self.lock:
+            self.calls.append(method)
+            flaky = key in self.flaky_calls
+            self.flaky_calls.discard(key)
+        if flaky:
+            out["error"] = {"code": -32005, "message": "limit exceeded"}
+        elif method == "eth_getBlockByNumber":
+            n = int(params[0], 16)
+            with self.lock:
+                lagging = n in self.null_once
+                self.null_once.discard(n)
+                forked = n in self.fork_once
+                self.fork_once.discard(n)
+            out["result"] = None if lagging else BLOCKS.get(n)
+            if forked:
+                out["result"] = {**BLOCKS[n], "parentHash": "0x" + "ee" * 32}
+        elif method == "eth_getBlockReceipts" and self.block_receipts:
+            n = int(params[0], 16)
+            rcpts = RECEIPTS.get(n)
+            with self.lock:
+                if n in self.reorg_once and rcpts:
+                    self.reorg_once.discard(n)
+                    rcpts = [{**r, "blockHash": "0x" + "ee" * 32} for r in rcpts]
+            out["result"] = rcpts
+        elif method == "eth_getTransactionReceipt":
+            out["result"] = next((r for rs in RECEIPTS.values() for r in rs if r["transactionHash"] == params[0]), None)
+        else:
+            out["error"] = {"code": -32601, "message": f"the method {method} does not exist/is not available"}
+        return out
+
+
+def _serve(rpc: MockRpc) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            with rpc.lock:
+                rpc.http_requests += 1
+                throttled = rpc.throttle_every and rpc.http_requests % rpc.throttle_every == 0
+                drop = rpc.close_every and rpc.http_requests % rpc.close_every == 0
+                rpc.in_flight += 1
+                rpc.peak_in_flight = max(rpc.peak_in_flight, rpc.in_flight)
+            try:
+                time.sleep(rpc.latency)
+                if throttled:
+                    status, payload = 429, b'{"error":"rate limited"}'
+                else:
+                    req = json.loads(body)
+                    resp = [rpc.answer(c) for c in req] if isinstance(req, list) else rpc.answer(req)
+                    status, payload = 200, json.dumps(resp).encode()
+            finally:
+                with rpc.lock:
+                    rpc.in_flight -= 1
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            self.close_connection = bool(drop)  # no "Connection: close": the client finds out on reuse
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class L1ExtractTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.out = Path(self._tmp.name) / "l1"
+
+    def _run(self, rpc: MockRpc, *, fmt: str = "jsonl", receipts: str = "auto", **limits: object):
+        server = _serve(rpc)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        limiter = l1.AdaptiveConcurrency(**{"initial": 2, "maximum": 8, **limits})
+        extractor, stats = asyncio.run(
+            l1.extract(
+                f"http://127.0.0.1:{server.server_address[1]}/rpc",
+                l1.split_range(FIRST, LAST, 16),
+                out_root=self.out,
+                run_date=RUN_DATE,
+                fmt=fmt,
+                batch_size=5,
+                receipts=receipts,
+                limiter=limiter,
+                backoff_seconds=0.001,
+            )
+        )
+        return extractor, stats, limiter
+
+    def _table(self, table: str) -> list[dict]:
+        part_dir = self.out / table / f"run_date={RUN_DATE.isoformat()}"
+        return [row for path in sorted(part_dir.iterdir()) for row in l1.read_part(path)]
+
+    def _assert_matches_fixture(self) -> None:
+        blocks = self._table("blocks")
+        self.assertEqual([b["block_number"] for b in blocks], list(range(FIRST, LAST + 1)))
+        self.assertEqual(blocks[3]["base_fee_per_gas_wei"], 7 * 103)
+        self.assertEqual(blocks[3]["tx_count"], 3)
+
+        txs = self._table("txs")
+        receipts = self._table("receipts")
+        expected = [r["transactionHash"] for n in range(FIRST, LAST + 1) for r in RECEIPTS[n]]
+        self.assertEqual([t["tx_hash"] for t in txs], expected)
+        self.assertEqual([r["tx_hash"] for r in receipts], expected)
+        typed = next(t for t in txs if t["tx_type"] == 2)
+        self.assertEqual(typed["max_fee_per_gas_wei"], 2**70 + typed["block_number"])
+        self.assertEqual(typed["from_address"], "0x" + "ab" * 19 + "01")
+        self.assertIsNone(txs[0]["max_fee_per_gas_wei"])
+        self.assertIsNone(next(t for t in txs if t["tx_index"] == 3)["to_address"])
+        self.assertEqual(receipts[0]["effective_gas_price_wei"], 10**10 + 101)
+
+        blobs = self._table("blob_tx")
+        expected_blobs = [t["hash"] for n in range(FIRST, LAST + 1) for t in BLOCKS[n]["transactions"] if t["type"] == "0x3"]
+        self.assertEqual([b["tx_hash"] for b in blobs], expected_blobs)
+        self.assertTrue(any(b["blob_count"] == 2 for b in blobs))
+        self.assertEqual(len(json.loads(blobs[0]["blob_versioned_hashes"])), blobs[0]["blob_count"])
+        rcpt = {r["tx_hash"]: r for r in receipts}
+        self.assertTrue(all(rcpt[b["tx_hash"]]["blob_gas_used"] == b["blob_count"] * l1.BLOB_GAS_PER_BLOB for b in blobs))
+
+    def test_block_receipts_batched_and_partitioned(self) -> None:
+        rpc = MockRpc()
+        extractor, stats, _ = self._run(rpc)
+        self._assert_matches_fixture()
+        self.assertEqual(extractor.stats.receipts_mode, "block")
+        self.assertEqual(extractor.stats.parts, 3)  # 100-111, 112-127, 128-139: aligned to 16
+        names = sorted(p.name for p in (self.out / "blocks" / "run_date=2026-01-22").iterdir())
+        self.assertEqual(names[0], "part-000000100-000000111.jsonl.gz")
+        self.assertEqual(set(rpc.calls), {"eth_getBlockByNumber", "eth_getBlockReceipts"})
+        # 40 block + 40 receipt calls in per-part batches of <= 5 (3+4+3 each), plus the probe.
+        self.assertEqual((stats.rpc_calls, stats.http_requests), (81, 21))
+        self.assertLessEqual(stats.connections, 8)
+
+    def test_falls_back_to_transaction_receipts(self) -> None:
+        rpc = MockRpc(block_receipts=False)
+        extractor, stats, _ = self._run(rpc)
+        self._assert_matches_fixture()
+        self.assertEqual(extractor.stats.receipts_mode, "tx")
+        self.assertIn("eth_getTransactionReceipt", rpc.calls)
+        with self.assertRaises(l1.RpcError):
+            self._run(MockRpc(block_receipts=False), receipts="block")
+
+    def test_faults_are_retried_and_concurrency_backs_off(self) -> None:
+        rpc = MockRpc()
+        rpc.throttle_every = 4
+        rpc.flaky_calls = {f"eth_getBlockByNumber:{hex(n)}" for n in (105, 120)} | {"eth_getBlockReceipts:0x83"}
+        rpc.null_once = {130}
+        rpc.reorg_once = {121}
+        extractor, stats, limiter = self._run(rpc, initial=8)
+        self._assert_matches_fixture()
+        self.assertEqual(extractor.stats.part_retries, 1)
+        self.assertGreater(stats.retries, 0)
+        self.assertGreater(limiter.decreases, 0)
+        self.assertLess(limiter.limit, 8)
+
+    def test_part_with_broken_parent_link_is_refetched(self) -> None:
+        rpc = MockRpc()
+        rpc.fork_once = {121}
+        extractor, _, _ = self._run(rpc)
+        self._assert_matches_fixture()
+        self.assertEqual(extractor.stats.part_retries, 1)
+
+    def test_stale_keepalive_connection_is_resent_without_backoff(self) -> None:
+        rpc = MockRpc()
+        rpc.close_every = 3
+        _, stats, limiter = self._run(rpc)
+        self._assert_matches_fixture()
+        self.assertGreater(stats.reconnects, 0)
+        self.assertEqual((stats.retries, limiter.decreases), (0, 0))
+
+    def test_concurrency_grows_when_fast_and_is_capped(self) -> None:
+        rpc = MockRpc()
+        rpc.latency = 0.01
+        _, _, limiter = self._run(rpc, initial=1, maximum=3)
+        self.assertEqual(limiter.peak_limit, 3)
+        self.assertLessEqual(rpc.peak_in_flight, 3)
+
+    def test_adaptive_limit_aimd(self) -> None:
+        lim = l1.AdaptiveConcurrency(initial=2, minimum=1, maximum=4, target_latency_seconds=1.0)
+        for _ in range(2 + 3 + 4):
+            lim.record(0.1, ok=True)
+        self.assertEqual(lim.limit, 4)
+        lim.record(1.5, ok=True)  # slower than target, within 2x: hold
+        self.assertEqual(lim.limit, 4)
+        lim.record(0.1, ok=False)
+        self.assertEqual(lim.limit, 2)
+        lim.record(0.1, ok=False)  # same congestion window: no second cut
+        self.assertEqual(lim.limit, 2)
+        lim._last_decrease -= 10
+        lim.record(5.0, ok=True)  # far above target counts as congestion
+        self.assertEqual(lim.limit, 1)
+
+    def test_split_range_aligns_parts(self) -> None:
+        self.assertEqual(l1.split_range(5, 25, 10), [(5, 9), (10, 19), (20, 25)])
+        self.assertEqual(l1.split_range(10, 10, 10), [(10, 10)])
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_parquet_parts(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._run(MockRpc(), fmt="parquet")
+        self._assert_matches_fixture()
+        path = next((self.out / "txs" / "run_date=2026-01-22").iterdir())
+        schema = pq.read_schema(path)
+        self.assertEqual(schema.field("max_fee_per_gas_wei").type, pa.decimal128(38, 0))
+        self.assertEqual(schema.field("block_number").type, pa.int64())
+
+    def test_cli_requires_endpoint(self) -> None:
+        with self.assertRaisesRegex(SystemExit, "L1_RPC_URL"):
+            l1.main(["--run-date", "2026-01-22", "--from-block", "1", "--to-block", "2", "--rpc-url", ""])
+        server = _serve(MockRpc())
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            l1.main(
+                [
+                    "--run-date", "2026-01-22", "--from-block", "100", "--to-block", "104", "--format", "jsonl",
+                    "--rpc-url", f"http://127.0.0.1:{server.server_address[1]}", "--out-root", str(self.out),
+                    "--block-index", str(self.out / "ts.u32"),
+                ]
+            )  # fmt: skip
+        self.assertIn("blocks=5 txs=10", buf.getvalue())
+        with l1.block_time_index.BlockTimeIndex(self.out / "ts.u32") as index:
+            self.assertEqual((index.base, index.head, index.timestamp(104)), (100, 104, 1_700_000_000 + 12 * 104))
+
+    def test_block_timestamps_checked_before_publishing_and_stale_index_entries_cleared(self) -> None:
+        index_path = self.out / "ts.u32"
+        l1.block_time_index.record_timestamps(index_path, [(105, 1_700_000_000 + 12 * 103)])  # pre-reorg leftover
+        rpc = MockRpc()
+        server = _serve(rpc)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        argv = [
+            "--run-date", "2026-01-22", "--from-block", "100", "--to-block", "104", "--format", "jsonl",
+            "--rpc-url", f"http://127.0.0.1:{server.server_address[1]}", "--out-root", str(self.out),
+            "--block-index", str(index_path),
+        ]  # fmt: skip
+        with redirect_stdout(io.StringIO()):
+            l1.main(argv)
+        with l1.block_time_index.BlockTimeIndex(index_path) as index:
+            self.assertEqual((index.head, index.timestamp(105)), (104, None))
+
+        shutil.rmtree(self.out / "blocks")
+        with mock.patch.dict(BLOCKS, {102: {**BLOCKS[102], "timestamp": BLOCKS[101]["timestamp"]}}):
+            with redirect_stdout(io.StringIO()), self.assertRaisesRegex(SystemExit, "102: timestamp .* does not increase"):
+                l1.main(argv)
+        self.assertFalse((self.out / "blocks").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+import json
+import sys
+import tempfile
+import unittest
+from datetime import date, datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import make_raw_manifest as mrm  # noqa: E402
+
+
+FIXED_NOW = datetime(2026, 1, 22, tzinfo=timezone.utc)
+
+
+class MakeRawManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        patcher = mock.patch.object(mrm, "_repo_root", return_value=self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+        self.snap = self.root / "data/raw/l1/2026-01-22"
+        for table in ("blocks", "receipts"):
+            for month in ("2024-02", "2024-03"):
+                d = self.snap / table / f"run_date={month}-01"
+                d.mkdir(parents=True)
+                for i in range(3):
+                    (d / f"part-{i:03d}.parquet").write_bytes(f"{table}:{month}:{i}".encode() * (i + 1))
+
+    def _build(self, **kwargs: object) -> dict[str, object]:
+        return mrm.build_manifest(
+            "l1",
+            Path("data/raw/l1/2026-01-22"),
+            "python src/etl/l1_extract.py",
+            as_of=date(2026, 1, 22),
+            fetched_at=FIXED_NOW,
+            **kwargs,
+        )
+
+    def _dump(self, manifest: dict[str, object]) -> str:
+        out = self.root / "m.json"
+        mrm.write_manifest(manifest, out)
+        return out.read_text(encoding="utf-8")
+
+    def test_manifest_is_byte_identical_across_hash_modes(self) -> None:
+        baseline = self._dump(self._build(hash_mode="serial"))
+        for mode, workers in [("thread", 4), ("thread", 1), ("process", 2)]:
+            with self.subTest(mode=mode, workers=workers):
+                self.assertEqual(self._dump(self._build(hash_mode=mode, workers=workers)), baseline)
+
+    def test_entries_sorted_with_hash_and_size(self) -> None:
+        files = self._build(hash_mode="thread", workers=3)["files"]
+        assert isinstance(files, list)
+        self.assertEqual(len(files), 12)
+        self.assertEqual([f["path"] for f in files], sorted(f["path"] for f in files))
+        first = files[0]
+        self.assertEqual(first["sha256"], mrm._sha256_file(self.root / first["path"]))
+        self.assertEqual(first["bytes"], (self.root / first["path"]).stat().st_size)
+
+    def test_files_restricts_manifest_to_listed_paths(self) -> None:
+        done = sorted((self.snap / "blocks/run_date=2024-02-01").iterdir())[:2]
+        files = self._build(files=[done[1], done[0].relative_to(self.root)])["files"]
+        assert isinstance(files, list)
+        self.assertEqual([f["path"] for f in files], [str(p.relative_to(self.root)) for p in done])
+        with self.assertRaisesRegex(SystemExit, "does not exist"):
+            self._build(files=[self.snap / "blocks/nope.parquet"])
+        with self.assertRaisesRegex(SystemExit, "outside the snapshot dir"):
+            outside = self.root / "other.parquet"
+            outside.write_bytes(b"x")
+            self._build(files=[outside])
+
+    def test_progress_reports_every_file(self) -> None:
+        calls: list[tuple[int, int, int]] = []
+        self._build(progress=lambda done, total, nbytes: calls.append((done, total, nbytes)))
+        self.assertEqual([c[0] for c in calls], list(range(1, 13)))
+        self.assertTrue(all(c[1] == 12 for c in calls))
+
+    def test_reuse_from_rehashes_only_changed_files(self) -> None:
+        prev_path = self.root / "data/raw_manifest/l1_2026-01-21.json"
+        prev_path.parent.mkdir(parents=True)
+        fingerprints: dict[str, list[int]] = {}
+        mrm.write_manifest(self._build(fingerprints_out=fingerprints), prev_path)
+        mrm.write_stat_cache(prev_path, fingerprints)
+        self.assertTrue(mrm.stat_cache_path_for(prev_path).exists())
+        self.assertNotEqual(mrm.stat_cache_path_for(prev_path), mrm.stat_cache_path_for(prev_path.with_suffix(".jsonl")))
+
+        changed = self.snap / "blocks/run_date=2024-03-01/part-002.parquet"
+        changed.write_bytes(b"reorged")
+        added = self.snap / "blocks/run_date=2024-03-01/part-003.parquet"
+        added.write_bytes(b"new")
+
+        hashed: list[int] = []
+        manifest = self._build(reuse_from=prev_path, progress=lambda done, total, nbytes: hashed.append(total))
+        incremental = manifest["incremental"]
+        assert isinstance(incremental, dict)
+        rel = lambda p: str(p.relative_to(self.root))  # noqa: E731
+        self.assertEqual(incremental["recomputed"], [rel(changed), rel(added)])
+        self.assertEqual(incremental["reused_count"], 11)
+        self.assertEqual(set(hashed), {2})
+
+        full = self._build()
+        self.assertEqual(manifest["files"], full["files"])
+
+    def test_reuse_without_stat_cache_rehashes_everything(self) -> None:
+        prev_path = self.root / "prev.json"
+        mrm.write_manifest(self._build(), prev_path)
+        incremental = self._build(reuse_from=prev_path)["incremental"]
+        assert isinstance(incremental, dict)
+        self.assertEqual(incremental["reused_count"], 0)
+        self.assertEqual(incremental["recomputed_count"], 12)
+
+    def test_verify_reports_missing_extra_and_mismatched(self) -> None:
+        manifest_path = self.root / "data/raw_manifest/l1_2026-01-22.json"
+        manifest_path.parent.mkdir(parents=True)
+        mrm.write_manifest(self._build(), manifest_path)
+
+        clean = mrm.verify_manifest(manifest_path)
+        self.assertTrue(clean["ok"])
+        self.assertEqual(clean["checked"], 12)
+        self.assertEqual(clean["snapshot_dir"], "data/raw/l1/2026-01-22")
+
+        blocks = self.snap / "blocks/run_date=2024-02-01"
+        (blocks / "part-000.parquet").unlink()
+        (blocks / "part-001.parquet").write_bytes(b"truncated")
+        p2 = blocks / "part-002.parquet"
+        p2.write_bytes(bytes(len(p2.read_bytes())))  # same size, different content
+        (blocks / "part-999.parquet").write_bytes(b"stray")
+
+        report = mrm.verify_manifest(manifest_path, workers=2)
+        prefix = "data/raw/l1/2026-01-22/blocks/run_date=2024-02-01/"
+        self.assertFalse(report["ok"])
+        self.assertEqual(report["missing"], [prefix + "part-000.parquet"])
+        self.assertEqual(report["size_mismatch"], [prefix + "part-001.parquet"])
+        self.assertEqual(report["sha256_mismatch"], [prefix + "part-002.parquet"])
+        self.assertEqual(report["extra"], [prefix + "part-999.parquet"])
+        self.assertEqual(report["checked"], 10)
+
+        fast = mrm.verify_manifest(manifest_path, fail_fast=True)
+        self.assertFalse(fast["ok"])
+        self.assertEqual(fast["missing"], [prefix + "part-000.parquet"])
+        self.assertEqual(fast["checked"], 0)
+
+        sampled = mrm.verify_manifest(manifest_path, sample=3, seed=7)
+        self.assertTrue(sampled["sampled"])
+        self.assertLessEqual(sampled["checked"], 3)
+        self.assertEqual((sampled["extra_checked"], sampled["extra"]), (False, []))  # no tree walk for a spot check
+        sampled = mrm.verify_manifest(manifest_path, sample=3, seed=7, check_extra=True)
+        self.assertEqual((sampled["extra_checked"], sampled["extra"]), (True, [prefix + "part-999.parquet"]))
+
+    def test_verify_scans_the_recorded_snapshot_dir(self) -> None:
+        manifest_path = self.root / "m.json"
+        only = sorted((self.snap / "blocks/run_date=2024-02-01").iterdir())
+        mrm.write_manifest(self._build(files=only), manifest_path)
+        subset = mrm.verify_manifest(manifest_path)
+        self.assertTrue(subset["ok"])  # the rest of the snapshot is not an "extra" of a subset manifest
+        self.assertFalse(subset["extra_checked"])
+
+        for p in self.snap.rglob("*.parquet"):
+            p.unlink()
+        mrm.write_manifest(self._build(), manifest_path)
+        (self.snap / "blocks/run_date=2024-02-01/part-000.parquet").write_bytes(b"stray")
+        empty = mrm.verify_manifest(manifest_path)
+        self.assertEqual(empty["snapshot_dir"], "data/raw/l1/2026-01-22")
+        self.assertEqual(empty["extra"], ["data/raw/l1/2026-01-22/blocks/run_date=2024-02-01/part-000.parquet"])
+
+    def test_tree_rolls_up_per_directory_and_diffs_locally(self) -> None:
+        before = self._build()
+        tree = before["tree"]
+        assert isinstance(tree, dict)
+        self.assertEqual(tree["root_path"], "data/raw/l1/2026-01-22")
+        dirs = tree["dirs"]
+        assert isinstance(dirs, dict)
+        self.assertIn("data/raw/l1/2026-01-22/blocks/run_date=2024-03-01", dirs)
+        self.assertEqual(tree["root"], dirs["data/raw/l1/2026-01-22"])
+        self.assertEqual(mrm.build_merkle_tree(tree["root_path"], before["files"]), tree)
+
+        (self.snap / "receipts/run_date=2024-03-01/part-000.parquet").write_bytes(b"reorg")
+        after = self._build()
+        self.assertEqual(
+            mrm.changed_dirs(tree, after["tree"]),
+            [
+                "data/raw/l1/2026-01-22",
+                "data/raw/l1/2026-01-22/receipts",
+                "data/raw/l1/2026-01-22/receipts/run_date=2024-03-01",
+            ],
+        )
+        self.assertEqual(mrm.changed_dirs(tree, tree), [])
+
+    def test_merkle_builder_rejects_unsorted_entries(self) -> None:
+        b = mrm.MerkleBuilder("d")
+        b.add("d/b", "0" * 64, 1)
+        with self.assertRaises(ValueError):
+            b.add("d/a", "0" * 64, 1)
+
+    def test_jsonl_manifest_streams_same_entries(self) -> None:
+        out = self.root / "data/raw_manifest/l1_2026-01-22.jsonl"
+        out.parent.mkdir(parents=True)
+        trailer = mrm.build_manifest_jsonl(
+            "l1",
+            Path("data/raw/l1/2026-01-22"),
+            "python src/etl/l1_extract.py",
+            out,
+            as_of=date(2026, 1, 22),
+            fetched_at=FIXED_NOW,
+            workers=3,
+        )
+        lines = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(lines[0]["kind"], "header")
+        self.assertEqual(lines[0]["snapshot_dir"], "data/raw/l1/2026-01-22")
+        self.assertEqual(lines[-1], trailer)
+        full = self._build()
+        self.assertEqual(lines[1:-1], full["files"])
+        self.assertEqual(trailer["count"], 12)
+        self.assertEqual(trailer["tree"], full["tree"])
+        self.assertTrue(mrm.verify_manifest(out)["ok"])
+
+    def test_mmap_path_matches_buffered_path(self) -> None:
+        p = self.root / "big.bin"
+        p.write_bytes(b"x" * 4096)
+        buffered = mrm._sha256_file(p)
+        with mock.patch.object(mrm, "MMAP_THRESHOLD_BYTES", 1):
+            self.assertEqual(mrm._sha256_file(p), buffered)
+
+
+if __name__ == "__main__":
+    unittest.main()
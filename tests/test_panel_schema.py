@@ -0,0 +1,161 @@
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "src" / "validation"))
+
+import panel_schema as ps  # noqa: E402
+
+
+DECOMP_HEADER = (
+    "date_utc,l1_base_fee_burn_eth,l1_blob_fee_burn_eth,l1_priority_fee_eth,l1_total_rent_eth,"
+    "l1_blob_gas_used,l1_calldata_gas_used,l1_blob_base_fee_gwei\n"
+)
+
+
+class PanelSchemaTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+
+    def _compile(self, rel: str) -> ps.CompiledSchema:
+        return ps.compile_schema(ps.load_schema(REPO / rel))
+
+    def test_contract_schemas_compile(self) -> None:
+        str_schema = self._compile("contracts/schemas/panel_schema_str_v1.yaml")
+        self.assertEqual(str_schema.schema.grain, ("date_utc", "rollup_id"))
+        self.assertEqual(str_schema.required, ("date_utc", "rollup_id", "l2_fees_eth", "rent_paid_eth"))
+        decomp = self._compile("contracts/schemas/panel_schema_decomp_v1.yaml")
+        self.assertEqual(decomp.identities[0][0], "l1_total_rent_eth")
+
+    def test_str_panel_type_null_and_grain_checks(self) -> None:
+        path = self.tmp / "panel.csv"
+        rows = [f"2024-03-{d:02d},base,1.5,0.5,1.0,{d}" for d in range(1, 11)]
+        rows[2] = "2024-03-03,base,,0.5,,3"  # null in a non-nullable column
+        rows[4] = "2024-02-30,base,1.5,0.5,1.0,5"  # not a calendar date
+        rows[6] = "2024-03-07,base,1.5,0.5,1.0,7.5"  # non-integer txcount
+        rows.append("2024-03-09,base,1.5,0.5,1.0,9")  # duplicate grain
+        path.write_text("date_utc,rollup_id,l2_fees_eth,rent_paid_eth,profit_eth,txcount\n" + "\n".join(rows) + "\n")
+
+        report = ps.validate_file(self._compile("contracts/schemas/panel_schema_str_v1.yaml"), path, chunk_rows=3)
+        self.assertFalse(report.ok)
+        self.assertEqual(report.rows, 11)
+        self.assertEqual(
+            sorted(report.failures),
+            sorted(
+                [
+                    "row2:null:l2_fees_eth",
+                    "row4:invalid_type:date_utc",
+                    "row6:invalid_type:txcount",
+                    "row10:duplicate_grain:2024-03-09|base",
+                ]
+            ),
+        )
+
+    def test_str_panel_sign_and_profit_checks(self) -> None:
+        path = self.tmp / "panel.csv"
+        rows = [f"2024-03-{d:02d},base,1.0,0.25,0.75,1" for d in range(1, 6)]
+        rows[1] = "2024-03-02,base,1.0,-0.25,1.25,1"  # negative rent (profit identity still holds)
+        rows[2] = "2024-03-03,base,1.0,0.25,0.5,1"  # profit far from fees - rent
+        rows[3] = "2024-03-04,base,1.0,0.25,0.751,1"  # within the protocol's 1% tolerance
+        path.write_text("date_utc,rollup_id,l2_fees_eth,rent_paid_eth,profit_eth,txcount\n" + "\n".join(rows) + "\n")
+        report = ps.validate_file(self._compile("contracts/schemas/panel_schema_str_v1.yaml"), path, chunk_rows=2)
+        self.assertEqual(report.failures, ["row1:negative:rent_paid_eth", "row2:profit_identity:profit_eth"])
+
+    def test_non_finite_numbers_rejected(self) -> None:
+        path = self.tmp / "panel.csv"
+        path.write_text(
+            "date_utc,rollup_id,l2_fees_eth,rent_paid_eth,profit_eth,txcount\n"
+            "2024-03-01,base,nan,0.25,0.75,1\n"
+            "2024-03-02,base,1.0,inf,0.75,1\n"
+            "2024-03-03,base,1.0,-nan,0.75,1\n"
+        )
+        report = ps.validate_file(self._compile("contracts/schemas/panel_schema_str_v1.yaml"), path)
+        self.assertFalse(report.ok)
+        self.assertEqual(
+            report.failures,
+            ["row0:invalid_type:l2_fees_eth", "row1:invalid_type:rent_paid_eth", "row2:invalid_type:rent_paid_eth"],
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_vectorized_csv_path_matches_python_path(self) -> None:
+        path = self.tmp / "panel.csv"
+        rows = [f"2024-03-{d:02d},r{d % 3},1.0,0.25,0.75,{d}" for d in range(1, 29)]
+        rows[1] = "2024-03-02,r2,1.0,-0.25,1.25,2"
+        rows[4] = "2024-03-05,r2,1.0,0.25,0.5,5"
+        rows[6] = "2024-03-07,r1,,0.25,,7"
+        rows[9] = "2024-03-10,r1,nan,0.25,0.75,"
+        rows += ["2024-03-03,r0,1.0,0.25,0.75,3", "2024-03-03,r0,1.0,0.25,0.75,3"]
+        header = "date_utc,rollup_id,l2_fees_eth,rent_paid_eth,profit_eth,txcount,note\n"
+        path.write_text(header + ",x\n".join(rows) + ",x\n")
+        compiled = self._compile("contracts/schemas/panel_schema_str_v1.yaml")
+
+        arrow_report = ps._validate_csv_arrow(compiled, path)
+        self.assertIsNotNone(arrow_report)
+        with mock.patch.object(ps, "_validate_csv_arrow", return_value=None):
+            python_report = ps.validate_file(compiled, path)
+        self.assertEqual(arrow_report.to_dict(), python_report.to_dict())
+        self.assertEqual(
+            arrow_report.failures,
+            [
+                "row9:invalid_type:l2_fees_eth",
+                "row6:null:l2_fees_eth",
+                "row1:negative:rent_paid_eth",
+                "row4:profit_identity:profit_eth",
+                "row28:duplicate_grain:2024-03-03|r0",
+                "row29:duplicate_grain:2024-03-03|r0",
+            ],
+        )
+
+        # A cell that does not convert to its declared type is left to the row-level path.
+        path.write_text(path.read_text().replace("2024-03-12,", "2024-02-30,"))
+        self.assertIsNone(ps._validate_csv_arrow(compiled, path))
+        self.assertIn("row11:invalid_type:date_utc", ps.validate_file(compiled, path).failures)
+
+    def test_decomposition_identity_and_missing_column(self) -> None:
+        path = self.tmp / "decomp.csv"
+        path.write_text(
+            DECOMP_HEADER + "2024-03-01,1.0,0.25,0.5,1.75,,,\n" + "2024-03-02,1.0,0.25,0.5,1.70,131072,,1.0\n"
+        )
+        compiled = self._compile("contracts/schemas/panel_schema_decomp_v1.yaml")
+        report = ps.validate_file(compiled, path)
+        self.assertEqual(report.failures, ["row1:identity:l1_total_rent_eth"])
+
+        path.write_text("date_utc,l1_total_rent_eth\n2024-03-01,1.0\n")
+        report = ps.validate_file(compiled, path)
+        self.assertEqual(report.counts["missing_column"], 6)
+
+    def test_invalid_schema_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            ps.parse_schema("table: t\nfields:\n  - name: a\n    type: blob\n")
+        with self.assertRaises(ValueError):
+            ps.parse_schema("table: t\ngrain:\n  - b\nfields:\n  - name: a\n    type: string\n")
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_parquet_input(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self.tmp / "panel.parquet"
+        table = pa.table(
+            {
+                "date_utc": ["2024-03-01", "2024-03-01"],
+                "rollup_id": ["base", "base"],
+                "l2_fees_eth": [1.0, None],
+                "rent_paid_eth": [0.5, 0.5],
+                "profit_eth": [0.5, None],
+                "txcount": [1, 2],
+            }
+        )
+        pq.write_table(table, path)
+        report = ps.validate_file(self._compile("contracts/schemas/panel_schema_str_v1.yaml"), path)
+        self.assertEqual(sorted(report.failures), ["row1:duplicate_grain:2024-03-01|base", "row1:null:l2_fees_eth"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "src" / "etl"))
+sys.path.insert(0, str(REPO / "src" / "validation"))
+
+import panel_schema as ps  # noqa: E402
+import panel_store as store  # noqa: E402
+
+HEADER = ["date_utc", "rollup_id", "l2_fees_eth", "rent_paid_eth", "profit_eth", "txcount"]
+
+
+def _rows() -> list[list[str]]:
+    rows = []
+    for month, days in ((1, 31), (2, 29), (3, 31)):
+        for day in range(1, days + 1):
+            for i, rollup in enumerate(("arbitrum", "base", "zksync_era")):
+                fees = (month * 100 + day) / 7 + i
+                profit = "" if day % 10 == 0 else repr(fees - 0.1)
+                rows.append([f"2024-{month:02d}-{day:02d}", rollup, repr(fees), repr(0.1), profit, str(day * 3 + i)])
+    return rows
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+class PanelStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+        self.schema = ps.load_schema(REPO / "contracts/schemas/panel_schema_str_v1.yaml")
+        self.dataset = self.tmp / "panel"
+        self.counts = store.write_dataset(self.schema, HEADER, _rows(), self.dataset, chunk_rows=50, row_group_rows=16)
+
+    def test_typed_month_partitions_with_statistics(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.assertEqual(self.counts, {"2024-01": 93, "2024-02": 87, "2024-03": 93})
+        self.assertEqual(sorted(p.name for p in self.dataset.iterdir()), ["month=2024-01", "month=2024-02", "month=2024-03"])
+        pf = pq.ParquetFile(self.dataset / "month=2024-02" / store.PART_FILE)
+        schema = pf.schema_arrow
+        self.assertEqual(schema.field("date_utc").type, pa.date32())
+        self.assertFalse(schema.field("l2_fees_eth").nullable)
+        self.assertEqual(schema.field("txcount").type, pa.int64())
+        self.assertGreater(pf.metadata.num_row_groups, 1)
+        col = pf.metadata.row_group(0).column(0)
+        self.assertEqual(col.compression, "ZSTD")
+        self.assertEqual((col.statistics.min, col.statistics.max), (date(2024, 2, 1), date(2024, 2, 6)))  # 16 rows = 3 rollups x 5.3 days
+
+    def test_filters_and_projection(self) -> None:
+        table = store.read_panel(
+            self.dataset,
+            columns=["date_utc", "l2_fees_eth"],
+            date_from=date(2024, 2, 28),
+            date_to=date(2024, 3, 2),
+            rollup_ids=["base"],
+        )
+        self.assertEqual(table.column_names, ["date_utc", "l2_fees_eth"])
+        self.assertEqual(
+            table.column("date_utc").to_pylist(), [date(2024, 2, 28), date(2024, 2, 29), date(2024, 3, 1), date(2024, 3, 2)]
+        )
+        self.assertEqual(table.column("l2_fees_eth").to_pylist()[0], 228 / 7 + 1)
+        self.assertEqual(store.read_panel(self.dataset, date_from=date(2025, 1, 1)).num_rows, 0)
+        with self.assertRaisesRegex(SystemExit, "Unknown columns"):
+            store.read_panel(self.dataset, columns=["nope"])
+
+    def test_csv_export_round_trips_and_validates(self) -> None:
+        src = self.tmp / "src.csv"
+        src.write_text(",".join(HEADER) + "\n" + "".join(",".join(r) + "\n" for r in _rows()))
+        out = self.tmp / "derived.csv"
+        self.assertEqual(store.export_csv(self.schema, self.dataset, out), 273)
+        self.assertEqual(out.read_bytes(), src.read_bytes())
+
+        report = ps.validate_file(ps.compile_schema(self.schema), self.dataset, chunk_rows=40)
+        self.assertTrue(report.ok, report.failures)
+        self.assertEqual(report.rows, 273)
+
+        buf = io.StringIO()
+        store.write_csv(store.scan(self.dataset, rollup_ids=["zksync_era"], date_to=date(2024, 1, 2)), buf, HEADER)
+        self.assertEqual(buf.getvalue().splitlines()[1:], [",".join(r) for r in _rows()[2:6:3]])
+
+    def test_rejects_unsorted_or_untyped_rows(self) -> None:
+        rows = _rows()
+        with self.assertRaisesRegex(ValueError, "not sorted"):
+            store.write_dataset(self.schema, HEADER, [rows[1], rows[0]], self.tmp / "bad")
+        rows[4][2] = ""
+        with self.assertRaisesRegex(ValueError, "row4: null in non-nullable column l2_fees_eth"):
+            store.write_dataset(self.schema, HEADER, rows, self.dataset)
+        self.assertFalse((self.tmp / "bad").exists())
+        self.assertEqual(store.read_panel(self.dataset).num_rows, 273)  # previous dataset left intact
+
+    def test_growthepie_panel_parquet_path_matches_csv_path(self) -> None:
+        import growthepie_panel as gp
+
+        snap = self.tmp / "snap"
+        (snap / "export").mkdir(parents=True)
+        for name, key in (("fees", "fees_paid_eth"), ("rent_paid", "rent_paid_eth"), ("profit", "profit_eth"), ("txcount", "txcount")):
+            records = [
+                {"metric_key": key, "origin_key": r, "date": f"2024-{m:02d}-0{d}", "value": m + d / 3}
+                for m in (1, 2)
+                for d in (1, 2)
+                for r in ("base", "arbitrum")
+            ]
+            (snap / "export" / f"{name}.json").write_text(json.dumps(records))
+        txcount = snap / "export" / "txcount.json"
+        txcount.write_text(json.dumps([{**r, "value": round(r["value"] * 3)} for r in json.loads(txcount.read_text())]))
+
+        direct, derived = self.tmp / "direct.csv", self.tmp / "derived.csv"
+        self.assertEqual(gp.write_panel(gp.build_pivot(snap), direct), (8, 0))
+        self.assertEqual(gp.write_panel_parquet(gp.build_pivot(snap), self.tmp / "gp_panel", derived), (8, 0))
+        self.assertEqual(derived.read_bytes(), direct.read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,304 @@
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import make_raw_manifest as mrm  # noqa: E402
+import quality_gates as qg  # noqa: E402
+
+
+class GateTestCase(unittest.TestCase):
+    """Runs each test inside an empty temporary repo (gates resolve paths relative to cwd)."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._cwd = os.getcwd()
+        os.chdir(self.root)
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(os.chdir, self._cwd)
+
+    def write(self, rel: str, text: str) -> Path:
+        p = self.root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(text, encoding="utf-8")
+        return p
+
+
+class RawManifestGateTest(GateTestCase):
+    def _manifest(self) -> dict[str, object]:
+        files = [
+            {"path": "data/raw/x/2026-01-22/a/part-0.json", "sha256": "a" * 64, "bytes": 1},
+            {"path": "data/raw/x/2026-01-22/b/part-0.json", "sha256": "b" * 64, "bytes": 2},
+        ]
+        return {
+            "source": "x",
+            "fetched_at_utc": "2026-01-22T00:00:00+00:00",
+            "command": "true",
+            "files": files,
+            "tree": mrm.build_merkle_tree("data/raw/x/2026-01-22", files),
+        }
+
+    def test_tree_consistent_with_leaves(self) -> None:
+        self.write("data/raw_manifest/x_2026-01-22.json", json.dumps(self._manifest()))
+        r = qg.gate_raw_manifest_validity(qg.RepoIndex())
+        self.assertTrue(r.ok, r.details)
+
+    def test_tree_mismatch_fails(self) -> None:
+        m = self._manifest()
+        m["files"][1]["sha256"] = "c" * 64  # type: ignore[index]
+        self.write("data/raw_manifest/x_2026-01-22.json", json.dumps(m))
+        r = qg.gate_raw_manifest_validity(qg.RepoIndex())
+        self.assertFalse(r.ok)
+        failures = r.details["failures"]
+        assert isinstance(failures, list)
+        self.assertTrue(any("tree:root_mismatch" in f for f in failures))
+        self.assertTrue(any("data/raw/x/2026-01-22/b" in f for f in failures))
+
+    def _write_jsonl(self, rel: str, lines: list[dict[str, object]]) -> None:
+        self.write(rel, "".join(json.dumps(line) + "\n" for line in lines))
+
+    def test_jsonl_manifest_validated_line_by_line(self) -> None:
+        m = self._manifest()
+        header = {
+            "kind": "header",
+            "format": mrm.JSONL_MANIFEST_FORMAT,
+            "snapshot_dir": "data/raw/x/2026-01-22",
+            "source": "x",
+            "fetched_at_utc": m["fetched_at_utc"],
+            "command": "true",
+        }
+        files = m["files"]
+        assert isinstance(files, list)
+        trailer = {"kind": "trailer", "count": 2, "tree": m["tree"]}
+        self._write_jsonl("data/raw_manifest/x_2026-01-22.jsonl", [header, *files, trailer])
+        r = qg.gate_raw_manifest_validity(qg.RepoIndex())
+        self.assertTrue(r.ok, r.details)
+
+        self._write_jsonl("data/raw_manifest/x_2026-01-22.jsonl", [header, files[1], files[0], trailer])
+        r = qg.gate_raw_manifest_validity(qg.RepoIndex())
+        self.assertFalse(r.ok)
+
+        self._write_jsonl("data/raw_manifest/x_2026-01-22.jsonl", [header, *files])
+        r = qg.gate_raw_manifest_validity(qg.RepoIndex())
+        self.assertIn("data/raw_manifest/x_2026-01-22.jsonl:missing_trailer", r.details["failures"])
+
+
+class RepoIndexTest(GateTestCase):
+    TASK = """---
+task_id: {task_id}
+title: t
+workstream: W1
+role: Worker
+priority: low
+dependencies: [{deps}]
+allowed_paths: []
+disallowed_paths: []
+outputs: []
+gates: []
+stop_conditions: []
+---
+## Context
+## Inputs
+## Outputs
+## Success Criteria
+## Status
+- State: backlog
+- Last updated: 2026-01-22
+## Notes / Decisions
+"""
+
+    def test_each_input_read_once_per_run(self) -> None:
+        self.write("contracts/project.yaml", "mode: empirical\n")
+        self.write(".orchestrator/backlog/T001_a.md", self.TASK.format(task_id="T001", deps=""))
+        self.write(".orchestrator/backlog/T002_b.md", self.TASK.format(task_id="T002", deps="T001"))
+        for d in ("active", "ready_for_review", "blocked", "done"):
+            (self.root / ".orchestrator" / d).mkdir(parents=True)
+
+        reads: list[str] = []
+        real_read = qg._read_text
+        with mock.patch.object(qg, "_read_text", side_effect=lambda p: reads.append(str(p)) or real_read(p)):
+            results = qg.run_gates(qg.GATES, workers=8)
+
+        self.assertTrue(results["task_hygiene"].ok, results["task_hygiene"].details)
+        self.assertTrue(results["task_dependencies"].ok, results["task_dependencies"].details)
+        self.assertEqual(results["project_contract"].details, {"mode": "empirical", "elapsed_seconds": mock.ANY})
+        self.assertEqual(len(reads), len(set(reads)))
+        self.assertIn(str(Path(".orchestrator/backlog/T002_b.md")), reads)
+
+    def test_changed_paths_computed_once(self) -> None:
+        index = qg.RepoIndex()
+        with mock.patch.object(qg, "_resolve_base_ref", return_value=None) as resolve:
+            qg.gate_contract_change_discipline(index)
+            r = qg.gate_registry_change_discipline(index)
+        self.assertEqual(resolve.call_count, 1)
+        self.assertEqual(r.details["reason"], "base_ref_missing")
+
+
+class PanelIntegrityTest(GateTestCase):
+    SAMPLE = "data/samples/growthepie/vendor_daily_rollup_panel_sample.csv"
+    PROCESSED = "data/processed/growthepie/vendor_daily_rollup_panel.csv"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.write(str(qg.STR_SCHEMA), (REPO / qg.STR_SCHEMA).read_text(encoding="utf-8"))
+
+    def _panel(self, rows: list[str]) -> str:
+        return "date_utc,rollup_id,l2_fees_eth,rent_paid_eth,profit_eth,txcount\n" + "".join(r + "\n" for r in rows)
+
+    def test_gate_applies_the_str_schema_to_each_panel_and_caches_per_file(self) -> None:
+        rows = [f"2024-03-{d:02d},arbitrum,1.0,0.25,0.75,10" for d in range(1, 29)]
+        rows[5] = "2024-03-06,arbitrum,1.0,-0.25,1.25,10"  # negative rent
+        rows[17] = "2024-03-18,arbitrum,1.0,0.25,0.5,10"  # profit far from fees - rent
+        rows[20] = "2024-03-21,arbitrum,1.0,0.25,,10"  # profit is optional
+        rows.append("2024-03-02,arbitrum,1.0,0.25,0.75,10")  # duplicate grain
+        self.write(self.SAMPLE, self._panel(["2024-03-01,base,1.0,0.5,0.5,1"]))
+        self.write(self.PROCESSED, self._panel(rows))
+        r = qg.gate_sample_panel_integrity(qg.RepoIndex(cache=qg.GateCache()))
+        self.assertFalse(r.ok)
+        self.assertEqual(r.details["rows"], {self.SAMPLE: 1, self.PROCESSED: 29})
+        self.assertEqual(
+            r.details["failures"],
+            [
+                f"{self.PROCESSED}:row5:negative:rent_paid_eth",
+                f"{self.PROCESSED}:row17:profit_identity:profit_eth",
+                f"{self.PROCESSED}:row28:duplicate_grain:2024-03-02|arbitrum",
+            ],
+        )
+
+        self.write(self.SAMPLE, self._panel(["2024-03-01,base,1.0,0.5,0.5,1", "2024-03-02,base,x,0.5,,1"]))
+        scanned: list[Path] = []
+        real = qg.panel_schema.validate_file
+        with mock.patch.object(qg.panel_schema, "validate_file", side_effect=lambda c, p: scanned.append(p) or real(c, p)):
+            r = qg.gate_sample_panel_integrity(qg.RepoIndex(cache=qg.GateCache()))
+        self.assertEqual(scanned, [Path(self.SAMPLE)])
+        self.assertEqual(r.details["rows"], {self.SAMPLE: 2, self.PROCESSED: 29})
+        self.assertEqual(r.details["failures"][0], f"{self.SAMPLE}:row1:invalid_type:l2_fees_eth")
+
+    def test_gate_fails_without_the_schema(self) -> None:
+        self.write(self.SAMPLE, self._panel(["2024-03-01,base,1.0,0.5,0.5,1"]))
+        (self.root / qg.STR_SCHEMA).unlink()
+        r = qg.gate_sample_panel_integrity(qg.RepoIndex())
+        self.assertFalse(r.ok)
+        self.assertEqual(r.details, {"missing": str(qg.STR_SCHEMA)})
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_parquet_partitions_checked_like_csv(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        part = self.root / "data/processed/growthepie/vendor_daily_rollup_panel/month=2024-03/part-0.parquet"
+        part.parent.mkdir(parents=True)
+        table = pa.table(
+            {
+                "date_utc": pa.array([date(2024, 3, d) for d in (1, 2, 2)], pa.date32()),
+                "rollup_id": ["base", "base", "base"],
+                "l2_fees_eth": [1.0, 1.0, 1.0],
+                "rent_paid_eth": [0.5, -0.5, 0.5],
+                "profit_eth": [0.5, None, 0.5],
+                "txcount": [1, 2, 3],
+            }
+        )
+        pq.write_table(table, part, row_group_size=2)
+        r = qg.gate_sample_panel_integrity(qg.RepoIndex())
+        rel = str(part.relative_to(self.root))
+        self.assertEqual(r.details["rows"], {rel: 3})
+        self.assertEqual(
+            r.details["failures"],
+            [f"{rel}:row1:negative:rent_paid_eth", f"{rel}:row2:duplicate_grain:2024-03-02|base"],
+        )
+
+
+class GateCacheTest(GateTestCase):
+    def test_unchanged_inputs_hit_and_edits_invalidate(self) -> None:
+        self.write("contracts/project.yaml", "mode: empirical\n")
+        gates = qg.select_gates(only=["project_contract", "environment"])
+        cache = qg.GateCache()
+
+        first = qg.run_gates(gates, workers=2, cache=cache)
+        self.assertEqual(first["project_contract"].details["cache"], "miss")
+        self.assertNotIn("cache", first["environment"].details)  # runtime-dependent: never cached
+
+        second = qg.run_gates(gates, workers=2, cache=cache)
+        self.assertEqual(second["project_contract"].details["cache"], "hit")
+        self.assertEqual(second["project_contract"].details["mode"], "empirical")
+
+        self.write("contracts/project.yaml", "mode: bogus\n")
+        third = qg.run_gates(gates, workers=2, cache=cache)
+        self.assertEqual(third["project_contract"].details["cache"], "miss")
+        self.assertFalse(third["project_contract"].ok)
+
+    def test_input_digests_reuse_stat_fingerprints_across_runs(self) -> None:
+        self.write("contracts/project.yaml", "mode: empirical\n")
+        gates = qg.select_gates(only=["project_contract"])
+        qg.run_gates(gates, workers=1, cache=qg.GateCache())
+
+        real = qg.hashlib.file_digest
+        with mock.patch.object(qg.hashlib, "file_digest", side_effect=real) as hashed:
+            second = qg.run_gates(gates, workers=1, cache=qg.GateCache())
+            self.assertEqual(hashed.call_count, 0)
+            self.assertEqual(second["project_contract"].details["cache"], "hit")
+
+            self.write("contracts/project.yaml", "mode: modeling\n")
+            third = qg.run_gates(gates, workers=1, cache=qg.GateCache())
+            self.assertEqual(hashed.call_count, 1)
+            self.assertEqual(third["project_contract"].details["cache"], "miss")
+
+    def test_evicts_least_recently_used_beyond_size_cap(self) -> None:
+        cache = qg.GateCache(max_bytes=1)
+        for i, key in enumerate(("old", "mid", "new")):
+            cache.put(key, qg.GateResult(ok=True, details={"i": i}))
+            os.utime(cache.cache_dir / f"{key}.json", ns=(i * 10**9, i * 10**9))
+        cache.max_bytes = (cache.cache_dir / "new.json").stat().st_size * 2
+        self.assertIsNotNone(cache.get("old"))  # touching makes "old" the most recently used
+        self.assertEqual(cache.evict(), ["mid"])
+        self.assertEqual(sorted(p.stem for p in cache.cache_dir.glob("*.json")), ["new", "old"])
+
+
+class GateRunnerTest(unittest.TestCase):
+    def test_select_only_and_skip_keep_declaration_order(self) -> None:
+        names = [n for n, _ in qg.select_gates(only=["task_hygiene", "environment"])]
+        self.assertEqual(names, [n for n, _ in qg.GATES if n in {"task_hygiene", "environment"}])
+        skipped = [n for n, _ in qg.select_gates(skip=["environment"])]
+        self.assertNotIn("environment", skipped)
+        self.assertEqual(len(skipped), len(qg.GATES) - 1)
+        with self.assertRaises(SystemExit):
+            qg.select_gates(only=["nope"])
+
+    def test_run_gates_times_each_gate_and_contains_crashes(self) -> None:
+        def boom(index: qg.RepoIndex) -> qg.GateResult:
+            raise RuntimeError("kaput")
+
+        gates = [("good", lambda index: qg.GateResult(ok=True, details={})), ("boom", boom)]
+        for workers in (1, 4):
+            with self.subTest(workers=workers):
+                results = qg.run_gates(gates, workers=workers)
+                self.assertEqual(list(results), ["good", "boom"])
+                self.assertTrue(results["good"].ok)
+                self.assertFalse(results["boom"].ok)
+                self.assertEqual(results["boom"].details["error"], "RuntimeError: kaput")
+                self.assertIn("elapsed_seconds", results["good"].details)
+
+
+class JudgeReportParseTest(unittest.TestCase):
+    def test_extracts_json_report_from_make_output(self) -> None:
+        import swarm
+
+        out = "python scripts/quality_gates.py --json\n" + json.dumps({"ok": False, "failed": ["environment"], "gates": {}}, indent=2)
+        out += "\nmake: *** [Makefile:4: gate] Error 1\n"
+        report = swarm._parse_quality_gates_report(out)
+        assert report is not None
+        self.assertEqual(report["failed"], ["environment"])
+        self.assertIsNone(swarm._parse_quality_gates_report("[environment] ok=True details={}"))
+
+
+if __name__ == "__main__":
+    unittest.main()
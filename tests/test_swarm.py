@@ -0,0 +1,571 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import swarm  # noqa: E402
+
+
+TASK = """---
+task_id: {task_id}
+title: "{task_id} title"
+workstream: {workstream}
+role: Worker
+priority: {priority}
+dependencies: [{deps}]
+parallel_ok: {parallel_ok}
+allowed_paths: []
+disallowed_paths: []
+outputs: []
+gates: []
+stop_conditions: []
+---
+## Status
+
+- State: {state}
+- Last updated: 2026-01-22
+"""
+
+
+class SwarmRepoTestCase(unittest.TestCase):
+    """Runs each test against an empty temporary repo with `.orchestrator/` lifecycle dirs."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.repo = Path(self._tmp.name).resolve()
+        for sub in swarm.LIFECYCLE_DIRS:
+            (self.repo / ".orchestrator" / sub).mkdir(parents=True)
+        patcher = mock.patch.object(swarm, "_repo_root", return_value=self.repo)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(swarm._TASK_PARSE_CACHE.clear)
+        ready_set = mock.patch.object(swarm, "_READY_SET", None)
+        ready_set.start()
+        self.addCleanup(ready_set.stop)
+
+    def write_task(
+        self,
+        folder: str,
+        task_id: str,
+        *,
+        state: str | None = None,
+        workstream: str = "W1",
+        priority: str = "medium",
+        deps: str = "",
+        parallel_ok: bool = False,
+    ) -> Path:
+        path = self.repo / ".orchestrator" / folder / f"{task_id}_task.md"
+        path.write_text(
+            TASK.format(
+                task_id=task_id,
+                state=state or folder,
+                workstream=workstream,
+                priority=priority,
+                deps=deps,
+                parallel_ok=str(parallel_ok).lower(),
+            ),
+            encoding="utf-8",
+        )
+        return path
+
+
+class TaskIndexTest(SwarmRepoTestCase):
+    def test_lookups_and_planner_helpers(self) -> None:
+        self.write_task("done", "T001", workstream="W1")
+        self.write_task("ready_for_review", "T002", state="done", workstream="W2")
+        self.write_task("backlog", "T003", deps="T001, T002", workstream="W1")
+        self.write_task("backlog", "T004", deps="T005", workstream="W3")
+        self.write_task("active", "T005", workstream="W3", parallel_ok=True)
+        (self.repo / ".orchestrator/backlog/T009_broken.md").write_text("no frontmatter\n", encoding="utf-8")
+
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            index = swarm.TaskIndex.build()
+        self.assertIn("T009_broken.md", err.getvalue())
+        self.assertEqual(index.get("T005").state, "active")  # type: ignore[union-attr]
+        self.assertEqual([t.task_id for t in index.in_workstream("W3")], ["T005", "T004"])
+        self.assertIn(str(self.repo / ".orchestrator/backlog/T009_broken.md"), index.errors)
+
+        done = swarm.done_task_ids(index)
+        self.assertEqual(done, {"T001", "T002"})
+        ready = swarm.ready_backlog_tasks(done_ids=done, claimed_ids=set(), index=index)
+        self.assertEqual([t.task_id for t in ready], ["T003"])
+        locked, parallel_only = swarm._compute_workstream_locks(repo=self.repo, claimed_ids={"T005"}, index=index)
+        self.assertEqual((locked, parallel_only), (set(), {"W3"}))
+
+    def test_parse_cache_reparses_only_changed_files(self) -> None:
+        a = self.write_task("backlog", "T001")
+        self.write_task("backlog", "T002")
+        swarm.TaskIndex.build()
+
+        parsed: list[Path] = []
+        real = swarm.load_task
+        with mock.patch.object(swarm, "load_task", side_effect=lambda p: parsed.append(p) or real(p)):
+            swarm.TaskIndex.build()
+            self.assertEqual(parsed, [])
+
+            a.write_text(a.read_text(encoding="utf-8").replace("State: backlog", "State: done"), encoding="utf-8")
+            st = a.stat()
+            os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            index = swarm.TaskIndex.build()
+        self.assertEqual(parsed, [a])
+        self.assertEqual(swarm.done_task_ids(index), {"T001"})
+
+        a.unlink()
+        swarm.TaskIndex.build()
+        self.assertNotIn(a, swarm._TASK_PARSE_CACHE)
+
+    def test_ready_set_rechecks_only_dependents_of_flipped_tasks(self) -> None:
+        a = self.write_task("backlog", "T001")
+        self.write_task("backlog", "T002", deps="T001")
+        self.write_task("backlog", "T003", deps="T002")
+        self.write_task("backlog", "T004")
+
+        ready = swarm.incremental_ready_set(swarm.TaskIndex.build(), verify=True)
+        self.assertEqual([t.task_id for t in ready.ready(set())], ["T001", "T004"])
+        self.assertEqual(ready.examined, 4)
+
+        swarm.incremental_ready_set(swarm.TaskIndex.build(), verify=True)
+        self.assertEqual(ready.examined, 0)
+
+        a.unlink()
+        self.write_task("done", "T001")
+        self.assertIs(swarm.incremental_ready_set(swarm.TaskIndex.build(), verify=True), ready)
+        self.assertEqual([t.task_id for t in ready.ready({"T004"})], ["T002"])
+        self.assertEqual(ready.done_ids(), {"T001"})
+        self.assertEqual(ready.examined, 3)  # old and new T001 files plus its dependent T002
+
+        ready._ready.add(self.repo / ".orchestrator/backlog/T003_task.md")
+        with self.assertRaisesRegex(RuntimeError, "diverged"):
+            ready.verify(swarm.TaskIndex.build())
+
+
+class SchedulerTest(SwarmRepoTestCase):
+    def test_critical_path_scores_and_order(self) -> None:
+        self.write_task("done", "T000", workstream="W1")
+        self.write_task("backlog", "T001", workstream="W1", priority="low", deps="T000")
+        self.write_task("backlog", "T002", workstream="W2", priority="high")
+        self.write_task("backlog", "T003", workstream="W1", deps="T001")
+        self.write_task("backlog", "T004", workstream="W3", deps="T002")
+        self.write_task("backlog", "T005", workstream="W2", deps="T003")
+        self.write_task("backlog", "T006", workstream="W1", priority="high")
+        index = swarm.TaskIndex.build()
+        done = swarm.done_task_ids(index)
+
+        scores = swarm.compute_task_scores(index, done_ids=done, workstream_seconds={"W1": 100.0, "W2": 50.0})
+        self.assertNotIn("T000", scores)
+        self.assertEqual((scores["T001"].critical_path_seconds, scores["T001"].fanout), (250.0, 2))
+        self.assertEqual((scores["T002"].critical_path_seconds, scores["T002"].fanout), (125.0, 1))
+        self.assertEqual(scores["T004"].duration_seconds, 75.0)  # unknown workstream: mean of known ones
+
+        ready = swarm.ready_backlog_tasks(done_ids=done, claimed_ids=set(), index=index)
+        ordered = swarm.schedule_order(ready, scores)
+        self.assertEqual([t.task_id for t in ordered], ["T001", "T002", "T006"])
+        self.assertEqual([t.task_id for t in swarm.schedule_order(ready, None)], ["T002", "T006", "T001"])
+        picked = swarm._apply_workstream_concurrency_filters(
+            tasks=ordered, locked_workstreams=set(), parallel_only_workstreams=set(), capacity=3
+        )
+        self.assertEqual([t.task_id for t in picked], ["T001", "T002"])  # T006 shares W1 with T001
+
+    def test_dependency_cycle_is_cut(self) -> None:
+        self.write_task("backlog", "T001", deps="T002")
+        self.write_task("backlog", "T002", deps="T001")
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            scores = swarm.compute_task_scores(swarm.TaskIndex.build(), done_ids=set())
+        self.assertIn("dependency cycle", err.getvalue())
+        self.assertEqual(scores["T001"].critical_path_seconds, 2 * swarm.DEFAULT_TASK_SECONDS)
+
+
+class LoopWatcherTest(SwarmRepoTestCase):
+    def test_detects_task_and_tmux_window_changes(self) -> None:
+        windows = ["@1 supervisor", "@2 T001"]
+        watcher = swarm.LoopWatcher(repo=self.repo, remote="origin", remote_poll_seconds=3600)
+        with mock.patch.object(swarm.LoopWatcher, "_tmux_windows", lambda self: tuple(windows)):
+            task = self.write_task("backlog", "T001")
+            watcher.mark()
+            self.assertEqual(watcher.changed(), [])
+            self.assertEqual(watcher.wait(max_idle_seconds=0.05, poll_seconds=0.01), "max_idle")
+
+            task.write_text(task.read_text(encoding="utf-8") + "\n- note\n", encoding="utf-8")
+            self.assertEqual(watcher.changed(), ["orchestrator"])
+
+            windows.pop()  # the T001 worker window exited
+            self.assertEqual(watcher.wait(max_idle_seconds=5, poll_seconds=0.01), "tmux_windows")
+
+
+    def test_task_moved_during_scan_is_skipped(self) -> None:
+        self.write_task("backlog", "T001")
+        gone = self.write_task("backlog", "T002")
+        real_stat = Path.stat
+
+        def racy_stat(path: Path, *args: object, **kwargs: object) -> os.stat_result:
+            if path == gone:
+                raise FileNotFoundError(path)
+            return real_stat(path, *args, **kwargs)
+
+        watcher = swarm.LoopWatcher(repo=self.repo, remote="origin", remote_poll_seconds=3600)
+        with mock.patch.object(Path, "stat", racy_stat):
+            names = [e[0] for e in watcher._orchestrator()]  # type: ignore[attr-defined]
+        self.assertIn("backlog/T001_task.md", names)
+        self.assertNotIn("backlog/T002_task.md", names)
+
+
+class WorkerPoolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.log_dir = Path(self._tmp.name) / "swarm_logs"
+
+    def test_runs_children_concurrently_and_logs_output(self) -> None:
+        pool = swarm.WorkerPool(log_dir=self.log_dir, max_child_seconds=None)
+        code = "import time; time.sleep(0.3); print('done {}')"
+        start = time.monotonic()
+        for tid in ("T001", "T002", "T003"):
+            pool.spawn(tid, [sys.executable, "-c", code.format(tid)], cwd=Path(self._tmp.name))
+        self.assertEqual(pool.running_ids(), {"T001", "T002", "T003"})
+        finished = pool.wait_all(poll_seconds=0.05)
+        self.assertLess(time.monotonic() - start, 0.85)
+        self.assertEqual(sorted(r["task_id"] for r in finished), ["T001", "T002", "T003"])
+        self.assertTrue(all(r["returncode"] == 0 and not r["timed_out"] for r in finished))
+        self.assertEqual(Path(finished[0]["log"]).read_text().strip(), f"done {finished[0]['task_id']}")
+        self.assertEqual(pool.running_ids(), set())
+
+    def test_kills_children_past_deadline(self) -> None:
+        pool = swarm.WorkerPool(log_dir=self.log_dir, max_child_seconds=0.2)
+        pool.spawn("T001", [sys.executable, "-c", "import time; time.sleep(30)"], cwd=Path(self._tmp.name))
+        self.assertEqual(pool.reap(), [])
+        time.sleep(0.3)
+        [rec] = pool.reap()
+        self.assertTrue(rec["timed_out"])
+        self.assertNotEqual(rec["returncode"], 0)
+
+    def test_repairs_respect_max_workers(self) -> None:
+        pool = swarm.WorkerPool(log_dir=self.log_dir, max_child_seconds=None)
+        pool.workers["T001"] = mock.Mock()  # a task worker already holds one of the two slots
+        failing = [{"name": "ci", "conclusion": "FAILURE"}]
+        prs = [
+            {"headRefName": f"T00{n}_fix", "number": n, "url": f"pr/{n}", "statusCheckRollup": failing}
+            | {"updatedAt": f"2020-01-0{n}T00:00:00Z"}
+            for n in (2, 3)
+        ]
+        args = argparse.Namespace(
+            unattended=True, max_repairs_per_tick=2, pr_cache_ttl_seconds=60, base_branch="main", remote="origin",
+            repair_after_seconds=0, max_repair_attempts=0, worktree_parent=self._tmp.name, runner="pool", max_workers=2,
+            codex_sandbox="workspace-write", final_state="review", max_worker_seconds=0, max_review_seconds=0,
+            max_gate_seconds=60, codex_model=None, create_pr=False, auto_merge=False,
+        )  # fmt: skip
+
+        def spawn(task_id: str, command: list[str], *, cwd: Path) -> None:
+            pool.workers[task_id] = mock.Mock()
+
+        with (
+            mock.patch.object(swarm, "_gh", return_value="gh"),
+            mock.patch.object(swarm, "_pr_cache", return_value=mock.Mock(open_prs=mock.Mock(return_value=prs))),
+            mock.patch.object(swarm, "_state_store", return_value=None),
+            mock.patch.object(swarm, "ensure_worktree_for_branch", return_value=Path(self._tmp.name)),
+            mock.patch.object(swarm, "_worker_pool", return_value=pool),
+            mock.patch.object(pool, "spawn", side_effect=spawn),
+            contextlib.redirect_stdout(io.StringIO()) as out,
+        ):
+            swarm._maybe_spawn_repairs(args, Path(self._tmp.name))
+        self.assertEqual(pool.running_ids(), {"T001", "T002"})  # oldest PR first, then the pool is full
+        self.assertIn("slots busy; deferring 1 repair(s)", out.getvalue())
+
+
+class JudgeGateTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+
+    def _gate(self, command: str, name: str, timeout: float | None = None) -> dict[str, object]:
+        return swarm.run_judge_gate(
+            command, cwd=self.tmp, env=dict(os.environ), log_path=self.tmp / f"{name}.log", timeout_seconds=timeout
+        )
+
+    def test_streams_output_and_records_usage(self) -> None:
+        report = '{"ok": false, "failed": ["repo_structure"], "gates": {}}'
+        code = f"import sys; print('x' * 5000); print({report!r}); sys.exit(2)"
+        rec = self._gate(f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}", "g0")
+        self.assertEqual((rec["returncode"], rec["timed_out"]), (2, False))
+        self.assertEqual(rec["failed_gates"], ["repo_structure"])
+        self.assertGreater(rec["peak_rss_kb"], 1000)  # the python child, not just /bin/sh
+        self.assertEqual(len(Path(str(rec["log"])).read_text()), 5000 + len(report) + 2)
+        self.assertEqual(len(str(rec["output"])), swarm.GATE_OUTPUT_TAIL_CHARS)
+
+        # Only the end of the log is read back; the report is still found after a long preamble.
+        with (
+            mock.patch.object(swarm, "GATE_REPORT_TAIL_BYTES", 1000),
+            mock.patch.object(Path, "read_text", side_effect=AssertionError("whole log read back")),
+        ):
+            rec = self._gate(f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}", "g1")
+        self.assertEqual(rec["failed_gates"], ["repo_structure"])
+        self.assertEqual(len(str(rec["output"])), 1000)
+        self.assertTrue(str(rec["output"]).endswith(report + "\n"))
+
+    def test_timeout_kills_gate_process_group(self) -> None:
+        start = time.monotonic()
+        rec = self._gate("sleep 30 & sleep 30; wait", "slow", timeout=0.2)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertTrue(rec["timed_out"])
+        self.assertNotEqual(rec["returncode"], 0)
+
+    def test_parallel_gates_frontmatter_flag(self) -> None:
+        path = self.tmp / "T001_task.md"
+        path.write_text(
+            TASK.format(task_id="T001", state="backlog", workstream="W1", priority="low", deps="", parallel_ok="false")
+            .replace("gates: []", "parallel_gates: true\ngates:\n  - make gate\n  - make test"),
+            encoding="utf-8",
+        )
+        task = swarm.load_task(path)
+        self.assertTrue(task.parallel_gates)
+        self.assertEqual(task.gates, ["make gate", "make test"])
+
+
+class WorktreePoolTest(SwarmRepoTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.git("init", "-q", "-b", "main")
+        self.git("config", "user.email", "swarm@example.com")
+        self.git("config", "user.name", "swarm")
+        self.task = self.write_task("backlog", "T001")
+        self.git("add", "-A")
+        self.git("commit", "-q", "-m", "init")
+        self.parent = self.repo / "wts"
+        self.parent.mkdir()
+        self.pool = swarm.WorktreePool(repo=self.repo, parent=self.parent, size=2)
+
+    def git(self, *args: str, cwd: Path | None = None) -> str:
+        cp = subprocess.run(["git", *args], cwd=cwd or self.repo, check=True, capture_output=True, text=True)
+        return cp.stdout.strip()
+
+    def test_claim_recycle_and_gc(self) -> None:
+        self.pool.refill_in_background(base_ref="main")
+        self.pool.wait()
+        prefix = self.pool.prefix
+        self.assertRegex(prefix, r"^wt-pool-[0-9a-f]{8}-$")
+        self.assertEqual([p.name for p in sorted(self.parent.iterdir())], [f"{prefix}0", f"{prefix}1"])
+
+        task = swarm.load_task(self.task)
+        wt, branch = swarm.ensure_worktree(task=task, worktree_parent=self.parent, base_ref="main", pool=self.pool)
+        self.assertEqual((wt.name, branch), ("wt-T001", "T001_task"))
+        self.assertEqual(self.git("branch", "--show-current", cwd=wt), "T001_task")
+        self.assertEqual(len(self.pool._slots()), 1)
+
+        (wt / "scratch.txt").write_text("uncommitted", encoding="utf-8")
+        self.assertEqual(self.pool.recycle(done_ids={"T001"}, busy_ids=set(), base_ref="main"), {})
+        (wt / "scratch.txt").unlink()
+        self.assertEqual(self.pool.recycle(done_ids={"T001"}, busy_ids={"T001"}, base_ref="main"), {})
+        self.assertEqual(self.pool.recycle(done_ids={"T001"}, busy_ids=set(), base_ref="main"), {"T001": "pooled"})
+        self.assertFalse(wt.exists())
+        self.assertTrue(all(s["detached"] for s in self.pool._slots()))
+
+        # A crashed run left one slot dirty and a half-created slot directory behind.
+        dirty = self.pool._slots()[0]["path"]
+        (dirty / "README.md").write_text("junk", encoding="utf-8")
+        (self.parent / f"{prefix}9").mkdir()
+        # Slots of another clone sharing the parent directory, and a live worktree of another repo.
+        (self.parent / "wt-pool-0").mkdir()
+        other = self.parent / f"{prefix}7"
+        other.mkdir()
+        (other / ".git").write_text(f"gitdir: {self.repo / 'elsewhere/.git/worktrees/x'}\n", encoding="utf-8")
+        self.assertEqual(sorted(self.pool.gc()), [str(dirty), str(self.parent / f"{prefix}9")])
+        self.assertEqual(len(self.pool._slots()), 1)
+        self.assertTrue((self.parent / "wt-pool-0").is_dir())
+        self.assertTrue(other.is_dir())
+
+    def test_failed_claim_leaves_the_slot_in_the_pool(self) -> None:
+        self.pool.refill(base_ref="main")
+        slots = [s["path"] for s in self.pool._slots()]
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            self.assertIsNone(self.pool.claim(task_id="T002", branch="T002_task", base_ref="no-such-ref"))
+        self.assertIn("could not switch", err.getvalue())
+        self.assertIsNone(self.pool.claim(task_id="T003", branch="main", base_ref="main"))  # checked out in the repo
+        self.assertEqual([s["path"] for s in self.pool._slots()], slots)
+        self.assertTrue(all(s["detached"] for s in self.pool._slots()))
+        self.assertFalse((self.parent / "wt-T002").exists())
+
+
+class PRStateCacheTest(SwarmRepoTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.state = self.repo / "fake_gh_state.json"
+        self.log = self.repo / "fake_gh_log.jsonl"
+        self.set_prs([{"number": 1, "headRefName": "T001_slug", "baseRefName": "main", "statusCheckRollup": []}])
+        env = {
+            "SWARM_GH": str(Path(swarm.__file__).with_name("fake_gh.py")),
+            "FAKE_GH_STATE": str(self.state),
+            "FAKE_GH_LOG": str(self.log),
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        global_cache = mock.patch.object(swarm, "_PR_CACHE", None)
+        global_cache.start()
+        self.addCleanup(global_cache.stop)
+
+    def set_prs(self, prs: list[dict[str, object]]) -> None:
+        self.state.write_text(json.dumps({"prs": prs}), encoding="utf-8")
+
+    def calls(self) -> list[str]:
+        if not self.log.exists():
+            return []
+        lines = [json.loads(line) for line in self.log.read_text(encoding="utf-8").splitlines()]
+        self.log.unlink()
+        return [" ".join(argv[:2]) for argv in lines]
+
+    def test_conditional_refresh_and_sharing(self) -> None:
+        cache = swarm._pr_cache(ttl_seconds=0)
+        self.assertEqual([pr["number"] for pr in cache.open_prs("main")], [1])
+        self.assertEqual(self.calls(), ["pr list"])
+        self.assertTrue((self.repo / swarm.PR_CACHE_PATH).exists())
+
+        # TTL expired: the conditional request fetches an ETag (200, list from the REST body), then 304s.
+        self.assertEqual(swarm._probe_pr_claims("origin", "main", 5), {"T001"})
+        self.assertEqual(swarm._probe_pr_claims("origin", "main", 5), {"T001"})
+        self.assertEqual(self.calls(), ["api -i", "api -i"])
+        self.assertEqual(cache.stats, {"hits": 0, "not_modified": 1, "list_changed": 1, "fetches": 1})
+        self.assertEqual(cache.open_prs("main")[0]["statusCheckRollup"], [])  # carried over: PR 1 not updated
+
+        # The list changed: the 200 body replaces it without a second `gh pr list`.
+        self.set_prs([{"number": 2, "headRefName": "T002_slug", "baseRefName": "main"}])
+        self.calls()
+        self.assertEqual(swarm._probe_pr_claims("origin", "main", 5), {"T002"})
+        self.assertEqual(self.calls(), ["api -i"])
+
+        # Within the TTL the repair loop reuses the claims probe's answer without calling gh.
+        cache.ttl_seconds = 3600
+        self.assertEqual(cache.open_prs("main")[0]["headRefName"], "T002_slug")
+        self.assertEqual(self.calls(), [])
+
+        # Entries past max age skip the conditional shortcut so check rollups get refreshed.
+        cache.ttl_seconds, cache.max_age_seconds = 0, 0
+        cache.open_prs("main")
+        self.assertEqual(self.calls(), ["pr list"])
+
+
+class StateStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.db = Path(self._tmp.name) / "data/tmp/swarm_state.sqlite3"
+        self.store = swarm.StateStore(self.db)
+        self.addCleanup(self.store.close)
+
+    def test_supervisor_and_run_task_share_one_run_row(self) -> None:
+        tick_id = self.store.start_tick("tick")
+        started = self.store.start_run("T001", kind="run", workstream="W1", runner="pool", tick_id=tick_id)
+        self.store.finish_tick(tick_id, seconds=0.5, status={"selected": ["T001"]})
+
+        # The run-task child (another connection, e.g. from a worktree) adopts the open row.
+        child = swarm.StateStore(self.db)
+        self.addCleanup(child.close)
+        run_id = child.open_run("T001", kind="run", workstream="W1")
+        self.assertEqual(run_id, started)
+        child.record_gate(
+            run_id, command="make gate", returncode=1, seconds=2.0, failed_gates=["repo_structure"], peak_rss_kb=2048
+        )
+        child.finish_run(run_id, final_state="blocked", returncode=0, gate_ok=False, worker_seconds=120.0)
+
+        # A later pool reap must not overwrite the outcome run-task recorded.
+        self.store.close_open_runs("T001", returncode=0, timed_out=False)
+        [run] = self.store.recent_runs(5)
+        self.assertEqual((run["final_state"], run["gate_ok"], run["worker_seconds"]), ("blocked", 0, 120.0))
+        self.assertEqual(self.store.gate_failures(), {"make gate": {"runs": 1, "failed": 1, "mean_seconds": 2.0, "max_peak_rss_kb": 2048}})
+
+        # Manual run-task invocations open their own row.
+        manual = child.open_run("T002", kind="run", workstream="W2")
+        self.assertNotEqual(manual, started)
+
+    def test_history_queries(self) -> None:
+        for task_id, ws, seconds in [("T001", "W1", 100.0), ("T002", "W1", 300.0), ("T003", "W3", 50.0)]:
+            run_id = self.store.start_run(task_id, kind="run", workstream=ws)
+            self.store.finish_run(run_id, final_state="ready_for_review", worker_seconds=seconds)
+        for _ in range(3):
+            self.store.start_run("T002", kind="repair", pr_number=7, reason="checks failing")
+        self.store.start_run("T003", kind="repair")
+
+        by_ws = self.store.worker_seconds_by_workstream()
+        self.assertEqual(by_ws["W1"], {"runs": 2, "mean_seconds": 200.0, "max_seconds": 300.0})
+        self.assertEqual(self.store.tasks_repaired_more_than(1), {"T002": 3})
+        stats = self.store.repair_stats()
+        self.assertEqual(stats["T002"][0], 3)
+        self.assertEqual(
+            self.store.attempt_counts(["T002", "T009"]), {"T002": {"runs": 4, "repairs": 3, "last_state": None}}
+        )
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            swarm.main(["history", "--state-db", str(self.db), "--repaired-more-than", "0"])
+        payload = json.loads(out.getvalue())
+        self.assertEqual(payload["repaired_more_than_0"], {"T002": 3, "T003": 1})
+        self.assertEqual(len(payload["recent_runs"]), 7)
+
+
+class ClaimProbeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(swarm._REMOTE_CLAIMS_CACHE.clear)
+        self.addCleanup(swarm._CLAIM_PROBE_INFLIGHT.clear)
+        self.remote_delay = 0.0
+        self.remote_ids = {"T010"}
+        self.remote_calls = 0
+        self.gh: str | None = "gh"
+
+        def remote(remote: str, base: str, timeout: float) -> set[str]:
+            self.remote_calls += 1
+            time.sleep(self.remote_delay)
+            return set(self.remote_ids)
+
+        def broken(remote: str, base: str, timeout: float) -> set[str]:
+            raise subprocess.CalledProcessError(128, ["git", "ls-remote"])
+
+        probes = [
+            ("worktrees", lambda r, b, t: {"T001"}, False),
+            ("open_prs", remote, True),
+            ("remote_branches", broken, True),
+        ]
+        for name, value in (("CLAIM_PROBES", probes), ("CLAIM_PROBE_TOOLS", {"open_prs": lambda: self.gh})):
+            patcher = mock.patch.object(swarm, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_slow_remote_probe_falls_back_to_cached_answer(self) -> None:
+        stats: list[dict[str, object]] = []
+        self.assertEqual(swarm.claimed_task_ids("origin", "main", timeout_seconds=1, stats=stats), {"T001", "T010"})
+        self.assertEqual(
+            [(e["probe"], e["ok"], e["source"]) for e in stats],
+            [("worktrees", True, "live"), ("open_prs", True, "live"), ("remote_branches", False, "none")],
+        )
+
+        self.remote_delay, self.remote_ids = 3.0, {"T099"}
+        stats.clear()
+        start = time.monotonic()
+        claimed = swarm.claimed_task_ids("origin", "main", timeout_seconds=0.1, stats=stats)
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertEqual(claimed, {"T001", "T010"})
+        self.assertEqual((stats[1]["error"], stats[1]["source"]), ("timeout", "cache"))
+
+        # The hung probe is still in flight: the next tick waits on it instead of starting another call.
+        self.assertEqual(swarm.claimed_task_ids("origin", "main", timeout_seconds=0.1), {"T001", "T010"})
+        self.assertEqual(self.remote_calls, 2)
+
+    def test_probe_without_its_cli_is_skipped_quietly(self) -> None:
+        self.gh = None
+        stats: list[dict[str, object]] = []
+        self.assertEqual(swarm.claimed_task_ids("origin", "main", timeout_seconds=1, stats=stats), {"T001"})
+        self.assertEqual((stats[1]["probe"], stats[1]["ok"], stats[1]["source"]), ("open_prs", True, "skipped"))
+        self.assertEqual(self.remote_calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()